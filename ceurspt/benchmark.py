@@ -0,0 +1,474 @@
+"""
+Created on 2026-10-19
+
+@author: agent
+"""
+
+import asyncio
+import json
+import platform
+import random
+import re
+import statistics
+import time
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional
+
+import httpx
+from fastapi.routing import APIRoute
+from fastapi.testclient import TestClient
+
+from ceurspt.bibtex import BibTexConverter
+from ceurspt.ceurws import JsonCacheManager, PaperManager, VolumeManager
+from ceurspt.jsonldBuilder import CeurWsJsonLdBuilder
+from ceurspt.memory_report import MemoryReport
+from ceurspt.profiler import Profiler
+from ceurspt.version import Version
+from ceurspt.webserver import WebServer
+
+
+class BenchmarkSuite:
+    """
+    offline benchmark of loading, lookups, routes, pdf range requests and
+    renderers
+
+    each benchmark is timed repeat times and summarized by its min,
+    median, mean, p95 and max in seconds
+    """
+
+    LOD_NAMES = ["volumes", "proceedings", "papers", "papers_dblp"]
+
+    def __init__(
+        self,
+        base_path: str,
+        base_url: str,
+        cache_dir: Optional[str] = None,
+        repeat: int = 5,
+        sample_size: int = 20,
+        static_directory: str = "static",
+    ):
+        """
+        constructor
+
+        Args:
+            base_path(str): the base path of the volume directories
+            base_url(str): the url of the RESTFul metadata service
+            cache_dir(str): the directory of the json cache files e.g. fixtures or a synthetic corpus
+            repeat(int): the number of times to run each benchmark
+            sample_size(int): the number of volumes and papers to run each renderer on
+            static_directory(str): the static directory of the webserver
+        """
+        self.base_path = base_path
+        self.base_url = base_url
+        self.cache_dir = cache_dir
+        self.repeat = repeat
+        self.sample_size = sample_size
+        self.static_directory = static_directory
+        self.results: Dict[str, dict] = {}
+        self.memory: Dict[str, dict] = {}
+
+    def time_it(self, group: str, name: str, func: Callable[[], object], repeat=None):
+        """
+        time the given function and record its summary
+
+        Args:
+            group(str): the group of the benchmark
+            name(str): the name of the benchmark
+            func(Callable): the function to time
+            repeat(int): the number of runs - default: my repeat
+
+        Returns:
+            object: the result of the last run
+        """
+        repeat = repeat or self.repeat
+        times = []
+        result = None
+        for _run in range(repeat):
+            start = time.perf_counter()
+            result = func()
+            times.append(time.perf_counter() - start)
+        self.record(group, name, times)
+        return result
+
+    def record(self, group: str, name: str, times: List[float], **extra):
+        """
+        record the summary of the given timings
+        """
+        times = sorted(times)
+        self.results[f"{group}:{name}"] = {
+            "group": group,
+            "name": name,
+            "n": len(times),
+            "min": times[0],
+            "median": statistics.median(times),
+            "mean": statistics.fmean(times),
+            "p95": Profiler.percentile(times, 95),
+            "max": times[-1],
+            **extra,
+        }
+
+    def new_managers(self):
+        """
+        get a new volume and paper manager
+        """
+        vm = VolumeManager(
+            base_path=self.base_path, base_url=self.base_url, cache_dir=self.cache_dir
+        )
+        pm = PaperManager(base_url=self.base_url, cache_dir=self.cache_dir)
+        return vm, pm
+
+    def bench_loading(self):
+        """
+        benchmark load_lod per lod and the startup of the managers
+        """
+        jcm = JsonCacheManager(base_url=self.base_url, cache_dir=self.cache_dir)
+        for lod_name in self.LOD_NAMES:
+            self.time_it("load_lod", lod_name, lambda: jcm.load_lod(lod_name))
+        vm, pm = self.new_managers()
+        self.time_it("startup", "getVolumes", vm.getVolumes)
+        self.time_it("startup", "getPapers", lambda: pm.getPapers(vm))
+        return vm, pm
+
+    def bench_construction(self, vm: VolumeManager, pm: PaperManager):
+        """
+        benchmark the construction of the Volume and Paper objects from the
+        loaded records with and without the generic LinkML coercion
+        """
+        volume_records = list(vm.volume_records_by_number.values())
+        paper_records = list(pm.paper_records_by_path.values())
+        for mode, fast in [("generic", False), ("fast", True)]:
+            self.time_it(
+                "construct",
+                f"Volume {mode}",
+                lambda: [vm.createVolume(record, fast) for record in volume_records],
+            )
+            self.time_it(
+                "construct",
+                f"Paper {mode}",
+                lambda: [
+                    pm.createPaper(record, vm.getVolume(record["vol_number"]), fast)
+                    for record in paper_records
+                ],
+            )
+
+    @classmethod
+    def sample(cls, items: list, size: int) -> list:
+        """
+        get an evenly spread sample of the given items
+        """
+        if len(items) <= size:
+            return items
+        step = len(items) / size
+        return [items[int(i * step)] for i in range(size)]
+
+    def bench_renderers(self, vm: VolumeManager, pm: PaperManager):
+        """
+        benchmark the individual renderers on a sample of volumes and papers
+        """
+        volumes = self.sample(list(vm.volumes_by_number.values()), self.sample_size)
+        papers = self.sample(list(pm.papers_by_path.values()), self.sample_size)
+        renderers = {
+            "Volume.getHtml": (volumes, lambda volume: volume.getHtml()),
+            "Volume.as_smw_markup": (volumes, lambda volume: volume.as_smw_markup()),
+            "BibTexConverter.convert_volume": (
+                volumes,
+                BibTexConverter.convert_volume,
+            ),
+            "CeurWsJsonLdBuilder.build": (
+                volumes,
+                lambda volume: CeurWsJsonLdBuilder.from_volume(volume, False).build(),
+            ),
+            "Paper.asHtml": (papers, lambda paper: paper.asHtml()),
+            "Paper.as_quickstatements": (
+                papers,
+                lambda paper: paper.as_quickstatements(),
+            ),
+            "Paper.as_smw_markup": (papers, lambda paper: paper.as_smw_markup()),
+        }
+        for name, (items, render) in renderers.items():
+            times = []
+            errors = 0
+            for _run in range(self.repeat):
+                for item in items:
+                    start = time.perf_counter()
+                    try:
+                        render(item)
+                    except Exception:
+                        errors += 1
+                    times.append(time.perf_counter() - start)
+            if times:
+                self.record("render", name, times, errors=errors)
+
+    @classmethod
+    def memory_per_item(cls, papers: List[object], authors: List[object]) -> dict:
+        """
+        get the bytes per paper and per distinct author of the given objects
+
+        the papers are accounted without their authors and strings shared
+        between objects are accounted only once
+
+        Args:
+            papers(list): the paper representations
+            authors(list): the distinct author representations
+        """
+        roots = {id(author) for author in authors}
+        seen = set()
+        paper_bytes = sum(
+            MemoryReport.deep_sizeof(paper, roots, seen) for paper in papers
+        )
+        author_bytes = sum(
+            MemoryReport.deep_sizeof(author, roots, seen) for author in authors
+        )
+        return {
+            "papers": len(papers),
+            "authors": len(authors),
+            "paper_bytes": paper_bytes,
+            "author_bytes": author_bytes,
+            "bytes_per_paper": paper_bytes / len(papers) if papers else 0.0,
+            "bytes_per_author": author_bytes / len(authors) if authors else 0.0,
+        }
+
+    def bench_dblp_memory(self, pm: PaperManager):
+        """
+        compare the memory of the dblp paper metadata as loaded json records
+        with the slotted model objects of the paper manager
+        """
+        records = pm.load_lod("papers_dblp")
+        # the json records repeat an author dict for each paper of the author
+        author_records = [
+            author for record in records for author in record.get("authors") or []
+        ]
+        self.memory["dblp:records"] = self.memory_per_item(records, author_records)
+        dblp_papers = list(pm.paper_dblp_by_path.values())
+        self.memory["dblp:objects"] = self.memory_per_item(
+            dblp_papers, list(pm.dblp_scholars.values())
+        )
+
+    def route_paths(self, ws: WebServer, vm: VolumeManager, pm: PaperManager):
+        """
+        get a concrete path for each GET route of the given webserver
+
+        Returns:
+            dict: the paths by route template
+        """
+        pdf_paths = list(pm.papers_by_path.keys())
+        # prefer a paper with dblp metadata to exercise the author bar
+        pdf_path = next(
+            (pdf_path for pdf_path in pdf_paths if pdf_path in pm.paper_dblp_by_path),
+            pdf_paths[0] if pdf_paths else None,
+        )
+        if pdf_path is not None:
+            vol_dir, _sep, pdf_file = pdf_path.partition("/")
+            number = int(vol_dir[len("Vol-") :])
+            pdf_name = pdf_file[: -len(".pdf")]
+        else:
+            number = next(iter(vm.volumes_by_number))
+            pdf_name = "paper1"
+        params = {
+            "number": str(number),
+            "pdf_name": pdf_name,
+            "qid": "Q1",
+            "upper": str(number + 10),
+            "lower": str(max(0, number - 10)),
+        }
+        paths = {}
+        for route in ws.app.routes:
+            if not isinstance(route, APIRoute) or "GET" not in route.methods:
+                continue
+            if route.path.startswith("/admin"):
+                continue
+            path = re.sub(
+                r"{(\w+)(:\w+)?}",
+                lambda match: params.get(match.group(1), "1"),
+                route.path,
+            )
+            paths[route.path] = path
+        return paths
+
+    def bench_routes(self, vm: VolumeManager, pm: PaperManager):
+        """
+        benchmark every GET route through an in process ASGI client
+        """
+        ws = WebServer(vm, pm, static_directory=self.static_directory)
+        client = TestClient(ws.app)
+        for template, path in self.route_paths(ws, vm, pm).items():
+            times = []
+            status = None
+            for _run in range(self.repeat):
+                start = time.perf_counter()
+                response = client.get(path, follow_redirects=False)
+                times.append(time.perf_counter() - start)
+                status = response.status_code
+            self.record("route", template, times, path=path, status=status)
+
+    def bench_pdf_ranges(
+        self,
+        vm: VolumeManager,
+        pm: PaperManager,
+        concurrency: int = 32,
+        requests: int = 512,
+        chunk_size: int = 64 * 1024,
+    ):
+        """
+        benchmark concurrent range requests of a pdf as issued by pdf viewers
+
+        Args:
+            vm(VolumeManager): the loaded volume manager
+            pm(PaperManager): the loaded paper manager
+            concurrency(int): the number of requests in flight
+            requests(int): the number of requests
+            chunk_size(int): the number of bytes per range
+        """
+        pdf_paths = list(pm.pdf_index.paths_by_pdf_path)
+        if not pdf_paths:
+            return
+        ws = WebServer(vm, pm, static_directory=self.static_directory)
+        path = f"/{pdf_paths[0]}"
+        times = []
+        errors = 0
+
+        async def fetch_ranges():
+            nonlocal errors
+            transport = httpx.ASGITransport(app=ws.app)
+            semaphore = asyncio.Semaphore(concurrency)
+            rng = random.Random(42)
+            async with httpx.AsyncClient(
+                transport=transport, base_url="http://test"
+            ) as client:
+                response = await client.get(path, headers={"Range": "bytes=0-0"})
+                size = int(response.headers["content-range"].rpartition("/")[2])
+
+                async def fetch(start: int):
+                    nonlocal errors
+                    end = min(size - 1, start + chunk_size - 1)
+                    async with semaphore:
+                        start_time = time.perf_counter()
+                        response = await client.get(
+                            path, headers={"Range": f"bytes={start}-{end}"}
+                        )
+                        times.append(time.perf_counter() - start_time)
+                    if (
+                        response.status_code != 206
+                        or len(response.content) != end - start + 1
+                    ):
+                        errors += 1
+
+                await asyncio.gather(
+                    *[fetch(rng.randrange(size)) for _ in range(requests)]
+                )
+
+        start = time.perf_counter()
+        asyncio.run(fetch_ranges())
+        elapsed = time.perf_counter() - start
+        fd_cache = ws.file_delivery.fd_cache
+        self.record(
+            "pdf",
+            f"range x{concurrency}",
+            times,
+            path=path,
+            errors=errors,
+            requests_per_second=requests / elapsed,
+            fd_cache_hits=fd_cache.hits,
+            fd_cache_misses=fd_cache.misses,
+        )
+        fd_cache.clear()
+
+    def run(self) -> dict:
+        """
+        run all benchmarks
+
+        Returns:
+            dict: the machine readable results
+        """
+        self.results = {}
+        self.memory = {}
+        vm, pm = self.bench_loading()
+        self.bench_construction(vm, pm)
+        self.bench_dblp_memory(pm)
+        self.bench_renderers(vm, pm)
+        self.bench_routes(vm, pm)
+        self.bench_pdf_ranges(vm, pm)
+        return {
+            "meta": {
+                "version": Version.version,
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "repeat": self.repeat,
+                "volumes": len(vm.volumes_by_number),
+                "papers": len(pm.papers_by_path),
+            },
+            "results": self.results,
+            "memory": self.memory,
+        }
+
+    @classmethod
+    def compare(
+        cls, baseline: dict, current: dict, threshold: float = 0.2, stat="median"
+    ) -> List[dict]:
+        """
+        compare the given results against a baseline
+
+        Args:
+            baseline(dict): the baseline results
+            current(dict): the current results
+            threshold(float): the relative slowdown that counts as regression
+            stat(str): the statistic to compare
+
+        Returns:
+            list: a comparison row per benchmark found in both results
+        """
+        rows = []
+        base_results = baseline.get("results", {})
+        for key, result in current.get("results", {}).items():
+            base = base_results.get(key)
+            if base is None or not base.get(stat):
+                continue
+            ratio = result[stat] / base[stat]
+            rows.append(
+                {
+                    "benchmark": key,
+                    "baseline": base[stat],
+                    "current": result[stat],
+                    "ratio": ratio,
+                    "regression": ratio > 1 + threshold,
+                }
+            )
+        return rows
+
+    @classmethod
+    def comparison_text(cls, rows: List[dict]) -> str:
+        """
+        get the given comparison rows as text table
+        """
+        lines = [f"{'benchmark':<60}{'baseline':>12}{'current':>12}{'ratio':>8}"]
+        for row in rows:
+            flag = "  REGRESSION" if row["regression"] else ""
+            lines.append(
+                f"{row['benchmark']:<60}{row['baseline']*1000:>10.3f}ms"
+                f"{row['current']*1000:>10.3f}ms{row['ratio']:>8.2f}{flag}"
+            )
+        return "\n".join(lines)
+
+    @classmethod
+    def memory_text(cls, memory: Dict[str, dict]) -> str:
+        """
+        get the given memory results as text table
+        """
+        lines = [
+            f"{'representation':<20}{'papers':>10}{'authors':>10}{'B/paper':>10}{'B/author':>10}"
+        ]
+        for name, entry in memory.items():
+            lines.append(
+                f"{name:<20}{entry['papers']:>10}{entry['authors']:>10}"
+                f"{entry['bytes_per_paper']:>10.0f}{entry['bytes_per_author']:>10.0f}"
+            )
+        return "\n".join(lines)
+
+    @classmethod
+    def load(cls, path: str) -> dict:
+        """
+        load benchmark results from the given json file
+        """
+        with open(path, encoding="utf-8") as json_file:
+            return json.load(json_file)
@@ -0,0 +1,244 @@
+"""
+Created on 2026-10-19
+
+@author: agent
+"""
+
+import json
+import mmap
+import os
+import time
+from typing import Optional, Tuple
+
+import orjson
+
+from ceurspt.ceurws import PaperManager, VolumeManager
+from ceurspt.profiler import TRACER, Profiler
+from ceurspt.suggest import SuggestIndex
+from ceurspt.version import Version
+
+
+class StartupBundle:
+    """
+    the precomputed state of the volume and paper managers so that a
+    server start needs neither to merge the proceedings nor to scan the
+    volume directories nor to index the titles
+
+    the bundle directory holds
+        records.json: the volume records merged with their proceedings, the
+            paper and dblp paper records, the pdf file paths and the
+            entries, words and trigrams of the suggest index
+        suggest.bin: the postings of the suggest index as unsigned ints
+        meta.json: the versions and the fingerprint of the sources
+
+    the records are json on purpose: the managers materialize every record
+    as a dict at startup so a memory mapped table would not be read lazily
+    and decoding packed records in python is slower than one orjson parse -
+    only the postings are binary since they are restored as arrays directly
+
+    the bundle is stale once its version, the ceur-spt version, the json
+    caches or a volume directory or archive changed - a stale bundle is
+    ignored and the managers are loaded from the json caches
+    """
+
+    VERSION = 1
+    # the json caches the managers are loaded from
+    LOD_NAMES = ["volumes", "proceedings", "papers", "papers_dblp"]
+
+    def __init__(self, bundle_dir: str):
+        """
+        constructor
+
+        Args:
+            bundle_dir(str): the directory of the bundle files
+        """
+        self.bundle_dir = bundle_dir
+
+    @classmethod
+    def stat_of(cls, path: str) -> Optional[Tuple[int, int]]:
+        """
+        get the modification time in nanoseconds and the size of the given path
+        """
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    @classmethod
+    def fingerprint(cls, vm: VolumeManager, numbers) -> dict:
+        """
+        get the fingerprint of the sources of the managers
+
+        Args:
+            vm(VolumeManager): the volume manager
+            numbers(Iterable): the volume numbers
+
+        Returns:
+            dict: the stats of the json caches and the modification times of
+            the volume directories or their archives - None if there is neither
+        """
+        lods = {
+            lod_name: cls.stat_of(vm.json_path(lod_name)) for lod_name in cls.LOD_NAMES
+        }
+        volumes = {}
+        if vm.base_path:
+            for number in numbers:
+                vol_dir = f"{vm.base_path}/Vol-{number}"
+                stat = cls.stat_of(vol_dir)
+                if stat is None:
+                    stat = cls.stat_of(f"{vol_dir}.zip")
+                # a directory's size says nothing - its mtime changes
+                # when files are added or removed
+                volumes[str(number)] = stat[0] if stat else None
+        # json round trip so that fingerprints compare equal to stored ones
+        return json.loads(json.dumps({"lods": lods, "volumes": volumes}))
+
+    def read_meta(self) -> Optional[dict]:
+        """
+        read the meta data of the bundle
+
+        Returns:
+            dict: the meta data or None if there is no complete bundle
+        """
+        meta_path = f"{self.bundle_dir}/meta.json"
+        if not os.path.isfile(meta_path):
+            return None
+        with open(meta_path, encoding="utf-8") as meta_file:
+            return json.load(meta_file)
+
+    def staleness(self, vm: VolumeManager) -> Optional[str]:
+        """
+        check whether the bundle can be used for the given volume manager
+
+        Returns:
+            str: the reason why the bundle is stale or None if it is up to date
+        """
+        meta = self.read_meta()
+        if meta is None:
+            return f"no bundle in {self.bundle_dir}"
+        if meta.get("version") != self.VERSION:
+            return f"bundle version {meta.get('version')} is not {self.VERSION}"
+        if meta.get("ceurspt_version") != Version.version:
+            return f"bundle of ceur-spt {meta.get('ceurspt_version')}"
+        if meta.get("base_path") != vm.base_path:
+            return f"bundle of base path {meta.get('base_path')}"
+        fingerprint = self.fingerprint(vm, meta["fingerprint"]["volumes"])
+        if fingerprint["lods"] != meta["fingerprint"]["lods"]:
+            return "json caches changed"
+        if fingerprint["volumes"] != meta["fingerprint"]["volumes"]:
+            return "volume directories changed"
+        return None
+
+    def build(self, vm: VolumeManager, pm: PaperManager) -> dict:
+        """
+        write the bundle of the given loaded managers
+
+        Args:
+            vm(VolumeManager): the volume manager with the loaded volumes
+            pm(PaperManager): the paper manager with the loaded papers
+
+        Returns:
+            dict: the numbers of volumes, papers and pdf files, the bytes
+            and the seconds taken
+        """
+        start = time.perf_counter()
+        os.makedirs(self.bundle_dir, exist_ok=True)
+        # the fingerprint is taken first so that changes while building
+        # make the bundle stale
+        fingerprint = self.fingerprint(vm, vm.volume_records_by_number)
+        # the records as loaded - duplicates and unlinked records included
+        paper_lod = pm.load_lod("papers")
+        paper_dblp_lod = pm.load_lod("papers_dblp")
+        suggest_state, suggest_data = pm.suggest_index.dump()
+        records = {
+            "volumes": list(vm.volume_records_by_number.values()),
+            "papers": paper_lod,
+            "papers_dblp": paper_dblp_lod,
+            "pdf_paths": pm.pdf_index.paths_by_pdf_path,
+            "suggest": suggest_state,
+        }
+        records_data = orjson.dumps(records)
+        meta = {
+            "version": self.VERSION,
+            "ceurspt_version": Version.version,
+            "base_path": vm.base_path,
+            "fingerprint": fingerprint,
+            "volumes": len(vm.volume_records_by_number),
+            "papers": len(paper_lod),
+            "pdf_files": len(pm.pdf_index),
+        }
+        files = {
+            "records.json": records_data,
+            "suggest.bin": suggest_data,
+            # the meta data is replaced last and marks the bundle as complete
+            "meta.json": json.dumps(meta).encode("utf-8"),
+        }
+        meta_path = f"{self.bundle_dir}/meta.json"
+        if os.path.isfile(meta_path):
+            # an interrupted build must not leave old meta data for new files
+            os.remove(meta_path)
+        for name, data in files.items():
+            tmp_path = f"{self.bundle_dir}/{name}.tmp"
+            with open(tmp_path, "wb") as tmp_file:
+                tmp_file.write(data)
+            os.replace(tmp_path, f"{self.bundle_dir}/{name}")
+        return {
+            "volumes": meta["volumes"],
+            "papers": meta["papers"],
+            "pdf_files": meta["pdf_files"],
+            "bytes": len(records_data) + len(suggest_data),
+            "seconds": time.perf_counter() - start,
+        }
+
+    def load(
+        self, vm: VolumeManager, pm: PaperManager, verbose: bool = False
+    ) -> Optional[str]:
+        """
+        load the given managers from the bundle if it is up to date
+
+        Args:
+            vm(VolumeManager): the volume manager to load
+            pm(PaperManager): the paper manager to load
+            verbose(bool): if True show verbose loading information
+
+        Returns:
+            str: the reason why the bundle is stale or None if it was loaded
+        """
+        profiler = Profiler("Loading bundle ...", profile=verbose)
+        with TRACER.span("check bundle"):
+            stale = self.staleness(vm)
+        if stale:
+            return stale
+        with TRACER.span("read bundle"):
+            with open(f"{self.bundle_dir}/records.json", "rb") as records_file:
+                records = orjson.loads(records_file.read())
+        vm.setVolumes(records["volumes"], [])
+        with TRACER.span("restore suggest index"):
+            suggest_path = f"{self.bundle_dir}/suggest.bin"
+            with open(suggest_path, "rb") as suggest_file:
+                if os.fstat(suggest_file.fileno()).st_size == 0:
+                    suggest_index = SuggestIndex.restore(records["suggest"], b"")
+                else:
+                    with mmap.mmap(
+                        suggest_file.fileno(), 0, access=mmap.ACCESS_READ
+                    ) as suggest_map:
+                        suggest_index = SuggestIndex.restore(
+                            records["suggest"], suggest_map
+                        )
+        with TRACER.span("getPapers"):
+            pm.setPapers(
+                vm,
+                records["papers"],
+                records["papers_dblp"],
+                verbose=verbose,
+                pdf_paths=records["pdf_paths"],
+                suggest_index=suggest_index,
+            )
+        duration = profiler.time(
+            f" {len(vm.volumes_by_number)} volumes {len(pm.papers_by_path)} papers"
+        )
+        for manager in [vm, pm]:
+            manager.lod_load_durations["bundle"] = duration
+            manager.lod_load_times["bundle"] = time.time()
+        return None
@@ -8,13 +8,15 @@ import dataclasses
 import json
 import logging
 import os
+import time
 import typing
 import urllib.error
+import urllib.parse
 import urllib.request
 from datetime import datetime
 from html import escape
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
 
 import orjson
 from bs4 import BeautifulSoup, Tag
@@ -22,8 +24,14 @@ from bs4 import BeautifulSoup, Tag
 import ceurspt.ceurws_base
 import ceurspt.models.dblp
 from ceurspt.dataclass_util import DataClassUtil
-from ceurspt.profiler import Profiler
+from ceurspt.file_delivery import PdfPathIndex
+from ceurspt.profiler import TRACER, Profiler
+from ceurspt.string_pool import StringPool
+from ceurspt.suggest import SuggestIndex
 from ceurspt.version import Version
+from ceurspt.volume_index import VolumeIndex
+from ceurspt.volume_table import VolumeTable
+from ceurspt.zip_store import ZIP_STORE
 
 
 logger = logging.getLogger(__name__)
@@ -31,25 +39,65 @@ logger = logging.getLogger(__name__)
 
 class Scholar(ceurspt.models.dblp.DblpScholar):
     """
-    a scholar
+    a scholar as author of a paper
     """
 
+    __slots__ = ("name", "index")
+
+    @classmethod
+    def from_dblp(
+        cls, dblp_scholar: ceurspt.models.dblp.DblpScholar, name: str, index: int
+    ) -> "Scholar":
+        """
+        get the author for the given shared dblp scholar
+
+        Args:
+            dblp_scholar(DblpScholar): the dblp scholar
+            name(str): the name of the author as given in the paper
+            index(int): the position of the author in the paper
+        """
+        return cls(
+            dblp_author_id=dblp_scholar.dblp_author_id,
+            label=dblp_scholar.label,
+            wikidata_id=dblp_scholar.wikidata_id,
+            orcid_id=dblp_scholar.orcid_id,
+            gnd_id=dblp_scholar.gnd_id,
+            name=name,
+            index=index,
+        )
+
 
 class Paper(ceurspt.ceurws_base.Paper):
     """
     a CEUR-WS Paper with it's behavior
+
+    the pdfUrl is stored as pdf_path relative to the CEUR-WS base url
+    e.g. Vol-3262/paper2.pdf
     """
 
+    CEUR_WS_URL = "https://ceur-ws.org/"
+
+    @property
+    def pdfUrl(self) -> Optional[str]:
+        pdf_path = self.__dict__.get("pdf_path")
+        if pdf_path is None or "://" in pdf_path:
+            return pdf_path
+        return f"{Paper.CEUR_WS_URL}{pdf_path}"
+
+    @pdfUrl.setter
+    def pdfUrl(self, pdf_url: Optional[str]):
+        if pdf_url is not None and pdf_url.startswith(Paper.CEUR_WS_URL):
+            pdf_url = pdf_url[len(Paper.CEUR_WS_URL) :]
+        self.pdf_path = pdf_url
+
     def getBasePath(self) -> Optional[str]:
         """
         get the base path to my files
         """
-        if self.pdfUrl:
-            base_path = self.pdfUrl.replace("https://ceur-ws.org/", "")
-            base_path = base_path.replace(".pdf", "")
-            base_path = f"{self.volume.vm.base_path}/{base_path}"
-            if os.path.isfile(f"{base_path}.pdf"):
-                return base_path
+        if self.pdf_path:
+            pdf_file = self.pm.pdf_index.get(self.pdf_path)
+            if pdf_file:
+                return pdf_file[: -len(".pdf")]
         return None
 
     def getContentPathByPostfix(self, postfix: str):
@@ -66,7 +114,7 @@ class Paper(ceurspt.ceurws_base.Paper):
         if base_path is None:
             return None
         text_path = f"{base_path}{postfix}"
-        if os.path.isfile(text_path):
+        if ZIP_STORE.isfile(text_path):
             return text_path
         else:
             return None
@@ -84,10 +132,26 @@ class Paper(ceurspt.ceurws_base.Paper):
         text_path = self.getContentPathByPostfix(postfix)
         content = None
         if text_path:
-            with open(text_path, "r", encoding="utf-8") as text_file:
-                content = text_file.read()
+            content = ZIP_STORE.read_text(text_path)
         return content
 
+    def iterContentByPostfix(
+        self, postfix: str, chunk_size: int = 64 * 1024
+    ) -> Iterator[str]:
+        """
+        get the content for the given postfix in chunks
+
+        Args:
+            postfix(str): the postfix to read
+            chunk_size(int): the number of bytes to read at a time
+
+        Returns:
+            Iterator[str]: the chunks of the content - none if there is no content
+        """
+        text_path = self.getContentPathByPostfix(postfix)
+        if text_path:
+            yield from ZIP_STORE.iter_text(text_path, chunk_size)
+
     def getText(self) -> str:
         """
         get the plain text content of this paper
@@ -95,14 +159,20 @@ class Paper(ceurspt.ceurws_base.Paper):
         text = self.getContentByPostfix("-content.txt")
         return text
 
-    def getPdf(self):
+    def getPdf(self) -> Optional[str]:
         """
         get the PDF file for this paper
+
+        Returns:
+            str: the path of the PDF file or None if it is not available
         """
         base_path = self.getBasePath()
+        if base_path is None:
+            return None
         pdf = f"{base_path}.pdf"
         return pdf
 
+    @TRACER.traced("Paper.getMergedDict")
     def getMergedDict(self) -> dict:
         """
         get the merged dict for this paper
@@ -115,14 +185,14 @@ class Paper(ceurspt.ceurws_base.Paper):
         }
         for key, value in my_dict.items():
             m_dict[f"spt.{key}"] = value
-        pdf_name = self.pdfUrl.replace("https://ceur-ws.org/", "")
+        pdf_name = self.pdf_path
         if pdf_name in self.pm.paper_records_by_path:
             pdf_record = self.pm.paper_records_by_path[pdf_name]
             for key, value in pdf_record.items():
                 m_dict[f"cvb.{key}"] = value
         if pdf_name in self.pm.paper_dblp_by_path:
-            dblp_record = self.pm.paper_dblp_by_path[pdf_name]
-            for key, value in dblp_record.items():
+            dblp_paper = self.pm.paper_dblp_by_path[pdf_name]
+            for key, value in dblp_paper.to_dict().items():
                 m_dict[f"dblp.{key}"] = value
         return m_dict
 
@@ -259,6 +329,16 @@ LAST|P50|{author.wikidata_id}|P1545|"{index+1}"
         Returns:
             str: the smw markup for this paper
         """
+        return "".join(self.iter_smw_markup())
+
+    def iter_smw_markup(self) -> Iterator[str]:
+        """
+        generate my semantic mediawiki markup in chunks - the text
+        is read chunk by chunk instead of being embedded at once
+
+        Returns:
+            Iterator[str]: the chunks of the smw markup for this paper
+        """
         m_dict = self.getMergedDict()
         self.authors = m_dict["cvb.authors"]
         if "dblp.dblp_publication_id" in m_dict:
@@ -280,10 +360,18 @@ LAST|P50|{author.wikidata_id}|P1545|"{index+1}"
 =={self.title}==
 <pdf width="1500px">{self.pdfUrl}</pdf>
 <pre>
-{self.getText()}
+"""
+        yield markup
+        has_text = False
+        for chunk in self.iterContentByPostfix("-content.txt"):
+            has_text = True
+            yield chunk
+        if not has_text:
+            # keep the markup of papers without text unchanged
+            yield "None"
+        yield """
 </pre>
         """
-        return markup
 
     def getAuthorIndex(self, name: str, authors: typing.List[str]):
         """
@@ -299,30 +387,35 @@ LAST|P50|{author.wikidata_id}|P1545|"{index+1}"
         """
         get my authors
 
+        the authors are created once per paper from the shared dblp scholars
+
         Returns:
             list: a list of Scholars
         """
-        m_dict = self.getMergedDict()
-        author_names = m_dict["cvb.authors"].split(",")
-        if "dblp.authors" in m_dict:
+        authors = self.__dict__.get("_authors")
+        if authors is not None:
+            return authors
+        pdf_name = self.pdf_path
+        paper_record = self.pm.paper_records_by_path.get(pdf_name, {})
+        author_names = paper_record.get("authors", "").split(",")
+        dblp_paper = self.pm.paper_dblp_by_path.get(pdf_name)
+        if dblp_paper is not None:
             authors = []
-            dblp_author_records = m_dict["dblp.authors"]
-            for dblp_author_record in dblp_author_records:
-                author = DataClassUtil.dataclass_from_dict(Scholar, dblp_author_record)
-                authors.append(author)
-                author.index = self.getAuthorIndex(author.label, author_names)
-                if author.index < len(author_names):
-                    author.name = author_names[author.index]
+            for dblp_scholar in dblp_paper.authors:
+                index = self.getAuthorIndex(dblp_scholar.label, author_names)
+                if index < len(author_names):
+                    name = author_names[index]
                 else:
-                    author.name = author.label
-            sorted_authors = sorted(authors, key=lambda author: author.index)
+                    name = dblp_scholar.label
+                authors.append(Scholar.from_dblp(dblp_scholar, name, index))
+            authors.sort(key=lambda author: author.index)
         else:
-            sorted_authors = []
-            for author_name in author_names:
-                scholar = Scholar(dblp_author_id=None, label=author_name)
-                scholar.name = author_name
-                sorted_authors.append(scholar)
-        return sorted_authors
+            authors = [
+                Scholar(dblp_author_id=None, label=author_name, name=author_name)
+                for author_name in author_names
+            ]
+        self._authors = authors
+        return authors
 
     def getAuthorBar(self):
         """
@@ -441,8 +534,7 @@ LAST|P50|{author.wikidata_id}|P1545|"{index+1}"
         Parameters:
             soup: The BeautifulSoup object to use for creating new tags.
         """
-        pdf_name = self.pdfUrl.replace("https://ceur-ws.org/", "")
-        pdf_name = pdf_name.replace(".pdf", "")
+        pdf_name = self.pdf_path.replace(".pdf", "")
         # create a list of icons to add to the div
         icon_list = [
             {
@@ -509,13 +601,17 @@ LAST|P50|{author.wikidata_id}|P1545|"{index+1}"
         icon_tag = Volume.create_icon_bar(soup, icon_list=icon_list)
         return icon_tag
 
+    @TRACER.traced("Paper.asHtml")
     def asHtml(self):
         """
         return an html response for this paper
         """
         soup = BeautifulSoup("<html></html>", "html.parser")
-        icon_bar = self.getIconBar(soup)
-        author_bar = self.getAuthorBar()
+        with TRACER.span("icon bar"):
+            icon_bar = self.getIconBar(soup)
+        with TRACER.span("author bar"):
+            author_bar = self.getAuthorBar()
+        volume_table = self.volume.getVolumeTable()
         content = f"""<!DOCTYPE html>
 <html lang="en">
 <head>
@@ -532,9 +628,9 @@ LAST|P50|{author.wikidata_id}|P1545|"{index+1}"
 </td>
 <td style="text-align: right; vertical-align: middle">
 <div style="float:left" id="CEURCCBY"></div>
-{Volume.volLink(self.volume.number,-1)}
+{Volume.volLink(self.volume.number,-1,volume_table)}
 <span class="CEURVOLNR">{Volume.volLink(self.volume.number)}</span>
-{Volume.volLink(self.volume.number,+1)}<br>
+{Volume.volLink(self.volume.number,+1,volume_table)}<br>
 <span class="CEURURN">urn:nbn:de:0074-{self.volume.number}-0</span>
 <p class="unobtrusive copyright" style="text-align: justify">Copyright &copy; {self.volume.date[:4]} for
 the individual papers by the papers' authors. 
@@ -569,6 +665,7 @@ class Volume(ceurspt.ceurws_base.Volume):
         ceurspt.ceurws_base.Volume.__init__(self, **kwargs)
         self.papers = []
 
+    @TRACER.traced("Volume.getMergedDict")
     def getMergedDict(self) -> dict:
         """
         get my merged dict
@@ -592,11 +689,33 @@ class Volume(ceurspt.ceurws_base.Volume):
                 m_dict[f"cvb.{key}"] = value
         return m_dict
 
+    def getVolumeTable(self) -> Optional[VolumeTable]:
+        """
+        get the volume table of my volume manager if any
+        """
+        vm = getattr(self, "vm", None)
+        return vm.volume_table if vm is not None else None
+
     @classmethod
-    def volLinkParts(cls, number: int, inc: int = 0):
+    def volLinkParts(
+        cls, number: int, inc: int = 0, table: Optional[VolumeTable] = None
+    ):
         """
         a relative volume link
+
+        Args:
+            number(int): the volume number
+            inc(int): the relative increment
+            table(VolumeTable): if given step to existing volumes only
+
+        Returns:
+            tuple: href and text or None if there is no such volume
         """
+        target = number + inc
+        if table is not None and inc != 0:
+            target = table.neighbour(number, inc)
+            if target is None:
+                return None
         if inc > 0:
             presymbol = "⫸"
             postsymbol = ""
@@ -606,31 +725,37 @@ class Volume(ceurspt.ceurws_base.Volume):
         else:
             presymbol = ""
             postsymbol = ""
-        href = f"/Vol-{number+inc}.html"
-        text = f"{presymbol}Vol-{number+inc}{postsymbol}"
+        href = f"/Vol-{target}.html"
+        text = f"{presymbol}Vol-{target}{postsymbol}"
         return href, text
 
     @classmethod
-    def volLink(cls, number: int, inc: int = 0) -> str:
+    def volLink(
+        cls, number: int, inc: int = 0, table: Optional[VolumeTable] = None
+    ) -> str:
         """
         get a relative volume link
 
         Args:
             number(int): the volume number
             inc(int): the relative increment
+            table(VolumeTable): if given link to existing volumes only
 
         Returns(str):
             a relative volume link
         """
-        href, text = cls.volLinkParts(number, inc)
-        if number > 0:
+        parts = cls.volLinkParts(number, inc, table)
+        if parts is not None and number > 0:
+            href, text = parts
             link = f"""<a href="{href}">{text}</a>"""
         else:
             link = ""
         return link
 
     @classmethod
-    def volLink_soup_tag(cls, soup, number: int, inc: int = 0) -> str:
+    def volLink_soup_tag(
+        cls, soup, number: int, inc: int = 0, table: Optional[VolumeTable] = None
+    ) -> str:
         """
         get a relative volume link as a soup tag
 
@@ -638,11 +763,15 @@ class Volume(ceurspt.ceurws_base.Volume):
             soup(BeautifulSoup): the soup
             number(int): the volume number
             inc(int): the relative increment
+            table(VolumeTable): if given link to existing volumes only
 
         Returns(str):
-            a relative volume link
+            a relative volume link or None if there is no such volume
         """
-        href, text = cls.volLinkParts(number, inc)
+        parts = cls.volLinkParts(number, inc, table)
+        if parts is None:
+            return None
+        href, text = parts
         link = soup.new_tag("a", href=href)
         link.string = text
         return link
@@ -850,10 +979,11 @@ class Volume(ceurspt.ceurws_base.Volume):
         """
         vol_tag = soup.find("span", class_="CEURVOLNR")
         if vol_tag:
-            prev_link = Volume.volLink_soup_tag(soup, self.number, -1)
+            volume_table = self.getVolumeTable()
+            prev_link = Volume.volLink_soup_tag(soup, self.number, -1, volume_table)
             if prev_link:
                 vol_tag.insert_before(prev_link)
-            next_link = Volume.volLink_soup_tag(soup, self.number, +1)
+            next_link = Volume.volLink_soup_tag(soup, self.number, +1, volume_table)
             if next_link:
                 vol_tag.insert_after(next_link)
 
@@ -893,6 +1023,7 @@ class Volume(ceurspt.ceurws_base.Volume):
         content = soup.prettify(formatter="html")
         return content
 
+    @TRACER.traced("Volume.getHtml")
     def getHtml(self, ext: str = ".pdf", fixLinks: bool = True) -> str:
         """
         get my HTML content
@@ -903,10 +1034,12 @@ class Volume(ceurspt.ceurws_base.Volume):
         """
         index_path = f"{self.vol_dir}/index.html"
         try:
-            with open(index_path, "r", encoding="utf-8") as index_html:
-                content = index_html.read()
-                if fixLinks:
+            with TRACER.span("read index.html"):
+                content = ZIP_STORE.read_text(index_path)
+            if fixLinks:
+                with TRACER.span("parse html"):
                     soup = BeautifulSoup(content, "html.parser")
+                with TRACER.span("fix links"):
                     for element in soup.findAll(["link", "a"]):
                         self.fix_element_tag(element, tag="href", ext=ext)
                     for element in soup.findAll(["image"]):
@@ -916,6 +1049,7 @@ class Volume(ceurspt.ceurws_base.Volume):
                     if first_hr:
                         icon_bar = self.getIconBar(soup)
                         first_hr.insert_before(icon_bar)
+                with TRACER.span("serialize html"):
                     content = soup.prettify(formatter="html")
             return content
         except Exception as ex:
@@ -954,13 +1088,23 @@ class JsonCacheManager:
     a json based cache manager
     """
 
-    def __init__(self, base_url: str = "https://cvb.wikidata.dbis.rwth-aachen.de"):
+    def __init__(
+        self,
+        base_url: str = "https://cvb.wikidata.dbis.rwth-aachen.de",
+        cache_dir: Optional[str] = None,
+    ):
         """
         constructor
 
         base_url(str): the base url to use for the json provider
+        cache_dir(str): the directory of the json cache files - default: ~/.ceurws
         """
         self.base_url = base_url
+        self.cache_dir = cache_dir
+        # duration and wall clock time of the last load by lod name
+        self.lod_load_durations: Dict[str, float] = {}
+        self.lod_load_times: Dict[str, float] = {}
+        self.string_pool = StringPool()
 
     def json_path(self, lod_name: str) -> str:
         """
@@ -972,7 +1116,7 @@ class JsonCacheManager:
         Returns:
             str: the path to the list of dict cache
         """
-        root_path = f"{Path.home()}/.ceurws"
+        root_path = self.cache_dir or f"{Path.home()}/.ceurws"
         os.makedirs(root_path, exist_ok=True)
         json_path = f"{root_path}/{lod_name}.json"
         return json_path
@@ -1041,19 +1185,28 @@ class JsonCacheManager:
         Returns:
             list: the list of dicts
         """
+        profiler = Profiler(f"load_lod {lod_name}", profile=False)
+        lod = None
         json_path = self.json_path(lod_name)
         if prefer_local and self._is_valid_local(json_path):
             try:
                 with open(json_path, encoding="utf-8") as json_file:
-                    json_str = json_file.read()
-                    return orjson.loads(json_str)
+                    with TRACER.span("read", path=json_path):
+                        json_str = json_file.read()
+                    with TRACER.span("decode"):
+                        lod = orjson.loads(json_str)
             except Exception as ex:
                 # fall through to remote on local read error
                 logging.warning(
                     f"Local cache {json_path} unreadable ({ex}); "
                     f"falling back to remote"
                 )
-        return self._fetch_remote(lod_name)
+        if lod is None:
+            with TRACER.span("fetch remote"):
+                lod = self._fetch_remote(lod_name)
+        self.lod_load_durations[lod_name] = profiler.time()
+        self.lod_load_times[lod_name] = time.time()
+        return lod
 
     def store(self, lod_name: str, lod: list, allow_empty: bool = False):
         """
@@ -1079,24 +1232,79 @@ class JsonCacheManager:
         with open(json_path, "wb") as json_file:
             json_file.write(orjson.dumps(lod))
 
+    @classmethod
+    def is_trusted(cls, record: dict, record_types: Dict[str, tuple]) -> bool:
+        """
+        check that the given record has the expected value types so that
+        objects can be constructed from it without generic coercion
+
+        Args:
+            record(dict): the record to check
+            record_types(dict): the allowed types by key
+
+        Returns:
+            bool: True if all keys are present with an allowed type
+        """
+        for key, types in record_types.items():
+            if key not in record or not isinstance(record[key], types):
+                return False
+        return True
+
 
 class VolumeManager(JsonCacheManager):
     """
     manage all volumes
     """
 
-    def __init__(self, base_path: str, base_url: str):
+    # the value types of volume records that allow fast construction
+    RECORD_TYPES = {
+        "number": (int,),
+        "title": (str, type(None)),
+        "pubDate": (str, type(None)),
+        "acronym": (str, type(None)),
+    }
+    # the keys of volume and proceedings records with values repeating across volumes
+    INTERN_KEYS = [
+        "lang",
+        "location",
+        "country",
+        "countryWikidataId",
+        "region",
+        "city",
+        "cityWikidataId",
+        "conference",
+        "editors",
+        "submittedBy",
+        "seealso",
+        "published",
+        "pubDate",
+        "desc",
+        "h1",
+        "language_of_work_or_name",
+        "language_of_work_or_nameLabel",
+        "eventSeries",
+        "eventSeriesLabel",
+        "eventSeriesOrdinal",
+        "publication_date",
+    ]
+    # the same keys of the proceedings values merged into volume records
+    WD_INTERN_KEYS = list(map("wd.{}".format, INTERN_KEYS))
+
+    def __init__(self, base_path: str, base_url: str, cache_dir: Optional[str] = None):
         """
         initialize me with the given base_path
 
         Args:
             base_path(str): the path to my files
             base_url(str): the url of the RESTFul metadata service
+            cache_dir(str): the directory of the json cache files
         """
-        JsonCacheManager.__init__(self, base_url=base_url)
+        JsonCacheManager.__init__(self, base_url=base_url, cache_dir=cache_dir)
         self.base_path = base_path
         self.volumes_by_number: Dict[int, Volume] = {}
         self.volume_records_by_number: Dict[int, dict] = {}
+        self.volume_table = VolumeTable()
+        self.volume_index = VolumeIndex(self.volume_table, {})
 
     def head_table_html(self) -> str:
         """ """
@@ -1162,24 +1370,9 @@ See end of the page for contact details and <a href="https://ceur-ws.org/#IMPRES
      {self.head_table_html()}
      <div>
 """
-        # prepare the indexing
-        # get the volumes as a list from 1 - top e.g. 3365
-        volumes = list(self.volumes_by_number.values())
-        # reverse the list
-        volumes.reverse()
-        # make sure upper and lower values are valid
-        if upper is None:
-            upper = volumes[0].number
-        if lower is None:
-            lower = 1
-        # loop over the reversed list
-        for vol_index in range(len(volumes)):
-            vol = volumes[vol_index]
+        # get the volumes from upper down to lower
+        for vol in self.volume_table.range(lower, upper, descending=True):
             vol_number = vol.number
-            if vol_number > upper:
-                continue
-            if vol_number < lower:
-                break
             if isinstance(vol.title, str):
                 vol_title = escape(vol.title)
             else:
@@ -1196,19 +1389,105 @@ See end of the page for contact details and <a href="https://ceur-ws.org/#IMPRES
 </html>"""
         return html
 
+    def volume_group_html(self, vol: Volume) -> str:
+        """
+        get the tbody block of the given volume for the alternative index
+
+        Args:
+            vol(Volume): the volume
+
+        Returns:
+            str: the html of the volume group
+        """
+        vol_number = vol.number
+        if isinstance(vol.title, str):
+            vol_title = escape(vol.title)
+        else:
+            vol_title = "Title missing (Might be one of the empty volumes)"
+        vol_record = self.getVolumeRecord(vol_number) or {}
+        h1 = vol_record.get("h1")
+        year = self.volume_index.year_by_number.get(vol_number)
+        editors = vol_record.get("editors")
+        submitter = vol_record.get("submittedBy")
+        published = vol_record.get("published")
+        urn = vol_record.get("urn")
+        html = f"""
+<tbody class="VOLGROUP" data-vol="{vol_number}" data-year="{year}">
+ <tr><th colspan="2">&nbsp;</th></tr>
+ <tr>
+    <td align="left" bgcolor="#DCDBD7"><b><a name="Vol-{vol_number}">Vol-{vol_number}</a></b></td>
+    <td align="left" bgcolor="#DCDBD7"><b><font color="#000000"><a href="/Vol-{vol_number}/">{h1}</a></font></b></td>
+ </tr>
+ <tr>
+    <td bgcolor="#FFFFFF">{vol_title}<br>
+       Edited by: {editors}<br>
+       Submitted by: {submitter}<br>
+       Published on CEUR-WS: {published}<br>
+       ONLINE: <a href="/Vol-{vol_number}/">https://ceur-ws.org/Vol-{vol_number}/</a><br>
+       URN: <a href="https://nbn-resolving.org/{urn}">{urn}</a><br>
+       ARCHIVE: <a href="https://ceur-ws.org/ftp-dir/Vol-{vol_number}.zip">https://ceur-ws.org/ftp-dir/Vol-{vol_number}.zip</a>
+    </td>
+ </tr>
+</tbody>
+"""
+        return html
+
+    def index_alt_fragment(self, page: dict) -> str:
+        """
+        get the volume groups of the given index page as html fragment
+
+        Args:
+            page(dict): the page as returned by VolumeIndex.query
+
+        Returns:
+            str: the html of the volume groups
+        """
+        return "".join(self.volume_group_html(vol) for vol in page["volumes"])
+
     def index_alt_html(
-            self, upper: Optional[int] = None, lower: Optional[int] = None
+        self,
+        upper: Optional[int] = None,
+        lower: Optional[int] = None,
+        year: Optional[int] = None,
+        acronym: Optional[str] = None,
+        series: Optional[str] = None,
+        cursor: Optional[int] = None,
+        limit: int = 50,
     ) -> str:
         """
-        return an index going from the given upper volume number down to the given lower volume number
+        return a filtered index going from the given upper volume number down to the given lower volume number
+
+        only the first page of the matching volumes is rendered - the filter bar
+        fetches further pages from /index_alt/volumes.html
 
         Args:
             upper(int): upper volume number to start with
             lower(int): lower volume number to end with
+            year(int): the publication year to filter by
+            acronym(str): the event acronym to filter by
+            series(str): the event series to filter by
+            cursor(int): continue with the volumes numbered below the cursor
+            limit(int): the number of volumes per page
 
         Returns:
             html code for index
         """
+        filters = {
+            "year": year,
+            "lower": lower,
+            "upper": upper,
+            "acronym": acronym,
+            "series": series,
+        }
+        page = self.volume_index.query(cursor=cursor, limit=limit, **filters)
+        params = {key: value for key, value in filters.items() if value is not None}
+        params.update({"cursor": page["next_cursor"], "limit": limit})
+        more_href = escape(f"/index_alt.html?{urllib.parse.urlencode(params)}")
+        year_options = "".join(
+            f'<option value="{option}"{" selected" if option == year else ""}>{option} ({count})</option>'
+            for option, count in self.volume_index.year_counts().items()
+        )
+        more_style = "" if page["next_cursor"] is not None else ' style="display:none"'
         html = """<!DOCTYPE HTML PUBLIC "-//W3C//DTD HTML 4.01 Transitional//EN"
    "https://www.w3.org/TR/html4/loose.dtd">
 <html>
@@ -1237,23 +1516,12 @@ See end of the page for contact details and <a href="https://ceur-ws.org/#IMPRES
          font-size: small;
          color: #404040;
       }
-      #VOLFILTER fieldset {
-         border: 0;
-         margin: 0;
-         padding: 0;
-         display: inline;
-      }
-      #VOLFILTER label.mode {
-         margin-right: 14px;
-         font-weight: bold;
-         cursor: pointer;
-      }
       #VOLFILTER .controls {
          display: inline-block;
-         margin-left: 18px;
+         margin-right: 18px;
       }
       #VOLFILTER select,
-      #VOLFILTER input[type="number"] {
+      #VOLFILTER input {
          font-family: arial, sans-serif;
          font-size: small;
          padding: 2px 4px;
@@ -1262,6 +1530,7 @@ See end of the page for contact details and <a href="https://ceur-ws.org/#IMPRES
          color: #404040;
       }
       #VOLFILTER input[type="number"] { width: 6em; }
+      #VOLFILTER input[type="text"] { width: 9em; }
       #VOLFILTER .sep { margin: 0 6px; color: #777777; }
       #VOLFILTER .count {
          float: right;
@@ -1269,7 +1538,8 @@ See end of the page for contact details and <a href="https://ceur-ws.org/#IMPRES
          font-size: smaller;
          padding-top: 2px;
       }
-      #VOLFILTER button.reset {
+      #VOLFILTER button,
+      #VOLMORE {
          margin-left: 14px;
          font-family: arial, sans-serif;
          font-size: x-small;
@@ -1279,11 +1549,9 @@ See end of the page for contact details and <a href="https://ceur-ws.org/#IMPRES
          color: #404040;
          cursor: pointer;
       }
-      #VOLFILTER button.reset:hover { color: #000080; }
-      #VOLFILTER .hidden-controls { display: none !important; }
-      .VOLGROUP.filtered-out { display: none; }
+      #VOLFILTER button:hover,
+      #VOLMORE:hover { color: #000080; }
       #NO-RESULTS {
-         display: none;
          width: 97%;
          padding: 12px;
          background-color: #FFFFFF;
@@ -1300,202 +1568,103 @@ See end of the page for contact details and <a href="https://ceur-ws.org/#IMPRES
   <body>
      {self.head_table_html()}
      <div>
-       <!-- ====================================================================== -->
+   <!-- ====================================================================== -->
    <!-- FILTER BAR                                                             -->
    <!-- ====================================================================== -->
-   <!-- Filter options are derived automatically from the data-year and        -->
-   <!-- data-vol attributes on each .VOLGROUP tbody below. Editors do NOT      -->
-   <!-- need to touch this bar when adding a new volume.                       -->
+   <!-- The volumes are filtered and paginated on the server: the form works   -->
+   <!-- without javascript, the script below only fetches the matching slice   -->
+   <!-- from /index_alt/volumes.html instead of reloading the page.            -->
    <!-- ====================================================================== -->
-   <div id="VOLFILTER">
-      <span class="count" id="VOLCOUNT">&nbsp;</span>
-      <fieldset>
-         <label class="mode"><input type="radio" name="filtermode" value="all" checked> All</label>
-         <label class="mode"><input type="radio" name="filtermode" value="year"> By year</label>
-         <label class="mode"><input type="radio" name="filtermode" value="range"> By volume range</label>
-      </fieldset>
-
-      <span class="controls" id="YEAR-CONTROLS">
+   <form id="VOLFILTER" method="get" action="/index_alt.html">
+      <span class="count" id="VOLCOUNT">{len(page["volumes"])} of {page["total"]} volumes shown</span>
+      <span class="controls">
          Year:
-         <select id="YEAR-SELECT"></select>
+         <select name="year" id="YEAR-SELECT"><option value="">all</option>{year_options}</select>
       </span>
-
-      <span class="controls" id="RANGE-CONTROLS">
-         Vol-<input type="number" id="RANGE-FROM" min="1" step="1" placeholder="from">
+      <span class="controls">
+         Vol-<input type="number" name="lower" min="1" step="1" placeholder="{self.volume_table.first}" value="{lower or ''}">
          <span class="sep">to</span>
-         Vol-<input type="number" id="RANGE-TO" min="1" step="1" placeholder="to">
+         Vol-<input type="number" name="upper" min="1" step="1" placeholder="{self.volume_table.last}" value="{upper or ''}">
       </span>
+      <span class="controls">
+         Acronym: <input type="text" name="acronym" value="{escape(acronym or '')}">
+      </span>
+      <span class="controls">
+         Event series: <input type="text" name="series" value="{escape(series or '')}">
+      </span>
+      <input type="hidden" name="limit" value="{limit}">
+      <button type="submit">Filter</button>
+      <button type="button" id="VOLRESET">Reset</button>
+   </form>
 
-      <button type="button" class="reset" id="VOLRESET">Reset</button>
-   </div>
-
-   <div id="NO-RESULTS">No volumes match the current filter.</div>
+   <div id="NO-RESULTS"{' style="display:none"' if page["total"] else ''}>No volumes match the current filter.</div>
 
-   <!-- ====================================================================== -->
-   <!-- VOLUMES TABLE                                                          -->
-   <!-- ====================================================================== -->
-   <!-- MAINTAINER NOTE: to add a volume, copy one <tbody class="VOLGROUP"> -->
-   <!-- block below. On the header <tr>, set:                                  -->
-   <!--   data-vol="NNNN"   (the volume number, integer)                       -->
-   <!--   data-year="YYYY"  (the publication year)                             -->
-   <!-- Everything else (filter dropdown, count, range bounds) updates         -->
-   <!-- automatically on page load. No JS edits required.                      -->
-   <!-- ====================================================================== -->
    <TABLE id="MAINTABLE" cellspacing=0 cellpadding=3 border=0 width="97%">
-"""
-        # prepare the indexing
-        # get the volumes as a list from 1 - top e.g. 3365
-        volumes: list[Volume] = list(self.volumes_by_number.values())
-        # reverse the list
-        volumes.reverse()
-        # make sure upper and lower values are valid
-        if upper is None:
-            upper = volumes[0].number
-        if lower is None:
-            lower = 1
-        # loop over the reversed list
-        for vol_index in range(len(volumes)):
-            vol = volumes[vol_index]
-            vol_number = vol.number
-            if vol_number > upper:
-                continue
-            if vol_number < lower:
-                break
-            if isinstance(vol.title, str):
-                vol_title = escape(vol.title)
-            else:
-                vol_title = "Title missing (Might be one of the empty volumes)"
-            if vol_title is None:
-                pass
-            vol_record = vol.getMergedDict()
-            h1 = vol_record.get("cvb.h1")
-            year = vol_record.get("cvb.year")
-            editors = vol_record.get("cvb.editors")
-            submitter = vol_record.get("cvb.submittedBy")
-            published = vol_record.get("cvb.published")
-            urn = vol_record.get("cvb.urn")
-            html += f"""
-<tbody class="VOLGROUP" data-vol="{vol_number}" data-year="{year}">
- <tr><th colspan="2">&nbsp;</th></tr>
- <tr>
-    <td align="left" bgcolor="#DCDBD7"><b><a name="Vol-{vol_number}">Vol-{vol_number}</a></b></td>
-    <td align="left" bgcolor="#DCDBD7"><b><font color="#000000"><a href="/Vol-{vol_number}/">{h1}</a></font></b></td>
- </tr>
- <tr>
-    <td bgcolor="#FFFFFF">{vol_title}<br>
-       Edited by: {editors}<br>
-       Submitted by: {submitter}<br>
-       Published on CEUR-WS: {published}<br>
-       ONLINE: <a href="/Vol-{vol_number}/">https://ceur-ws.org/Vol-{vol_number}/</a><br>
-       URN: <a href="https://nbn-resolving.org/{urn}">{urn}</a><br>
-       ARCHIVE: <a href="https://ceur-ws.org/ftp-dir/Vol-{vol_number}.zip">https://ceur-ws.org/ftp-dir/Vol-{vol_number}.zip</a>
-    </td>
- </tr>
-</tbody>
-"""
-        html += """ 
+{self.index_alt_fragment(page)}
    </TABLE>
+   <a id="VOLMORE" href="{more_href}"{more_style}>more volumes</a>
       </div>
-  
+"""
+        html += """
    <!-- ====================================================================== -->
-   <!-- Filter script — plain JS, no dependencies, <2KB.                       -->
-   <!-- Reads data-vol and data-year from every tbody.VOLGROUP and             -->
-   <!-- hides/shows them based on the selected filter mode.                    -->
+   <!-- Filter script — plain JS, no dependencies.                             -->
+   <!-- Fetches the matching slice of volumes as html fragment; the total and  -->
+   <!-- the cursor of the next slice come in the X-Total-Count and             -->
+   <!-- X-Next-Cursor response headers.                                        -->
    <!-- ====================================================================== -->
    <script type="text/javascript">
    (function () {
-      var groups   = Array.prototype.slice.call(document.querySelectorAll('tbody.VOLGROUP'));
-      var yearSel  = document.getElementById('YEAR-SELECT');
-      var yearBox  = document.getElementById('YEAR-CONTROLS');
-      var rangeBox = document.getElementById('RANGE-CONTROLS');
-      var rFrom    = document.getElementById('RANGE-FROM');
-      var rTo      = document.getElementById('RANGE-TO');
+      var form     = document.getElementById('VOLFILTER');
+      var table    = document.getElementById('MAINTABLE');
       var countEl  = document.getElementById('VOLCOUNT');
       var noRes    = document.getElementById('NO-RESULTS');
+      var more     = document.getElementById('VOLMORE');
       var resetBtn = document.getElementById('VOLRESET');
-      var modes    = document.querySelectorAll('input[name="filtermode"]');
-
-      // Collect years and vol bounds from the data-* attributes.
-      var years = {}, minVol = Infinity, maxVol = -Infinity;
-      groups.forEach(function (g) {
-         var y = parseInt(g.getAttribute('data-year'), 10);
-         var v = parseInt(g.getAttribute('data-vol'),  10);
-         if (!isNaN(y)) years[y] = true;
-         if (!isNaN(v)) {
-            if (v < minVol) minVol = v;
-            if (v > maxVol) maxVol = v;
-         }
-      });
-
-      // Populate the year dropdown, newest first.
-      var yearList = Object.keys(years).map(Number).sort(function (a, b) { return b - a; });
-      yearList.forEach(function (y) {
-         var o = document.createElement('option');
-         o.value = String(y);
-         o.textContent = String(y);
-         yearSel.appendChild(o);
-      });
-
-      // Seed range inputs with the full known range as placeholders.
-      rFrom.placeholder = String(minVol);
-      rTo.placeholder   = String(maxVol);
-
-      function currentMode() {
-         for (var i = 0; i < modes.length; i++) if (modes[i].checked) return modes[i].value;
-         return 'all';
+      var cursor   = null;
+      var shown    = table.querySelectorAll('tbody.VOLGROUP').length;
+
+      function params() {
+         var query = [];
+         Array.prototype.forEach.call(form.elements, function (el) {
+            if (el.name && el.value !== '') {
+               query.push(encodeURIComponent(el.name) + '=' + encodeURIComponent(el.value));
+            }
+         });
+         return query;
       }
 
-      function setControlVisibility(mode) {
-         yearBox.classList.toggle('hidden-controls',  mode !== 'year');
-         rangeBox.classList.toggle('hidden-controls', mode !== 'range');
+      function load(append) {
+         var query = params();
+         if (append && cursor !== null) query.push('cursor=' + cursor);
+         fetch('/index_alt/volumes.html?' + query.join('&'))
+            .then(function (response) {
+               var total = parseInt(response.headers.get('X-Total-Count'), 10);
+               var next  = response.headers.get('X-Next-Cursor');
+               return response.text().then(function (fragment) {
+                  if (!append) { table.innerHTML = ''; shown = 0; }
+                  table.insertAdjacentHTML('beforeend', fragment);
+                  shown = table.querySelectorAll('tbody.VOLGROUP').length;
+                  cursor = next ? parseInt(next, 10) : null;
+                  countEl.textContent = shown + ' of ' + total + ' volumes shown';
+                  noRes.style.display = (total === 0) ? 'block' : 'none';
+                  more.style.display  = (cursor === null) ? 'none' : 'inline';
+               });
+            });
       }
 
-      function apply() {
-         var mode = currentMode();
-         setControlVisibility(mode);
-
-         var selYear = parseInt(yearSel.value, 10);
-         var fromV   = parseInt(rFrom.value, 10); if (isNaN(fromV)) fromV = -Infinity;
-         var toV     = parseInt(rTo.value,   10); if (isNaN(toV))   toV   =  Infinity;
-         if (fromV > toV) { var t = fromV; fromV = toV; toV = t; }
-
-         var shown = 0;
-         groups.forEach(function (g) {
-            var y = parseInt(g.getAttribute('data-year'), 10);
-            var v = parseInt(g.getAttribute('data-vol'),  10);
-            var keep = true;
-            if (mode === 'year')  keep = (y === selYear);
-            if (mode === 'range') keep = (v >= fromV && v <= toV);
-            g.classList.toggle('filtered-out', !keep);
-            if (keep) shown++;
-         });
-
-         countEl.textContent = shown + ' of ' + groups.length + ' volumes shown';
-         noRes.style.display = (shown === 0) ? 'block' : 'none';
-      }
+      var href = more.getAttribute('href');
+      var match = /cursor=(\\d+)/.exec(href);
+      if (match && more.style.display !== 'none') cursor = parseInt(match[1], 10);
 
-      // Wire events.
-      modes.forEach(function (m) { m.addEventListener('change', apply); });
-      yearSel.addEventListener('change', function () {
-         // Auto-switch to "year" mode when user picks a year.
-         document.querySelector('input[name="filtermode"][value="year"]').checked = true;
-         apply();
-      });
-      [rFrom, rTo].forEach(function (el) {
-         el.addEventListener('input', function () {
-            document.querySelector('input[name="filtermode"][value="range"]').checked = true;
-            apply();
-         });
-      });
+      form.addEventListener('submit', function (event) { event.preventDefault(); load(false); });
+      form.addEventListener('change', function () { load(false); });
+      more.addEventListener('click', function (event) { event.preventDefault(); load(true); });
       resetBtn.addEventListener('click', function () {
-         document.querySelector('input[name="filtermode"][value="all"]').checked = true;
-         yearSel.selectedIndex = 0;
-         rFrom.value = '';
-         rTo.value   = '';
-         apply();
+         Array.prototype.forEach.call(form.elements, function (el) {
+            if (el.name && el.name !== 'limit') el.value = '';
+         });
+         load(false);
       });
-
-      apply();
    })();
    </script>
   </body>
@@ -1522,6 +1691,49 @@ See end of the page for contact details and <a href="https://ceur-ws.org/#IMPRES
         else:
             return None
 
+    def createVolume(self, volume_record: dict, fast: bool = True) -> Volume:
+        """
+        create a volume from the given record
+
+        Args:
+            volume_record(dict): the volume record
+            fast(bool): if True skip the generic LinkML coercion for trusted records
+
+        Returns:
+            Volume: the volume
+        """
+        vol_number = volume_record["number"]
+        title = volume_record["title"]
+        pub_date_str = volume_record["pubDate"]
+        if pub_date_str:
+            pub_date = datetime.fromisoformat(pub_date_str).date()
+        else:
+            pub_date = None
+        acronym = volume_record["acronym"]
+        if fast and self.is_trusted(volume_record, self.RECORD_TYPES):
+            # the values __post_init__ would coerce to - XSDDate is an iso string
+            volume = DataClassUtil.fast_construct(
+                Volume,
+                number=vol_number,
+                title=title,
+                date=pub_date.isoformat() if pub_date else None,
+                acronym=acronym,
+                papers=[],
+            )
+        else:
+            volume = Volume(
+                number=vol_number, title=title, date=pub_date, acronym=acronym
+            )
+            volume.number = int(volume.number)
+        volume.vm = self
+        vol_dir = f"{self.base_path}/Vol-{vol_number}"
+        if os.path.isdir(vol_dir):
+            volume.vol_dir = vol_dir
+        else:
+            # the path of the directory in Vol-N.zip if the volume is archived
+            volume.vol_dir = ZIP_STORE.volume_dir(vol_dir)
+        return volume
+
     def getVolumes(self, verbose: bool = False):
         """
         get my volumes
@@ -1532,81 +1744,111 @@ See end of the page for contact details and <a href="https://ceur-ws.org/#IMPRES
         profiler = Profiler("Loading volumes", profile=verbose)
         volume_lod = self.load_lod("volumes")
         proceedings_lod = self.load_lod("proceedings")
-        self.volumes_by_number = {}
-        self.volume_records_by_number = {}
-        for volume_record in volume_lod:
-            vol_number = volume_record["number"]
-            self.volume_records_by_number[vol_number] = volume_record
-            title = volume_record["title"]
-            pub_date_str = volume_record["pubDate"]
-            if pub_date_str:
-                pub_date = datetime.fromisoformat(pub_date_str).date()
-            else:
-                pub_date = None
-            acronym = volume_record["acronym"]
-            volume = Volume(
-                number=vol_number, title=title, date=pub_date, acronym=acronym
-            )
-            volume.vm = self
-            volume.number = int(volume.number)
-            vol_dir = f"{self.base_path}/Vol-{vol_number}"
-            if os.path.isdir(vol_dir):
-                volume.vol_dir = vol_dir
-            else:
-                volume.vol_dir = None
-            self.volumes_by_number[vol_number] = volume
-        for proc_record in proceedings_lod:
-            number = proc_record["sVolume"]
-            if not number:
-                print(f"Warning: {proc_record} has no volume number")
-            else:
-                if number not in self.volume_records_by_number:
-                    logger.debug(
-                        "Volumes and Proceedings cache are out of sync! Volume number: {number} not found in volumes"
-                    )
-                    continue
-                volume_record = self.volume_records_by_number[number]
-                volume = self.volumes_by_number[number]
-                for key, value in proc_record.items():
-                    volume_record[f"wd.{key}"] = value
-                map_pairs = [
-                    ("item", "wikidataid"),
-                    ("itemDescription", "description"),
-                    ("dblpProceedingsId", "dblp"),
-                    ("described_at_URL", "url"),
-                    ("ppnId", "k10plus"),
-                    ("URN_NBN", "urn"),
-                ]
-                for wd_id, attr in map_pairs:
-                    wd_key = f"wd.{wd_id}"
-                    if wd_key in volume_record:
-                        value = volume_record[wd_key]
-                        if isinstance(value, str):
-                            value = value.replace("http://www.wikidata.org/entity/", "")
-                            value = value.replace("https://www.wikidata.org/wiki/", "")
-                        setattr(volume, attr, value)
-                        pass
+        self.setVolumes(volume_lod, proceedings_lod)
         msg = f"{len(self.volumes_by_number)} volumes"
         profiler.time(msg)
 
+    def setVolumes(self, volume_lod: list, proceedings_lod: list):
+        """
+        create my volumes from the given records and merge the proceedings
+
+        Args:
+            volume_lod(list): the volume records - possibly merged already
+            proceedings_lod(list): the proceedings records to merge
+        """
+        self.volumes_by_number = {}
+        self.volume_records_by_number = {}
+        # a new pool per load so that a reload does not keep stale strings
+        self.string_pool = StringPool()
+        with TRACER.span("build volumes"):
+            for volume_record in volume_lod:
+                self.string_pool.intern_record(volume_record, self.INTERN_KEYS)
+                # records merged with their proceedings before
+                self.string_pool.intern_record(volume_record, self.WD_INTERN_KEYS)
+                vol_number = volume_record["number"]
+                self.volume_records_by_number[vol_number] = volume_record
+                volume = self.createVolume(volume_record)
+                self.volumes_by_number[vol_number] = volume
+                self.applyProceedings(volume_record, volume)
+        with TRACER.span("merge proceedings"):
+            for proc_record in proceedings_lod:
+                self.string_pool.intern_record(proc_record, self.INTERN_KEYS)
+                number = proc_record["sVolume"]
+                if not number:
+                    print(f"Warning: {proc_record} has no volume number")
+                else:
+                    if number not in self.volume_records_by_number:
+                        logger.debug(
+                            "Volumes and Proceedings cache are out of sync! Volume number: {number} not found in volumes"
+                        )
+                        continue
+                    volume_record = self.volume_records_by_number[number]
+                    volume = self.volumes_by_number[number]
+                    for key, value in proc_record.items():
+                        volume_record[f"wd.{key}"] = value
+                    self.applyProceedings(volume_record, volume)
+        self.volume_table = VolumeTable(self.volumes_by_number.values())
+        self.volume_index = VolumeIndex(
+            self.volume_table, self.volume_records_by_number
+        )
+
+    def applyProceedings(self, volume_record: dict, volume: Volume):
+        """
+        set the attributes of the given volume from the proceedings
+        values merged into its record
+
+        Args:
+            volume_record(dict): the volume record with the wd. prefixed values
+            volume(Volume): the volume to set the attributes of
+        """
+        map_pairs = [
+            ("item", "wikidataid"),
+            ("itemDescription", "description"),
+            ("dblpProceedingsId", "dblp"),
+            ("described_at_URL", "url"),
+            ("ppnId", "k10plus"),
+            ("URN_NBN", "urn"),
+        ]
+        for wd_id, attr in map_pairs:
+            wd_key = f"wd.{wd_id}"
+            if wd_key in volume_record:
+                value = volume_record[wd_key]
+                if isinstance(value, str):
+                    value = value.replace("http://www.wikidata.org/entity/", "")
+                    value = value.replace("https://www.wikidata.org/wiki/", "")
+                setattr(volume, attr, value)
+
 
 class PaperManager(JsonCacheManager):
     """
     manage all papers
     """
 
-    def __init__(self, base_url: str):
+    # the value types of paper records that allow fast construction
+    RECORD_TYPES = {
+        "id": (str,),
+        "title": (str, type(None)),
+        "pdf_name": (str,),
+    }
+    # the keys of paper records with values repeating across papers
+    INTERN_KEYS = ["vol_number", "pdf_name", "type", "fail"]
+
+    def __init__(self, base_url: str, cache_dir: Optional[str] = None):
         """
         constructor
 
         Args:
             base_url(str): the url of the RESTFul metadata service
+            cache_dir(str): the directory of the json cache files
         """
-        JsonCacheManager.__init__(self, base_url)
+        JsonCacheManager.__init__(self, base_url, cache_dir=cache_dir)
         self.papers_by_id: Dict[str, Paper] = {}
         self.papers_by_path: Dict[str, Paper] = {}
         self.paper_records_by_path: Dict[str, dict] = {}
-        self.paper_dblp_by_path: Dict[str, dict] = {}
+        self.paper_dblp_by_path: Dict[str, ceurspt.models.dblp.DblpPaper] = {}
+        self.dblp_scholars: Dict[str, ceurspt.models.dblp.DblpScholar] = {}
+        self.pdf_index = PdfPathIndex()
+        self.suggest_index = SuggestIndex()
 
     def getPaper(self, number: int, pdf_name: str):
         """
@@ -1641,6 +1883,51 @@ class PaperManager(JsonCacheManager):
         ]
         return volume_papers
 
+    @classmethod
+    def pdfPath(cls, paper_record: dict) -> str:
+        """
+        get the pdf path e.g. Vol-3262/paper2.pdf of the given paper record
+        """
+        return f"Vol-{paper_record['vol_number']}/{paper_record['pdf_name']}"
+
+    def createPaper(
+        self, paper_record: dict, volume: Optional[Volume], fast: bool = True
+    ) -> Paper:
+        """
+        create a paper from the given record
+
+        Args:
+            paper_record(dict): the paper record
+            volume(Volume): the volume of the paper
+            fast(bool): if True skip the generic LinkML coercion for trusted records
+
+        Returns:
+            Paper: the paper
+        """
+        pdf_path = self.pdfPath(paper_record)
+        if (
+            fast
+            and self.is_trusted(paper_record, self.RECORD_TYPES)
+            and (volume is None or isinstance(volume, Volume))
+        ):
+            paper = DataClassUtil.fast_construct(
+                Paper,
+                id=paper_record["id"],
+                title=paper_record["title"],
+                pdf_path=pdf_path,
+                volume=volume,
+            )
+        else:
+            paper = Paper(
+                id=paper_record["id"],
+                title=paper_record["title"],
+                # authors=paper_record["authors"],
+                pdfUrl=f"{Paper.CEUR_WS_URL}{pdf_path}",
+                volume=volume,
+            )
+        paper.pm = self
+        return paper
+
     def getPapers(self, vm: VolumeManager, verbose: bool = False):
         """
         get all papers
@@ -1649,47 +1936,89 @@ class PaperManager(JsonCacheManager):
             vm: VolumeManager
             verbose(bool): if True show verbose loading information
         """
-        profiler = Profiler("Loading papers ...", profile=verbose)
-        paper_lod = self.load_lod("papers")
-        msg = f"{len(paper_lod)} papers"
-        profiler.time(msg)
-        profiler = Profiler("Loading dblp paper metadata ...", profile=verbose)
-        paper_dblp_lod = self.load_lod("papers_dblp")
-        msg = f"{len(paper_dblp_lod)} dblp indexed papers"
-        profiler.time(msg)
+        with TRACER.span("getPapers"):
+            profiler = Profiler("Loading papers ...", profile=verbose)
+            paper_lod = self.load_lod("papers")
+            msg = f"{len(paper_lod)} papers"
+            profiler.time(msg)
+            profiler = Profiler("Loading dblp paper metadata ...", profile=verbose)
+            paper_dblp_lod = self.load_lod("papers_dblp")
+            msg = f"{len(paper_dblp_lod)} dblp indexed papers"
+            profiler.time(msg)
+            self.setPapers(vm, paper_lod, paper_dblp_lod, verbose=verbose)
+
+    def setPapers(
+        self,
+        vm: VolumeManager,
+        paper_lod: list,
+        paper_dblp_lod: list,
+        verbose: bool = False,
+        pdf_paths: Optional[Dict[str, str]] = None,
+        suggest_index: Optional[SuggestIndex] = None,
+    ):
+        """
+        create my papers from the given records and link them to their
+        volumes, their dblp metadata and their pdf files
+
+        Args:
+            vm: VolumeManager
+            paper_lod(list): the paper records
+            paper_dblp_lod(list): the dblp paper records
+            verbose(bool): if True show verbose linking information
+            pdf_paths(dict): the precomputed pdf file paths - scanned if None
+            suggest_index(SuggestIndex): the precomputed suggest index - updated if None
+        """
         profiler = Profiler("Linking papers and volumes...", profile=verbose)
         self.papers_by_id = {}
         self.paper_records_by_path = {}
         self.papers_by_path = {}
-        for _index, paper_record in enumerate(paper_lod):
-            pdf_name = paper_record["pdf_name"]
-            volume_number = paper_record["vol_number"]
-            volume = vm.getVolume(volume_number)
-            # pdf_url=f"https://ceur-ws.org/Vol-{volume_number}/{pdf_name}"
-            pdf_path = f"Vol-{volume_number}/{pdf_name}"
-            pdf_url = f"https://ceur-ws.org/{pdf_path}"
-            try:
-                paper = Paper(
-                    id=paper_record["id"],
-                    title=paper_record["title"],
-                    # authors=paper_record["authors"],
-                    pdfUrl=pdf_url,
-                    volume=volume,
-                )
-                paper.pm = self
-                if volume:
-                    volume.addPaper(paper)
-                self.papers_by_id[paper_record["id"]] = paper
-                self.papers_by_path[pdf_path] = paper
-                self.paper_records_by_path[pdf_path] = paper_record
-            except Exception as ex:
-                print(
-                    f"handling of Paper for pdfUrl '{pdf_url}' failed with {str(ex)}",
-                    flush=True,
+        with TRACER.span("construct papers"):
+            # share the string pool of the volumes
+            self.string_pool = vm.string_pool
+            for _index, paper_record in enumerate(paper_lod):
+                self.string_pool.intern_record(paper_record, self.INTERN_KEYS)
+                volume = vm.getVolume(paper_record["vol_number"])
+                try:
+                    paper = self.createPaper(paper_record, volume)
+                    if volume:
+                        volume.addPaper(paper)
+                    # the paper's pdf path is shared as key
+                    self.papers_by_id[paper_record["id"]] = paper
+                    self.papers_by_path[paper.pdf_path] = paper
+                    self.paper_records_by_path[paper.pdf_path] = paper_record
+                except Exception as ex:
+                    pdf_url = f"{Paper.CEUR_WS_URL}{self.pdfPath(paper_record)}"
+                    print(
+                        f"handling of Paper for pdfUrl '{pdf_url}' failed with {str(ex)}",
+                        flush=True,
+                    )
+        with TRACER.span("link dblp papers"):
+            self.paper_dblp_by_path = {}
+            # scholars are shared across the papers they authored
+            self.dblp_scholars = {}
+            for _index, dblp_record in enumerate(paper_dblp_lod):
+                dblp_paper = ceurspt.models.dblp.DblpPaper.from_dict(
+                    dblp_record, self.dblp_scholars
                 )
-        self.paper_dblp_by_path = {}
-        for _index, dblp_record in enumerate(paper_dblp_lod):
-            pdf_id = dblp_record["pdf_id"]
-            self.paper_dblp_by_path[f"{pdf_id}.pdf"] = dblp_record
+                pdf_path = f"{dblp_paper.pdf_id}.pdf"
+                paper = self.papers_by_path.get(pdf_path)
+                if paper is not None:
+                    pdf_path = paper.pdf_path
+                self.paper_dblp_by_path[pdf_path] = dblp_paper
         msg = f"{len(self.papers_by_path)} papers linked to volumes"
         profiler.time(msg)
+        profiler = Profiler("Indexing pdf files ...", profile=verbose)
+        self.pdf_index = PdfPathIndex(vm.base_path)
+        if pdf_paths is None:
+            self.pdf_index.build(self.papers_by_path.keys())
+        else:
+            self.pdf_index.paths_by_pdf_path = pdf_paths
+        msg = f"{len(self.pdf_index)} pdf files available"
+        profiler.time(msg)
+        if suggest_index is not None:
+            self.suggest_index = suggest_index
+            return
+        profiler = Profiler("Indexing titles and acronyms ...", profile=verbose)
+        stats = self.suggest_index.update(vm, self)
+        msg = f"{stats['added']} added {stats['removed']} removed {stats['kept']} kept"
+        profiler.time(msg)
@@ -5,6 +5,7 @@ Created on 30.03.2023
 """
 
 import dataclasses
+from typing import Dict, Tuple
 
 
 class DataClassUtil:
@@ -14,6 +15,58 @@ class DataClassUtil:
     https://stackoverflow.com/a/54769644/1497139
     """
 
+    # the field defaults and default factories by dataclass
+    _defaults: Dict[type, Tuple[dict, dict]] = {}
+
+    @classmethod
+    def field_defaults(cls, klass) -> Tuple[dict, dict]:
+        """
+        get the default values and default factories of the fields of the given dataclass
+        """
+        defaults = cls._defaults.get(klass)
+        if defaults is None:
+            values, factories = {}, {}
+            for field in dataclasses.fields(klass):
+                # fields overridden by a property keep their state elsewhere
+                if isinstance(getattr(klass, field.name, None), property):
+                    continue
+                if field.default is not dataclasses.MISSING:
+                    values[field.name] = field.default
+                elif field.default_factory is not dataclasses.MISSING:
+                    factories[field.name] = field.default_factory
+            defaults = (values, factories)
+            cls._defaults[klass] = defaults
+        return defaults
+
+    @classmethod
+    def fast_construct(cls, klass, **values):
+        """
+        construct an instance of the given dataclass from trusted values
+        without calling __init__ and __post_init__
+
+        the values must already have the types __post_init__ would
+        coerce them to and fields overridden by a property must be given
+        by the attribute the property is based on
+
+        Args:
+            klass: the dataclass
+            **values: the field values
+
+        Returns:
+            the instance
+        """
+        defaults, factories = cls.field_defaults(klass)
+        # object.__new__ is what JsonObj.__new__ of the LinkML YAMLRoot
+        # ends up calling when not copying an existing object
+        instance = object.__new__(klass)
+        instance_dict = instance.__dict__
+        instance_dict.update(defaults)
+        for name, factory in factories.items():
+            if name not in values:
+                instance_dict[name] = factory()
+        instance_dict.update(values)
+        return instance
+
     @classmethod
     def dataclass_from_dict(cls, klass, d):
         try:
@@ -0,0 +1,283 @@
+"""
+Created on 2026-10-19
+
+@author: agent
+"""
+
+import json
+import os
+import re
+import time
+from array import array
+from collections import defaultdict
+from datetime import datetime, timezone
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+from ceurspt.fork_pool import fork_map
+
+WORD_RE = re.compile(r"\w+")
+
+
+def _signatures_in_worker(
+    finder: "DuplicateFinder", pdf_paths: List[str]
+) -> List[Optional[array]]:
+    """
+    get the MinHash signatures of the given papers in a worker process
+    """
+    return [finder.signature_of(pdf_path) for pdf_path in pdf_paths]
+
+
+class MinHash:
+    """
+    MinHash signatures by one permutation hashing
+
+    each shingle is hashed once - the hash selects one of the bins and the
+    minimum per bin is kept so that a signature costs one hash per shingle
+    instead of one per shingle and permutation - empty bins borrow the
+    value of the next non empty bin
+    """
+
+    def __init__(self, num_bins: int = 64, shingle_size: int = 5):
+        """
+        constructor
+
+        Args:
+            num_bins(int): the number of signature values - a power of two
+            shingle_size(int): the number of words per shingle
+        """
+        if num_bins & (num_bins - 1):
+            raise ValueError(f"the number of bins {num_bins} must be a power of two")
+        self.num_bins = num_bins
+        self.shingle_size = shingle_size
+        self.bin_bits = num_bins.bit_length() - 1
+
+    def shingles(self, text: str) -> Set[int]:
+        """
+        get the hashed word shingles of the given text
+
+        the shingles are hashed with the builtin hash which is only stable
+        within one process and its forks - signatures are not persisted
+        """
+        words = WORD_RE.findall(text.lower())
+        if not words:
+            return set()
+        size = min(self.shingle_size, len(words))
+        shingles = zip(*(words[offset:] for offset in range(size)))
+        return {value & 0xFFFFFFFF for value in map(hash, shingles)}
+
+    def signature(self, shingles: Set[int]) -> Optional[array]:
+        """
+        get the signature of the given hashed shingles
+
+        Returns:
+            array: the minimum per bin or None if there are no shingles
+        """
+        if not shingles:
+            return None
+        empty = 1 << 32
+        mins = [empty] * self.num_bins
+        mask = self.num_bins - 1
+        bits = self.bin_bits
+        for value in shingles:
+            index = value & mask
+            value >>= bits
+            if value < mins[index]:
+                mins[index] = value
+        # densify by rotation - empty bins take the next non empty bin
+        # offset by the distance so that they do not match by accident
+        for index in range(self.num_bins):
+            if mins[index] == empty:
+                distance = 1
+                while mins[(index + distance) % self.num_bins] == empty:
+                    distance += 1
+                borrowed = mins[(index + distance) % self.num_bins]
+                mins[index] = empty + distance * empty + borrowed
+        return array("Q", mins)
+
+    @classmethod
+    def similarity(cls, signature: array, other: array) -> float:
+        """
+        estimate the jaccard similarity of the given signatures
+        """
+        same = sum(
+            1 for value, other_value in zip(signature, other) if value == other_value
+        )
+        return same / len(signature)
+
+
+class DuplicateFinder:
+    """
+    find near duplicate papers by MinHash signatures of their texts
+
+    the signatures are computed in forked worker processes and split into
+    bands - papers sharing all values of a band become candidates so that
+    only candidate pairs are compared instead of all pairs
+    """
+
+    # the number of papers per worker task
+    BATCH_SIZE = 256
+    # buckets with more papers are boilerplate e.g. empty templates
+    MAX_BUCKET = 50
+
+    def __init__(
+        self,
+        pm,
+        pdf_paths: Optional[List[str]] = None,
+        bands: int = 16,
+        rows: int = 4,
+        threshold: float = 0.8,
+        workers: int = 1,
+    ):
+        """
+        constructor
+
+        Args:
+            pm(PaperManager): the paper manager with the loaded papers
+            pdf_paths(list): the pdf paths of the papers to check - default: all
+            bands(int): the number of LSH bands
+            rows(int): the number of signature values per band
+            threshold(float): the minimum estimated jaccard similarity to report
+            workers(int): the number of worker processes
+        """
+        self.pm = pm
+        self.pdf_paths = (
+            sorted(pm.papers_by_path) if pdf_paths is None else list(pdf_paths)
+        )
+        self.bands = bands
+        self.rows = rows
+        self.threshold = threshold
+        self.workers = max(1, workers or 1)
+        self.minhash = MinHash(num_bins=bands * rows)
+
+    def signature_of(self, pdf_path: str) -> Optional[array]:
+        """
+        get the signature of the -content.txt of the given paper
+
+        Returns:
+            array: the signature or None if the paper has no text
+        """
+        paper = self.pm.papers_by_path.get(pdf_path)
+        if paper is None:
+            return None
+        text = paper.getContentByPostfix("-content.txt")
+        if not text:
+            return None
+        return self.minhash.signature(self.minhash.shingles(text))
+
+    def signatures(self) -> Iterator[Tuple[str, Optional[array]]]:
+        """
+        get the signatures of my papers - in a process pool with more than one worker
+        """
+        batches = [
+            self.pdf_paths[index : index + self.BATCH_SIZE]
+            for index in range(0, len(self.pdf_paths), self.BATCH_SIZE)
+        ]
+        results = fork_map(_signatures_in_worker, batches, self.workers, state=self)
+        for batch, signatures in zip(batches, results):
+            yield from zip(batch, signatures)
+
+    def candidates(self, signatures: List[array]) -> Set[Tuple[int, int]]:
+        """
+        get the candidate pairs of signatures sharing at least one band
+
+        Args:
+            signatures(list): the signatures
+
+        Returns:
+            set: the index pairs with the lower index first
+        """
+        pairs = set()
+        for band in range(self.bands):
+            start = band * self.rows
+            buckets: Dict[tuple, List[int]] = defaultdict(list)
+            for index, signature in enumerate(signatures):
+                buckets[tuple(signature[start : start + self.rows])].append(index)
+            for bucket in buckets.values():
+                if 1 < len(bucket) <= self.MAX_BUCKET:
+                    for i, first in enumerate(bucket):
+                        for second in bucket[i + 1 :]:
+                            pairs.add((first, second))
+        return pairs
+
+    def find(self) -> dict:
+        """
+        find the near duplicate papers
+
+        Returns:
+            dict: the report with the duplicate pairs most similar first
+        """
+        start = time.perf_counter()
+        pdf_paths = []
+        signatures = []
+        for pdf_path, signature in self.signatures():
+            if signature is not None:
+                pdf_paths.append(pdf_path)
+                signatures.append(signature)
+        candidates = self.candidates(signatures)
+        pairs = []
+        for first, second in candidates:
+            similarity = MinHash.similarity(signatures[first], signatures[second])
+            if similarity >= self.threshold:
+                pairs.append(
+                    self.as_pair(pdf_paths[first], pdf_paths[second], similarity)
+                )
+        pairs.sort(
+            key=lambda pair: (-pair["similarity"], pair["papers"][0]["pdf_path"])
+        )
+        return {
+            "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "papers": len(self.pdf_paths),
+            "texts": len(signatures),
+            "bands": self.bands,
+            "rows": self.rows,
+            "threshold": self.threshold,
+            "candidates": len(candidates),
+            "seconds": round(time.perf_counter() - start, 3),
+            "pairs": pairs,
+        }
+
+    def as_pair(self, pdf_path: str, other_path: str, similarity: float) -> dict:
+        """
+        get the report entry of the given duplicate pair
+        """
+        papers = []
+        for path in (pdf_path, other_path):
+            paper = self.pm.papers_by_path.get(path)
+            papers.append(
+                {
+                    "pdf_path": path,
+                    "title": paper.title if paper else None,
+                    "url": "/" + path.replace(".pdf", ".html"),
+                }
+            )
+        return {
+            "similarity": round(similarity, 4),
+            "cross_volume": pdf_path.split("/")[0] != other_path.split("/")[0],
+            "papers": papers,
+        }
+
+    @classmethod
+    def write_report(cls, report: dict, report_path: str):
+        """
+        write the given report as json replacing an existing report at once
+        """
+        report_dir = os.path.dirname(report_path)
+        if report_dir:
+            os.makedirs(report_dir, exist_ok=True)
+        tmp_path = f"{report_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as report_file:
+            json.dump(report, report_file, indent=2)
+        os.replace(tmp_path, report_path)
+
+    @classmethod
+    def read_report(cls, report_path: str) -> Optional[dict]:
+        """
+        read the report from the given path
+
+        Returns:
+            dict: the report or None if there is no report
+        """
+        if not report_path or not os.path.isfile(report_path):
+            return None
+        with open(report_path, encoding="utf-8") as report_file:
+            return json.load(report_file)
@@ -0,0 +1,612 @@
+"""
+Created on 2026-10-19
+
+@author: agent
+"""
+
+import os
+import re
+import threading
+import time
+import zipfile
+from collections import OrderedDict, deque
+from email.utils import formatdate
+from typing import Dict, Iterable, Mapping, Optional, Tuple, Union
+
+import anyio
+from starlette.responses import Response, StreamingResponse
+from starlette.types import Receive, Scope, Send
+
+from ceurspt.zip_store import ZIP_STORE, ZipStore
+
+
+class PdfPathIndex:
+    """
+    precomputed index of the PDF files available below a base path
+
+    maps relative pdf paths such as Vol-3262/paper1.pdf to their absolute path
+    so that resolving a paper's files needs no per request filesystem probing
+
+    volumes without an unpacked Vol-N directory are looked up in their
+    Vol-N.zip archive
+    """
+
+    def __init__(
+        self, base_path: Optional[str] = None, zip_store: Optional[ZipStore] = None
+    ):
+        """
+        constructor
+
+        Args:
+            base_path(str): the base path of the volume directories
+            zip_store(ZipStore): the store of the volume archives
+        """
+        self.base_path = base_path
+        self.zip_store = zip_store if zip_store is not None else ZIP_STORE
+        self.paths_by_pdf_path: Dict[str, str] = {}
+
+    def __len__(self) -> int:
+        return len(self.paths_by_pdf_path)
+
+    def build(self, pdf_paths: Iterable[str]):
+        """
+        build the index for the given relative pdf paths
+
+        each volume directory is listed only once instead of probing
+        every single pdf with os.path.isfile
+
+        Args:
+            pdf_paths(Iterable[str]): relative pdf paths e.g. Vol-3262/paper1.pdf
+        """
+        self.paths_by_pdf_path = {}
+        if not self.base_path:
+            return
+        entries_by_dir: Dict[str, Tuple[str, frozenset]] = {}
+        for pdf_path in pdf_paths:
+            vol_dir, _sep, file_name = pdf_path.rpartition("/")
+            dir_entries = entries_by_dir.get(vol_dir)
+            if dir_entries is None:
+                dir_entries = self._list_dir(f"{self.base_path}/{vol_dir}")
+                entries_by_dir[vol_dir] = dir_entries
+            dir_path, entries = dir_entries
+            if file_name in entries:
+                self.paths_by_pdf_path[pdf_path] = f"{dir_path}/{file_name}"
+
+    def _list_dir(self, dir_path: str) -> Tuple[str, frozenset]:
+        """
+        list the given volume directory falling back to its archive
+
+        Returns:
+            tuple: the path of the directory and the names of its files
+        """
+        entries = self._list_files(dir_path)
+        if not entries:
+            archive_dir = self.zip_store.volume_dir(dir_path)
+            if archive_dir is not None:
+                return archive_dir, self.zip_store.list_files(archive_dir)
+        return dir_path, entries
+
+    def _list_files(self, dir_path: str) -> frozenset:
+        """
+        list the names of the regular files in the given directory
+        """
+        try:
+            with os.scandir(dir_path) as it:
+                return frozenset(entry.name for entry in it if entry.is_file())
+        except OSError:
+            return frozenset()
+
+    def get(self, pdf_path: str) -> Optional[str]:
+        """
+        get the absolute path for the given relative pdf path
+
+        Args:
+            pdf_path(str): the relative pdf path
+
+        Returns:
+            str: the absolute path or None if the pdf is not available
+        """
+        return self.paths_by_pdf_path.get(pdf_path)
+
+
+class CachedFile:
+    """
+    an open file descriptor with the metadata needed to serve it
+    """
+
+    def __init__(self, path: str, fd: int, size: int, mtime: float):
+        self.path = path
+        self.fd = fd
+        self.size = size
+        self.mtime = mtime
+        self.etag = f'"{size:x}-{int(mtime * 1_000_000):x}"'
+        self.last_modified = formatdate(mtime, usegmt=True)
+        self.checked = time.monotonic()
+        # number of responses currently reading from the descriptor
+        self.users = 0
+        self.evicted = False
+
+
+class FileDescriptorCache:
+    """
+    least recently used cache of open file descriptors
+
+    descriptors are read with os.pread so concurrent responses can share
+    them without seeking; evicted descriptors are closed only once the
+    last response using them has finished
+    """
+
+    def __init__(self, max_size: int = 256, revalidate_secs: float = 5.0):
+        """
+        constructor
+
+        Args:
+            max_size(int): the maximum number of open descriptors
+            revalidate_secs(float): re-stat cached files after this many seconds
+        """
+        self.max_size = max_size
+        self.revalidate_secs = revalidate_secs
+        self.files: "OrderedDict[str, CachedFile]" = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        # files of responses collected without being sent
+        self.orphans: deque = deque()
+
+    def __len__(self) -> int:
+        return len(self.files)
+
+    def acquire(self, path: str) -> CachedFile:
+        """
+        get an open cached file for the given path - the caller
+        has to release it when done
+
+        Args:
+            path(str): the path of the file
+
+        Returns:
+            CachedFile: the cached file
+
+        Raises:
+            OSError: if the file can not be opened
+        """
+        with self.lock:
+            self._release_orphans()
+            cached = self.files.get(path)
+            if cached is not None and self._is_stale(cached):
+                self._evict(path)
+                cached = None
+            if cached is not None:
+                self.hits += 1
+                self.files.move_to_end(path)
+                cached.users += 1
+                return cached
+            self.misses += 1
+        fd = os.open(path, os.O_RDONLY)
+        stat = os.fstat(fd)
+        cached = CachedFile(path, fd, stat.st_size, stat.st_mtime)
+        cached.users = 1
+        with self.lock:
+            if path in self.files:
+                self._evict(path)
+            self.files[path] = cached
+            while len(self.files) > self.max_size:
+                oldest_path = next(iter(self.files))
+                self._evict(oldest_path)
+        return cached
+
+    def release(self, cached: CachedFile):
+        """
+        release a file acquired before
+        """
+        with self.lock:
+            self._release(cached)
+
+    def release_later(self, cached: CachedFile):
+        """
+        release a file acquired before on the next acquire - for finalizers
+        which must not wait for the lock the collecting thread may hold
+        """
+        self.orphans.append(cached)
+
+    def _release(self, cached: CachedFile):
+        """
+        release the given file - needs the lock
+        """
+        cached.users -= 1
+        if cached.evicted and cached.users <= 0:
+            os.close(cached.fd)
+
+    def _release_orphans(self):
+        """
+        release the files of collected responses - needs the lock
+        """
+        while self.orphans:
+            self._release(self.orphans.popleft())
+
+    def _is_stale(self, cached: CachedFile) -> bool:
+        """
+        check whether the file was replaced or modified since it was opened
+        """
+        now = time.monotonic()
+        if now - cached.checked < self.revalidate_secs:
+            return False
+        cached.checked = now
+        try:
+            stat = os.stat(cached.path)
+        except OSError:
+            return True
+        return stat.st_size != cached.size or stat.st_mtime != cached.mtime
+
+    def _evict(self, path: str):
+        """
+        remove the given path from the cache - needs the lock
+        """
+        cached = self.files.pop(path)
+        cached.evicted = True
+        self.evictions += 1
+        if cached.users <= 0:
+            os.close(cached.fd)
+
+    def clear(self):
+        """
+        close all descriptors that are not in use
+        """
+        with self.lock:
+            self._release_orphans()
+            for path in list(self.files):
+                self._evict(path)
+
+
+class FileRangeResponse(Response):
+    """
+    response streaming a byte range of a cached file
+
+    servers supporting the ASGI zero copy send extension get the descriptor
+    to sendfile the range - otherwise the range is read chunk by chunk
+
+    the file is released once the response has been sent - or when the
+    response is collected without being sent e.g. after a failing middleware
+    """
+
+    chunk_size = 256 * 1024
+    ZERO_COPY_SEND = "http.response.zerocopysend"
+
+    def __init__(
+        self,
+        fd_cache: FileDescriptorCache,
+        cached: CachedFile,
+        start: int,
+        end: int,
+        status_code: int,
+        headers: Mapping[str, str],
+        media_type: str,
+    ):
+        """
+        constructor
+
+        Args:
+            fd_cache(FileDescriptorCache): the cache to release the file to
+            cached(CachedFile): the file to stream
+            start(int): the first byte to send
+            end(int): the last byte to send (inclusive)
+            status_code(int): 200 or 206
+            headers(dict): the response headers
+            media_type(str): the media type
+        """
+        self.fd_cache = fd_cache
+        self.cached = cached
+        self.start = start
+        self.end = end
+        self.status_code = status_code
+        self.media_type = media_type
+        self.background = None
+        self.body = None
+        self.released = False
+        self.init_headers(headers)
+
+    def release(self):
+        """
+        release my file to the cache once
+        """
+        if not self.released:
+            self.released = True
+            self.fd_cache.release(self.cached)
+
+    def __del__(self):
+        if not getattr(self, "released", True):
+            self.released = True
+            self.fd_cache.release_later(self.cached)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        try:
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": self.status_code,
+                    "headers": self.raw_headers,
+                }
+            )
+            offset = self.start
+            remaining = self.end - self.start + 1
+            if remaining > 0 and self.ZERO_COPY_SEND in scope.get("extensions", {}):
+                with open(self.cached.fd, "rb", buffering=0, closefd=False) as file:
+                    await send(
+                        {
+                            "type": self.ZERO_COPY_SEND,
+                            "file": file,
+                            "offset": offset,
+                            "count": remaining,
+                            "more_body": False,
+                        }
+                    )
+                return
+            more_body = True
+            while remaining > 0:
+                chunk = await anyio.to_thread.run_sync(
+                    os.pread, self.cached.fd, min(self.chunk_size, remaining), offset
+                )
+                if not chunk:
+                    # the file shrunk while streaming
+                    break
+                offset += len(chunk)
+                remaining -= len(chunk)
+                more_body = remaining > 0
+                await send(
+                    {
+                        "type": "http.response.body",
+                        "body": chunk,
+                        "more_body": more_body,
+                    }
+                )
+            if more_body:
+                await send({"type": "http.response.body", "body": b""})
+        finally:
+            self.release()
+
+
+class MemoryRangeResponse(Response):
+    """
+    response streaming a byte range of a buffer e.g. a view of a
+    memory mapped archive
+    """
+
+    chunk_size = 256 * 1024
+
+    def __init__(
+        self,
+        data: Union[memoryview, bytes],
+        start: int,
+        end: int,
+        status_code: int,
+        headers: Mapping[str, str],
+        media_type: str,
+    ):
+        """
+        constructor
+
+        Args:
+            data(memoryview): the content to stream from
+            start(int): the first byte to send
+            end(int): the last byte to send (inclusive)
+            status_code(int): 200 or 206
+            headers(dict): the response headers
+            media_type(str): the media type
+        """
+        self.data = memoryview(data)
+        self.start = start
+        self.end = end
+        self.status_code = status_code
+        self.media_type = media_type
+        self.background = None
+        self.body = None
+        self.init_headers(headers)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await send(
+            {
+                "type": "http.response.start",
+                "status": self.status_code,
+                "headers": self.raw_headers,
+            }
+        )
+        offset = self.start
+        end = self.end + 1
+        while True:
+            chunk_end = min(offset + self.chunk_size, end)
+            await send(
+                {
+                    "type": "http.response.body",
+                    "body": bytes(self.data[offset:chunk_end]),
+                    "more_body": chunk_end < end,
+                }
+            )
+            offset = chunk_end
+            if offset >= end:
+                break
+
+
+class FileDelivery:
+    """
+    serve files with strong ETags, conditional requests and
+    single byte range support from a cache of open file descriptors
+    or from the members of volume archives
+    """
+
+    # a single byte range - a first and last position or a suffix length
+    RANGE_RE = re.compile(r"(\d*)-(\d*)", re.ASCII)
+
+    def __init__(
+        self,
+        fd_cache: Optional[FileDescriptorCache] = None,
+        zip_store: Optional[ZipStore] = None,
+    ):
+        """
+        constructor
+
+        Args:
+            fd_cache(FileDescriptorCache): the descriptor cache to use
+            zip_store(ZipStore): the store of the volume archives
+        """
+        self.fd_cache = fd_cache if fd_cache is not None else FileDescriptorCache()
+        self.zip_store = zip_store if zip_store is not None else ZIP_STORE
+
+    @classmethod
+    def parse_range(cls, range_header: str, size: int) -> Optional[Tuple[int, int]]:
+        """
+        parse a single range Range header
+
+        invalid headers are ignored as RFC 9110 section 14.2 asks for -
+        the full content is sent
+
+        Args:
+            range_header(str): the value of the Range header
+            size(int): the size of the file
+
+        Returns:
+            tuple: (start,end) inclusive or None if the header is to be ignored
+
+        Raises:
+            ValueError: if the range is not satisfiable
+        """
+        unit, _sep, ranges = range_header.partition("=")
+        if unit.strip().lower() != "bytes" or "," in ranges:
+            # other units and multipart ranges get the full content
+            return None
+        match = cls.RANGE_RE.fullmatch(ranges.strip())
+        if match is None or match.group(0) == "-":
+            return None
+        first, last = match.groups()
+        if first == "":
+            # the suffix range of the last bytes
+            start = max(0, size - int(last))
+            end = size - 1
+        else:
+            start = int(first)
+            end = int(last) if last else size - 1
+            if last and start > end:
+                return None
+        if start >= size:
+            raise ValueError(f"unsatisfiable range {range_header}")
+        return start, min(end, size - 1)
+
+    def negotiate(
+        self, request_headers: Mapping[str, str], size: int, headers: Dict[str, str]
+    ) -> Union[Response, Tuple[int, int, int]]:
+        """
+        evaluate the conditional and range headers of a request
+
+        Args:
+            request_headers(Mapping): the headers of the request
+            size(int): the size of the file
+            headers(dict): the response headers with the etag - range headers are added
+
+        Returns:
+            Response: a 304 or 416 response or a tuple of the status code,
+            the first and the last byte to send
+        """
+        etag = headers["etag"]
+        if_none_match = request_headers.get("if-none-match")
+        if if_none_match and etag in [tag.strip() for tag in if_none_match.split(",")]:
+            return Response(status_code=304, headers=headers)
+        start, end = 0, size - 1
+        status_code = 200
+        range_header = request_headers.get("range")
+        if_range = request_headers.get("if-range")
+        if range_header and (not if_range or if_range.strip() == etag):
+            try:
+                byte_range = self.parse_range(range_header, size)
+            except ValueError:
+                headers["content-range"] = f"bytes */{size}"
+                return Response(status_code=416, headers=headers)
+            if byte_range is not None:
+                start, end = byte_range
+                status_code = 206
+                headers["content-range"] = f"bytes {start}-{end}/{size}"
+        headers["content-length"] = str(max(0, end - start + 1))
+        return status_code, start, end
+
+    def member_response(
+        self, request_headers: Mapping[str, str], path: str, media_type: str
+    ) -> Response:
+        """
+        get the response for the given archived file - stored members are
+        streamed from the memory map of the archive without unpacking and
+        complete deflated members are decompressed while streaming
+
+        Raises:
+            OSError: if there is no such member
+        """
+        found = self.zip_store.member(path)
+        if found is None:
+            raise FileNotFoundError(f"no member {path}")
+        archive, member = found
+        headers = {
+            "accept-ranges": "bytes",
+            "etag": f'"{member.crc:x}-{member.size:x}"',
+            "last-modified": formatdate(archive.mtime, usegmt=True),
+        }
+        negotiated = self.negotiate(request_headers, member.size, headers)
+        if isinstance(negotiated, Response):
+            return negotiated
+        status_code, start, end = negotiated
+        if member.method != zipfile.ZIP_STORED and status_code == 200:
+            return StreamingResponse(
+                self.zip_store.iter_bytes(path),
+                status_code=status_code,
+                headers=headers,
+                media_type=media_type,
+            )
+        data = self.zip_store.read_member(archive, member)
+        return MemoryRangeResponse(
+            data,
+            start,
+            end,
+            status_code=status_code,
+            headers=headers,
+            media_type=media_type,
+        )
+
+    def response(
+        self,
+        request_headers: Mapping[str, str],
+        path: str,
+        media_type: str = "application/pdf",
+    ) -> Response:
+        """
+        get the response for the given file
+
+        Args:
+            request_headers(Mapping): the headers of the request
+            path(str): the path of the file to serve
+            media_type(str): the media type of the file
+
+        Returns:
+            Response: a 200, 206, 304 or 416 response
+
+        Raises:
+            OSError: if the file can not be opened
+        """
+        if self.zip_store.is_archived(path):
+            return self.member_response(request_headers, path, media_type)
+        cached = self.fd_cache.acquire(path)
+        headers = {
+            "accept-ranges": "bytes",
+            "etag": cached.etag,
+            "last-modified": cached.last_modified,
+        }
+        negotiated = self.negotiate(request_headers, cached.size, headers)
+        if isinstance(negotiated, Response):
+            self.fd_cache.release(cached)
+            return negotiated
+        status_code, start, end = negotiated
+        return FileRangeResponse(
+            self.fd_cache,
+            cached,
+            start,
+            end,
+            status_code=status_code,
+            headers=headers,
+            media_type=media_type,
+        )
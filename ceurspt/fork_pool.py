@@ -0,0 +1,95 @@
+"""
+Created on 2026-10-19
+
+@author: agent
+"""
+
+import multiprocessing
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from functools import partial
+from typing import Any, Callable, Iterable, Iterator
+
+# the state installed by the pool initializer in each forked worker process
+_worker_state: Any = None
+
+
+def _set_worker_state(state: Any):
+    """
+    install the given state in a worker process
+    """
+    global _worker_state
+    _worker_state = state
+
+
+def _call_in_worker(function: Callable, batch: Any) -> Any:
+    """
+    call the given function with the installed state in a worker process
+    """
+    return function(_worker_state, batch)
+
+
+def can_fork() -> bool:
+    """
+    check whether worker processes can be forked on this platform
+    """
+    return "fork" in multiprocessing.get_all_start_methods()
+
+
+def fork_map(
+    function: Callable[[Any, Any], Any],
+    batches: Iterable,
+    workers: int = 1,
+    state: Any = None,
+    ordered: bool = True,
+) -> Iterator:
+    """
+    call function(state, batch) for each of the given batches - in a pool of
+    forked worker processes with more than one worker
+
+    the state is handed to the workers by the pool initializer and inherited
+    copy-on-write by the fork so that it is never pickled - only a bounded
+    window of batches is in flight so that memory stays constant for slow
+    consumers
+
+    Args:
+        function(Callable): a module level function of the state and a batch
+        batches(Iterable): the batches
+        workers(int): the number of worker processes
+        state(Any): the state to pass to the function
+        ordered(bool): if False yield the results as they complete
+
+    Yields:
+        the result of each batch
+    """
+    batches = list(batches)
+    if workers <= 1 or len(batches) < 2 or not can_fork():
+        for batch in batches:
+            yield function(state, batch)
+        return
+    call = partial(_call_in_worker, function)
+    window = workers * 4
+    batch_iter = iter(batches)
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("fork"),
+        initializer=_set_worker_state,
+        initargs=(state,),
+    ) as executor:
+        pending = deque(
+            executor.submit(call, batch)
+            for _index, batch in zip(range(window), batch_iter)
+        )
+        while pending:
+            if ordered:
+                future = pending.popleft()
+                result = future.result()
+            else:
+                done, _not_done = wait(pending, return_when=FIRST_COMPLETED)
+                future = done.pop()
+                pending.remove(future)
+                result = future.result()
+            for batch in batch_iter:
+                pending.append(executor.submit(call, batch))
+                break
+            yield result
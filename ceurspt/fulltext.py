@@ -0,0 +1,567 @@
+"""
+Created on 2026-10-19
+
+@author: agent
+"""
+
+import heapq
+import json
+import math
+import mmap
+import os
+import re
+import struct
+import time
+from array import array
+from collections import Counter
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from ceurspt.fork_pool import fork_map
+from ceurspt.index_versions import IndexVersions
+from ceurspt.zip_store import ZIP_STORE
+
+# the words that are too frequent to be worth indexing
+STOP_WORDS = frozenset("""
+    a an and are as at be but by for from has have in is it its of on or
+    that the this to was were which with we our us not no can been these
+    those their there than then also such into may more other some
+    """.split())
+
+TOKEN_RE = re.compile(r"\w{2,64}")
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    split the given text into lower case index terms without stop words
+
+    Args:
+        text(str): the text to tokenize
+
+    Returns:
+        list: the terms in text order
+    """
+    return [
+        token
+        for token in TOKEN_RE.findall(text.lower())
+        if token not in STOP_WORDS and not token.isdigit()
+    ]
+
+
+def encode_varints(numbers: List[int]) -> bytes:
+    """
+    encode the given non negative numbers as variable length bytes
+    with 7 bits per byte and the high bit marking continuation
+    """
+    if not numbers or max(numbers) < 0x80:
+        # gaps and term frequencies mostly fit into a single byte
+        return bytes(numbers)
+    out = bytearray()
+    for number in numbers:
+        while number >= 0x80:
+            out.append((number & 0x7F) | 0x80)
+            number >>= 7
+        out.append(number)
+    return bytes(out)
+
+
+def decode_varints(data) -> List[int]:
+    """
+    decode the given variable length bytes to numbers
+    """
+    numbers = []
+    number = 0
+    shift = 0
+    for byte in data:
+        if byte & 0x80:
+            number |= (byte & 0x7F) << shift
+            shift += 7
+        else:
+            numbers.append(number | (byte << shift))
+            number = 0
+            shift = 0
+    return numbers
+
+
+def term_counts(text: str) -> Tuple[Dict[str, int], int]:
+    """
+    get the term frequencies and the number of terms of the given text
+
+    Args:
+        text(str): the text
+
+    Returns:
+        tuple: the frequency by term and the number of terms
+    """
+    counts = Counter(TOKEN_RE.findall(text.lower()))
+    # filtering the distinct tokens is cheaper than filtering all tokens
+    for token in list(counts):
+        if token in STOP_WORDS or token.isdigit():
+            del counts[token]
+    return counts, sum(counts.values())
+
+
+# a posting chunk is the first doc id, the last doc id, the number of docs and
+# the varint encoded postings following the first doc id gap - chunks of
+# consecutive doc id ranges are concatenated by encoding the gap between them
+PostingChunk = Tuple[int, int, int, bytes]
+
+
+def encode_chunk(postings: List[Tuple[int, int]]) -> PostingChunk:
+    """
+    encode the given ascending doc ids and term frequencies as posting chunk
+    """
+    numbers = []
+    previous = postings[0][0]
+    for doc_id, tf in postings:
+        numbers.append(doc_id - previous)
+        numbers.append(tf)
+        previous = doc_id
+    # the first gap is encoded when the chunks are concatenated
+    return postings[0][0], previous, len(postings), encode_varints(numbers[1:])
+
+
+def _invert_batch(
+    _builder: "FullTextIndexBuilder", text_paths: List[str]
+) -> Tuple[List[int], Dict[str, PostingChunk]]:
+    """
+    tokenize and invert the given files in a worker process
+
+    Returns:
+        tuple: the document lengths and the posting chunk by term with the
+        doc ids counted from the start of the batch
+    """
+    doclens = []
+    postings: Dict[str, List[Tuple[int, int]]] = {}
+    for doc_id, text_path in enumerate(text_paths):
+        counts, length = term_counts(ZIP_STORE.read_text(text_path, errors="replace"))
+        doclens.append(length)
+        for term, tf in counts.items():
+            postings.setdefault(term, []).append((doc_id, tf))
+    chunks = {term: encode_chunk(postings[term]) for term in postings}
+    return doclens, chunks
+
+
+class FullTextIndex:
+    """
+    a memory mapped on-disk inverted index over the paper texts
+    answering ranked BM25 queries
+
+    each version of the index is a subdirectory of the index directory
+    - see IndexVersions - holding
+        terms.bin: the utf-8 encoded terms in byte order
+        lexicon.bin: per term the offsets and lengths of the term and its postings
+            the number of documents and the last doc id
+        postings.bin: per term the varint encoded doc id gaps and term frequencies
+        doclens.bin: the number of terms of each document
+        meta.json: the documents with the mtime and size of their text files
+    """
+
+    # term offset, term length, document frequency, last doc id,
+    # postings offset, postings length
+    LEXICON = struct.Struct("<IHIIQI")
+    K1 = 1.2
+    B = 0.75
+
+    def __init__(self, index_dir: str):
+        """
+        constructor
+
+        Args:
+            index_dir(str): the directory of the index versions
+        """
+        self.index_dir = index_dir
+        # the version is resolved once so that all files are of the same version
+        self.version_dir = IndexVersions(index_dir).current_dir()
+        self.meta = self.read_meta(index_dir, self.version_dir)
+        if self.meta is None:
+            raise FileNotFoundError(f"no full text index in {index_dir}")
+        self.docs = [doc[0] for doc in self.meta["docs"]]
+        self.doclens = array("I")
+        with open(f"{self.version_dir}/doclens.bin", "rb") as doclens_file:
+            self.doclens.frombytes(doclens_file.read())
+        self.avg_len = sum(self.doclens) / len(self.doclens) if self.doclens else 0.0
+        self.terms = self.map_file("terms.bin")
+        self.lexicon = self.map_file("lexicon.bin")
+        self.postings = self.map_file("postings.bin")
+        self.term_count = len(self.lexicon) // self.LEXICON.size
+
+    def __len__(self) -> int:
+        return len(self.docs)
+
+    @classmethod
+    def read_meta(
+        cls, index_dir: str, version_dir: Optional[str] = None
+    ) -> Optional[dict]:
+        """
+        read the meta data of the index in the given directory
+
+        Args:
+            index_dir(str): the directory of the index versions
+            version_dir(str): the version to read - default: the current one
+
+        Returns:
+            dict: the meta data or None if there is no index
+        """
+        if version_dir is None:
+            version_dir = IndexVersions(index_dir).current_dir()
+        if version_dir is None:
+            return None
+        meta_path = f"{version_dir}/meta.json"
+        if not os.path.isfile(meta_path):
+            return None
+        with open(meta_path, encoding="utf-8") as meta_file:
+            return json.load(meta_file)
+
+    def map_file(self, name: str):
+        """
+        memory map the given index file read only
+        """
+        with open(f"{self.version_dir}/{name}", "rb") as index_file:
+            if os.fstat(index_file.fileno()).st_size == 0:
+                # empty files can not be mapped
+                return b""
+            return mmap.mmap(index_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def entry(self, index: int) -> tuple:
+        """
+        get the lexicon entry with the given index
+        """
+        return self.LEXICON.unpack_from(self.lexicon, index * self.LEXICON.size)
+
+    def term_at(self, index: int) -> bytes:
+        """
+        get the term of the lexicon entry with the given index
+        """
+        term_offset, term_len = self.entry(index)[:2]
+        return self.terms[term_offset : term_offset + term_len]
+
+    def lookup(self, term: str) -> Optional[tuple]:
+        """
+        find the given term by binary search in the lexicon
+
+        Returns:
+            tuple: the lexicon entry or None if the term is not indexed
+        """
+        key = term.encode("utf-8")
+        low, high = 0, self.term_count
+        while low < high:
+            mid = (low + high) // 2
+            if self.term_at(mid) < key:
+                low = mid + 1
+            else:
+                high = mid
+        if low < self.term_count and self.term_at(low) == key:
+            return self.entry(low)
+        return None
+
+    def postings_of(self, term: str) -> Iterator[Tuple[int, int]]:
+        """
+        get the doc ids and term frequencies of the given term
+
+        Yields:
+            tuple: doc id and term frequency
+        """
+        entry = self.lookup(term)
+        if entry is not None:
+            yield from self.decode_postings(entry)
+
+    def decode_postings(self, entry: tuple) -> Iterator[Tuple[int, int]]:
+        """
+        decode the postings of the given lexicon entry
+        """
+        offset, length = entry[4:]
+        numbers = decode_varints(self.postings[offset : offset + length])
+        doc_id = 0
+        for index in range(0, len(numbers), 2):
+            doc_id += numbers[index]
+            yield doc_id, numbers[index + 1]
+
+    def all_postings(self) -> Iterator[Tuple[str, List[Tuple[int, int]]]]:
+        """
+        get the postings of all terms in term order
+        """
+        for index in range(self.term_count):
+            entry = self.entry(index)
+            yield self.term_of(entry), list(self.decode_postings(entry))
+
+    def term_of(self, entry: tuple) -> str:
+        """
+        get the term of the given lexicon entry
+        """
+        return self.terms[entry[0] : entry[0] + entry[1]].decode("utf-8")
+
+    def chunks(self) -> Iterator[Tuple[str, PostingChunk]]:
+        """
+        get the postings of all terms as posting chunks without decoding them
+        """
+        for index in range(self.term_count):
+            entry = self.entry(index)
+            _term_offset, _term_len, df, last, offset, length = entry
+            data = self.postings[offset : offset + length]
+            # split off the first doc id which is the gap to 0
+            end = 0
+            while data[end] & 0x80:
+                end += 1
+            first = decode_varints(data[: end + 1])[0]
+            yield self.term_of(entry), (first, last, df, bytes(data[end + 1 :]))
+
+    def idf(self, df: int) -> float:
+        """
+        get the BM25 inverse document frequency for the given document frequency
+        """
+        count = len(self.docs)
+        return math.log(1.0 + (count - df + 0.5) / (df + 0.5))
+
+    def search(self, query: str, limit: int = 10) -> dict:
+        """
+        rank the documents for the given query with BM25
+
+        Args:
+            query(str): the query text
+            limit(int): the maximum number of hits
+
+        Returns:
+            dict: the total number of matching documents and the hits with
+            pdf_path and score best first
+        """
+        scores: Dict[int, float] = {}
+        k1 = self.K1
+        b = self.B
+        avg_len = self.avg_len or 1.0
+        for term in set(tokenize(query)):
+            entry = self.lookup(term)
+            if entry is None:
+                continue
+            idf = self.idf(entry[2])
+            for doc_id, tf in self.decode_postings(entry):
+                norm = k1 * (1.0 - b + b * self.doclens[doc_id] / avg_len)
+                score = idf * tf * (k1 + 1.0) / (tf + norm)
+                scores[doc_id] = scores.get(doc_id, 0.0) + score
+        best = heapq.nlargest(max(0, limit), scores.items(), key=lambda item: item[1])
+        return {
+            "total": len(scores),
+            "hits": [
+                {"pdf_path": self.docs[doc_id], "score": round(score, 4)}
+                for doc_id, score in best
+            ],
+        }
+
+    def close(self):
+        """
+        release my memory maps
+        """
+        for mapped in (self.terms, self.lexicon, self.postings):
+            if isinstance(mapped, mmap.mmap):
+                mapped.close()
+
+
+class FullTextIndexBuilder:
+    """
+    build the full text index from the -content.txt files of the papers
+
+    batches of files are tokenized and inverted in a process pool - unchanged
+    files are recognized by their mtime and size and keep their postings
+    from the previous index
+    """
+
+    # the number of files tokenized and inverted per worker task
+    BATCH_SIZE = 256
+
+    def __init__(self, text_files: Dict[str, str], index_dir: str, workers: int = 1):
+        """
+        constructor
+
+        Args:
+            text_files(dict): the text file path by pdf path e.g. Vol-3262/paper2.pdf
+            index_dir(str): the directory to write the index to
+            workers(int): the number of worker processes to tokenize and invert with
+        """
+        self.text_files = text_files
+        self.index_dir = index_dir
+        self.workers = max(1, workers or 1)
+
+    @classmethod
+    def text_files_of(cls, pm) -> Dict[str, str]:
+        """
+        get the available -content.txt files of the papers of the given paper manager
+
+        Args:
+            pm(PaperManager): the paper manager with the loaded papers
+
+        Returns:
+            dict: the text file path by pdf path
+        """
+        text_files = {}
+        for pdf_path, paper in pm.papers_by_path.items():
+            text_path = paper.getContentPathByPostfix("-content.txt")
+            if text_path:
+                text_files[pdf_path] = text_path
+        return text_files
+
+    def invert_all(
+        self, text_paths: List[str]
+    ) -> Iterator[Tuple[List[int], Dict[str, PostingChunk]]]:
+        """
+        tokenize and invert the given files in batches in order - in a process
+        pool with more than one worker
+        """
+        batches = [
+            text_paths[index : index + self.BATCH_SIZE]
+            for index in range(0, len(text_paths), self.BATCH_SIZE)
+        ]
+        yield from fork_map(_invert_batch, batches, self.workers, state=self)
+
+    def build(self) -> dict:
+        """
+        build or update the index
+
+        Returns:
+            dict: the number of documents, the number of added, kept and
+            removed documents, the number of terms and the seconds taken
+        """
+        start = time.perf_counter()
+        old_meta = FullTextIndex.read_meta(self.index_dir)
+        old_docs = {}
+        if old_meta is not None:
+            old_docs = {
+                pdf_path: (doc_id, mtime, size)
+                for doc_id, (pdf_path, mtime, size) in enumerate(old_meta["docs"])
+            }
+        stats = {}
+        for pdf_path, text_path in self.text_files.items():
+            try:
+                stats[pdf_path] = ZIP_STORE.stat(text_path)
+            except OSError:
+                continue
+        # the kept documents come first in their old order so that their
+        # doc ids stay ascending in the copied postings
+        kept = [
+            pdf_path
+            for pdf_path, (_doc_id, mtime, size) in sorted(
+                old_docs.items(), key=lambda item: item[1][0]
+            )
+            if stats.get(pdf_path) == (mtime, size)
+        ]
+        kept_set = set(kept)
+        changed = sorted(pdf_path for pdf_path in stats if pdf_path not in kept_set)
+        removed = sum(1 for pdf_path in old_docs if pdf_path not in stats)
+        result = {
+            "docs": len(kept) + len(changed),
+            "added": len(changed),
+            "kept": len(kept),
+            "removed": removed,
+        }
+        if old_meta is not None and not changed and not removed:
+            result["terms"] = old_meta.get("terms", 0)
+            result["seconds"] = time.perf_counter() - start
+            return result
+        chunks: Dict[str, List[PostingChunk]] = {}
+        doclens = array("I")
+        if kept:
+            old_ids = [old_docs[pdf_path][0] for pdf_path in kept]
+            old_index = FullTextIndex(self.index_dir)
+            self.keep(old_index, old_ids, chunks)
+            doclens.extend(old_index.doclens[old_id] for old_id in old_ids)
+            old_index.close()
+        text_paths = [self.text_files[pdf_path] for pdf_path in changed]
+        for batch_doclens, batch_chunks in self.invert_all(text_paths):
+            base = len(doclens)
+            doclens.extend(batch_doclens)
+            for term, (first, last, df, data) in batch_chunks.items():
+                chunk = (base + first, base + last, df, data)
+                chunks.setdefault(term, []).append(chunk)
+        docs = [[pdf_path, *stats[pdf_path]] for pdf_path in kept + changed]
+        self.write(docs, doclens, chunks)
+        result["terms"] = len(chunks)
+        result["seconds"] = time.perf_counter() - start
+        return result
+
+    def keep(
+        self,
+        old_index: FullTextIndex,
+        old_ids: List[int],
+        chunks: Dict[str, List[PostingChunk]],
+    ):
+        """
+        add the postings of the kept documents of the old index to the given chunks
+
+        Args:
+            old_index(FullTextIndex): the previous index
+            old_ids(list): the old doc ids of the kept documents in their new order
+            chunks(dict): the posting chunks by term to add to
+        """
+        count = len(old_ids)
+        if old_ids == list(range(count)):
+            # documents were only added or changed at the end - the postings
+            # of the kept documents are copied without decoding
+            for term, chunk in old_index.chunks():
+                if chunk[0] >= count:
+                    continue
+                if chunk[1] >= count:
+                    postings = [
+                        posting
+                        for posting in old_index.postings_of(term)
+                        if posting[0] < count
+                    ]
+                    chunk = encode_chunk(postings)
+                chunks[term] = [chunk]
+            return
+        remap = {old_id: new_id for new_id, old_id in enumerate(old_ids)}
+        for term, term_postings in old_index.all_postings():
+            kept_postings = [
+                (remap[doc_id], tf) for doc_id, tf in term_postings if doc_id in remap
+            ]
+            if kept_postings:
+                chunks[term] = [encode_chunk(kept_postings)]
+
+    def write(
+        self,
+        docs: List[list],
+        doclens: array,
+        chunks: Dict[str, List[PostingChunk]],
+    ):
+        """
+        write the index files into a new version which is published once it
+        is complete so that readers never see a partial or mixed index
+        """
+        versions = IndexVersions(self.index_dir)
+        version_dir = versions.new_dir()
+        terms_out = bytearray()
+        lexicon_out = bytearray()
+        postings_out = bytearray()
+        encoded_terms = sorted((term.encode("utf-8"), term) for term in chunks)
+        for term_bytes, term in encoded_terms:
+            offset = len(postings_out)
+            previous = 0
+            df = 0
+            for first, last, count, data in chunks[term]:
+                postings_out += encode_varints([first - previous])
+                postings_out += data
+                previous = last
+                df += count
+            lexicon_out += FullTextIndex.LEXICON.pack(
+                len(terms_out),
+                len(term_bytes),
+                df,
+                previous,
+                offset,
+                len(postings_out) - offset,
+            )
+            terms_out += term_bytes
+        meta = {
+            "version": 1,
+            "docs": docs,
+            "terms": len(chunks),
+            "postings_bytes": len(postings_out),
+        }
+        files = {
+            "terms.bin": bytes(terms_out),
+            "lexicon.bin": bytes(lexicon_out),
+            "postings.bin": bytes(postings_out),
+            "doclens.bin": doclens.tobytes(),
+            "meta.json": json.dumps(meta).encode("utf-8"),
+        }
+        for name, data in files.items():
+            with open(f"{version_dir}/{name}", "wb") as index_file:
+                index_file.write(data)
+        versions.publish(version_dir)
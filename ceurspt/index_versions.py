@@ -0,0 +1,94 @@
+"""
+Created on 2026-10-19
+
+@author: agent
+"""
+
+import os
+import re
+import shutil
+from typing import List, Optional
+
+
+class IndexVersions:
+    """
+    the versions of an on-disk index in the subdirectories v1, v2, ... of
+    the index directory
+
+    a new version is written into a fresh subdirectory and published by
+    atomically replacing the pointer file current with its name - readers
+    resolve the pointer once and see either the old or the new index but
+    never a mix of both
+
+    version numbers only grow so that the name of the current version
+    tells whether an open index is still current
+    """
+
+    POINTER = "current"
+    VERSION_RE = re.compile(r"v(\d+)$")
+
+    def __init__(self, index_dir: str):
+        """
+        constructor
+
+        Args:
+            index_dir(str): the directory holding the versions
+        """
+        self.index_dir = index_dir
+        self.pointer_path = f"{index_dir}/{self.POINTER}"
+
+    def versions(self) -> List[int]:
+        """
+        get the numbers of the version subdirectories in ascending order
+        """
+        if not os.path.isdir(self.index_dir):
+            return []
+        numbers = []
+        for name in os.listdir(self.index_dir):
+            match = self.VERSION_RE.match(name)
+            if match and os.path.isdir(f"{self.index_dir}/{name}"):
+                numbers.append(int(match.group(1)))
+        return sorted(numbers)
+
+    def current_dir(self) -> Optional[str]:
+        """
+        get the directory of the published version
+
+        Returns:
+            str: the directory or None if no version has been published
+        """
+        try:
+            with open(self.pointer_path, encoding="utf-8") as pointer_file:
+                name = pointer_file.read().strip()
+        except FileNotFoundError:
+            return None
+        return f"{self.index_dir}/{name}"
+
+    def new_dir(self) -> str:
+        """
+        create the directory for the next version
+        """
+        versions = self.versions()
+        number = versions[-1] + 1 if versions else 1
+        version_dir = f"{self.index_dir}/v{number}"
+        os.makedirs(version_dir)
+        return version_dir
+
+    def publish(self, version_dir: str):
+        """
+        make the given version the current one and remove all versions but
+        the previous one which readers may still have open
+
+        Args:
+            version_dir(str): the directory of the complete new version
+        """
+        previous_dir = self.current_dir()
+        name = os.path.basename(version_dir)
+        tmp_path = f"{self.pointer_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as tmp_file:
+            tmp_file.write(name)
+        os.replace(tmp_path, self.pointer_path)
+        keep = {name, os.path.basename(previous_dir) if previous_dir else None}
+        for number in self.versions():
+            if f"v{number}" not in keep:
+                shutil.rmtree(f"{self.index_dir}/v{number}", ignore_errors=True)
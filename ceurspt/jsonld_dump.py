@@ -0,0 +1,136 @@
+"""
+Created on 2026-10-19
+
+@author: agent
+"""
+
+import os
+from typing import BinaryIO, Iterator, List
+
+import orjson
+from rdflib import Dataset, URIRef
+
+from ceurspt.ceurws import VolumeManager
+from ceurspt.fork_pool import fork_map
+from ceurspt.jsonldBuilder import CeurWsJsonLdBuilder
+
+
+def _build_in_worker(dumper: "CorpusDumper", number: int) -> bytes:
+    """
+    build the serialized document of the given volume in a worker process
+    """
+    return dumper.build_volume(number)
+
+
+class CorpusDumper:
+    """
+    stream the whole CEUR-WS corpus as JSON-LD
+    one document per volume either as NDJSON or as N-Quads
+    """
+
+    FORMATS = {
+        "ndjson": "application/x-ndjson",
+        "nquads": "application/n-quads",
+    }
+
+    def __init__(
+        self,
+        vm: VolumeManager,
+        fmt: str = "ndjson",
+        workers: int = 1,
+        include_errors: bool = False,
+    ):
+        """
+        constructor
+
+        Args:
+            vm(VolumeManager): the volume manager with the loaded volumes and papers
+            fmt(str): the output format - ndjson or nquads
+            workers(int): the number of worker processes to build volumes with
+            include_errors(bool): if True add ceur:errors to the documents
+        """
+        if fmt not in self.FORMATS:
+            raise ValueError(
+                f"unknown dump format {fmt} - use one of {', '.join(self.FORMATS)}"
+            )
+        self.vm = vm
+        self.fmt = fmt
+        self.workers = max(1, workers or 1)
+        self.include_errors = include_errors
+
+    @property
+    def media_type(self) -> str:
+        """
+        the media type of my output format
+        """
+        return self.FORMATS[self.fmt]
+
+    def volume_numbers(self) -> List[int]:
+        """
+        get the numbers of the volumes to dump in ascending order
+        """
+        return sorted(self.vm.volumes_by_number.keys())
+
+    def build_volume(self, number: int) -> bytes:
+        """
+        build the serialized JSON-LD document for the given volume
+
+        Args:
+            number(int): the volume number
+
+        Returns:
+            bytes: one NDJSON line or the N-Quads of the volume
+        """
+        volume = self.vm.getVolume(number)
+        builder = CeurWsJsonLdBuilder.from_volume(volume, self.include_errors)
+        doc = builder.build()
+        json_bytes = orjson.dumps(doc, default=str)
+        if self.fmt == "ndjson":
+            return json_bytes + b"\n"
+        graph_iri = doc.get("@id")
+        if not isinstance(graph_iri, str) or not graph_iri.startswith("http"):
+            graph_iri = f"https://ceur-ws.org/Vol-{number}/"
+        dataset = Dataset()
+        graph = dataset.graph(URIRef(graph_iri))
+        graph.parse(data=json_bytes.decode("utf-8"), format="json-ld")
+        nquads = dataset.serialize(format="nquads", encoding="utf-8")
+        return nquads.rstrip(b"\n") + b"\n"
+
+    def stream(self) -> Iterator[bytes]:
+        """
+        generate the serialized volumes in volume number order
+
+        with more than one worker the volumes are built in forked worker
+        processes - only a bounded window of volumes is in flight so
+        memory stays constant for slow consumers
+
+        Yields:
+            bytes: the serialized document of the next volume
+        """
+        yield from fork_map(
+            _build_in_worker, self.volume_numbers(), self.workers, state=self
+        )
+
+    def dump(self, out: BinaryIO) -> int:
+        """
+        dump all volumes to the given binary stream
+
+        Args:
+            out(BinaryIO): the stream to write to
+
+        Returns:
+            int: the number of volumes written
+        """
+        count = 0
+        for chunk in self.stream():
+            out.write(chunk)
+            count += 1
+        out.flush()
+        return count
+
+    @classmethod
+    def default_workers(cls) -> int:
+        """
+        get the default number of worker processes
+        """
+        return os.cpu_count() or 1
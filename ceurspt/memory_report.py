@@ -0,0 +1,316 @@
+"""
+Created on 2026-10-19
+
+@author: agent
+"""
+
+import gc
+import sys
+import tracemalloc
+from types import BuiltinFunctionType, FunctionType, MethodType, ModuleType
+from typing import Callable, Dict, Iterable, List, Optional, Set
+
+from ceurspt.ceurws import PaperManager, VolumeManager
+
+# objects that are shared process wide and never part of a breakdown
+_SKIP_TYPES = (type, ModuleType, FunctionType, BuiltinFunctionType, MethodType)
+_ATOMIC_TYPES = (str, bytes, int, float, bool, type(None))
+
+
+class MemoryReport:
+    """
+    memory accounting for the loaded volume and paper managers
+
+    combines tracemalloc measurements of the loading phases with a
+    structural breakdown of the retained objects; each object is
+    accounted to the first category that reaches it and traversal
+    stops at the managers and at the items of other categories
+    """
+
+    def __init__(
+        self,
+        vm: VolumeManager,
+        pm: PaperManager,
+        caches: Optional[Dict[str, object]] = None,
+    ):
+        """
+        constructor
+
+        Args:
+            vm(VolumeManager): the volume manager
+            pm(PaperManager): the paper manager
+            caches(dict): additional caches to account by name
+        """
+        self.vm = vm
+        self.pm = pm
+        self.caches = caches or {}
+        self.phases: Dict[str, dict] = {}
+
+    @classmethod
+    def start_tracing(cls) -> bool:
+        """
+        start tracemalloc if it is not tracing yet
+
+        Returns:
+            bool: True if tracing was started by this call
+        """
+        if tracemalloc.is_tracing():
+            return False
+        tracemalloc.start()
+        return True
+
+    def load(self, verbose: bool = False):
+        """
+        load the volumes and papers while measuring each phase with tracemalloc
+
+        Args:
+            verbose(bool): if True show verbose loading information
+        """
+        started = self.start_tracing()
+        try:
+            self.measure("getVolumes", lambda: self.vm.getVolumes(verbose=verbose))
+            self.measure(
+                "getPapers", lambda: self.pm.getPapers(self.vm, verbose=verbose)
+            )
+        finally:
+            if started:
+                tracemalloc.stop()
+
+    def measure(self, phase: str, action: Callable[[], None]):
+        """
+        run the given action and record the memory it retained and its peak
+
+        Args:
+            phase(str): the name of the phase
+            action(Callable): the action to run
+        """
+        gc.collect()
+        tracemalloc.reset_peak()
+        before, _peak = tracemalloc.get_traced_memory()
+        action()
+        gc.collect()
+        after, peak = tracemalloc.get_traced_memory()
+        self.phases[phase] = {"retained": after - before, "peak": peak - before}
+
+    def categories(self) -> Dict[str, List[object]]:
+        """
+        get the items to account by category in accounting order
+        """
+        vm, pm = self.vm, self.pm
+        categories = {
+            "volume records": list(vm.volume_records_by_number.values()),
+            "paper records": list(pm.paper_records_by_path.values()),
+            "DblpPaper objects": list(pm.paper_dblp_by_path.values()),
+            "DblpScholar objects": list(pm.dblp_scholars.values()),
+            "Volume objects": list(vm.volumes_by_number.values()),
+            "Paper objects": list(pm.papers_by_path.values()),
+            "volumes_by_number": [vm.volumes_by_number],
+            "volume_records_by_number": [vm.volume_records_by_number],
+            "papers_by_path": [pm.papers_by_path],
+            "papers_by_id": [pm.papers_by_id],
+            "paper_records_by_path": [pm.paper_records_by_path],
+            "paper_dblp_by_path": [pm.paper_dblp_by_path],
+            "dblp_scholars": [pm.dblp_scholars],
+            "pdf_index": [pm.pdf_index],
+            # the pooled strings are accounted by the records sharing them
+            "string pool": [vm.string_pool.strings],
+        }
+        for name, cache in self.caches.items():
+            categories[f"cache {name}"] = [cache]
+        return categories
+
+    def breakdown(self) -> Dict[str, dict]:
+        """
+        get the structural breakdown of the retained memory by category
+
+        Returns:
+            dict: bytes, count and per object average by category
+        """
+        categories = self.categories()
+        roots: Set[int] = {id(self.vm), id(self.pm)}
+        for items in categories.values():
+            roots.update(id(item) for item in items)
+        seen: Set[int] = set()
+        result = {}
+        for name, items in categories.items():
+            total = sum(self.deep_sizeof(item, roots, seen) for item in items)
+            count = len(items)
+            if len(items) == 1 and isinstance(items[0], dict):
+                count = len(items[0])
+            result[name] = {
+                "bytes": total,
+                "count": count,
+                "avg": total / count if count else 0.0,
+            }
+        return result
+
+    @classmethod
+    def deep_sizeof(cls, obj: object, roots: Set[int], seen: Set[int]) -> int:
+        """
+        get the size of the given object and everything reachable from it
+        that has not been seen yet
+
+        Args:
+            obj(object): the object to measure
+            roots(set): ids of objects that are accounted on their own
+            seen(set): ids of the objects accounted so far
+
+        Returns:
+            int: the size in bytes
+        """
+        size = 0
+        stack = [obj]
+        while stack:
+            current = stack.pop()
+            current_id = id(current)
+            if current_id in seen or isinstance(current, _SKIP_TYPES):
+                continue
+            if current_id in roots and current is not obj:
+                continue
+            seen.add(current_id)
+            size += sys.getsizeof(current)
+            if isinstance(current, _ATOMIC_TYPES):
+                continue
+            if isinstance(current, dict):
+                stack.extend(current.keys())
+                stack.extend(current.values())
+            elif isinstance(current, (list, tuple, set, frozenset)):
+                stack.extend(current)
+            else:
+                stack.extend(cls._attributes(current))
+        return size
+
+    @classmethod
+    def _attributes(cls, obj: object) -> Iterable[object]:
+        """
+        get the attribute values of the given object
+        """
+        instance_dict = getattr(obj, "__dict__", None)
+        if isinstance(instance_dict, dict):
+            yield instance_dict
+        for klass in type(obj).__mro__:
+            for slot in klass.__dict__.get("__slots__", ()):
+                if slot in ("__dict__", "__weakref__"):
+                    continue
+                value = getattr(obj, slot, None)
+                if value is not None:
+                    yield value
+
+    def as_dict(self, diff: Optional[dict] = None) -> dict:
+        """
+        get the report as a dict
+
+        Args:
+            diff(dict): an optional reload diff to include
+        """
+        breakdown = self.breakdown()
+        report = {
+            "phases": self.phases,
+            "breakdown": breakdown,
+            "total": sum(entry["bytes"] for entry in breakdown.values()),
+            "string_pool": self.vm.string_pool.as_dict(),
+        }
+        if diff is not None:
+            report["reload_diff"] = diff
+        return report
+
+    @classmethod
+    def format_bytes(cls, size: float) -> str:
+        """
+        format the given number of bytes human readable
+        """
+        for unit in ["B", "KiB", "MiB"]:
+            if abs(size) < 1024:
+                return f"{size:.1f} {unit}"
+            size /= 1024
+        return f"{size:.1f} GiB"
+
+    def as_text(self, diff: Optional[dict] = None) -> str:
+        """
+        get the report as a text table
+
+        Args:
+            diff(dict): an optional reload diff to include
+        """
+        report = self.as_dict(diff)
+        lines = []
+        if report["phases"]:
+            lines.append(f"{'phase':<28}{'retained':>14}{'peak':>14}")
+            for phase, entry in report["phases"].items():
+                lines.append(
+                    f"{phase:<28}{self.format_bytes(entry['retained']):>14}"
+                    f"{self.format_bytes(entry['peak']):>14}"
+                )
+            lines.append("")
+        lines.append(f"{'category':<28}{'size':>14}{'count':>10}{'avg':>12}")
+        for name, entry in report["breakdown"].items():
+            lines.append(
+                f"{name:<28}{self.format_bytes(entry['bytes']):>14}"
+                f"{entry['count']:>10}{self.format_bytes(entry['avg']):>12}"
+            )
+        lines.append(f"{'total':<28}{self.format_bytes(report['total']):>14}")
+        pool = report["string_pool"]
+        lines.append(
+            f"string pool: {pool['strings']} strings, {pool['hits']} duplicates"
+            f" saving {self.format_bytes(pool['saved'])}"
+            f" ({self.format_bytes(pool['net'])} net of the pool)"
+        )
+        if diff is not None:
+            lines.append("")
+            lines.append(
+                f"reload diff: {self.format_bytes(diff['growth'])} net growth"
+                f" in {diff['blocks']} blocks"
+            )
+            for entry in diff["top"]:
+                lines.append(
+                    f"{self.format_bytes(entry['size_diff']):>14}"
+                    f"{entry['count_diff']:>8}  {entry['location']}"
+                )
+        return "\n".join(lines)
+
+    @classmethod
+    def reload_diff(cls, reload: Callable[[], object], top: int = 10) -> dict:
+        """
+        diff tracemalloc snapshots taken before and after a reload
+
+        if tracing was not active a warm up reload is done first so that
+        lazily created module state is traced and only the net growth of
+        a reload shows
+
+        Args:
+            reload(Callable): the reload action - it should load into fresh
+                managers so that the live ones are not swapped while serving
+            top(int): the number of allocation sites to show
+
+        Returns:
+            dict: the net growth in bytes and blocks and the top allocation sites
+        """
+        started = cls.start_tracing()
+        try:
+            if started:
+                reload()
+            gc.collect()
+            before = tracemalloc.take_snapshot()
+            reload()
+            gc.collect()
+            after = tracemalloc.take_snapshot()
+        finally:
+            if started:
+                tracemalloc.stop()
+        filters = [tracemalloc.Filter(False, tracemalloc.__file__)]
+        stats = after.filter_traces(filters).compare_to(
+            before.filter_traces(filters), "lineno"
+        )
+        diff = {
+            "growth": sum(stat.size_diff for stat in stats),
+            "blocks": sum(stat.count_diff for stat in stats),
+            "top": [
+                {
+                    "location": str(stat.traceback),
+                    "size_diff": stat.size_diff,
+                    "count_diff": stat.count_diff,
+                }
+                for stat in stats[:top]
+            ],
+        }
+        return diff
@@ -0,0 +1,432 @@
+"""
+Created on 2026-10-19
+
+@author: agent
+"""
+
+import os
+import time
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, List, Tuple
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+LabelValues = Tuple[str, ...]
+
+
+def _format_labels(names: Tuple[str, ...], values: LabelValues, extra: str = "") -> str:
+    """
+    format the given label names and values in the Prometheus text format
+    """
+    parts = []
+    for name, value in zip(names, values):
+        value = str(value).replace("\\", "\\\\").replace('"', '\\"')
+        value = value.replace("\n", "\\n")
+        parts.append(f'{name}="{value}"')
+    if extra:
+        parts.append(extra)
+    if not parts:
+        return ""
+    return "{" + ",".join(parts) + "}"
+
+
+def _merge_labels(labels: str, extra: str) -> str:
+    """
+    add the given formatted labels to the formatted labels of a sample
+    """
+    if not extra:
+        return labels
+    if not labels:
+        return "{" + extra + "}"
+    return labels[:-1] + "," + extra + "}"
+
+
+def _format_value(value: float) -> str:
+    """
+    format a sample value
+    """
+    if isinstance(value, int):
+        return str(value)
+    return repr(float(value))
+
+
+class Metric:
+    """
+    a named metric with optional labels
+    """
+
+    kind = "untyped"
+
+    def __init__(self, name: str, help_text: str, label_names: Iterable[str] = ()):
+        """
+        constructor
+
+        Args:
+            name(str): the metric name
+            help_text(str): the help text
+            label_names(Iterable[str]): the names of the labels
+        """
+        self.name = name
+        self.help_text = help_text
+        self.label_names = tuple(label_names)
+
+    def samples(self) -> List[Tuple[str, str, float]]:
+        """
+        get my samples as (suffixed name, formatted labels, value) tuples
+        """
+        return []
+
+    def render(self, extra_labels: str = "") -> str:
+        """
+        render me in the Prometheus text exposition format
+
+        Args:
+            extra_labels(str): formatted labels to add to each sample
+        """
+        lines = [
+            f"# HELP {self.name} {self.help_text}",
+            f"# TYPE {self.name} {self.kind}",
+        ]
+        for name, labels, value in self.samples():
+            labels = _merge_labels(labels, extra_labels)
+            lines.append(f"{name}{labels} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+
+class Counter(Metric):
+    """
+    a monotonically increasing counter
+    """
+
+    kind = "counter"
+
+    def __init__(self, name: str, help_text: str, label_names: Iterable[str] = ()):
+        Metric.__init__(self, name, help_text, label_names)
+        self.values: Dict[LabelValues, int] = {}
+
+    def inc(self, *label_values: str, amount: int = 1):
+        """
+        increment the counter for the given label values
+        """
+        self.values[label_values] = self.values.get(label_values, 0) + amount
+
+    def samples(self):
+        return [
+            (self.name, _format_labels(self.label_names, values), count)
+            for values, count in sorted(self.values.items())
+        ]
+
+
+class Gauge(Metric):
+    """
+    a gauge whose values are collected by a callback at scrape time
+    so that hot code paths never need to update it
+    """
+
+    kind = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        collect: Callable[[], Dict[LabelValues, float]],
+        label_names: Iterable[str] = (),
+    ):
+        """
+        constructor
+
+        Args:
+            name(str): the metric name
+            help_text(str): the help text
+            collect(Callable): callback returning the values by label values
+            label_names(Iterable[str]): the names of the labels
+        """
+        Metric.__init__(self, name, help_text, label_names)
+        self.collect = collect
+
+    def samples(self):
+        return [
+            (self.name, _format_labels(self.label_names, values), value)
+            for values, value in sorted(self.collect().items())
+        ]
+
+
+class CallbackCounter(Gauge):
+    """
+    a counter maintained elsewhere e.g. by a cache and collected at scrape time
+    """
+
+    kind = "counter"
+
+
+class Histogram(Metric):
+    """
+    a histogram with fixed buckets
+    """
+
+    kind = "histogram"
+
+    DEFAULT_BUCKETS = (
+        0.001,
+        0.0025,
+        0.005,
+        0.01,
+        0.025,
+        0.05,
+        0.1,
+        0.25,
+        0.5,
+        1.0,
+        2.5,
+        5.0,
+        10.0,
+    )
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        label_names: Iterable[str] = (),
+        buckets: Tuple[float, ...] = DEFAULT_BUCKETS,
+    ):
+        Metric.__init__(self, name, help_text, label_names)
+        self.buckets = tuple(sorted(buckets))
+        # per label values: non cumulative bucket counts (+Inf last), sum
+        self.counts: Dict[LabelValues, List[int]] = {}
+        self.sums: Dict[LabelValues, float] = {}
+
+    def observe(self, value: float, *label_values: str):
+        """
+        record an observation for the given label values
+        """
+        counts = self.counts.get(label_values)
+        if counts is None:
+            counts = [0] * (len(self.buckets) + 1)
+            self.counts[label_values] = counts
+            self.sums[label_values] = 0.0
+        counts[bisect_left(self.buckets, value)] += 1
+        self.sums[label_values] += value
+
+    def samples(self):
+        samples = []
+        for values, counts in sorted(self.counts.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                labels = _format_labels(self.label_names, values, f'le="{le}"')
+                samples.append((f"{self.name}_bucket", labels, cumulative))
+            labels = _format_labels(self.label_names, values)
+            samples.append((f"{self.name}_sum", labels, self.sums[values]))
+            samples.append((f"{self.name}_count", labels, cumulative))
+        return samples
+
+
+class MetricsRegistry:
+    """
+    in-process registry of metrics rendered for the /metrics endpoint
+
+    pre-forked workers each keep their own metrics and a scrape reaches
+    only one of them - with pid_label each sample carries the pid of its
+    worker so that the series of the workers do not look like resets of
+    each other and can be summed up by the monitoring
+    """
+
+    def __init__(self, prefix: str = "ceurspt", pid_label: bool = False):
+        """
+        constructor
+
+        Args:
+            prefix(str): the prefix for all metric names
+            pid_label(bool): if True label each sample with the process id
+        """
+        self.prefix = prefix
+        self.pid_label = pid_label
+        self.metrics: Dict[str, Metric] = {}
+        # caches with hits, misses and evictions attributes by name
+        self.caches: Dict[str, object] = {}
+        self.requests = self.add(
+            Counter(
+                f"{prefix}_http_requests_total",
+                "number of HTTP requests by route, method and status",
+                ("route", "method", "status"),
+            )
+        )
+        self.latency = self.add(
+            Histogram(
+                f"{prefix}_http_request_duration_seconds",
+                "HTTP request latency by route",
+                ("route",),
+            )
+        )
+        for event in ["hits", "misses", "evictions"]:
+            self.add(
+                CallbackCounter(
+                    f"{prefix}_cache_{event}_total",
+                    f"number of cache {event} by cache",
+                    self._cache_collector(event),
+                    ("cache",),
+                )
+            )
+        self.add(
+            Gauge(
+                f"{prefix}_cache_entries",
+                "number of entries by cache",
+                lambda: {(name,): len(cache) for name, cache in self.caches.items()},
+                ("cache",),
+            )
+        )
+
+    def _cache_collector(self, event: str):
+        """
+        get a collector for the given cache event counter
+        """
+
+        def collect():
+            return {
+                (name,): getattr(cache, event, 0) for name, cache in self.caches.items()
+            }
+
+        return collect
+
+    def add(self, metric: Metric) -> Metric:
+        """
+        add the given metric
+
+        Args:
+            metric(Metric): the metric to add
+
+        Returns:
+            Metric: the metric added
+        """
+        self.metrics[metric.name] = metric
+        return metric
+
+    def add_gauge(
+        self,
+        name: str,
+        help_text: str,
+        collect: Callable[[], Dict[LabelValues, float]],
+        label_names: Iterable[str] = (),
+    ) -> Gauge:
+        """
+        add a callback gauge with my prefix
+        """
+        return self.add(Gauge(f"{self.prefix}_{name}", help_text, collect, label_names))
+
+    def register_cache(self, name: str, cache: object):
+        """
+        register a cache that counts hits, misses and evictions
+
+        Args:
+            name(str): the name of the cache
+            cache(object): the cache
+        """
+        self.caches[name] = cache
+
+    def register_managers(self, vm, pm):
+        """
+        register the gauges for the given volume and paper manager
+
+        Args:
+            vm(VolumeManager): the volume manager
+            pm(PaperManager): the paper manager
+        """
+        self.add_gauge(
+            "index_entries",
+            "number of entries by index",
+            lambda: {
+                ("volumes_by_number",): len(vm.volumes_by_number),
+                ("papers_by_path",): len(pm.papers_by_path),
+                ("paper_dblp_by_path",): len(pm.paper_dblp_by_path),
+            },
+            ("index",),
+        )
+        managers = {"volumes": vm, "papers": pm}
+
+        def lod_durations():
+            return {
+                (manager_name, lod_name): duration
+                for manager_name, manager in managers.items()
+                for lod_name, duration in manager.lod_load_durations.items()
+            }
+
+        def lod_ages():
+            now = time.time()
+            return {
+                (manager_name, lod_name): now - loaded
+                for manager_name, manager in managers.items()
+                for lod_name, loaded in manager.lod_load_times.items()
+            }
+
+        self.add_gauge(
+            "lod_load_duration_seconds",
+            "duration of the last load of each list of dicts",
+            lod_durations,
+            ("manager", "lod"),
+        )
+        self.add_gauge(
+            "lod_age_seconds",
+            "seconds since each list of dicts was loaded",
+            lod_ages,
+            ("manager", "lod"),
+        )
+
+    def observe_request(self, route: str, method: str, status: int, elapsed: float):
+        """
+        record a finished request
+        """
+        self.requests.inc(route, method, str(status))
+        self.latency.observe(elapsed, route)
+
+    def render(self) -> str:
+        """
+        render all metrics in the Prometheus text exposition format
+        """
+        # the pid is taken at render time since workers are forked after
+        # the registry has been created
+        extra_labels = f'pid="{os.getpid()}"' if self.pid_label else ""
+        return "".join(metric.render(extra_labels) for metric in self.metrics.values())
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware counting requests and their latency per route template
+    """
+
+    def __init__(self, app: ASGIApp, metrics: MetricsRegistry):
+        self.app = app
+        self.metrics = metrics
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        start = time.perf_counter()
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = time.perf_counter() - start
+            self.metrics.observe_request(
+                self.route_label(scope), scope["method"], status_code, elapsed
+            )
+
+    @classmethod
+    def route_label(cls, scope: Scope) -> str:
+        """
+        get the route template of the request so that the label
+        cardinality is bounded by the number of routes
+        """
+        route = scope.get("route")
+        path = getattr(route, "path", None) if route is not None else None
+        if path is None:
+            return "unmatched"
+        return path
@@ -0,0 +1,409 @@
+"""
+Created on 2026-10-19
+
+@author: agent
+"""
+
+import hashlib
+import http.client
+import os
+import shutil
+import threading
+import time
+import urllib.parse
+import zipfile
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from typing import Dict, List, Optional
+
+
+class ConnectionPool:
+    """
+    bounded pool of keep-alive connections to a single http(s) host
+
+    at most max_size connections are open at a time - idle connections
+    are reused by the next request
+    """
+
+    def __init__(self, url: str, max_size: int = 4, timeout: float = 60.0):
+        """
+        constructor
+
+        Args:
+            url(str): the url of the host e.g. https://ceur-ws.org/ftp-dir
+            max_size(int): the maximum number of open connections
+            timeout(float): the socket timeout in seconds
+        """
+        parsed = urllib.parse.urlsplit(url)
+        if parsed.scheme not in ("http", "https"):
+            raise ValueError(f"unsupported mirror url {url}")
+        self.scheme = parsed.scheme
+        self.host = parsed.hostname
+        self.port = parsed.port
+        self.path = parsed.path.rstrip("/")
+        self.timeout = timeout
+        self.slots = threading.BoundedSemaphore(max_size)
+        self.idle: List[http.client.HTTPConnection] = []
+        self.lock = threading.Lock()
+        self.opened = 0
+
+    def acquire(self) -> http.client.HTTPConnection:
+        """
+        get an idle or new connection - blocks while max_size connections are in use
+        """
+        self.slots.acquire()
+        with self.lock:
+            if self.idle:
+                return self.idle.pop()
+            self.opened += 1
+        connection_class = (
+            http.client.HTTPSConnection
+            if self.scheme == "https"
+            else http.client.HTTPConnection
+        )
+        return connection_class(self.host, self.port, timeout=self.timeout)
+
+    def release(self, connection: http.client.HTTPConnection, reuse: bool):
+        """
+        return the given connection to the pool
+
+        Args:
+            connection(HTTPConnection): the connection acquired before
+            reuse(bool): False if the connection is in an unknown state
+        """
+        if reuse:
+            with self.lock:
+                self.idle.append(connection)
+        else:
+            connection.close()
+        self.slots.release()
+
+    def close(self):
+        """
+        close the idle connections
+        """
+        with self.lock:
+            for connection in self.idle:
+                connection.close()
+            self.idle = []
+
+
+class VolumeMirror:
+    """
+    mirror the Vol-N.zip archives of a range of volumes
+
+    the archives are downloaded concurrently over a bounded pool of
+    keep-alive connections into Vol-N.zip.part files that are resumed by
+    range requests after an interruption - complete archives are verified
+    against the SHA256SUMS of the mirror if available and their CRCs
+    before they are renamed to Vol-N.zip
+
+    the archives are extracted in parallel to a temporary directory that
+    is renamed to Vol-N when complete so that volumes with a Vol-N
+    directory (or a Vol-N.zip with keep_zip) are skipped on the next run
+
+    threads are used for the extraction as well since zlib and the file
+    writes release the GIL and the downloads keep running while extracting
+    """
+
+    DEFAULT_URL = "https://ceur-ws.wikidata.dbis.rwth-aachen.de/ftp-dir"
+    CHUNK_SIZE = 1024 * 1024
+
+    def __init__(
+        self,
+        base_path: str,
+        mirror_url: str = DEFAULT_URL,
+        connections: int = 4,
+        workers: int = 4,
+        keep_zip: bool = False,
+        retries: int = 3,
+        timeout: float = 60.0,
+    ):
+        """
+        constructor
+
+        Args:
+            base_path(str): the directory of the volumes
+            mirror_url(str): the url of the directory with the Vol-N.zip archives
+            connections(int): the maximum number of concurrent downloads
+            workers(int): the number of concurrent extractions
+            keep_zip(bool): keep the archives instead of extracting them
+            retries(int): the number of attempts per download
+            timeout(float): the socket timeout in seconds
+        """
+        self.base_path = base_path
+        self.mirror_url = mirror_url
+        self.connections = max(1, connections)
+        self.workers = max(1, workers)
+        self.keep_zip = keep_zip
+        self.retries = max(1, retries)
+        self.pool = ConnectionPool(mirror_url, self.connections, timeout=timeout)
+        self.checksums: Optional[Dict[str, str]] = None
+        self.checksums_lock = threading.Lock()
+
+    def is_complete(self, number: int) -> bool:
+        """
+        check whether the given volume was mirrored completely
+        """
+        vol_path = f"{self.base_path}/Vol-{number}"
+        if self.keep_zip:
+            return os.path.isfile(f"{vol_path}.zip") or os.path.isdir(vol_path)
+        return os.path.isdir(vol_path)
+
+    def get(self, name: str, offset: int = 0) -> Optional[http.client.HTTPResponse]:
+        """
+        start a GET request for the given file of the mirror
+
+        Args:
+            name(str): the file name e.g. Vol-3262.zip
+            offset(int): the first byte wanted
+
+        Returns:
+            HTTPResponse: the response with its connection as attribute - None if
+            the file does not exist - the caller has to call finish
+        """
+        connection = self.pool.acquire()
+        headers = {"Range": f"bytes={offset}-"} if offset else {}
+        try:
+            connection.request("GET", f"{self.pool.path}/{name}", headers=headers)
+            response = connection.getresponse()
+        except Exception:
+            self.pool.release(connection, reuse=False)
+            raise
+        response.pool_connection = connection
+        if response.status == 404:
+            response.read()
+            self.finish(response)
+            return None
+        return response
+
+    def finish(self, response: http.client.HTTPResponse):
+        """
+        release the connection of the given response to the pool
+        """
+        reuse = response.isclosed() and not response.will_close
+        if not response.isclosed():
+            response.close()
+        self.pool.release(response.pool_connection, reuse=reuse)
+
+    def load_checksums(self) -> Dict[str, str]:
+        """
+        load the SHA256SUMS of the mirror - empty if there are none
+        """
+        with self.checksums_lock:
+            if self.checksums is None:
+                self.checksums = self.fetch_checksums()
+        return self.checksums
+
+    def fetch_checksums(self) -> Dict[str, str]:
+        """
+        fetch the sha256sum formatted checksums by file name
+        """
+        checksums = {}
+        response = self.get("SHA256SUMS")
+        if response is not None:
+            try:
+                if response.status == 200:
+                    for line in response.read().decode("utf-8").splitlines():
+                        digest, _sep, name = line.strip().partition(" ")
+                        if name:
+                            checksums[name.strip().lstrip("*")] = digest.lower()
+                else:
+                    response.read()
+            finally:
+                self.finish(response)
+        return checksums
+
+    def download(self, number: int) -> dict:
+        """
+        download the archive of the given volume resuming a partial download
+
+        Returns:
+            dict: the volume number, the status downloaded, missing or failed,
+            the number of bytes received and whether the download was resumed
+        """
+        name = f"Vol-{number}.zip"
+        zip_path = f"{self.base_path}/{name}"
+        part_path = f"{zip_path}.part"
+        result = {"volume": number, "status": "failed", "bytes": 0, "resumed": False}
+        for _attempt in range(self.retries):
+            offset = os.path.getsize(part_path) if os.path.isfile(part_path) else 0
+            try:
+                response = self.get(name, offset)
+                if response is None:
+                    result["status"] = "missing"
+                    return result
+                try:
+                    received = self.receive(response, part_path, offset)
+                finally:
+                    self.finish(response)
+            except (OSError, http.client.HTTPException) as ex:
+                result["error"] = str(ex)
+                continue
+            if received is None:
+                result["error"] = f"HTTP {response.status} for {name}"
+                return result
+            result["bytes"] += received
+            result["resumed"] = result["resumed"] or (
+                offset > 0 and response.status != 200
+            )
+            error = self.verify(name, part_path)
+            if error:
+                os.remove(part_path)
+                result["error"] = error
+                return result
+            os.replace(part_path, zip_path)
+            result.pop("error", None)
+            result["status"] = "downloaded"
+            return result
+        return result
+
+    def receive(
+        self, response: http.client.HTTPResponse, part_path: str, offset: int
+    ) -> Optional[int]:
+        """
+        write the body of the given response to the partial file
+
+        Returns:
+            int: the number of bytes received or None for unexpected responses
+
+        Raises:
+            IncompleteRead: if the connection was closed before the end of the body
+        """
+        if response.status == 416 and offset:
+            # the partial file is already complete
+            response.read()
+            return 0
+        if response.status == 200:
+            offset = 0
+        elif response.status == 206:
+            content_range = response.getheader("Content-Range", "")
+            start = content_range.partition(" ")[2].partition("-")[0]
+            if start != str(offset):
+                # start over with the next attempt
+                os.remove(part_path)
+                raise http.client.HTTPException(f"unexpected range {content_range}")
+        else:
+            response.read()
+            return None
+        expected = response.getheader("Content-Length")
+        received = 0
+        with open(part_path, "ab" if offset else "wb") as part_file:
+            while True:
+                chunk = response.read(self.CHUNK_SIZE)
+                if not chunk:
+                    break
+                part_file.write(chunk)
+                received += len(chunk)
+        if expected is not None and received != int(expected):
+            raise http.client.IncompleteRead(b"", int(expected) - received)
+        return received
+
+    def verify(self, name: str, part_path: str) -> Optional[str]:
+        """
+        verify the downloaded archive against the checksum of the mirror
+
+        Returns:
+            str: the error or None if the archive is valid
+        """
+        digest = self.load_checksums().get(name)
+        if digest:
+            sha256 = hashlib.sha256()
+            with open(part_path, "rb") as part_file:
+                for chunk in iter(lambda: part_file.read(self.CHUNK_SIZE), b""):
+                    sha256.update(chunk)
+            actual = sha256.hexdigest()
+            if actual != digest:
+                return f"sha256 mismatch for {name}: {actual} != {digest}"
+        try:
+            with zipfile.ZipFile(part_path) as zip_file:
+                bad_member = zip_file.testzip()
+        except (OSError, zipfile.BadZipFile) as ex:
+            return f"{name} is not a valid zip archive: {ex}"
+        if bad_member:
+            return f"bad CRC of {bad_member} in {name}"
+        return None
+
+    def extract(self, number: int) -> Optional[str]:
+        """
+        extract the archive of the given volume to its Vol-N directory
+
+        Returns:
+            str: the error or None if the volume was extracted
+        """
+        vol_name = f"Vol-{number}"
+        zip_path = f"{self.base_path}/{vol_name}.zip"
+        tmp_dir = f"{self.base_path}/.{vol_name}.tmp"
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        try:
+            with zipfile.ZipFile(zip_path) as zip_file:
+                names = zip_file.namelist()
+                prefixed = all(name.startswith(f"{vol_name}/") for name in names)
+                target = tmp_dir if prefixed else f"{tmp_dir}/{vol_name}"
+                zip_file.extractall(target)
+            os.replace(f"{tmp_dir}/{vol_name}", f"{self.base_path}/{vol_name}")
+        except (OSError, zipfile.BadZipFile) as ex:
+            return str(ex)
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+        os.remove(zip_path)
+        return None
+
+    def mirror(self, first: int, last: int) -> dict:
+        """
+        mirror the volumes of the given range
+
+        Args:
+            first(int): the number of the first volume
+            last(int): the number of the last volume (inclusive)
+
+        Returns:
+            dict: the results by volume, the counts by status and the seconds taken
+        """
+        start = time.perf_counter()
+        os.makedirs(self.base_path, exist_ok=True)
+        results = {}
+        pending = []
+        for number in range(first, last + 1):
+            if self.is_complete(number):
+                results[number] = {"volume": number, "status": "skipped", "bytes": 0}
+            else:
+                pending.append(number)
+        downloads = ThreadPoolExecutor(max_workers=self.connections)
+        extractions = ThreadPoolExecutor(max_workers=self.workers)
+        with downloads, extractions:
+            futures = {}
+            extracting: Dict[Future, dict] = {}
+            for number in pending:
+                if os.path.isfile(f"{self.base_path}/Vol-{number}.zip"):
+                    # downloaded by an earlier run that did not extract it
+                    result = {"volume": number, "status": "downloaded", "bytes": 0}
+                    results[number] = result
+                    if not self.keep_zip:
+                        extracting[extractions.submit(self.extract, number)] = result
+                else:
+                    futures[downloads.submit(self.download, number)] = number
+            for future in as_completed(futures):
+                result = future.result()
+                results[result["volume"]] = result
+                if result["status"] == "downloaded" and not self.keep_zip:
+                    extracting[extractions.submit(self.extract, result["volume"])] = (
+                        result
+                    )
+            for future in as_completed(extracting):
+                result = extracting[future]
+                error = future.result()
+                if error:
+                    result["status"] = "failed"
+                    result["error"] = error
+                else:
+                    result["status"] = "extracted"
+        self.pool.close()
+        counts: Dict[str, int] = {}
+        for result in results.values():
+            counts[result["status"]] = counts.get(result["status"], 0) + 1
+        return {
+            "volumes": [results[number] for number in sorted(results)],
+            "counts": counts,
+            "bytes": sum(result["bytes"] for result in results.values()),
+            "seconds": time.perf_counter() - start,
+        }
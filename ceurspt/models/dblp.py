@@ -1,46 +1,275 @@
-from dataclasses import dataclass, field
-from typing import List, Optional
-
-
-@dataclass
-class DblpScholar:
-    dblp_author_id: str
-    label: Optional[str] = None
-    wikidata_id: Optional[str] = None
-    orcid_id: Optional[str] = None
-    gnd_id: Optional[str] = None
-
-
-@dataclass
-class DblpPaper:
-    dblp_publication_id: str
-    dblp_proceeding_id: str
-    volume_number: int
-    title: str
-    authors: Optional[List[DblpScholar]] = field(default_factory=list)
-    pdf_id: Optional[str] = None
-
-    def __post_init__(self):
-        for i, author in enumerate(self.authors):
-            if isinstance(author, dict):
-                self.authors[i] = DblpScholar(**author)
-
-
-@dataclass
-class DblpProceeding:
-    dblp_publication_id: str
-    volume_number: int
-    title: str
-    dblp_event_id: Optional[str] = None
-    papers: Optional[List[DblpPaper]] = field(default_factory=list)
-    editors: Optional[List[DblpScholar]] = field(default_factory=list)
-
-    def __post_init__(self):
-        if self.editors:
-            for i, editor in enumerate(self.editors):
-                if isinstance(editor, dict):
-                    self.editors[i] = DblpScholar(**editor)
-        if self.papers:
-            for i, paper in enumerate(self.papers):
-                if isinstance(paper, dict):
-                    self.papers[i] = DblpPaper(**paper)
+"""
+Created on 2026-10-19
+
+@author: agent
+"""
+
+import logging
+import sys
+from typing import Dict, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+# the slots by model class
+_ALL_SLOTS: Dict[type, Tuple[str, ...]] = {}
+# the unknown keys already logged by model class
+_UNKNOWN_KEYS: Set[Tuple[type, str]] = set()
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    """
+    intern the given identifier so that equal identifiers share one string
+    """
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+class DblpModel:
+    """
+    base of the compact dblp model classes
+
+    the models use __slots__ instead of a per instance __dict__ and
+    intern their identifiers since the same ids repeat across the corpus
+
+    keys of the records without a slot are not kept - each unknown key is
+    logged once per class so that new fields of the dblp records show up
+    """
+
+    __slots__ = ()
+    # the slots that hold identifiers
+    ID_SLOTS = ()
+
+    def __init__(self, **kwargs):
+        slots = self.all_slots()
+        for slot in slots:
+            value = kwargs.get(slot)
+            if slot in self.ID_SLOTS:
+                value = _intern(value)
+            setattr(self, slot, value)
+        if len(kwargs) > len(slots):
+            self.log_unknown_keys(kwargs)
+
+    @classmethod
+    def log_unknown_keys(cls, record: dict):
+        """
+        log the keys of the given record that have no slot - once per class
+        """
+        slots = cls.all_slots()
+        for key in record:
+            if key not in slots and (cls, key) not in _UNKNOWN_KEYS:
+                _UNKNOWN_KEYS.add((cls, key))
+                logger.warning(f"{cls.__name__} ignores the unknown key {key}")
+
+    @classmethod
+    def all_slots(cls) -> Tuple[str, ...]:
+        """
+        get the slots of my class and its bases in definition order
+        """
+        slots = _ALL_SLOTS.get(cls)
+        if slots is None:
+            slots = tuple(
+                slot
+                for klass in reversed(cls.__mro__)
+                for slot in klass.__dict__.get("__slots__", ())
+            )
+            _ALL_SLOTS[cls] = slots
+        return slots
+
+    def __eq__(self, other) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(
+            getattr(self, slot) == getattr(other, slot) for slot in self.all_slots()
+        )
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        fields = ", ".join(
+            f"{slot}={getattr(self, slot, None)!r}" for slot in self.all_slots()
+        )
+        return f"{type(self).__name__}({fields})"
+
+    def to_dict(self) -> dict:
+        """
+        convert me to a dict in the format of the dblp json records
+        """
+        record = {}
+        for slot in self.all_slots():
+            value = getattr(self, slot)
+            if isinstance(value, list):
+                value = [
+                    item.to_dict() if isinstance(item, DblpModel) else item
+                    for item in value
+                ]
+            record[slot] = value
+        return record
+
+
+class DblpScholar(DblpModel):
+    """
+    a dblp author or editor - shared by all papers and proceedings of the
+    scholar when loaded with a scholars registry
+    """
+
+    __slots__ = ("dblp_author_id", "label", "wikidata_id", "orcid_id", "gnd_id")
+    ID_SLOTS = ("dblp_author_id", "wikidata_id", "orcid_id", "gnd_id")
+
+    def __init__(
+        self,
+        dblp_author_id: Optional[str] = None,
+        label: Optional[str] = None,
+        wikidata_id: Optional[str] = None,
+        orcid_id: Optional[str] = None,
+        gnd_id: Optional[str] = None,
+        **kwargs,
+    ):
+        super().__init__(
+            dblp_author_id=dblp_author_id,
+            label=label,
+            wikidata_id=wikidata_id,
+            orcid_id=orcid_id,
+            gnd_id=gnd_id,
+            **kwargs,
+        )
+
+    @classmethod
+    def from_dict(
+        cls, record: dict, scholars: Optional[Dict[str, "DblpScholar"]] = None
+    ) -> "DblpScholar":
+        """
+        get the scholar for the given record
+
+        Args:
+            record(dict): the dblp author record
+            scholars(dict): registry of scholars by dblp author id to share instances
+
+        Returns:
+            DblpScholar: the shared or a new scholar
+        """
+        author_id = record.get("dblp_author_id")
+        if scholars is not None and author_id:
+            scholar = scholars.get(author_id)
+            if scholar is None:
+                scholar = cls(**record)
+                scholars[scholar.dblp_author_id] = scholar
+            return scholar
+        return cls(**record)
+
+
+def _scholars(
+    records: Optional[list], scholars: Optional[Dict[str, DblpScholar]]
+) -> List[DblpScholar]:
+    """
+    convert the given author or editor records to scholars
+    """
+    return [
+        (
+            DblpScholar.from_dict(record, scholars)
+            if isinstance(record, dict)
+            else record
+        )
+        for record in records or []
+    ]
+
+
+class DblpPaper(DblpModel):
+    """
+    the dblp metadata of a CEUR-WS paper with its authors
+    """
+
+    __slots__ = (
+        "dblp_publication_id",
+        "dblp_proceeding_id",
+        "volume_number",
+        "title",
+        "authors",
+        "pdf_id",
+    )
+    ID_SLOTS = ("dblp_publication_id", "dblp_proceeding_id", "pdf_id")
+
+    def __init__(
+        self,
+        dblp_publication_id: str,
+        dblp_proceeding_id: str,
+        volume_number: int,
+        title: str,
+        authors: Optional[List[DblpScholar]] = None,
+        pdf_id: Optional[str] = None,
+        scholars: Optional[Dict[str, DblpScholar]] = None,
+    ):
+        super().__init__(
+            dblp_publication_id=dblp_publication_id,
+            dblp_proceeding_id=dblp_proceeding_id,
+            volume_number=volume_number,
+            title=title,
+            authors=_scholars(authors, scholars),
+            pdf_id=pdf_id,
+        )
+
+    @classmethod
+    def from_dict(
+        cls, record: dict, scholars: Optional[Dict[str, DblpScholar]] = None
+    ) -> "DblpPaper":
+        """
+        get the paper for the given record
+
+        Args:
+            record(dict): the dblp paper record
+            scholars(dict): registry of scholars by dblp author id to share instances
+        """
+        return cls(**record, scholars=scholars)
+
+
+class DblpProceeding(DblpModel):
+    """
+    the dblp metadata of a CEUR-WS volume with its papers and editors
+    """
+
+    __slots__ = (
+        "dblp_publication_id",
+        "volume_number",
+        "title",
+        "dblp_event_id",
+        "papers",
+        "editors",
+    )
+    ID_SLOTS = ("dblp_publication_id", "dblp_event_id")
+
+    def __init__(
+        self,
+        dblp_publication_id: str,
+        volume_number: int,
+        title: str,
+        dblp_event_id: Optional[str] = None,
+        papers: Optional[List[DblpPaper]] = None,
+        editors: Optional[List[DblpScholar]] = None,
+        scholars: Optional[Dict[str, DblpScholar]] = None,
+    ):
+        super().__init__(
+            dblp_publication_id=dblp_publication_id,
+            volume_number=volume_number,
+            title=title,
+            dblp_event_id=dblp_event_id,
+            papers=[
+                (
+                    DblpPaper.from_dict(paper, scholars)
+                    if isinstance(paper, dict)
+                    else paper
+                )
+                for paper in papers or []
+            ],
+            editors=_scholars(editors, scholars),
+        )
+
+    @classmethod
+    def from_dict(
+        cls, record: dict, scholars: Optional[Dict[str, DblpScholar]] = None
+    ) -> "DblpProceeding":
+        """
+        get the proceeding for the given record
+
+        Args:
+            record(dict): the dblp proceeding record
+            scholars(dict): registry of scholars by dblp author id to share instances
+        """
+        return cls(**record, scholars=scholars)
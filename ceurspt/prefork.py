@@ -0,0 +1,331 @@
+"""
+Created on 2026-10-19
+
+@author: agent
+"""
+
+import gc
+import os
+import signal
+import socket
+import time
+from typing import Dict, List, Optional
+
+import uvicorn
+from starlette.types import ASGIApp
+
+from ceurspt.replay import AccessLogEntry, LogReplayer
+
+
+class PreforkServer:
+    """
+    serve an ASGI app from several forked uvicorn workers
+
+    the parent loads and indexes everything once, freezes the garbage
+    collector so that the loaded objects are never touched by collections
+    and forks the workers which then share the loaded state copy-on-write
+    """
+
+    LOOPS = ["auto", "asyncio", "uvloop"]
+    HTTPS = ["auto", "h11", "httptools"]
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        host: str = "127.0.0.1",
+        port: int = 9990,
+        workers: int = 2,
+        loop: str = "auto",
+        http: str = "auto",
+        log_level: str = "info",
+    ):
+        """
+        constructor
+
+        Args:
+            app(ASGIApp): the application to serve
+            host(str): the host to listen on
+            port(int): the port to listen on
+            workers(int): the number of worker processes
+            loop(str): the event loop implementation auto, asyncio or uvloop
+            http(str): the http protocol implementation auto, h11 or httptools
+            log_level(str): the uvicorn log level of the workers
+        """
+        if not hasattr(os, "fork"):
+            raise RuntimeError("pre-fork serving needs os.fork")
+        self.app = app
+        self.host = host
+        self.port = port
+        self.workers = workers
+        self.loop = loop
+        self.http = http
+        self.log_level = log_level
+        self.sock: Optional[socket.socket] = None
+        self.pids: List[int] = []
+        self.stopping = False
+
+    def bind(self) -> socket.socket:
+        """
+        bind the listening socket shared by all workers
+        """
+        family = socket.AF_INET6 if ":" in self.host else socket.AF_INET
+        sock = socket.socket(family, socket.SOCK_STREAM)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        sock.bind((self.host, self.port))
+        sock.listen(2048)
+        sock.set_inheritable(True)
+        return sock
+
+    def spawn(self) -> int:
+        """
+        fork a worker serving on the shared socket
+
+        Returns:
+            int: the pid of the worker
+        """
+        pid = os.fork()
+        if pid:
+            self.pids.append(pid)
+            return pid
+        # worker
+        exit_code = 0
+        try:
+            signal.signal(signal.SIGINT, signal.SIG_DFL)
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+            gc.enable()
+            config = uvicorn.Config(
+                self.app, loop=self.loop, http=self.http, log_level=self.log_level
+            )
+            server = uvicorn.Server(config)
+            server.run(sockets=[self.sock])
+        except BaseException:
+            exit_code = 1
+        finally:
+            os._exit(exit_code)
+
+    def start(self):
+        """
+        bind the socket, freeze the loaded state and fork my workers
+        """
+        self.sock = self.bind()
+        # move everything loaded so far to the permanent generation so that
+        # collections in the workers do not write to the shared pages
+        gc.collect()
+        gc.freeze()
+        for _worker in range(self.workers):
+            self.spawn()
+
+    def stop(self, timeout: float = 10.0):
+        """
+        terminate my workers and wait for them
+        """
+        self.stopping = True
+        for pid in self.pids:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+        deadline = time.monotonic() + timeout
+        for pid in list(self.pids):
+            while True:
+                try:
+                    done, _status = os.waitpid(pid, os.WNOHANG)
+                except ChildProcessError:
+                    break
+                if done or time.monotonic() > deadline:
+                    if not done:
+                        os.kill(pid, signal.SIGKILL)
+                        os.waitpid(pid, 0)
+                    break
+                time.sleep(0.05)
+        self.pids = []
+        if self.sock is not None:
+            self.sock.close()
+            self.sock = None
+        gc.unfreeze()
+
+    def serve(self):
+        """
+        start my workers and supervise them until SIGINT or SIGTERM
+        restarting workers that died unexpectedly
+        """
+
+        def handle_signal(_signum, _frame):
+            self.stopping = True
+            for pid in self.pids:
+                try:
+                    os.kill(pid, signal.SIGTERM)
+                except ProcessLookupError:
+                    pass
+
+        self.start()
+        signal.signal(signal.SIGINT, handle_signal)
+        signal.signal(signal.SIGTERM, handle_signal)
+        print(
+            f"serving on {self.host}:{self.port} with {self.workers} workers {self.pids}",
+            flush=True,
+        )
+        while self.pids:
+            try:
+                pid, _status = os.wait()
+            except ChildProcessError:
+                break
+            if pid in self.pids:
+                self.pids.remove(pid)
+                if not self.stopping:
+                    print(f"worker {pid} died - restarting", flush=True)
+                    self.spawn()
+        self.sock.close()
+
+    def wait_ready(self, timeout: float = 10.0) -> bool:
+        """
+        wait until my workers accept connections
+        """
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            try:
+                with socket.create_connection((self.host, self.port), timeout=1):
+                    pass
+                return True
+            except OSError:
+                time.sleep(0.05)
+        return False
+
+    @classmethod
+    def process_memory(cls, pid: int) -> Dict[str, int]:
+        """
+        get the memory of the given process from /proc/<pid>/smaps_rollup
+
+        Args:
+            pid(int): the process id
+
+        Returns:
+            dict: rss, pss and uss (unique set size) in bytes - empty if not available
+        """
+        fields = {}
+        try:
+            with open(f"/proc/{pid}/smaps_rollup", encoding="utf-8") as smaps:
+                for line in smaps:
+                    key, _sep, value = line.partition(":")
+                    parts = value.split()
+                    if len(parts) == 2 and parts[1] == "kB":
+                        fields[key] = int(parts[0]) * 1024
+        except OSError:
+            return {}
+        return {
+            "rss": fields.get("Rss", 0),
+            "pss": fields.get("Pss", 0),
+            "uss": fields.get("Private_Clean", 0) + fields.get("Private_Dirty", 0),
+        }
+
+    def worker_memory(self) -> Dict[int, Dict[str, int]]:
+        """
+        get the memory of each of my workers
+        """
+        return {pid: self.process_memory(pid) for pid in self.pids}
+
+
+class PreforkBenchmark:
+    """
+    measure the aggregate throughput and the per worker unique memory
+    for different numbers of pre-forked workers
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        paths: List[str],
+        port: int = 9991,
+        loop: str = "auto",
+        http: str = "auto",
+    ):
+        """
+        constructor
+
+        Args:
+            app(ASGIApp): the application to serve
+            paths(list): the request paths to cycle through
+            port(int): the local port to use
+            loop(str): the event loop implementation
+            http(str): the http protocol implementation
+        """
+        self.app = app
+        self.paths = paths
+        self.port = port
+        self.loop = loop
+        self.http = http
+
+    def measure(self, workers: int, requests: int, concurrency: int) -> dict:
+        """
+        measure the given number of workers
+
+        Returns:
+            dict: throughput, latencies and worker memory
+        """
+        server = PreforkServer(
+            self.app,
+            port=self.port,
+            workers=workers,
+            loop=self.loop,
+            http=self.http,
+            log_level="warning",
+        )
+        server.start()
+        try:
+            if not server.wait_ready():
+                raise RuntimeError(f"workers did not start on port {self.port}")
+            replayer = LogReplayer(
+                base_url=f"http://127.0.0.1:{self.port}", concurrency=concurrency
+            )
+            entries = [
+                AccessLogEntry("GET", self.paths[i % len(self.paths)], 200)
+                for i in range(requests)
+            ]
+            # warm up every worker before measuring
+            replayer.replay(entries[: max(len(self.paths), workers * 4)])
+            report = replayer.replay(entries)
+            memory = server.worker_memory()
+        finally:
+            server.stop()
+        uss = [mem["uss"] for mem in memory.values() if mem]
+        pss = [mem["pss"] for mem in memory.values() if mem]
+        errors = sum(
+            family["server_errors"] + family["failures"]
+            for family in report["families"].values()
+        )
+        return {
+            "workers": workers,
+            "requests": report["requests"],
+            "errors": errors,
+            "throughput": report["throughput"],
+            "uss_per_worker": sum(uss) / len(uss) if uss else None,
+            "pss_total": sum(pss) if pss else None,
+        }
+
+    def run(
+        self, worker_counts: List[int], requests: int = 2000, concurrency: int = 32
+    ) -> List[dict]:
+        """
+        measure each of the given worker counts
+        """
+        return [
+            self.measure(workers, requests, concurrency) for workers in worker_counts
+        ]
+
+    @classmethod
+    def report_text(cls, rows: List[dict]) -> str:
+        """
+        get the given measurements as text table
+        """
+        lines = [
+            f"{'workers':>8}{'req/s':>10}{'errors':>8}{'USS/worker':>14}{'PSS total':>14}"
+        ]
+        for row in rows:
+            uss = row["uss_per_worker"]
+            pss = row["pss_total"]
+            lines.append(
+                f"{row['workers']:>8}{row['throughput']:>10.1f}{row['errors']:>8}"
+                f"{(f'{uss/2**20:.1f} MiB' if uss is not None else '-'):>14}"
+                f"{(f'{pss/2**20:.1f} MiB' if pss is not None else '-'):>14}"
+            )
+        return "\n".join(lines)
@@ -4,25 +4,285 @@ Created on 27.03.2023
 @author: wf
 """
 
+import json
+import math
+import os
+import threading
 import time
+from contextvars import ContextVar
+from functools import wraps
+from typing import Any, Dict, List, Optional
+
+
+class Span:
+    """
+    a timed span of work that may be nested in a parent span
+    """
+
+    def __init__(self, name: str, parent: Optional["Span"] = None, **args):
+        """
+        constructor
+
+        Args:
+            name(str): the name of the span
+            parent(Span): the enclosing span if any
+            args: additional attributes to record
+        """
+        self.name = name
+        self.parent = parent
+        self.args = args
+        self.tid = threading.get_ident()
+        self.start_ns = time.perf_counter_ns()
+        self.end_ns: Optional[int] = None
+
+    @property
+    def elapsed(self) -> float:
+        """
+        the elapsed time in seconds - up to now if the span is still open
+        """
+        end_ns = self.end_ns if self.end_ns is not None else time.perf_counter_ns()
+        return (end_ns - self.start_ns) / 1e9
+
+
+class _SpanContext:
+    """
+    context manager for a span of a tracer
+    """
+
+    def __init__(self, tracer: "Tracer", name: str, args: Dict[str, Any]):
+        self.tracer = tracer
+        self.name = name
+        self.args = args
+        self.span = None
+
+    def __enter__(self) -> Span:
+        self.span = self.tracer.start_span(self.name, **self.args)
+        return self.span
+
+    def __exit__(self, *_exc):
+        self.tracer.end_span(self.span)
+        return False
+
+
+class _NoSpanContext:
+    """
+    shared no-op context manager used while tracing is disabled
+    """
+
+    def __enter__(self):
+        return None
+
+    def __exit__(self, *_exc):
+        return False
+
+
+_NO_SPAN = _NoSpanContext()
+
+
+class Tracer:
+    """
+    hierarchical span tracer based on the monotonic perf_counter clock
+
+    spans nest via a context variable so they work across threads and
+    asyncio tasks; finished spans can be exported as Chrome trace
+    events (chrome://tracing, Perfetto) or as a nested JSON tree
+    """
+
+    FORMATS = ["chrome", "json"]
+
+    def __init__(self, enabled: bool = False, max_spans: int = 1_000_000):
+        """
+        constructor
+
+        Args:
+            enabled(bool): if True record spans
+            max_spans(int): the maximum number of spans to keep
+        """
+        self.enabled = enabled
+        self.max_spans = max_spans
+        self.spans: List[Span] = []
+        self.dropped = 0
+        self.origin_ns = time.perf_counter_ns()
+        self.current: ContextVar[Optional[Span]] = ContextVar(
+            f"span_{id(self)}", default=None
+        )
+
+    def reset(self):
+        """
+        forget all recorded spans
+        """
+        self.spans = []
+        self.dropped = 0
+        self.origin_ns = time.perf_counter_ns()
+
+    def span(self, name: str, **args):
+        """
+        get a context manager for a span with the given name
+
+        Args:
+            name(str): the name of the span
+            args: additional attributes to record
+
+        Returns:
+            a context manager yielding the Span or None if tracing is disabled
+        """
+        if not self.enabled:
+            return _NO_SPAN
+        return _SpanContext(self, name, args)
+
+    def start_span(self, name: str, **args) -> Span:
+        """
+        start a span as child of the current span
+
+        Args:
+            name(str): the name of the span
+            args: additional attributes to record
+
+        Returns:
+            Span: the started span
+        """
+        span = Span(name, parent=self.current.get(), **args)
+        if self.enabled:
+            span.token = self.current.set(span)
+        return span
+
+    def end_span(self, span: Span):
+        """
+        end the given span and make its parent the current span again
+        """
+        if span is None or span.end_ns is not None:
+            return
+        span.end_ns = time.perf_counter_ns()
+        token = getattr(span, "token", None)
+        if token is None:
+            return
+        try:
+            self.current.reset(token)
+        except ValueError:
+            # ended in another context or out of order
+            self.current.set(span.parent)
+        if len(self.spans) < self.max_spans:
+            self.spans.append(span)
+        else:
+            self.dropped += 1
+
+    def traced(self, name: Optional[str] = None):
+        """
+        decorator tracing each call of the decorated function as a span
+
+        Args:
+            name(str): the span name - defaults to the qualified function name
+        """
+
+        def decorator(func):
+            span_name = name or func.__qualname__
+
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                with self.span(span_name):
+                    return func(*args, **kwargs)
+
+            return wrapper
+
+        return decorator
+
+    def as_chrome_trace(self) -> dict:
+        """
+        get the recorded spans as Chrome trace event format
+
+        Returns:
+            dict: the trace with complete ("X") events in microseconds
+        """
+        pid = os.getpid()
+        events = []
+        for span in sorted(self.spans, key=lambda span: span.start_ns):
+            event = {
+                "name": span.name,
+                "ph": "X",
+                "ts": (span.start_ns - self.origin_ns) / 1000,
+                "dur": (span.end_ns - span.start_ns) / 1000,
+                "pid": pid,
+                "tid": span.tid,
+            }
+            if span.args:
+                event["args"] = {key: str(value) for key, value in span.args.items()}
+            events.append(event)
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def as_tree(self) -> List[dict]:
+        """
+        get the recorded spans as a nested tree
+
+        Returns:
+            list: the root spans with their children
+        """
+        nodes = {}
+        roots = []
+        for span in sorted(self.spans, key=lambda span: span.start_ns):
+            node = {
+                "name": span.name,
+                "start_ms": (span.start_ns - self.origin_ns) / 1e6,
+                "duration_ms": (span.end_ns - span.start_ns) / 1e6,
+            }
+            if span.args:
+                node["args"] = {key: str(value) for key, value in span.args.items()}
+            node["children"] = []
+            nodes[id(span)] = node
+        for span in self.spans:
+            parent_node = nodes.get(id(span.parent)) if span.parent else None
+            if parent_node is not None:
+                parent_node["children"].append(nodes[id(span)])
+            else:
+                roots.append(nodes[id(span)])
+        roots.sort(key=lambda node: node["start_ms"])
+        return roots
+
+    def export(self, path: str, fmt: str = "chrome"):
+        """
+        export the recorded spans to the given file
+
+        Args:
+            path(str): the file to write
+            fmt(str): chrome for the Chrome trace event format or json for a nested tree
+        """
+        if fmt == "chrome":
+            data = self.as_chrome_trace()
+        elif fmt == "json":
+            data = {"spans": self.as_tree(), "dropped": self.dropped}
+        else:
+            raise ValueError(f"unknown trace format {fmt}")
+        with open(path, "w", encoding="utf-8") as trace_file:
+            json.dump(data, trace_file, indent=1)
+
+
+# the process wide default tracer - disabled unless switched on e.g. via --trace
+TRACER = Tracer()
 
 
 class Profiler:
     """
     simple profiler
+
+    each profiler is a span of the default tracer and can be used
+    as a context manager
     """
 
-    def __init__(self, msg, profile=True):
+    def __init__(self, msg, profile=True, tracer: Tracer = None):
         """
         construct me with the given msg and profile active flag
 
         Args:
             msg(str): the message to show if profiling is active
             profile(bool): True if messages should be shown
+            tracer(Tracer): the tracer to record my span with - default: TRACER
         """
         self.msg = msg
         self.profile = profile
-        self.starttime = time.time()
+        self.tracer = tracer if tracer is not None else TRACER
+        self.span = self.tracer.start_span(msg)
+        self.starttime = time.perf_counter()
         if profile:
             print(f"Starting {msg} ...", flush=True)
 
@@ -30,7 +290,56 @@ class Profiler:
         """
         time the action and print if profile is active
         """
-        elapsed = time.time() - self.starttime
+        elapsed = time.perf_counter() - self.starttime
+        self.tracer.end_span(self.span)
         if self.profile:
             print(f"{self.msg}{extraMsg} took {elapsed:5.1f} s", flush=True)
         return elapsed
+
+    @classmethod
+    def percentile(cls, times: List[float], percent: float) -> float:
+        """
+        get the given percentile of the given timings by nearest rank
+
+        Args:
+            times(list): the timings in any order
+            percent(float): the percentile from 0 to 100
+
+        Returns:
+            float: the timing of the nearest rank or 0.0 if there are none
+        """
+        if not times:
+            return 0.0
+        times = sorted(times)
+        rank = math.ceil(percent / 100 * len(times)) - 1
+        return times[min(max(rank, 0), len(times) - 1)]
+
+    def __enter__(self) -> "Profiler":
+        return self
+
+    def __exit__(self, *_exc):
+        if self.span.end_ns is None:
+            self.time()
+        return False
+
+
+class TraceMiddleware:
+    """
+    ASGI middleware recording a span per request named by its route template
+    """
+
+    def __init__(self, app, tracer: Tracer = None):
+        self.app = app
+        self.tracer = tracer if tracer is not None else TRACER
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not self.tracer.enabled:
+            await self.app(scope, receive, send)
+            return
+        span = self.tracer.start_span(f"{scope['method']} {scope['path']}")
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            route = scope.get("route")
+            span.args["route"] = getattr(route, "path", "unmatched")
+            self.tracer.end_span(span)
@@ -0,0 +1,365 @@
+"""
+Created on 2026-10-19
+
+@author: agent
+"""
+
+import heapq
+import json
+import math
+import mmap
+import os
+import time
+from array import array
+from collections import Counter
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from ceurspt.fork_pool import fork_map
+from ceurspt.fulltext import term_counts
+from ceurspt.index_versions import IndexVersions
+from ceurspt.zip_store import ZIP_STORE
+
+
+def _df_in_worker(builder: "RelatedPapersBuilder", pdf_paths: List[str]) -> Counter:
+    """
+    count the document frequencies of the given papers in a worker process
+    """
+    df = Counter()
+    for pdf_path in pdf_paths:
+        df.update(builder.counts(pdf_path).keys())
+    return df
+
+
+def _vectorize_in_worker(
+    builder: "RelatedPapersBuilder", pdf_paths: List[str]
+) -> List[Tuple[Tuple[str, ...], array]]:
+    """
+    get the pruned tf-idf vectors of the given papers in a worker process
+    """
+    return [builder.vector(pdf_path) for pdf_path in pdf_paths]
+
+
+def _neighbours_in_worker(
+    builder: "RelatedPapersBuilder", doc_ids: range
+) -> Tuple[array, array]:
+    """
+    get the top k neighbours of the given documents in a worker process
+    """
+    return builder.neighbours(doc_ids)
+
+
+class RelatedPapers:
+    """
+    the precomputed top k most similar papers of each paper
+
+    each version is a subdirectory of the index directory - see
+    IndexVersions - holding
+        related.json: the pdf paths of the papers in doc id order and k
+        neighbours.bin: k doc ids per paper padded with -1
+        scores.bin: k cosine similarities per paper
+    """
+
+    def __init__(self, index_dir: str):
+        """
+        constructor
+
+        Args:
+            index_dir(str): the directory of the related papers versions
+        """
+        self.index_dir = index_dir
+        # the version is resolved once so that all files are of the same version
+        self.version_dir = IndexVersions(index_dir).current_dir()
+        self.meta = self.read_meta(index_dir, self.version_dir)
+        if self.meta is None:
+            raise FileNotFoundError(f"no related papers in {index_dir}")
+        self.k = self.meta["k"]
+        self.docs = self.meta["docs"]
+        self.doc_ids = {pdf_path: doc_id for doc_id, pdf_path in enumerate(self.docs)}
+        self.neighbour_map = self.map_file("neighbours.bin")
+        self.score_map = self.map_file("scores.bin")
+        self.neighbour_ids = memoryview(self.neighbour_map).cast("i")
+        self.scores = memoryview(self.score_map).cast("f")
+
+    def __len__(self) -> int:
+        return len(self.docs)
+
+    @classmethod
+    def read_meta(
+        cls, index_dir: str, version_dir: Optional[str] = None
+    ) -> Optional[dict]:
+        """
+        read the meta data of the related papers in the given directory
+
+        Args:
+            index_dir(str): the directory of the related papers versions
+            version_dir(str): the version to read - default: the current one
+
+        Returns:
+            dict: the meta data or None if there are no related papers
+        """
+        if version_dir is None:
+            version_dir = IndexVersions(index_dir).current_dir()
+        if version_dir is None:
+            return None
+        meta_path = f"{version_dir}/related.json"
+        if not os.path.isfile(meta_path):
+            return None
+        with open(meta_path, encoding="utf-8") as meta_file:
+            return json.load(meta_file)
+
+    def map_file(self, name: str):
+        """
+        memory map the given file read only
+        """
+        with open(f"{self.version_dir}/{name}", "rb") as index_file:
+            if os.fstat(index_file.fileno()).st_size == 0:
+                # empty files can not be mapped
+                return b""
+            return mmap.mmap(index_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def related(
+        self, pdf_path: str, k: Optional[int] = None
+    ) -> List[Tuple[str, float]]:
+        """
+        get the papers most similar to the given paper
+
+        Args:
+            pdf_path(str): the pdf path of the paper e.g. Vol-3262/paper2.pdf
+            k(int): the maximum number of papers - default: all precomputed
+
+        Returns:
+            list: the pdf paths and similarities most similar first
+        """
+        doc_id = self.doc_ids.get(pdf_path)
+        if doc_id is None:
+            return []
+        k = self.k if k is None else max(0, min(k, self.k))
+        start = doc_id * self.k
+        related = []
+        for index in range(start, start + k):
+            other = self.neighbour_ids[index]
+            if other < 0:
+                break
+            related.append((self.docs[other], round(self.scores[index], 4)))
+        return related
+
+    def close(self):
+        """
+        release my memory maps
+        """
+        self.neighbour_ids.release()
+        self.scores.release()
+        for mapped in (self.neighbour_map, self.score_map):
+            if isinstance(mapped, mmap.mmap):
+                mapped.close()
+
+
+class RelatedPapersBuilder:
+    """
+    compute the related papers from the tf-idf vectors of the paper
+    titles and -content.txt files
+
+    the sparse vectors are pruned to their highest weighted terms and the
+    cosine similarities are accumulated over the postings of an inverted
+    index - each batch of papers is computed in a forked worker process
+    """
+
+    # the number of terms kept per vector
+    MAX_TERMS = 24
+    # the number of highest weighted postings kept per term
+    MAX_POSTINGS = 100
+    # the weight of a title term relative to a term of the text
+    TITLE_BOOST = 3
+    # the number of papers per worker task
+    BATCH_SIZE = 256
+
+    def __init__(
+        self,
+        titles: Dict[str, str],
+        text_files: Dict[str, str],
+        index_dir: str,
+        k: int = 10,
+        workers: int = 1,
+    ):
+        """
+        constructor
+
+        Args:
+            titles(dict): the title by pdf path e.g. Vol-3262/paper2.pdf
+            text_files(dict): the -content.txt file path by pdf path
+            index_dir(str): the directory to write the related papers to
+            k(int): the number of related papers to keep per paper
+            workers(int): the number of worker processes
+        """
+        self.titles = titles
+        self.text_files = text_files
+        self.index_dir = index_dir
+        self.k = k
+        self.workers = max(1, workers or 1)
+        self.docs = sorted(set(titles) | set(text_files))
+        self.idf: Dict[str, float] = {}
+        self.term_ids: Dict[str, int] = {}
+        self.postings: List[Tuple[array, array]] = []
+        self.vectors: List[Tuple[array, array]] = []
+
+    @classmethod
+    def from_managers(cls, pm, text_files: Dict[str, str], index_dir: str, **kwargs):
+        """
+        create a builder for the loaded papers of the given paper manager
+
+        Args:
+            pm(PaperManager): the paper manager with the loaded papers
+            text_files(dict): the -content.txt file path by pdf path
+            index_dir(str): the directory to write the related papers to
+        """
+        titles = {
+            pdf_path: paper.title
+            for pdf_path, paper in pm.papers_by_path.items()
+            if paper.title
+        }
+        return cls(titles, text_files, index_dir, **kwargs)
+
+    def counts(self, pdf_path: str) -> Counter:
+        """
+        get the boosted term counts of the title and text of the given paper
+        """
+        counts = Counter()
+        text_path = self.text_files.get(pdf_path)
+        if text_path:
+            try:
+                text = ZIP_STORE.read_text(text_path, errors="replace")
+                counts, _length = term_counts(text)
+            except OSError:
+                pass
+        title_counts, _length = term_counts(self.titles.get(pdf_path) or "")
+        for term, tf in title_counts.items():
+            counts[term] += tf * self.TITLE_BOOST
+        return counts
+
+    def vector(self, pdf_path: str) -> Tuple[Tuple[str, ...], array]:
+        """
+        get the pruned and normalized tf-idf vector of the given paper
+
+        Returns:
+            tuple: the terms and their weights
+        """
+        weights = []
+        for term, tf in self.counts(pdf_path).items():
+            idf = self.idf.get(term)
+            if idf:
+                weights.append(((1.0 + math.log(tf)) * idf, term))
+        best = heapq.nlargest(self.MAX_TERMS, weights)
+        norm = math.sqrt(sum(weight * weight for weight, _term in best)) or 1.0
+        terms = tuple(term for _weight, term in best)
+        return terms, array("f", (weight / norm for weight, _term in best))
+
+    def neighbours(self, doc_ids: range) -> Tuple[array, array]:
+        """
+        get the k most similar documents of the given documents
+
+        Returns:
+            tuple: k doc ids per document padded with -1 and the similarities
+        """
+        neighbour_ids = array("i")
+        scores = array("f")
+        for doc_id in doc_ids:
+            accumulated: Dict[int, float] = {}
+            term_ids, weights = self.vectors[doc_id]
+            for term_id, weight in zip(term_ids, weights):
+                other_ids, other_weights = self.postings[term_id]
+                for other, other_weight in zip(other_ids, other_weights):
+                    accumulated[other] = (
+                        accumulated.get(other, 0.0) + weight * other_weight
+                    )
+            accumulated.pop(doc_id, None)
+            best = heapq.nlargest(self.k, accumulated, key=accumulated.get)
+            for other in best:
+                neighbour_ids.append(other)
+                scores.append(accumulated[other])
+            for _pad in range(self.k - len(best)):
+                neighbour_ids.append(-1)
+                scores.append(0.0)
+        return neighbour_ids, scores
+
+    def run(self, function: Callable, batches: List) -> Iterator:
+        """
+        run the given worker function on the given batches in order - in a
+        process pool with more than one worker
+        """
+        yield from fork_map(function, batches, self.workers, state=self)
+
+    def build(self) -> dict:
+        """
+        compute and write the related papers
+
+        Returns:
+            dict: the number of papers, terms and the seconds taken
+        """
+        start = time.perf_counter()
+        batches = [
+            self.docs[index : index + self.BATCH_SIZE]
+            for index in range(0, len(self.docs), self.BATCH_SIZE)
+        ]
+        df = Counter()
+        for batch_df in self.run(_df_in_worker, batches):
+            df.update(batch_df)
+        # terms of a single paper can not relate papers
+        self.idf = {
+            term: math.log(len(self.docs) / count)
+            for term, count in df.items()
+            if count >= 2
+        }
+        # the workers of the next stages are forked with the vectors
+        self.vectors = []
+        postings: Dict[int, List[Tuple[float, int]]] = {}
+        for batch_vectors in self.run(_vectorize_in_worker, batches):
+            for terms, weights in batch_vectors:
+                doc_id = len(self.vectors)
+                term_ids = array("I")
+                for term, weight in zip(terms, weights):
+                    term_id = self.term_ids.setdefault(term, len(self.term_ids))
+                    term_ids.append(term_id)
+                    postings.setdefault(term_id, []).append((weight, doc_id))
+                self.vectors.append((term_ids, weights))
+        self.postings = []
+        for term_id in range(len(self.term_ids)):
+            best = heapq.nlargest(self.MAX_POSTINGS, postings[term_id])
+            self.postings.append(
+                (
+                    array("I", (doc_id for _weight, doc_id in best)),
+                    array("f", (weight for weight, _doc_id in best)),
+                )
+            )
+        ranges = [
+            range(index, min(index + self.BATCH_SIZE, len(self.docs)))
+            for index in range(0, len(self.docs), self.BATCH_SIZE)
+        ]
+        neighbour_ids = array("i")
+        scores = array("f")
+        for batch_ids, batch_scores in self.run(_neighbours_in_worker, ranges):
+            neighbour_ids.extend(batch_ids)
+            scores.extend(batch_scores)
+        self.write(neighbour_ids, scores)
+        return {
+            "docs": len(self.docs),
+            "terms": len(self.term_ids),
+            "seconds": time.perf_counter() - start,
+        }
+
+    def write(self, neighbour_ids: array, scores: array):
+        """
+        write the related papers into a new version which is published once
+        it is complete
+        """
+        versions = IndexVersions(self.index_dir)
+        version_dir = versions.new_dir()
+        meta = {"version": 1, "k": self.k, "docs": self.docs}
+        files = {
+            "neighbours.bin": neighbour_ids.tobytes(),
+            "scores.bin": scores.tobytes(),
+            "related.json": json.dumps(meta).encode("utf-8"),
+        }
+        for name, data in files.items():
+            with open(f"{version_dir}/{name}", "wb") as index_file:
+                index_file.write(data)
+        versions.publish(version_dir)
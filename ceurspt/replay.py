@@ -0,0 +1,266 @@
+"""
+Created on 2026-10-19
+
+@author: agent
+"""
+
+import asyncio
+import re
+import time
+from typing import Dict, Iterable, Iterator, List, Optional
+
+import httpx
+from starlette.types import ASGIApp
+
+from ceurspt.profiler import Profiler
+
+
+class AccessLogEntry:
+    """
+    a request recorded in an access log in common or combined log format
+    """
+
+    LOG_PATTERN = re.compile(
+        r"^(?P<host>\S+) \S+ \S+ \[(?P<time>[^\]]+)\] "
+        r'"(?P<method>[A-Z]+) (?P<path>\S+)(?: [^"]*)?" (?P<status>\d{3}) (?P<size>\S+)'
+    )
+
+    def __init__(self, method: str, path: str, status: int):
+        self.method = method
+        self.path = path
+        self.status = status
+
+    @classmethod
+    def parse(cls, line: str) -> Optional["AccessLogEntry"]:
+        """
+        parse the given log line
+
+        Returns:
+            AccessLogEntry: the entry or None if the line is not a valid log line
+        """
+        match = cls.LOG_PATTERN.match(line)
+        if not match:
+            return None
+        return cls(match["method"], match["path"], int(match["status"]))
+
+    @classmethod
+    def read(cls, log_path: str, methods=("GET",)) -> Iterator["AccessLogEntry"]:
+        """
+        read the replayable entries of the given access log lazily
+
+        HEAD requests are skipped by default since the GET routes of the
+        server answer them with 405 and would count as client errors
+        """
+        with open(log_path, encoding="utf-8", errors="replace") as log_file:
+            for line in log_file:
+                entry = cls.parse(line)
+                if entry is not None and entry.method in methods:
+                    yield entry
+
+
+class RouteFamilyStats:
+    """
+    latencies and errors of the requests of a route family
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.latencies: List[float] = []
+        self.client_errors = 0
+        self.server_errors = 0
+        self.failures = 0
+
+    @property
+    def count(self) -> int:
+        return len(self.latencies)
+
+    @property
+    def error_rate(self) -> float:
+        """
+        the share of server errors and failed requests
+        """
+        if not self.count:
+            return 0.0
+        return (self.server_errors + self.failures) / self.count
+
+    def percentile(self, percent: float) -> float:
+        """
+        get the given latency percentile in seconds (nearest rank)
+        """
+        return Profiler.percentile(self.latencies, percent)
+
+    def as_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "client_errors": self.client_errors,
+            "server_errors": self.server_errors,
+            "failures": self.failures,
+            "error_rate": self.error_rate,
+            "p50": self.percentile(50),
+            "p90": self.percentile(90),
+            "p99": self.percentile(99),
+            "max": max(self.latencies, default=0.0),
+        }
+
+
+class LogReplayer:
+    """
+    replay the URL mix of an access log in process via ASGI or against
+    a running server with a configurable concurrency and rate
+    """
+
+    FAMILIES = ["/Vol-*.html", "*.json", "*.pdf", "/index*", "other"]
+
+    def __init__(
+        self,
+        app: Optional[ASGIApp] = None,
+        base_url: Optional[str] = None,
+        concurrency: int = 16,
+        rate: float = 0.0,
+        timeout: float = 30.0,
+    ):
+        """
+        constructor
+
+        Args:
+            app(ASGIApp): the application to replay against in process
+            base_url(str): the url of a running server e.g. http://localhost:9990
+            concurrency(int): the maximum number of requests in flight
+            rate(float): the requests per second to issue - 0 for as fast as possible
+            timeout(float): the request timeout in seconds
+        """
+        if (app is None) == (base_url is None):
+            raise ValueError("replay needs either an app or a base_url")
+        self.app = app
+        self.base_url = base_url
+        self.concurrency = concurrency
+        self.rate = rate
+        self.timeout = timeout
+        self.stats: Dict[str, RouteFamilyStats] = {}
+        self.elapsed = 0.0
+
+    @classmethod
+    def route_family(cls, path: str) -> str:
+        """
+        get the route family of the given request path
+        """
+        path = path.split("?", 1)[0]
+        if path.endswith(".pdf"):
+            return "*.pdf"
+        if path.endswith(".json"):
+            return "*.json"
+        if path.startswith("/index"):
+            return "/index*"
+        if path.startswith("/Vol-") and path.endswith(".html"):
+            return "/Vol-*.html"
+        return "other"
+
+    def client(self) -> httpx.AsyncClient:
+        """
+        get the http client for my target
+        """
+        if self.app is not None:
+            # application errors are reported as 500 like a server would
+            transport = httpx.ASGITransport(app=self.app, raise_app_exceptions=False)
+            return httpx.AsyncClient(
+                transport=transport, base_url="http://replay", timeout=self.timeout
+            )
+        limits = httpx.Limits(max_connections=self.concurrency)
+        return httpx.AsyncClient(
+            base_url=self.base_url, timeout=self.timeout, limits=limits
+        )
+
+    def record(self, path: str, latency: float, status: Optional[int]):
+        """
+        record the outcome of a request
+        """
+        family = self.route_family(path)
+        stats = self.stats.get(family)
+        if stats is None:
+            stats = RouteFamilyStats(family)
+            self.stats[family] = stats
+        stats.latencies.append(latency)
+        if status is None:
+            stats.failures += 1
+        elif status >= 500:
+            stats.server_errors += 1
+        elif status >= 400:
+            stats.client_errors += 1
+
+    async def replay_async(self, entries: Iterable[AccessLogEntry]):
+        """
+        replay the given entries with my concurrency many workers
+        """
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        # the workers share the iterator so memory stays bounded for large logs
+        scheduled = enumerate(entries)
+
+        async def worker(client: httpx.AsyncClient):
+            for index, entry in scheduled:
+                if self.rate > 0:
+                    delay = start + index / self.rate - loop.time()
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+                request_start = time.perf_counter()
+                status = None
+                try:
+                    response = await client.request(entry.method, entry.path)
+                    status = response.status_code
+                except httpx.HTTPError:
+                    pass
+                self.record(entry.path, time.perf_counter() - request_start, status)
+
+        async with self.client() as client:
+            await asyncio.gather(*[worker(client) for _ in range(self.concurrency)])
+        self.elapsed = loop.time() - start
+
+    def replay(self, entries: Iterable[AccessLogEntry]) -> dict:
+        """
+        replay the given entries and get the report
+
+        Args:
+            entries(Iterable[AccessLogEntry]): the requests to replay
+
+        Returns:
+            dict: the throughput and the statistics by route family
+        """
+        self.stats = {}
+        asyncio.run(self.replay_async(entries))
+        return self.as_dict()
+
+    def as_dict(self) -> dict:
+        """
+        get my report as dict
+        """
+        total = sum(stats.count for stats in self.stats.values())
+        families = [family for family in self.FAMILIES if family in self.stats]
+        return {
+            "requests": total,
+            "elapsed": self.elapsed,
+            "throughput": total / self.elapsed if self.elapsed else 0.0,
+            "concurrency": self.concurrency,
+            "rate": self.rate,
+            "families": {family: self.stats[family].as_dict() for family in families},
+        }
+
+    @classmethod
+    def report_text(cls, report: dict) -> str:
+        """
+        get the given report as text table
+        """
+        lines = [
+            f"{report['requests']} requests in {report['elapsed']:.2f} s "
+            f"({report['throughput']:.1f} req/s, concurrency {report['concurrency']})",
+            f"{'family':<14}{'count':>8}{'p50 ms':>10}{'p90 ms':>10}{'p99 ms':>10}"
+            f"{'max ms':>10}{'4xx':>7}{'5xx':>7}{'fail':>6}{'err%':>7}",
+        ]
+        for family, stats in report["families"].items():
+            lines.append(
+                f"{family:<14}{stats['count']:>8}"
+                f"{stats['p50']*1000:>10.1f}{stats['p90']*1000:>10.1f}"
+                f"{stats['p99']*1000:>10.1f}{stats['max']*1000:>10.1f}"
+                f"{stats['client_errors']:>7}{stats['server_errors']:>7}"
+                f"{stats['failures']:>6}{stats['error_rate']*100:>7.2f}"
+            )
+        return "\n".join(lines)
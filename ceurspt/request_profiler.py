@@ -0,0 +1,235 @@
+"""
+Created on 2026-10-19
+
+@author: agent
+"""
+
+import asyncio
+import cProfile
+import hmac
+import json
+import os
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+from typing import Optional
+from urllib.parse import parse_qs
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+class SamplingProfiler:
+    """
+    statistical profiler sampling the stack of a single thread
+
+    the samples are aggregated as collapsed stacks ("frame;frame;frame count")
+    as understood by flamegraph.pl and speedscope
+    """
+
+    def __init__(self, thread_id: int, interval: float = 0.001):
+        """
+        constructor
+
+        Args:
+            thread_id(int): the ident of the thread to sample
+            interval(float): the sampling interval in seconds
+        """
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks = Counter()
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _sample(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                file_name = os.path.basename(code.co_filename)
+                stack.append(f"{code.co_name} ({file_name}:{frame.f_lineno})")
+                frame = frame.f_back
+            self.stacks[";".join(reversed(stack))] += 1
+            self.samples += 1
+
+    def start(self):
+        """
+        start sampling in a background thread
+        """
+        self._thread = threading.Thread(
+            target=self._sample, name="request-sampler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        """
+        stop sampling
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def dump(self, path: str):
+        """
+        write the collapsed stacks to the given path
+        """
+        with open(path, "w", encoding="utf-8") as collapsed_file:
+            for stack, count in self.stacks.most_common():
+                collapsed_file.write(f"{stack} {count}\n")
+
+
+class RequestProfilerMiddleware:
+    """
+    ASGI middleware profiling single requests on demand
+
+    a request is profiled if it carries the X-Profile header or the profile
+    query parameter with the mode cprofile or sample together with the admin
+    token in the X-Admin-Token header or the admin_token query parameter;
+    the profile is written to the profile directory and its id is returned
+    in the X-Profile-Id response header
+    """
+
+    MODES = {"cprofile": ".prof", "sample": ".collapsed"}
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        profile_dir: str,
+        admin_token: str,
+        sample_interval: float = 0.001,
+    ):
+        """
+        constructor
+
+        Args:
+            app(ASGIApp): the application to wrap
+            profile_dir(str): the directory to write the profiles to
+            admin_token(str): the token a request needs to be profiled
+            sample_interval(float): the interval of the sampling profiler in seconds
+        """
+        if not admin_token:
+            raise ValueError("request profiling needs an admin token")
+        self.app = app
+        self.profile_dir = profile_dir
+        self.admin_token = admin_token
+        self.sample_interval = sample_interval
+        # cProfile allows only one active profiler at a time
+        self.lock = asyncio.Lock()
+        os.makedirs(profile_dir, exist_ok=True)
+
+    def get_request_options(self, scope: Scope):
+        """
+        get the requested profiling mode and the token given
+
+        Returns:
+            tuple: mode and token - both None if no profiling was requested
+        """
+        headers = {key.lower(): value for key, value in scope.get("headers", [])}
+        query = parse_qs(scope.get("query_string", b"").decode("latin-1"))
+        mode = (
+            headers.get(b"x-profile", b"").decode("latin-1")
+            or query.get("profile", [None])[0]
+        )
+        token = (
+            headers.get(b"x-admin-token", b"").decode("latin-1")
+            or query.get("admin_token", [None])[0]
+        )
+        return mode, token
+
+    def is_authorized(self, token: Optional[str]) -> bool:
+        """
+        check the given token against the admin token
+        """
+        if not token:
+            return False
+        return hmac.compare_digest(token.encode(), self.admin_token.encode())
+
+    async def respond_error(self, send: Send, status: int, msg: str):
+        """
+        send a plain text error response
+        """
+        body = msg.encode("utf-8")
+        await send(
+            {
+                "type": "http.response.start",
+                "status": status,
+                "headers": [
+                    (b"content-type", b"text/plain; charset=utf-8"),
+                    (b"content-length", str(len(body)).encode()),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        mode, token = self.get_request_options(scope)
+        if not mode:
+            await self.app(scope, receive, send)
+            return
+        if not self.is_authorized(token):
+            await self.respond_error(send, 403, "profiling needs a valid admin token")
+            return
+        if mode not in self.MODES:
+            await self.respond_error(
+                send, 400, f"unknown profile mode {mode} - use {', '.join(self.MODES)}"
+            )
+            return
+        profile_id = f"{time.strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:8]}"
+
+        async def send_with_profile_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", []))
+                headers.append((b"x-profile-id", profile_id.encode("latin-1")))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        async with self.lock:
+            start = time.perf_counter()
+            if mode == "cprofile":
+                profiler = cProfile.Profile()
+                profiler.enable()
+            else:
+                profiler = SamplingProfiler(
+                    threading.get_ident(), interval=self.sample_interval
+                )
+                profiler.start()
+            try:
+                await self.app(scope, receive, send_with_profile_id)
+            finally:
+                if mode == "cprofile":
+                    profiler.disable()
+                else:
+                    profiler.stop()
+                elapsed = time.perf_counter() - start
+                self.write_profile(profile_id, mode, profiler, scope, elapsed)
+
+    def write_profile(
+        self, profile_id: str, mode: str, profiler, scope: Scope, elapsed: float
+    ):
+        """
+        write the profile and its metadata to my profile directory
+        """
+        base_path = os.path.join(self.profile_dir, profile_id)
+        profile_path = f"{base_path}{self.MODES[mode]}"
+        if mode == "cprofile":
+            profiler.dump_stats(profile_path)
+        else:
+            profiler.dump(profile_path)
+        meta = {
+            "id": profile_id,
+            "mode": mode,
+            "method": scope.get("method"),
+            "path": scope.get("path"),
+            "elapsed": elapsed,
+            "file": f"{profile_id}{self.MODES[mode]}",
+        }
+        with open(f"{base_path}.json", "w", encoding="utf-8") as meta_file:
+            json.dump(meta, meta_file, indent=2)
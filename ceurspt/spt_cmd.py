@@ -4,6 +4,9 @@ Created on 2023-03-17
 @author: wf
 """
 
+import itertools
+import json
+import os
 import socket
 import sys
 import traceback
@@ -13,10 +16,23 @@ from pathlib import Path
 
 import uvicorn
 
+from ceurspt.benchmark import BenchmarkSuite
+from ceurspt.bundle import StartupBundle
 from ceurspt.ceurws import JsonCacheManager, PaperManager, VolumeManager
-from ceurspt.profiler import Profiler
+from ceurspt.duplicates import DuplicateFinder
+from ceurspt.fulltext import FullTextIndexBuilder
+from ceurspt.jsonld_dump import CorpusDumper
+from ceurspt.memory_report import MemoryReport
+from ceurspt.mirror import VolumeMirror
+from ceurspt.prefork import PreforkBenchmark, PreforkServer
+from ceurspt.profiler import TRACER, Profiler, Tracer
+from ceurspt.related import RelatedPapersBuilder
+from ceurspt.replay import AccessLogEntry, LogReplayer
+from ceurspt.synthetic import SyntheticCorpus
+from ceurspt.text_extraction import TextExtractionPipeline
 from ceurspt.version import Version
 from ceurspt.webserver import WebServer
+from ceurspt.xml_metadata import XmlMetadataBuilder
 
 
 class CeurSptCmd:
@@ -59,6 +75,89 @@ class CeurSptCmd:
             help="the base url to use for the RESTFul metadata service [default: %(default)s]",
             default=base_url,
         )
+        parser.add_argument(
+            "--cache-dir",
+            help="the directory of the json cache files [default: ~/.ceurws]",
+        )
+        parser.add_argument(
+            "--benchmark",
+            nargs="?",
+            const="-",
+            metavar="FILE",
+            help="run the benchmark suite writing the json results to FILE or stdout",
+        )
+        parser.add_argument(
+            "--benchmark-baseline",
+            metavar="FILE",
+            help="compare the benchmark results against the given baseline results",
+        )
+        parser.add_argument(
+            "--benchmark-threshold",
+            type=float,
+            default=0.2,
+            help="relative slowdown flagged as regression [default: %(default)s]",
+        )
+        parser.add_argument(
+            "--benchmark-repeat",
+            type=int,
+            default=5,
+            help="number of runs per benchmark [default: %(default)s]",
+        )
+        parser.add_argument(
+            "--generate-corpus",
+            metavar="DIR",
+            help="generate a synthetic corpus with the lods in DIR/cache "
+            "and the volume files in DIR/ceur-ws",
+        )
+        parser.add_argument(
+            "--corpus-volumes",
+            type=int,
+            default=10000,
+            help="number of volumes of the synthetic corpus [default: %(default)s]",
+        )
+        parser.add_argument(
+            "--corpus-papers",
+            type=int,
+            default=500000,
+            help="number of papers of the synthetic corpus [default: %(default)s]",
+        )
+        parser.add_argument(
+            "--corpus-seed",
+            type=int,
+            default=42,
+            help="random seed of the synthetic corpus [default: %(default)s]",
+        )
+        parser.add_argument(
+            "--corpus-lods-only",
+            action="store_true",
+            help="generate only the lods of the synthetic corpus without volume files",
+        )
+        parser.add_argument(
+            "--replay",
+            metavar="LOGFILE",
+            help="replay the GET requests of the given access log in common log format",
+        )
+        parser.add_argument(
+            "--replay-url",
+            help="replay against the server at this url instead of in process",
+        )
+        parser.add_argument(
+            "--replay-concurrency",
+            type=int,
+            default=16,
+            help="number of concurrent replay requests [default: %(default)s]",
+        )
+        parser.add_argument(
+            "--replay-rate",
+            type=float,
+            default=0.0,
+            help="requests per second to replay - 0 for unlimited [default: %(default)s]",
+        )
+        parser.add_argument(
+            "--replay-limit",
+            type=int,
+            help="replay at most this many requests",
+        )
         parser.add_argument(
             "-d",
             "--debug",
@@ -66,12 +165,203 @@ class CeurSptCmd:
             action="store_true",
             help="show debug info [default: %(default)s]",
         )
+        parser.add_argument(
+            "--memory-report",
+            action="store_true",
+            help="load the volumes and papers and report their memory usage",
+        )
+        parser.add_argument(
+            "--reload-diff",
+            action="store_true",
+            help="add the memory diff of a hot reload to the memory report",
+        )
+        parser.add_argument(
+            "--dump-jsonld",
+            nargs="?",
+            const="-",
+            metavar="FILE",
+            help="dump the JSON-LD of all volumes to the given file or stdout",
+        )
+        parser.add_argument(
+            "--dump-format",
+            choices=list(CorpusDumper.FORMATS),
+            default="ndjson",
+            help="the format of the JSON-LD dump [default: %(default)s]",
+        )
+        parser.add_argument(
+            "--dump-workers",
+            type=int,
+            default=CorpusDumper.default_workers(),
+            help="number of worker processes for the offline --dump-jsonld "
+            "[default: %(default)s]",
+        )
+        parser.add_argument(
+            "--build-fulltext-index",
+            action="store_true",
+            help="build or update the full text index of the paper -content.txt files",
+        )
+        parser.add_argument(
+            "--fulltext-index",
+            metavar="DIR",
+            help="the directory of the full text index [default: <cache dir>/fulltext]",
+        )
+        parser.add_argument(
+            "--fulltext-workers",
+            type=int,
+            default=os.cpu_count() or 1,
+            help="number of worker processes to tokenize the texts with "
+            "for the full text index, the related papers and the duplicates "
+            "[default: %(default)s]",
+        )
+        parser.add_argument(
+            "--build-related",
+            action="store_true",
+            help="precompute the most similar papers of each paper",
+        )
+        parser.add_argument(
+            "--related-index",
+            metavar="DIR",
+            help="the directory of the related papers [default: <cache dir>/related]",
+        )
+        parser.add_argument(
+            "--related-k",
+            type=int,
+            default=10,
+            help="number of related papers to keep per paper [default: %(default)s]",
+        )
+        parser.add_argument(
+            "--find-duplicates",
+            action="store_true",
+            help="find near duplicate papers by MinHash signatures of their texts",
+        )
+        parser.add_argument(
+            "--duplicates-report",
+            metavar="FILE",
+            help="the json report of the near duplicate papers "
+            "[default: <cache dir>/duplicates.json]",
+        )
+        parser.add_argument(
+            "--duplicates-threshold",
+            type=float,
+            default=0.8,
+            help="minimum estimated jaccard similarity of duplicates "
+            "[default: %(default)s]",
+        )
+        parser.add_argument(
+            "--extract-text",
+            action="store_true",
+            help="extract the -content.txt files of the pdf files without an "
+            "up to date text file",
+        )
+        parser.add_argument(
+            "--text-extractor",
+            choices=list(TextExtractionPipeline.EXTRACTORS),
+            default="pdftotext",
+            help="the pdf text extractor [default: %(default)s]",
+        )
+        parser.add_argument(
+            "--extract-workers",
+            type=int,
+            default=os.cpu_count() or 1,
+            help="number of worker processes to extract texts with "
+            "[default: %(default)s]",
+        )
+        parser.add_argument(
+            "--extract-xml",
+            action="store_true",
+            help="extract the metadata of the GROBID and CERMINE xml files "
+            "into the xml metadata store",
+        )
+        parser.add_argument(
+            "--xml-store",
+            metavar="DIR",
+            help="the directory of the metadata extracted from the xml files "
+            "[default: <cache dir>/xml-metadata]",
+        )
+        parser.add_argument(
+            "--mirror",
+            action="store_true",
+            help="download and extract the Vol-N.zip archives of the volumes "
+            "--from N --to M to the base path",
+        )
+        parser.add_argument(
+            "--from",
+            dest="mirror_from",
+            type=int,
+            default=1,
+            help="the first volume to mirror [default: %(default)s]",
+        )
+        parser.add_argument(
+            "--to",
+            dest="mirror_to",
+            type=int,
+            help="the last volume to mirror [default: the --from volume]",
+        )
+        parser.add_argument(
+            "--mirror-url",
+            default=VolumeMirror.DEFAULT_URL,
+            help="the url of the directory with the volume archives "
+            "[default: %(default)s]",
+        )
+        parser.add_argument(
+            "--mirror-connections",
+            type=int,
+            default=4,
+            help="the maximum number of concurrent downloads [default: %(default)s]",
+        )
+        parser.add_argument(
+            "--mirror-workers",
+            type=int,
+            default=4,
+            help="the number of concurrent extractions [default: %(default)s]",
+        )
+        parser.add_argument(
+            "--keep-zip",
+            action="store_true",
+            help="keep the mirrored volumes as Vol-N.zip archives to be served "
+            "without unpacking",
+        )
+        parser.add_argument(
+            "--trace",
+            metavar="FILE",
+            help="record hierarchical timing spans and export them to the given file",
+        )
+        parser.add_argument(
+            "--trace-format",
+            choices=Tracer.FORMATS,
+            default="chrome",
+            help="the format of the trace export [default: %(default)s]",
+        )
+        parser.add_argument(
+            "--profile-requests",
+            metavar="DIR",
+            help="allow profiling single requests via the X-Profile header or "
+            "profile query parameter writing the profiles to DIR - needs --admin-token",
+        )
+        parser.add_argument(
+            "--admin-token",
+            default=os.environ.get("CEURSPT_ADMIN_TOKEN"),
+            help="the token needed for administrative requests "
+            "[default: $CEURSPT_ADMIN_TOKEN]",
+        )
         parser.add_argument(
             "-rc",
             "--recreate",
             action="store_true",
             help="reload caches e.g. volume table",
         )
+        parser.add_argument(
+            "--build-bundle",
+            action="store_true",
+            help="precompute the merged records and indexes loaded at server "
+            "start - after the caches were reloaded when combined with -rc",
+        )
+        parser.add_argument(
+            "--bundle",
+            metavar="DIR",
+            help="the directory of the startup bundle "
+            "[default: <cache dir>/bundle]",
+        )
 
         parser.add_argument(
             "-v",
@@ -90,6 +380,39 @@ class CeurSptCmd:
             default=9990,
             help="the port to serve from [default: %(default)s]",
         )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="number of pre-forked worker processes sharing the loaded data - "
+            "each worker keeps its own /metrics labelled with its pid "
+            "[default: %(default)s]",
+        )
+        parser.add_argument(
+            "--loop",
+            choices=PreforkServer.LOOPS,
+            default="auto",
+            help="the event loop implementation [default: %(default)s]",
+        )
+        parser.add_argument(
+            "--http",
+            choices=PreforkServer.HTTPS,
+            default="auto",
+            help="the http protocol implementation [default: %(default)s]",
+        )
+        parser.add_argument(
+            "--prefork-benchmark",
+            metavar="COUNTS",
+            help="measure throughput and per worker memory for the comma separated "
+            "worker counts e.g. 1,2,4",
+        )
+        parser.add_argument(
+            "--prefork-requests",
+            type=int,
+            default=2000,
+            help="number of requests per worker count of the pre-fork benchmark "
+            "[default: %(default)s]",
+        )
         parser.add_argument(
             "-s",
             "--serve",
@@ -131,41 +454,44 @@ class CeurSptCmd:
         Returns:
             int: number of lods that failed to refresh
         """
-        jcm = JsonCacheManager(base_url=args.baseurl)
-        failed: list[str] = []
-        for lod_name in [
-            "volumes",
-            "papers",
-            "proceedings",
-            "authors_dblp",
-            "papers_dblp",
-        ]:
-            profiler = Profiler(f"read {lod_name} ...", profile=True)
-            try:
-                # prefer_local=False: -rc means "refresh from remote"
-                lod = jcm.load_lod(lod_name, prefer_local=False)
-            except Exception as ex:
-                sys.stderr.write(
-                    f"ERROR: failed to fetch {lod_name}: {ex}\n"
-                )
-                failed.append(lod_name)
-                continue
-            _elapsed = profiler.time(f" read {len(lod)} {lod_name}")
-            if not lod:
-                sys.stderr.write(
-                    f"ERROR: remote returned empty lod for {lod_name}; "
-                    f"keeping existing local cache\n"
-                )
-                failed.append(lod_name)
-                continue
-            try:
-                jcm.store(lod_name, lod)
-            except Exception as ex:
-                sys.stderr.write(f"ERROR: failed to store {lod_name}: {ex}\n")
-                failed.append(lod_name)
-                continue
-            profiler = Profiler(f"store {lod_name} ...", profile=True)
-            _elapsed = profiler.time(f" store {len(lod)} {lod_name}")
+        with TRACER.span("recreate"):
+            jcm = JsonCacheManager(base_url=args.baseurl, cache_dir=args.cache_dir)
+            failed: list[str] = []
+            for lod_name in [
+                "volumes",
+                "papers",
+                "proceedings",
+                "authors_dblp",
+                "papers_dblp",
+            ]:
+                profiler = Profiler(f"read {lod_name} ...", profile=True)
+                try:
+                    # prefer_local=False: -rc means "refresh from remote"
+                    lod = jcm.load_lod(lod_name, prefer_local=False)
+                except Exception as ex:
+                    profiler.time(" failed")
+                    sys.stderr.write(
+                        f"ERROR: failed to fetch {lod_name}: {ex}\n"
+                    )
+                    failed.append(lod_name)
+                    continue
+                _elapsed = profiler.time(f" read {len(lod)} {lod_name}")
+                if not lod:
+                    sys.stderr.write(
+                        f"ERROR: remote returned empty lod for {lod_name}; "
+                        f"keeping existing local cache\n"
+                    )
+                    failed.append(lod_name)
+                    continue
+                profiler = Profiler(f"store {lod_name} ...", profile=True)
+                try:
+                    jcm.store(lod_name, lod)
+                except Exception as ex:
+                    profiler.time(" failed")
+                    sys.stderr.write(f"ERROR: failed to store {lod_name}: {ex}\n")
+                    failed.append(lod_name)
+                    continue
+                _elapsed = profiler.time(f" store {len(lod)} {lod_name}")
         if failed:
             sys.stderr.write(
                 f"recreate finished with {len(failed)} failure(s): "
@@ -173,17 +499,506 @@ class CeurSptCmd:
             )
         return len(failed)
 
-    def start(self, args: Namespace):
+    def load_managers(self, args: Namespace, use_bundle: bool = False):
         """
+        load the volumes and papers
+
         Args:
             args(Arguments): command line arguments
+            use_bundle(bool): if True load from the startup bundle unless it is stale
+
+        Returns:
+            tuple: the VolumeManager and PaperManager
         """
-        vm = VolumeManager(base_path=args.basepath, base_url=args.baseurl)
+        vm = VolumeManager(
+            base_path=args.basepath, base_url=args.baseurl, cache_dir=args.cache_dir
+        )
+        pm = PaperManager(base_url=args.baseurl, cache_dir=args.cache_dir)
+        if use_bundle:
+            bundle = StartupBundle(self.bundle_dir(args))
+            stale = bundle.load(vm, pm, args.verbose)
+            if not stale:
+                return vm, pm
+            if args.verbose or os.path.isdir(bundle.bundle_dir):
+                print(f"startup bundle not used: {stale}", file=sys.stderr)
         vm.getVolumes(args.verbose)
-        pm = PaperManager(base_url=args.baseurl)
         pm.getPapers(vm, args.verbose)
-        ws = WebServer(vm, pm)
-        uvicorn.run(ws.app, host=args.host, port=args.port)
+        return vm, pm
+
+    def cache_dir(self, args: Namespace) -> str:
+        """
+        get the directory of the json caches and the derived indexes
+
+        Args:
+            args(Arguments): command line arguments
+        """
+        return args.cache_dir or f"{Path.home()}/.ceurws"
+
+    def bundle_dir(self, args: Namespace) -> str:
+        """
+        get the directory of the startup bundle
+
+        Args:
+            args(Arguments): command line arguments
+        """
+        if args.bundle:
+            return args.bundle
+        return f"{self.cache_dir(args)}/bundle"
+
+    def build_bundle(self, args: Namespace) -> dict:
+        """
+        precompute the startup bundle from the json caches
+
+        Args:
+            args(Arguments): command line arguments
+
+        Returns:
+            dict: the build statistics
+        """
+        vm, pm = self.load_managers(args)
+        bundle = StartupBundle(self.bundle_dir(args))
+        stats = bundle.build(vm, pm)
+        print(
+            f"bundle of {stats['volumes']} volumes {stats['papers']} papers and "
+            f"{stats['pdf_files']} pdf files ({stats['bytes'] / 1e6:.1f} MB) "
+            f"in {bundle.bundle_dir} took {stats['seconds']:.1f} s"
+        )
+        return stats
+
+    def dump_jsonld(self, args: Namespace) -> int:
+        """
+        dump the JSON-LD of the whole corpus
+
+        Args:
+            args(Arguments): command line arguments
+
+        Returns:
+            int: the number of volumes dumped
+        """
+        vm, _pm = self.load_managers(args)
+        dumper = CorpusDumper(vm, fmt=args.dump_format, workers=args.dump_workers)
+        to_stdout = args.dump_jsonld == "-"
+        # keep stdout clean for the dump itself
+        profiler = Profiler(
+            f"dump {args.dump_format}", profile=args.verbose and not to_stdout
+        )
+        if to_stdout:
+            count = dumper.dump(sys.stdout.buffer)
+        else:
+            with open(args.dump_jsonld, "wb") as dump_file:
+                count = dumper.dump(dump_file)
+        profiler.time(f" of {count} volumes")
+        return count
+
+    def fulltext_dir(self, args: Namespace) -> str:
+        """
+        get the directory of the full text index
+
+        Args:
+            args(Arguments): command line arguments
+        """
+        if args.fulltext_index:
+            return args.fulltext_index
+        return f"{self.cache_dir(args)}/fulltext"
+
+    def related_dir(self, args: Namespace) -> str:
+        """
+        get the directory of the related papers
+
+        Args:
+            args(Arguments): command line arguments
+        """
+        if args.related_index:
+            return args.related_index
+        return f"{self.cache_dir(args)}/related"
+
+    def duplicates_report(self, args: Namespace) -> str:
+        """
+        get the path of the near duplicate papers report
+
+        Args:
+            args(Arguments): command line arguments
+        """
+        if args.duplicates_report:
+            return args.duplicates_report
+        return f"{self.cache_dir(args)}/duplicates.json"
+
+    def xml_store_dir(self, args: Namespace) -> str:
+        """
+        get the directory of the metadata extracted from the xml files
+
+        Args:
+            args(Arguments): command line arguments
+        """
+        if args.xml_store:
+            return args.xml_store
+        return f"{self.cache_dir(args)}/xml-metadata"
+
+    def extract_xml(self, args: Namespace) -> dict:
+        """
+        extract the metadata of the changed GROBID and CERMINE xml files
+
+        Args:
+            args(Arguments): command line arguments
+
+        Returns:
+            dict: the build statistics
+        """
+        _vm, pm = self.load_managers(args)
+        store_dir = self.xml_store_dir(args)
+        xml_files = XmlMetadataBuilder.xml_files_of(pm)
+        builder = XmlMetadataBuilder(xml_files, store_dir, workers=args.extract_workers)
+        stats = builder.build()
+        for error in stats["errors"]:
+            print(error, file=sys.stderr)
+        print(
+            f"{stats['extracted']} of {stats['volumes']} volumes with "
+            f"{stats['papers']} papers extracted {stats['removed']} removed "
+            f"{stats['failed']} failed in {store_dir} took {stats['seconds']:.1f} s"
+        )
+        return stats
+
+    def find_duplicates(self, args: Namespace) -> dict:
+        """
+        find near duplicate papers and write the report
+
+        Args:
+            args(Arguments): command line arguments
+
+        Returns:
+            dict: the report
+        """
+        _vm, pm = self.load_managers(args)
+        finder = DuplicateFinder(
+            pm, threshold=args.duplicates_threshold, workers=args.fulltext_workers
+        )
+        report = finder.find()
+        report_path = self.duplicates_report(args)
+        DuplicateFinder.write_report(report, report_path)
+        cross_volume = sum(1 for pair in report["pairs"] if pair["cross_volume"])
+        print(
+            f"{len(report['pairs'])} near duplicates ({cross_volume} across volumes) "
+            f"of {report['texts']} texts from {report['candidates']} candidates "
+            f"in {report_path} took {report['seconds']:.1f} s"
+        )
+        return report
+
+    def build_related(self, args: Namespace) -> dict:
+        """
+        precompute the most similar papers of each paper
+
+        Args:
+            args(Arguments): command line arguments
+
+        Returns:
+            dict: the build statistics
+        """
+        _vm, pm = self.load_managers(args)
+        index_dir = self.related_dir(args)
+        builder = RelatedPapersBuilder.from_managers(
+            pm,
+            FullTextIndexBuilder.text_files_of(pm),
+            index_dir,
+            k=args.related_k,
+            workers=args.fulltext_workers,
+        )
+        stats = builder.build()
+        print(
+            f"{args.related_k} related papers for {stats['docs']} papers "
+            f"with {stats['terms']} terms in {index_dir} took {stats['seconds']:.1f} s"
+        )
+        return stats
+
+    def extract_text(self, args: Namespace) -> dict:
+        """
+        extract the texts of the pdf files that have no up to date text file
+
+        Args:
+            args(Arguments): command line arguments
+
+        Returns:
+            dict: the extraction report
+        """
+        _vm, pm = self.load_managers(args)
+
+        def show_progress(progress: dict):
+            eta = progress["eta_seconds"]
+            eta_msg = f" eta {eta / 3600:.1f} h" if eta is not None else ""
+            print(
+                f"{progress['done']}/{progress['pending']} pdfs "
+                f"{progress['files_per_second']:.1f} files/s "
+                f"{progress['mb_per_second']:.1f} MB/s{eta_msg}",
+                file=sys.stderr,
+            )
+
+        pipeline = TextExtractionPipeline(
+            TextExtractionPipeline.pdf_files_of(pm),
+            extractor=args.text_extractor,
+            workers=args.extract_workers,
+            progress=show_progress,
+        )
+        report = pipeline.run()
+        for error in report["errors"]:
+            print(error, file=sys.stderr)
+        print(
+            f"{report['extracted']} extracted {report['failed']} failed "
+            f"{report['up_to_date']} up to date {report['archived']} archived "
+            f"of {report['pdfs']} pdfs in {report['seconds']:.1f} s "
+            f"({report['files_per_second']:.1f} files/s)"
+        )
+        return report
+
+    def build_fulltext_index(self, args: Namespace) -> dict:
+        """
+        build or update the full text index of the paper texts
+
+        Args:
+            args(Arguments): command line arguments
+
+        Returns:
+            dict: the build statistics
+        """
+        _vm, pm = self.load_managers(args)
+        index_dir = self.fulltext_dir(args)
+        text_files = FullTextIndexBuilder.text_files_of(pm)
+        builder = FullTextIndexBuilder(
+            text_files, index_dir, workers=args.fulltext_workers
+        )
+        stats = builder.build()
+        print(
+            f"{stats['docs']} documents ({stats['added']} added, {stats['kept']} kept, "
+            f"{stats['removed']} removed) with {stats['terms']} terms "
+            f"in {index_dir} took {stats['seconds']:.1f} s"
+        )
+        return stats
+
+    def memory_report(self, args: Namespace) -> str:
+        """
+        load the volumes and papers and report their memory usage
+
+        Args:
+            args(Arguments): command line arguments
+
+        Returns:
+            str: the memory report
+        """
+        vm = VolumeManager(
+            base_path=args.basepath, base_url=args.baseurl, cache_dir=args.cache_dir
+        )
+        pm = PaperManager(base_url=args.baseurl, cache_dir=args.cache_dir)
+        report = MemoryReport(vm, pm)
+        report.load(args.verbose)
+        diff = None
+        if args.reload_diff:
+
+            def reload():
+                vm.getVolumes()
+                pm.getPapers(vm)
+
+            diff = MemoryReport.reload_diff(reload)
+        text = report.as_text(diff)
+        print(text)
+        return text
+
+    def benchmark(self, args: Namespace) -> int:
+        """
+        run the benchmark suite and optionally compare it to a baseline
+
+        Args:
+            args(Arguments): command line arguments
+
+        Returns:
+            int: the number of regressions found
+        """
+        suite = BenchmarkSuite(
+            base_path=args.basepath,
+            base_url=args.baseurl,
+            cache_dir=args.cache_dir,
+            repeat=args.benchmark_repeat,
+        )
+        results = suite.run()
+        json_str = json.dumps(results, indent=2)
+        if args.benchmark == "-":
+            print(json_str)
+        else:
+            with open(args.benchmark, "w", encoding="utf-8") as json_file:
+                json_file.write(json_str)
+        # keep stdout clean if the results are written there
+        out = sys.stderr if args.benchmark == "-" else sys.stdout
+        print(BenchmarkSuite.memory_text(results["memory"]), file=out)
+        regressions = 0
+        if args.benchmark_baseline:
+            baseline = BenchmarkSuite.load(args.benchmark_baseline)
+            rows = BenchmarkSuite.compare(
+                baseline, results, threshold=args.benchmark_threshold
+            )
+            print(BenchmarkSuite.comparison_text(rows), file=out)
+            regressions = sum(1 for row in rows if row["regression"])
+        return regressions
+
+    def mirror(self, args: Namespace) -> dict:
+        """
+        mirror the volume archives of the given range
+
+        Args:
+            args(Arguments): command line arguments
+
+        Returns:
+            dict: the mirror report
+        """
+        last = args.mirror_to if args.mirror_to is not None else args.mirror_from
+        volume_mirror = VolumeMirror(
+            args.basepath,
+            mirror_url=args.mirror_url,
+            connections=args.mirror_connections,
+            workers=args.mirror_workers,
+            keep_zip=args.keep_zip,
+        )
+        report = volume_mirror.mirror(args.mirror_from, last)
+        for result in report["volumes"]:
+            if result["status"] == "failed":
+                print(f"Vol-{result['volume']} failed: {result.get('error')}")
+        counts = " ".join(
+            f"{count} {status}" for status, count in sorted(report["counts"].items())
+        )
+        print(
+            f"{counts} - {report['bytes'] / 1e6:.1f} MB to {args.basepath} "
+            f"in {report['seconds']:.1f} s"
+        )
+        return report
+
+    def generate_corpus(self, args: Namespace) -> dict:
+        """
+        generate a synthetic corpus
+
+        Args:
+            args(Arguments): command line arguments
+
+        Returns:
+            dict: the number of records written by lod name
+        """
+        corpus = SyntheticCorpus(
+            volumes=args.corpus_volumes,
+            papers=args.corpus_papers,
+            seed=args.corpus_seed,
+        )
+        cache_dir = f"{args.generate_corpus}/cache"
+        base_path = None if args.corpus_lods_only else f"{args.generate_corpus}/ceur-ws"
+        profiler = Profiler(
+            f"generating {args.corpus_volumes} volumes with {args.corpus_papers} papers"
+        )
+        counts = corpus.generate(cache_dir, base_path)
+        profiler.time()
+        for lod_name, count in counts.items():
+            print(f"{count} {lod_name}")
+        base_path_option = f" --basepath {base_path}" if base_path else ""
+        print(f"use with --cache-dir {cache_dir}{base_path_option}")
+        return counts
+
+    def replay(self, args: Namespace) -> dict:
+        """
+        replay an access log and report throughput, latencies and errors
+
+        Args:
+            args(Arguments): command line arguments
+
+        Returns:
+            dict: the replay report
+        """
+        if args.replay_url:
+            replayer = LogReplayer(
+                base_url=args.replay_url,
+                concurrency=args.replay_concurrency,
+                rate=args.replay_rate,
+            )
+        else:
+            vm, pm = self.load_managers(args)
+            ws = WebServer(vm, pm)
+            replayer = LogReplayer(
+                app=ws.app, concurrency=args.replay_concurrency, rate=args.replay_rate
+            )
+        entries = AccessLogEntry.read(args.replay)
+        if args.replay_limit:
+            entries = itertools.islice(entries, args.replay_limit)
+        report = replayer.replay(entries)
+        print(LogReplayer.report_text(report))
+        return report
+
+    def create_webserver(self, args: Namespace) -> WebServer:
+        """
+        load the managers and create the webserver
+
+        Args:
+            args(Arguments): command line arguments
+        """
+        vm, pm = self.load_managers(args, use_bundle=True)
+        if args.profile_requests and not args.admin_token:
+            raise ValueError("--profile-requests needs an --admin-token")
+        ws = WebServer(
+            vm,
+            pm,
+            admin_token=args.admin_token,
+            profile_dir=args.profile_requests,
+            fulltext_dir=self.fulltext_dir(args),
+            related_dir=self.related_dir(args),
+            duplicates_report=self.duplicates_report(args),
+            xml_store_dir=self.xml_store_dir(args),
+        )
+        return ws
+
+    def prefork_benchmark(self, args: Namespace) -> list:
+        """
+        measure throughput and per worker memory for different worker counts
+
+        Args:
+            args(Arguments): command line arguments
+
+        Returns:
+            list: a measurement per worker count
+        """
+        ws = self.create_webserver(args)
+        if args.replay:
+            paths = [entry.path for entry in AccessLogEntry.read(args.replay)]
+        else:
+            suite = BenchmarkSuite(base_path=args.basepath, base_url=args.baseurl)
+            paths = [
+                path
+                for template, path in suite.route_paths(ws, ws.vm, ws.pm).items()
+                if template not in ["/corpus.jsonld", "/metrics"]
+            ]
+        benchmark = PreforkBenchmark(
+            ws.app, paths, port=args.port, loop=args.loop, http=args.http
+        )
+        worker_counts = [int(count) for count in args.prefork_benchmark.split(",")]
+        rows = benchmark.run(
+            worker_counts,
+            requests=args.prefork_requests,
+            concurrency=args.replay_concurrency,
+        )
+        print(PreforkBenchmark.report_text(rows))
+        return rows
+
+    def start(self, args: Namespace):
+        """
+        Args:
+            args(Arguments): command line arguments
+        """
+        ws = self.create_webserver(args)
+        if args.workers > 1:
+            ws.metrics.pid_label = True
+            server = PreforkServer(
+                ws.app,
+                host=args.host,
+                port=args.port,
+                workers=args.workers,
+                loop=args.loop,
+                http=args.http,
+            )
+            server.serve()
+        else:
+            uvicorn.run(
+                ws.app, host=args.host, port=args.port, loop=args.loop, http=args.http
+            )
 
 
 def main(argv=None):  # IGNORE:C0111
@@ -207,16 +1022,58 @@ def main(argv=None):  # IGNORE:C0111
         if len(argv) < 1:
             parser.print_usage()
             sys.exit(1)
+        if args.trace:
+            TRACER.enabled = True
         if args.about:
             print(program_version_message)
             print(f"see {Version.doc_url}")
             webbrowser.open(Version.doc_url)
-        if args.recreate:
-            failed = spt_cmd.recreate(args)
-            if failed:
-                return 3
-        elif args.serve:
-            spt_cmd.start(args)
+        try:
+            if args.recreate:
+                failed = spt_cmd.recreate(args)
+                if failed:
+                    return 3
+                if args.build_bundle:
+                    spt_cmd.build_bundle(args)
+            elif args.build_bundle:
+                spt_cmd.build_bundle(args)
+            elif args.build_fulltext_index:
+                spt_cmd.build_fulltext_index(args)
+            elif args.build_related:
+                spt_cmd.build_related(args)
+            elif args.find_duplicates:
+                spt_cmd.find_duplicates(args)
+            elif args.extract_text:
+                report = spt_cmd.extract_text(args)
+                if report["failed"]:
+                    return 5
+            elif args.extract_xml:
+                stats = spt_cmd.extract_xml(args)
+                if stats["failed"]:
+                    return 5
+            elif args.mirror:
+                report = spt_cmd.mirror(args)
+                if report["counts"].get("failed"):
+                    return 5
+            elif args.dump_jsonld:
+                spt_cmd.dump_jsonld(args)
+            elif args.memory_report:
+                spt_cmd.memory_report(args)
+            elif args.generate_corpus:
+                spt_cmd.generate_corpus(args)
+            elif args.prefork_benchmark:
+                spt_cmd.prefork_benchmark(args)
+            elif args.replay:
+                spt_cmd.replay(args)
+            elif args.benchmark:
+                regressions = spt_cmd.benchmark(args)
+                if regressions:
+                    return 4
+            elif args.serve:
+                spt_cmd.start(args)
+        finally:
+            if args.trace:
+                TRACER.export(args.trace, fmt=args.trace_format)
 
     except KeyboardInterrupt:
         ###
@@ -0,0 +1,75 @@
+"""
+Created on 2026-10-19
+
+@author: agent
+"""
+
+import sys
+from typing import Dict, Iterable, Optional
+
+
+class StringPool:
+    """
+    a pool of strings shared by the loaded lods
+
+    equal strings from different records are replaced by the first
+    instance seen so that each distinct value is stored only once
+    """
+
+    def __init__(self):
+        self.strings: Dict[str, str] = {}
+        # number of replaced duplicates and the bytes they occupied
+        self.hits = 0
+        self.saved = 0
+
+    def __len__(self) -> int:
+        return len(self.strings)
+
+    def intern(self, value: Optional[str]) -> Optional[str]:
+        """
+        get the pooled instance of the given value
+
+        Args:
+            value(str): the value - non strings are returned as is
+
+        Returns:
+            str: the shared instance
+        """
+        if not isinstance(value, str):
+            return value
+        pooled = self.strings.setdefault(value, value)
+        if pooled is not value:
+            self.hits += 1
+            self.saved += sys.getsizeof(value)
+        return pooled
+
+    def intern_record(self, record: dict, keys: Iterable[str]):
+        """
+        intern the values of the given keys of the given record in place
+
+        Args:
+            record(dict): the record
+            keys(Iterable): the keys of the values that repeat across records
+        """
+        for key in keys:
+            value = record.get(key)
+            if isinstance(value, str):
+                record[key] = self.intern(value)
+
+    def pool_bytes(self) -> int:
+        """
+        get the size of the pool dict itself
+        """
+        return sys.getsizeof(self.strings)
+
+    def as_dict(self) -> dict:
+        """
+        get my statistics
+        """
+        return {
+            "strings": len(self.strings),
+            "hits": self.hits,
+            "saved": self.saved,
+            "pool": self.pool_bytes(),
+            "net": self.saved - self.pool_bytes(),
+        }
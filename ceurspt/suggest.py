@@ -0,0 +1,408 @@
+"""
+Created on 2026-10-19
+
+@author: agent
+"""
+
+import heapq
+import re
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+WORD_RE = re.compile(r"\w+")
+
+
+class SuggestIndex:
+    """
+    in-memory autocomplete index over the volume titles and acronyms
+    and the paper titles
+
+    the distinct words are kept in sorted order so that all words with a
+    given prefix are found by bisection - words without exact or prefix
+    match are looked up by their trigrams for fuzzy matching
+
+    entries are numbered in insertion order with append only postings so
+    that reloads only index the changed entries - replaced entries are
+    tombstoned and the index is rebuilt once too many are dead
+    """
+
+    # the maximum number of words a prefix expands to
+    MAX_PREFIX_WORDS = 64
+    # the maximum number of words a misspelled word expands to
+    MAX_FUZZY_WORDS = 5
+    # the minimum trigram jaccard similarity of a fuzzy match
+    MIN_SIMILARITY = 0.4
+    # the maximum number of matching entries to rank
+    MAX_CANDIDATES = 50
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        """
+        remove all entries
+        """
+        # kind, key, label, acronym and url by entry id
+        self.entries: List[Optional[tuple]] = []
+        self.entry_by_key: Dict[str, int] = {}
+        self.dead = 0
+        self.word_ids: Dict[str, int] = {}
+        self.words: List[str] = []
+        # sorted lazily after words were added
+        self.sorted_words: Optional[List[str]] = None
+        # ascending entry ids by word id
+        self.postings: List[array] = []
+        # word ids by trigram
+        self.trigrams: Dict[str, array] = {}
+
+    def __len__(self) -> int:
+        return len(self.entry_by_key)
+
+    @classmethod
+    def tokenize(cls, text: Optional[str]) -> List[str]:
+        """
+        get the lower case words of the given text
+        """
+        return WORD_RE.findall(text.lower()) if text else []
+
+    @classmethod
+    def trigrams_of(cls, word: str) -> List[str]:
+        """
+        get the distinct trigrams of the given word padded at both ends
+        """
+        padded = f"  {word} "
+        return list({padded[i : i + 3] for i in range(len(padded) - 2)})
+
+    @classmethod
+    def records_of(cls, vm, pm) -> Iterator[Tuple[str, tuple]]:
+        """
+        get the entries of the given managers by key - the newest volumes first
+        followed by the papers of the newest volumes
+
+        Args:
+            vm(VolumeManager): the volume manager with the loaded volumes
+            pm(PaperManager): the paper manager with the loaded papers
+
+        Yields:
+            tuple: the key and the kind, label, acronym and url of the entry
+        """
+        for volume in reversed(vm.volume_table.volumes):
+            key = f"Vol-{volume.number}"
+            label = volume.title or key
+            yield key, ("volume", label, volume.acronym, f"/{key}.html")
+        papers = sorted(
+            pm.papers_by_path.items(),
+            key=lambda item: -item[1].volume.number if item[1].volume else 0,
+        )
+        for pdf_path, paper in papers:
+            if paper.title:
+                url = f"/{pdf_path[: -len('.pdf')]}.html"
+                yield pdf_path, ("paper", paper.title, None, url)
+
+    def update(self, vm, pm) -> dict:
+        """
+        update the index to the loaded volumes and papers only indexing
+        the entries that changed since the last update
+
+        Args:
+            vm(VolumeManager): the volume manager with the loaded volumes
+            pm(PaperManager): the paper manager with the loaded papers
+
+        Returns:
+            dict: the number of added, removed and kept entries
+        """
+        stats = {"added": 0, "removed": 0, "kept": 0}
+        records = dict(self.records_of(vm, pm))
+        for key, entry_id in list(self.entry_by_key.items()):
+            kind, _key, label, acronym, url = self.entries[entry_id]
+            if records.get(key) == (kind, label, acronym, url):
+                stats["kept"] += 1
+                del records[key]
+            else:
+                self.remove(key)
+                stats["removed"] += 1
+        for key, record in records.items():
+            self.add(key, *record)
+            stats["added"] += 1
+        if self.dead > len(self.entries) // 4:
+            self.rebuild()
+        # sort the words at load time instead of on the first query
+        if self.sorted_words is None:
+            self.sorted_words = sorted(self.words)
+        return stats
+
+    def dump(self) -> Tuple[dict, bytes]:
+        """
+        get my state to store it e.g. in a startup bundle
+
+        Returns:
+            tuple: the entries, words and trigrams with the lengths of their
+            postings and the concatenated postings as native unsigned ints
+        """
+        trigram_keys = list(self.trigrams)
+        state = {
+            "entries": self.entries,
+            "words": self.words,
+            "posting_lengths": [len(postings) for postings in self.postings],
+            "trigrams": trigram_keys,
+            "trigram_lengths": [len(self.trigrams[key]) for key in trigram_keys],
+        }
+        data = array("I")
+        for postings in self.postings:
+            data.extend(postings)
+        for key in trigram_keys:
+            data.extend(self.trigrams[key])
+        return state, data.tobytes()
+
+    @classmethod
+    def restore(cls, state: dict, data) -> "SuggestIndex":
+        """
+        restore an index from a state and postings dumped before
+
+        Args:
+            state(dict): the state as returned by dump
+            data: the postings bytes e.g. a memory mapped file
+
+        Returns:
+            SuggestIndex: the restored index
+        """
+        index = cls()
+        index.entries = [tuple(entry) if entry else None for entry in state["entries"]]
+        for entry_id, entry in enumerate(index.entries):
+            if entry is None:
+                index.dead += 1
+            else:
+                index.entry_by_key[entry[1]] = entry_id
+        index.words = state["words"]
+        index.word_ids = {word: word_id for word_id, word in enumerate(index.words)}
+        view = memoryview(data)
+        offset = 0
+
+        def next_postings(length: int) -> array:
+            nonlocal offset
+            postings = array("I")
+            end = offset + length * postings.itemsize
+            postings.frombytes(view[offset:end])
+            offset = end
+            return postings
+
+        index.postings = [next_postings(length) for length in state["posting_lengths"]]
+        index.trigrams = {
+            key: next_postings(length)
+            for key, length in zip(state["trigrams"], state["trigram_lengths"])
+        }
+        view.release()
+        index.sorted_words = sorted(index.words)
+        return index
+
+    def rebuild(self):
+        """
+        rebuild the index from the live entries dropping the tombstones
+        """
+        live = [entry for entry in self.entries if entry is not None]
+        self.clear()
+        for kind, key, label, acronym, url in live:
+            self.add(key, kind, label, acronym, url)
+
+    def add(self, key: str, kind: str, label: str, acronym: Optional[str], url: str):
+        """
+        add an entry
+
+        Args:
+            key(str): the unique key e.g. Vol-3262 or Vol-3262/paper2.pdf
+            kind(str): volume or paper
+            label(str): the title
+            acronym(str): the acronym of a volume
+            url(str): the url of the entry
+        """
+        if key in self.entry_by_key:
+            self.remove(key)
+        entry_id = len(self.entries)
+        self.entries.append((kind, key, label, acronym, url))
+        self.entry_by_key[key] = entry_id
+        words = set(self.tokenize(label)) | set(self.tokenize(acronym))
+        for word in words:
+            word_id = self.word_ids.get(word)
+            if word_id is None:
+                word_id = len(self.words)
+                self.word_ids[word] = word_id
+                self.words.append(word)
+                self.postings.append(array("I"))
+                self.sorted_words = None
+                for trigram in self.trigrams_of(word):
+                    self.trigrams.setdefault(trigram, array("I")).append(word_id)
+            self.postings[word_id].append(entry_id)
+
+    def remove(self, key: str):
+        """
+        tombstone the entry with the given key
+        """
+        entry_id = self.entry_by_key.pop(key, None)
+        if entry_id is not None:
+            self.entries[entry_id] = None
+            self.dead += 1
+
+    def prefix_words(self, prefix: str) -> List[int]:
+        """
+        get the ids of the words starting with the given prefix
+        """
+        if self.sorted_words is None:
+            self.sorted_words = sorted(self.words)
+        sorted_words = self.sorted_words
+        word_ids = []
+        index = bisect_left(sorted_words, prefix)
+        while index < len(sorted_words) and len(word_ids) < self.MAX_PREFIX_WORDS:
+            word = sorted_words[index]
+            if not word.startswith(prefix):
+                break
+            word_ids.append(self.word_ids[word])
+            index += 1
+        return word_ids
+
+    def fuzzy_words(self, word: str) -> List[int]:
+        """
+        get the ids of the words most similar to the given word by trigrams
+        """
+        trigrams = self.trigrams_of(word)
+        shared = Counter()
+        for trigram in trigrams:
+            shared.update(self.trigrams.get(trigram, ()))
+        scored = []
+        for word_id, count in shared.items():
+            other = len(self.words[word_id]) + 2
+            similarity = count / (len(trigrams) + other - count)
+            if similarity >= self.MIN_SIMILARITY:
+                scored.append((similarity, word_id))
+        best = heapq.nlargest(self.MAX_FUZZY_WORDS, scored)
+        return [word_id for _similarity, word_id in best]
+
+    def word_group(self, token: str, prefix: bool) -> Tuple[List[int], List[int]]:
+        """
+        get the ids of the words matching the given query token
+
+        Returns:
+            tuple: the ids of exact matches and of prefix or fuzzy matches
+        """
+        word_id = self.word_ids.get(token)
+        exact = [word_id] if word_id is not None else []
+        others = []
+        if prefix:
+            others = [other for other in self.prefix_words(token) if other != word_id]
+        if not exact and not others:
+            others = self.fuzzy_words(token)
+        return exact, others
+
+    def entry_words(self, entry_id: int) -> Set[str]:
+        """
+        get the words of the entry with the given id
+        """
+        _kind, _key, label, acronym, _url = self.entries[entry_id]
+        return set(self.tokenize(label)) | set(self.tokenize(acronym))
+
+    def candidate_ids(self, groups: List[Tuple[List[int], List[int]]]) -> Iterator[int]:
+        """
+        get the ascending ids of the entries that may match the given word groups
+
+        words that must match exactly are intersected as sets - otherwise
+        the postings of the most selective group are merged
+        """
+        strict = sorted(
+            (
+                self.postings[exact[0]]
+                for exact, others in groups
+                if exact and not others
+            ),
+            key=len,
+        )
+        if strict:
+            entry_ids = set(strict[0])
+            for postings in strict[1:]:
+                entry_ids.intersection_update(postings)
+            yield from sorted(entry_ids)
+            return
+
+        def size(group) -> int:
+            return sum(len(self.postings[word_id]) for word_id in group[0] + group[1])
+
+        driver = min(groups, key=size)
+        previous = None
+        for entry_id in heapq.merge(
+            *(self.postings[word_id] for word_id in driver[0] + driver[1])
+        ):
+            if entry_id != previous:
+                previous = entry_id
+                yield entry_id
+
+    def suggest(self, query: str, limit: int = 10) -> List[dict]:
+        """
+        get the best matching volumes and papers for the given query
+        the last word of the query is matched as prefix
+
+        Args:
+            query(str): the partial title or acronym e.g. "SEMANTiCS 2023"
+            limit(int): the maximum number of suggestions
+
+        Returns:
+            list: the suggestions with kind, label, acronym, url and score
+        """
+        tokens = self.tokenize(query)
+        if not tokens:
+            return []
+        groups = [
+            self.word_group(token, prefix=index == len(tokens) - 1)
+            for index, token in enumerate(tokens)
+        ]
+        if any(not exact and not others for exact, others in groups):
+            return []
+        # the words of each group to check the candidates against
+        word_sets = [
+            (
+                {self.words[word_id] for word_id in exact},
+                {self.words[word_id] for word_id in others},
+            )
+            for exact, others in groups
+        ]
+
+        candidates = []
+        for entry_id in self.candidate_ids(groups):
+            if self.entries[entry_id] is None:
+                continue
+            words = self.entry_words(entry_id)
+            score = 0.0
+            for exact, others in word_sets:
+                if not exact.isdisjoint(words):
+                    score += 1.0
+                elif not others.isdisjoint(words):
+                    score += 0.5
+                else:
+                    break
+            else:
+                candidates.append((score, entry_id))
+                if len(candidates) >= self.MAX_CANDIDATES:
+                    break
+        normalized = " ".join(tokens)
+        ranked = []
+        for score, entry_id in candidates:
+            kind, key, label, acronym, url = self.entries[entry_id]
+            if acronym and " ".join(self.tokenize(acronym)) == normalized:
+                score += 2.0
+            if kind == "volume":
+                score += 0.5
+            ranked.append((-score, entry_id))
+        ranked.sort()
+        suggestions = []
+        for neg_score, entry_id in ranked[: max(0, limit)]:
+            kind, key, label, acronym, url = self.entries[entry_id]
+            suggestions.append(
+                {
+                    "kind": kind,
+                    "key": key,
+                    "label": label,
+                    "acronym": acronym,
+                    "url": url,
+                    "score": -neg_score,
+                }
+            )
+        return suggestions
@@ -0,0 +1,514 @@
+"""
+Created on 2026-10-19
+
+@author: agent
+"""
+
+import html
+import itertools
+import os
+import random
+from datetime import date, timedelta
+from typing import Dict, List
+
+import orjson
+
+
+class LodWriter:
+    """
+    write a list of dicts as json array one record at a time
+    so that large corpora never need to be held in memory
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.count = 0
+        self.file = open(path, "wb")
+        self.file.write(b"[")
+
+    def write(self, record: dict):
+        """
+        write the given record
+        """
+        if self.count:
+            self.file.write(b",\n")
+        self.file.write(orjson.dumps(record))
+        self.count += 1
+
+    def close(self):
+        """
+        finish the json array
+        """
+        self.file.write(b"]")
+        self.file.close()
+
+
+class ZipfSampler:
+    """
+    sample items with a Zipf like rank frequency distribution
+    """
+
+    def __init__(self, rng: random.Random, items: List[str], exponent: float = 1.1):
+        self.rng = rng
+        self.items = items
+        self.cum_weights = list(
+            itertools.accumulate(
+                1.0 / (rank**exponent) for rank in range(1, len(items) + 1)
+            )
+        )
+
+    def sample(self, k: int) -> List[str]:
+        """
+        get k samples
+        """
+        return self.rng.choices(self.items, cum_weights=self.cum_weights, k=k)
+
+
+class SyntheticCorpus:
+    """
+    generator for a synthetic CEUR-WS corpus of configurable size
+
+    writes the volumes, proceedings, papers, papers_dblp and authors_dblp
+    lods to a cache directory and optionally the matching Vol-N/index.html,
+    stub pdf and -content.txt files to a base path
+    """
+
+    SYLLABLES = [
+        "ka", "lo", "mi", "ne", "ra", "ti", "so", "vu", "de", "ba", "gri", "tal",
+        "mon", "ser", "pha", "qua", "lin", "dor", "sen", "ver", "cho", "zen",
+    ]  # fmt: skip
+    COUNTRIES = [
+        ("Germany", "Q183", "Berlin", "Q64"),
+        ("Italy", "Q38", "Rome", "Q220"),
+        ("Spain", "Q29", "Madrid", "Q2807"),
+        ("France", "Q142", "Paris", "Q90"),
+        ("Ukraine", "Q212", "Kyiv", "Q1899"),
+        ("Greece", "Q41", "Athens", "Q1524"),
+        ("Austria", "Q40", "Vienna", "Q1741"),
+        ("Netherlands", "Q55", "Amsterdam", "Q727"),
+    ]
+    EVENT_KINDS = ["Workshop", "Conference", "Symposium", "Doctoral Consortium"]
+
+    def __init__(
+        self,
+        volumes: int = 10000,
+        papers: int = 500000,
+        seed: int = 42,
+        dblp_ratio: float = 0.4,
+        wikidata_ratio: float = 0.8,
+        pdf_size: int = 1024,
+        text_words: int = 300,
+    ):
+        """
+        constructor
+
+        Args:
+            volumes(int): the number of volumes to generate
+            papers(int): the total number of papers to generate
+            seed(int): the random seed
+            dblp_ratio(float): the share of volumes indexed by dblp
+            wikidata_ratio(float): the share of volumes with wikidata proceedings
+            pdf_size(int): the size of each stub pdf in bytes
+            text_words(int): the number of words of each -content.txt file
+        """
+        self.volumes = volumes
+        self.papers = papers
+        self.seed = seed
+        self.dblp_ratio = dblp_ratio
+        self.wikidata_ratio = wikidata_ratio
+        self.pdf_size = pdf_size
+        self.text_words = text_words
+        self.rng = random.Random(seed)
+        words = self.make_names(5000, 2, 4)
+        # rank the words randomly instead of alphabetically
+        self.rng.shuffle(words)
+        self.words = ZipfSampler(self.rng, words)
+        self.author_names = ZipfSampler(
+            self.rng, self.make_person_names(max(1000, papers // 3)), exponent=0.8
+        )
+        self.authors_dblp: Dict[str, dict] = {}
+
+    def make_names(
+        self, count: int, min_syllables: int, max_syllables: int
+    ) -> List[str]:
+        """
+        make the given number of distinct pseudo words
+        """
+        names = set()
+        while len(names) < count:
+            syllables = self.rng.randint(min_syllables, max_syllables)
+            names.add("".join(self.rng.choices(self.SYLLABLES, k=syllables)))
+        return sorted(names)
+
+    def make_person_names(self, count: int) -> List[str]:
+        """
+        make the given number of distinct person names in random order
+        """
+        first_names = self.make_names(min(3000, count), 2, 3)
+        last_names = self.make_names(min(20000, count), 2, 4)
+        names = []
+        seen = set()
+        while len(names) < count:
+            first = self.rng.choice(first_names).capitalize()
+            last = self.rng.choice(last_names).capitalize()
+            name = f"{first} {last}"
+            if name not in seen:
+                seen.add(name)
+                names.append(name)
+        return names
+
+    def title(self, min_words: int = 4, max_words: int = 14) -> str:
+        """
+        make a title
+        """
+        words = self.words.sample(self.rng.randint(min_words, max_words))
+        return " ".join(words).capitalize()
+
+    def paper_counts(self) -> List[int]:
+        """
+        distribute the papers over the volumes with a heavy tailed size distribution
+        """
+        weights = [self.rng.lognormvariate(0, 0.8) for _ in range(self.volumes)]
+        total = sum(weights)
+        budget = max(0, self.papers - self.volumes)
+        counts = [1 + int(budget * weight / total) for weight in weights]
+        # distribute the rounding remainder
+        for index in itertools.islice(
+            itertools.cycle(range(self.volumes)), max(0, self.papers - sum(counts))
+        ):
+            counts[index] += 1
+        return counts
+
+    def volume_record(self, number: int, pub_date: date, paper_count: int) -> dict:
+        """
+        make the volume record for the given number
+        """
+        country, country_qid, city, city_qid = self.rng.choice(self.COUNTRIES)
+        acronym_word = self.words.sample(1)[0].upper()[:6]
+        year = pub_date.year if pub_date.month > 2 else pub_date.year - 1
+        acronym = f"{acronym_word}-{year}"
+        voltitle = (
+            f"{self.EVENT_KINDS[number % len(self.EVENT_KINDS)]} on {self.title(3, 7)}"
+        )
+        title = f"Proceedings of the {voltitle} ({acronym})"
+        event_from = pub_date - timedelta(days=self.rng.randint(30, 200))
+        event_to = event_from + timedelta(days=self.rng.randint(0, 4))
+        editors = ", ".join(self.author_names.sample(self.rng.randint(1, 5)))
+        loctime = f"{city}, {country}, {event_from.strftime('%B %d')} - {event_to.strftime('%B %d, %Y')}"
+        virtual = self.rng.random() < 0.1
+        return {
+            "number": number,
+            "url": f"https://ceur-ws.org/Vol-{number}/",
+            "title": title,
+            "fullTitle": None,
+            "acronym": acronym,
+            "lang": None,
+            "location": None,
+            "country": None if virtual else country,
+            "countryWikidataId": None if virtual else country_qid,
+            "region": None,
+            "city": None if virtual else city,
+            "cityWikidataId": None if virtual else city_qid,
+            "ordinal": None,
+            "date": None,
+            "dateFrom": event_from.isoformat(),
+            "dateTo": event_to.isoformat(),
+            "pubYear": None,
+            "pubDate": f"{pub_date.isoformat()}T00:00:00",
+            "submitDate": None,
+            "valid": True,
+            "conference": None,
+            "editors": editors,
+            "_sessions": None,
+            "virtualEvent": virtual,
+            "submittedBy": editors.split(", ")[0],
+            "fromLine": number * 40,
+            "toLine": number * 40 + paper_count + 20,
+            "loctime": loctime,
+            "tdtitle": None,
+            "seealso": "",
+            "volname": f"https://ceur-ws.org/Vol-{number}/",
+            "published": pub_date.isoformat(),
+            "year": str(year),
+            "urn": f"urn:nbn:de:0074-{number}-{number % 10}",
+            "archive": f"https://ceur-ws.org/ftp-dir/Vol-{number}.zip",
+            "desc": "?",
+            "h1": f"{acronym} {voltitle}",
+            "volume_number": f"Vol-{number}",
+            "ceurpubdate": pub_date.isoformat(),
+            "voltitle": voltitle,
+            "colocated": None,
+            "homepage": f"https://{acronym_word.lower()}.example.org/{year}/",
+            "h3": f"{title} {loctime}",
+        }
+
+    def proceedings_record(self, volume_record: dict) -> dict:
+        """
+        make the wikidata proceedings record for the given volume record
+        """
+        number = volume_record["number"]
+        acronym = volume_record["acronym"]
+        return {
+            "item": f"http://www.wikidata.org/entity/Q{200000000 + number}",
+            "itemLabel": volume_record["title"],
+            "itemDescription": f"Proceedings of {acronym} workshop",
+            "sVolume": number,
+            "Volume": None,
+            "short_name": acronym,
+            "dblpProceedingsId": f"conf/{acronym.lower()}/{volume_record['year']}",
+            "title": volume_record["title"],
+            "language_of_work_or_name": None,
+            "language_of_work_or_nameLabel": None,
+            "URN_NBN": volume_record["urn"],
+            "publication_date": volume_record["pubDate"],
+            "described_at_URL": f"http://ceur-ws.org/Vol-{number}/",
+            "event": f"http://www.wikidata.org/entity/Q{300000000 + number}",
+            "eventLabel": volume_record["voltitle"],
+            "eventSeries": "",
+            "eventSeriesLabel": "",
+            "eventSeriesOrdinal": "",
+            "dblpEventId": "",
+            "fullWorkUrl": f"http://ceur-ws.org/Vol-{number}/",
+            "homePage": None,
+            "ppnId": str(1000000000 + number),
+        }
+
+    def paper_records(self, number: int, paper_count: int) -> List[dict]:
+        """
+        make the paper records of the given volume
+        """
+        records = []
+        page = 1
+        for index in range(paper_count):
+            if index == 0 and paper_count > 3 and self.rng.random() < 0.6:
+                pdf_name = "preface"
+                title = None
+                authors = ""
+                pages = None
+            else:
+                pdf_name = f"paper{index}"
+                title = self.title()
+                authors = ",".join(
+                    self.author_names.sample(
+                        self.rng.choice([1, 2, 2, 3, 3, 3, 4, 4, 5, 6, 8])
+                    )
+                )
+                page_count = self.rng.randint(4, 20)
+                pages = f"{page}-{page + page_count - 1}"
+                page += page_count
+            records.append(
+                {
+                    "id": f"Vol-{number}/{pdf_name}",
+                    "title": title,
+                    "type": None,
+                    "position": None,
+                    "pagesFrom": None,
+                    "pagesTo": None,
+                    "authors": authors,
+                    "vol_number": str(number),
+                    "pdf_name": f"{pdf_name}.pdf",
+                    "pages": pages,
+                    "fail": None,
+                }
+            )
+        return records
+
+    def dblp_author(self, name: str) -> dict:
+        """
+        get the dblp author record for the given name
+        """
+        author = self.authors_dblp.get(name)
+        if author is None:
+            pid = len(self.authors_dblp) + 1
+            has_wikidata = self.rng.random() < 0.3
+            author = {
+                "dblp_author_id": f"https://dblp.org/pid/{pid // 1000}/{pid}",
+                "label": name,
+                "wikidata_id": f"Q{400000000 + pid}" if has_wikidata else None,
+                "orcid_id": (
+                    f"0000-0002-{pid // 10000:04d}-{pid % 10000:04d}"
+                    if self.rng.random() < 0.4
+                    else None
+                ),
+                "gnd_id": None,
+            }
+            self.authors_dblp[name] = author
+        return author
+
+    def dblp_record(self, volume_record: dict, paper_record: dict) -> dict:
+        """
+        make the dblp record for the given paper
+        """
+        number = volume_record["number"]
+        acronym = volume_record["acronym"].lower()
+        authors = [
+            self.dblp_author(name)
+            for name in paper_record["authors"].split(",")
+            if name
+        ]
+        key = "".join(author["label"].split()[-1][:1] for author in authors[:4])
+        return {
+            "dblp_publication_id": f"https://dblp.org/rec/conf/{acronym}/{key}{paper_record['id'].rpartition('/')[2]}",
+            "dblp_proceeding_id": f"https://dblp.org/rec/conf/{acronym}/{volume_record['year']}",
+            "volume_number": number,
+            "title": f"{paper_record['title']}.",
+            "authors": authors,
+            "pdf_id": paper_record["id"],
+        }
+
+    def index_html(self, volume_record: dict, paper_records: List[dict]) -> str:
+        """
+        make the CEUR-WS style index.html of the given volume
+        """
+        number = volume_record["number"]
+        esc = html.escape
+        editors = "\n".join(
+            f'<h3><span class="CEURVOLEDITOR">{esc(editor)}</span></h3>'
+            for editor in volume_record["editors"].split(", ")
+        )
+        items = []
+        for record in paper_records:
+            pdf_name = record["pdf_name"]
+            title = esc(record["title"] or "Preface")
+            authors = ", ".join(
+                f'<span class="CEURAUTHOR">{esc(author)}</span>'
+                for author in record["authors"].split(",")
+                if author
+            )
+            pages = (
+                f' <span class="CEURPAGES">{record["pages"]}</span>'
+                if record["pages"]
+                else ""
+            )
+            items.append(
+                f'<li id="{pdf_name[:-4]}"><a href="{pdf_name}">'
+                f'<span class="CEURTITLE">{title}</span></a>{pages}<br>\n{authors}\n</li>'
+            )
+        paper_list = "\n".join(items)
+        return f"""<!DOCTYPE html>
+<!-- CEURVERSION=2020-07-09 -->
+<html lang="en">
+<head>
+<meta http-equiv="Content-type" content="text/html;charset=utf-8">
+<link rel="stylesheet" type="text/css" href="../ceur-ws.css">
+<title>CEUR-WS.org/Vol-{number} - {esc(volume_record["title"])}</title>
+</head>
+<body>
+<table style="border: 0; border-spacing: 0; border-collapse: collapse; width: 95%">
+<tbody><tr>
+<td style="text-align: left; vertical-align: middle">
+<a href="http://ceur-ws.org/"><div id="CEURWSLOGO"></div></a>
+</td>
+<td style="text-align: right; vertical-align: middle">
+<span class="CEURVOLNR">Vol-{number}</span> <br>
+<span class="CEURURN">{volume_record["urn"]}</span>
+</td>
+</tr>
+</tbody></table>
+<hr>
+<h1><a href="{volume_record["homepage"]}"><span class="CEURVOLACRONYM">{esc(volume_record["acronym"])}</span></a>
+<span class="CEURVOLTITLE">{esc(volume_record["voltitle"])}</span></h1>
+<h3><span class="CEURFULLTITLE">{esc(volume_record["title"])}</span></h3>
+<h3><span class="CEURLOCTIME">{esc(volume_record["loctime"])}</span></h3>
+<br>
+<b> Edited by </b>
+{editors}
+<hr>
+<h2>Table of Contents</h2>
+<ul>
+{paper_list}
+</ul>
+<hr>
+<div class="CEURPUBDATE">{volume_record["published"]}</div>
+</body></html>
+"""
+
+    def stub_pdf(self, title: str) -> bytes:
+        """
+        make a minimal pdf padded to my pdf size
+        """
+        pdf = (
+            b"%PDF-1.4\n1 0 obj<</Type/Catalog/Pages 2 0 R>>endobj\n"
+            b"2 0 obj<</Type/Pages/Kids[3 0 R]/Count 1>>endobj\n"
+            b"3 0 obj<</Type/Page/Parent 2 0 R/MediaBox[0 0 595 842]>>endobj\n"
+            + f"% {title}\n".encode("ascii", "replace")
+        )
+        trailer = b"trailer<</Root 1 0 R>>\n%%EOF\n"
+        padding = max(0, self.pdf_size - len(pdf) - len(trailer))
+        return pdf + b"%" + b"x" * max(0, padding - 2) + b"\n" + trailer
+
+    def content_text(self, title: str) -> str:
+        """
+        make the plain text content of a paper
+        """
+        words = self.words.sample(self.text_words)
+        lines = [" ".join(words[i : i + 12]) for i in range(0, len(words), 12)]
+        return f"{title}\n\nAbstract\n" + "\n".join(lines) + "\n"
+
+    def write_files(self, vol_dir: str, volume_record: dict, paper_records: List[dict]):
+        """
+        write the index.html, stub pdfs and text files of a volume
+        """
+        os.makedirs(vol_dir, exist_ok=True)
+        with open(f"{vol_dir}/index.html", "w", encoding="utf-8") as index_file:
+            index_file.write(self.index_html(volume_record, paper_records))
+        for record in paper_records:
+            title = record["title"] or "Preface"
+            base = f"{vol_dir}/{record['pdf_name'][:-4]}"
+            with open(f"{base}.pdf", "wb") as pdf_file:
+                pdf_file.write(self.stub_pdf(title))
+            with open(f"{base}-content.txt", "w", encoding="utf-8") as text_file:
+                text_file.write(self.content_text(title))
+
+    def generate(self, cache_dir: str, base_path: str = None) -> Dict[str, int]:
+        """
+        generate the corpus
+
+        Args:
+            cache_dir(str): the directory to write the json lods to
+            base_path(str): the directory for the volume files - None for lods only
+
+        Returns:
+            dict: the number of records written by lod name
+        """
+        os.makedirs(cache_dir, exist_ok=True)
+        writers = {
+            lod_name: LodWriter(f"{cache_dir}/{lod_name}.json")
+            for lod_name in ["volumes", "proceedings", "papers", "papers_dblp"]
+        }
+        start_date = date(2000, 1, 1)
+        span_days = (date(2025, 12, 31) - start_date).days
+        try:
+            for index, paper_count in enumerate(self.paper_counts()):
+                number = index + 1
+                pub_date = start_date + timedelta(
+                    days=span_days * index // max(1, self.volumes)
+                )
+                volume_record = self.volume_record(number, pub_date, paper_count)
+                paper_records = self.paper_records(number, paper_count)
+                writers["volumes"].write(volume_record)
+                if self.rng.random() < self.wikidata_ratio:
+                    writers["proceedings"].write(self.proceedings_record(volume_record))
+                in_dblp = self.rng.random() < self.dblp_ratio
+                for paper_record in paper_records:
+                    writers["papers"].write(paper_record)
+                    if in_dblp and paper_record["authors"]:
+                        writers["papers_dblp"].write(
+                            self.dblp_record(volume_record, paper_record)
+                        )
+                if base_path:
+                    self.write_files(
+                        f"{base_path}/Vol-{number}", volume_record, paper_records
+                    )
+        finally:
+            for writer in writers.values():
+                writer.close()
+        with open(f"{cache_dir}/authors_dblp.json", "wb") as authors_file:
+            authors = [
+                {key: value for key, value in author.items() if key != "gnd_id"}
+                for author in self.authors_dblp.values()
+            ]
+            authors_file.write(orjson.dumps(authors))
+        counts = {lod_name: writer.count for lod_name, writer in writers.items()}
+        counts["authors_dblp"] = len(self.authors_dblp)
+        return counts
@@ -0,0 +1,311 @@
+"""
+Created on 2026-10-19
+
+@author: agent
+"""
+
+import abc
+import importlib.util
+import os
+import shutil
+import subprocess
+import time
+from typing import Callable, Dict, List, Optional, Tuple, Type
+
+from ceurspt.fork_pool import fork_map
+from ceurspt.zip_store import ZipStore
+
+
+def _extract_in_worker(
+    pipeline: "TextExtractionPipeline", jobs: List[Tuple[str, str]]
+) -> List[Tuple[str, Optional[str]]]:
+    """
+    extract the text of the given pdf files in a worker process
+    """
+    return [pipeline.extract_one(pdf_file, text_file) for pdf_file, text_file in jobs]
+
+
+class TextExtractor(abc.ABC):
+    """
+    extracts the plain text of a pdf file
+    """
+
+    name = "abstract"
+
+    def available(self) -> bool:
+        """
+        check whether the extractor can be used on this machine
+        """
+        return False
+
+    @abc.abstractmethod
+    def extract(self, pdf_file: str, text_file: str):
+        """
+        extract the text of the given pdf file
+
+        Args:
+            pdf_file(str): the path of the pdf file
+            text_file(str): the path of the text file to write
+
+        Raises:
+            Exception: if the text could not be extracted
+        """
+
+
+class PdftotextExtractor(TextExtractor):
+    """
+    extract the text with the pdftotext command of poppler-utils
+    """
+
+    name = "pdftotext"
+
+    def __init__(self, timeout: float = 120.0):
+        """
+        constructor
+
+        Args:
+            timeout(float): the maximum seconds per pdf file
+        """
+        self.timeout = timeout
+
+    def available(self) -> bool:
+        return shutil.which("pdftotext") is not None
+
+    def extract(self, pdf_file: str, text_file: str):
+        subprocess.run(
+            ["pdftotext", "-q", "-enc", "UTF-8", pdf_file, text_file],
+            check=True,
+            timeout=self.timeout,
+        )
+
+
+class PypdfExtractor(TextExtractor):
+    """
+    extract the text with the pypdf library if it is installed
+    """
+
+    name = "pypdf"
+
+    def available(self) -> bool:
+        return importlib.util.find_spec("pypdf") is not None
+
+    def extract(self, pdf_file: str, text_file: str):
+        from pypdf import PdfReader
+
+        reader = PdfReader(pdf_file)
+        pages = [page.extract_text() or "" for page in reader.pages]
+        with open(text_file, "w", encoding="utf-8") as text:
+            text.write("\n".join(pages))
+
+
+class TextExtractionPipeline:
+    """
+    extract the -content.txt files of the pdf files that have no text
+    file or one older than the pdf
+
+    batches of pdf files are extracted in forked worker processes - each
+    text file is written to a temporary file first and renamed when
+    complete so that an interrupted run leaves no truncated texts
+    """
+
+    # the extractor classes by name - register more with register
+    EXTRACTORS: Dict[str, Type[TextExtractor]] = {
+        PdftotextExtractor.name: PdftotextExtractor,
+        PypdfExtractor.name: PypdfExtractor,
+    }
+    # the number of pdf files per worker task
+    BATCH_SIZE = 8
+
+    def __init__(
+        self,
+        pdf_files: Dict[str, str],
+        extractor: str = PdftotextExtractor.name,
+        workers: int = 1,
+        progress: Optional[Callable[[dict], None]] = None,
+        progress_secs: float = 10.0,
+    ):
+        """
+        constructor
+
+        Args:
+            pdf_files(dict): the pdf file path by pdf path e.g. Vol-3262/paper2.pdf
+            extractor(str): the name of the extractor to use
+            workers(int): the number of worker processes
+            progress(Callable): called with the progress at most every progress_secs
+            progress_secs(float): the seconds between progress calls
+        """
+        if extractor not in self.EXTRACTORS:
+            raise ValueError(
+                f"unknown text extractor {extractor} - use one of {', '.join(self.EXTRACTORS)}"
+            )
+        self.pdf_files = pdf_files
+        self.extractor = self.EXTRACTORS[extractor]()
+        self.workers = max(1, workers or 1)
+        self.progress = progress
+        self.progress_secs = progress_secs
+
+    @classmethod
+    def register(cls, extractor_class: Type[TextExtractor]):
+        """
+        register the given extractor class by its name
+        """
+        cls.EXTRACTORS[extractor_class.name] = extractor_class
+
+    @classmethod
+    def unregister(cls, extractor_class: Type[TextExtractor]):
+        """
+        remove the given extractor class if it is registered
+        """
+        if cls.EXTRACTORS.get(extractor_class.name) is extractor_class:
+            del cls.EXTRACTORS[extractor_class.name]
+
+    @classmethod
+    def pdf_files_of(cls, pm) -> Dict[str, str]:
+        """
+        get the available pdf files of the papers of the given paper manager
+
+        Args:
+            pm(PaperManager): the paper manager with the loaded papers
+
+        Returns:
+            dict: the pdf file path by pdf path
+        """
+        return dict(pm.pdf_index.paths_by_pdf_path)
+
+    @classmethod
+    def text_file_of(cls, pdf_file: str) -> str:
+        """
+        get the path of the -content.txt file of the given pdf file
+        """
+        return f"{pdf_file[: -len('.pdf')]}-content.txt"
+
+    @classmethod
+    def is_up_to_date(cls, pdf_file: str, text_file: str) -> bool:
+        """
+        check whether the text file exists and is not older than the pdf file
+        """
+        try:
+            return os.stat(text_file).st_mtime_ns >= os.stat(pdf_file).st_mtime_ns
+        except OSError:
+            return False
+
+    def pending(self) -> Tuple[List[Tuple[str, str]], dict]:
+        """
+        get the pdf files to extract
+
+        Returns:
+            tuple: the pdf and text file pairs to extract and the number of
+            up to date and archived pdf files
+        """
+        jobs = []
+        counts = {"up_to_date": 0, "archived": 0}
+        for pdf_path in sorted(self.pdf_files):
+            pdf_file = self.pdf_files[pdf_path]
+            if ZipStore.is_archived(pdf_file):
+                # the text can not be written next to a pdf in a Vol-N.zip
+                counts["archived"] += 1
+                continue
+            text_file = self.text_file_of(pdf_file)
+            if self.is_up_to_date(pdf_file, text_file):
+                counts["up_to_date"] += 1
+            else:
+                jobs.append((pdf_file, text_file))
+        return jobs, counts
+
+    def extract_one(self, pdf_file: str, text_file: str) -> Tuple[str, Optional[str]]:
+        """
+        extract the text of the given pdf file replacing the text file at once
+
+        Returns:
+            tuple: the pdf file and the error or None if the text was extracted
+        """
+        tmp_file = f"{text_file}.{os.getpid()}.tmp"
+        try:
+            self.extractor.extract(pdf_file, tmp_file)
+            os.replace(tmp_file, text_file)
+            return pdf_file, None
+        except Exception as ex:
+            if os.path.isfile(tmp_file):
+                os.remove(tmp_file)
+            return pdf_file, f"{type(ex).__name__}: {ex}"
+
+    def results(self, jobs: List[Tuple[str, str]]):
+        """
+        extract the given jobs yielding the results of each batch as it completes
+        - in a process pool with more than one worker
+        """
+        batches = [
+            jobs[index : index + self.BATCH_SIZE]
+            for index in range(0, len(jobs), self.BATCH_SIZE)
+        ]
+        yield from fork_map(
+            _extract_in_worker, batches, self.workers, state=self, ordered=False
+        )
+
+    def run(self) -> dict:
+        """
+        extract the text of all pdf files without an up to date text file
+
+        Returns:
+            dict: the counts of extracted, failed, up to date and archived pdf
+            files, the throughput and the first errors
+
+        Raises:
+            RuntimeError: if there are pdf files to extract and the extractor
+            is not available
+        """
+        start = time.perf_counter()
+        jobs, counts = self.pending()
+        if jobs and not self.extractor.available():
+            raise RuntimeError(
+                f"text extractor {self.extractor.name} is not available on this machine"
+            )
+        sizes = {pdf_file: os.path.getsize(pdf_file) for pdf_file, _text in jobs}
+        report = {
+            "pdfs": len(self.pdf_files),
+            "pending": len(jobs),
+            "extracted": 0,
+            "failed": 0,
+            **counts,
+            "bytes": 0,
+            "errors": [],
+        }
+        last_progress = start
+        for batch_results in self.results(jobs):
+            for pdf_file, error in batch_results:
+                if error:
+                    report["failed"] += 1
+                    if len(report["errors"]) < 20:
+                        report["errors"].append(f"{pdf_file}: {error}")
+                else:
+                    report["extracted"] += 1
+                    report["bytes"] += sizes[pdf_file]
+            now = time.perf_counter()
+            if self.progress and now - last_progress >= self.progress_secs:
+                last_progress = now
+                self.progress(self.throughput(report, now - start))
+        report.update(self.throughput(report, time.perf_counter() - start))
+        return report
+
+    @classmethod
+    def throughput(cls, report: dict, seconds: float) -> dict:
+        """
+        get the progress and throughput of the given report
+
+        Returns:
+            dict: the number of done pdf files, the files and MB per second
+            and the estimated seconds left
+        """
+        done = report["extracted"] + report["failed"]
+        files_per_second = done / seconds if seconds > 0 else 0.0
+        left = report["pending"] - done
+        return {
+            "done": done,
+            "pending": report["pending"],
+            "seconds": round(seconds, 3),
+            "files_per_second": round(files_per_second, 2),
+            "mb_per_second": (
+                round(report["bytes"] / 1e6 / seconds, 2) if seconds > 0 else 0.0
+            ),
+            "eta_seconds": round(left / files_per_second) if files_per_second else None,
+        }
@@ -0,0 +1,207 @@
+"""
+Created on 2026-10-19
+
+@author: agent
+"""
+
+import re
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Dict, List, Optional
+
+from ceurspt.volume_table import VolumeTable
+
+
+class VolumeIndex:
+    """
+    precomputed filter buckets over the volume table for the server side
+    filtered and paginated volume index
+
+    pages are sliced with a keyset cursor: the page continues with the
+    volumes numbered below the cursor so that the newest volumes come first
+    """
+
+    MAX_LIMIT = 500
+
+    def __init__(self, table: VolumeTable, records: Dict[int, dict]):
+        """
+        constructor
+
+        Args:
+            table(VolumeTable): the volume table
+            records(dict): the volume records by number
+        """
+        self.table = table
+        self.records = records
+        # sorted volume numbers by year, acronym and event series
+        self.years: Dict[int, array] = {}
+        self.acronyms: Dict[str, array] = {}
+        self.series: Dict[str, array] = {}
+        # the bucket keys by volume number to check further filters
+        self.year_by_number: Dict[int, Optional[int]] = {}
+        self.acronym_by_number: Dict[int, Optional[str]] = {}
+        self.series_by_number: Dict[int, tuple] = {}
+        self.build()
+
+    @classmethod
+    def acronym_key(cls, acronym: Optional[str]) -> Optional[str]:
+        """
+        get the bucket key of the given acronym e.g. amt for "AMT 2015"
+        """
+        if not acronym:
+            return None
+        key = re.sub(r"[\s\-_'/]*\d{2,4}$", "", acronym.strip()).lower()
+        return key or acronym.lower()
+
+    @classmethod
+    def series_key(cls, series: Optional[str]) -> Optional[str]:
+        """
+        get the bucket key of the given event series label or wikidata id
+        """
+        if not series:
+            return None
+        series = series.strip().replace("http://www.wikidata.org/entity/", "")
+        return series.lower() or None
+
+    @classmethod
+    def year_of(cls, record: dict, volume) -> Optional[int]:
+        """
+        get the publication year of the given volume record
+        """
+        year = record.get("year")
+        if isinstance(year, int):
+            return year
+        # the year is a string in most records
+        if isinstance(year, str) and year.strip().isdigit():
+            return int(year)
+        date = record.get("published") or getattr(volume, "date", None)
+        if isinstance(date, str) and date[:4].isdigit():
+            return int(date[:4])
+        return None
+
+    def build(self):
+        """
+        build the buckets - the table is in ascending order so the buckets are sorted
+        """
+        for volume in self.table:
+            number = volume.number
+            record = self.records.get(number, {})
+            year = self.year_of(record, volume)
+            acronym = self.acronym_key(volume.acronym or record.get("acronym"))
+            series = tuple(
+                key
+                for key in (
+                    self.series_key(record.get("wd.eventSeriesLabel")),
+                    self.series_key(record.get("wd.eventSeries")),
+                )
+                if key
+            )
+            self.year_by_number[number] = year
+            self.acronym_by_number[number] = acronym
+            self.series_by_number[number] = series
+            if year is not None:
+                self.years.setdefault(year, array("q")).append(number)
+            if acronym:
+                self.acronyms.setdefault(acronym, array("q")).append(number)
+            for key in series:
+                self.series.setdefault(key, array("q")).append(number)
+
+    def year_counts(self) -> Dict[int, int]:
+        """
+        get the number of volumes by year newest first
+        """
+        return {
+            year: len(self.years[year]) for year in sorted(self.years, reverse=True)
+        }
+
+    def matches(
+        self,
+        year: Optional[int] = None,
+        lower: Optional[int] = None,
+        upper: Optional[int] = None,
+        acronym: Optional[str] = None,
+        series: Optional[str] = None,
+    ) -> List[int]:
+        """
+        get the numbers of the volumes matching the given filters in ascending order
+        """
+        acronym = self.acronym_key(acronym)
+        series = self.series_key(series)
+        empty = array("q")
+        candidates = [self.table.numbers]
+        if year is not None:
+            candidates.append(self.years.get(year, empty))
+        if acronym:
+            candidates.append(self.acronyms.get(acronym, empty))
+        if series:
+            candidates.append(self.series.get(series, empty))
+        # start from the smallest bucket and check the other filters
+        base = min(candidates, key=len)
+        start = 0 if lower is None else bisect_left(base, lower)
+        end = len(base) if upper is None else bisect_right(base, upper)
+        numbers = []
+        for number in base[start:end]:
+            if year is not None and self.year_by_number[number] != year:
+                continue
+            if acronym and self.acronym_by_number[number] != acronym:
+                continue
+            if series and series not in self.series_by_number[number]:
+                continue
+            numbers.append(number)
+        return numbers
+
+    def query(
+        self,
+        year: Optional[int] = None,
+        lower: Optional[int] = None,
+        upper: Optional[int] = None,
+        acronym: Optional[str] = None,
+        series: Optional[str] = None,
+        cursor: Optional[int] = None,
+        limit: int = 50,
+    ) -> dict:
+        """
+        get a page of the volumes matching the given filters newest first
+
+        Args:
+            year(int): the publication year
+            lower(int): the lowest volume number
+            upper(int): the highest volume number
+            acronym(str): the event acronym with or without year e.g. AMT
+            series(str): the event series label or wikidata id
+            cursor(int): continue with the volumes numbered below the cursor
+            limit(int): the maximum number of volumes of the page
+
+        Returns:
+            dict: the total number of matches, the volumes of the page and the next cursor
+        """
+        limit = max(1, min(limit, self.MAX_LIMIT))
+        numbers = self.matches(year, lower, upper, acronym, series)
+        end = len(numbers) if cursor is None else bisect_left(numbers, cursor)
+        start = max(0, end - limit)
+        page = numbers[start:end]
+        page.reverse()
+        return {
+            "total": len(numbers),
+            "volumes": [self.table.get(number) for number in page],
+            "next_cursor": page[-1] if start > 0 else None,
+        }
+
+    def as_row(self, volume) -> dict:
+        """
+        get the index row of the given volume for the json api
+        """
+        record = self.records.get(volume.number, {})
+        return {
+            "number": volume.number,
+            "title": volume.title,
+            "acronym": volume.acronym,
+            "year": self.year_by_number.get(volume.number),
+            "h1": record.get("h1"),
+            "editors": record.get("editors"),
+            "submittedBy": record.get("submittedBy"),
+            "published": record.get("published"),
+            "urn": record.get("urn"),
+            "eventSeries": record.get("wd.eventSeriesLabel") or None,
+            "url": f"/Vol-{volume.number}.html",
+        }
@@ -0,0 +1,122 @@
+"""
+Created on 2026-10-19
+
+@author: agent
+"""
+
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Iterable, Iterator, List, Optional
+
+
+class VolumeTable:
+    """
+    the volumes sorted by number in an array backed table
+
+    range slices and neighbour queries are answered by bisection
+    instead of walking all volumes
+    """
+
+    def __init__(self, volumes: Iterable = ()):
+        """
+        constructor
+
+        Args:
+            volumes(Iterable): the volumes to index - each with an int number
+        """
+        ordered = sorted(volumes, key=lambda volume: volume.number)
+        self.numbers = array("q", (volume.number for volume in ordered))
+        self.volumes: List = ordered
+
+    def __len__(self) -> int:
+        return len(self.numbers)
+
+    def __iter__(self) -> Iterator:
+        return iter(self.volumes)
+
+    def __contains__(self, number: int) -> bool:
+        index = bisect_left(self.numbers, number)
+        return index < len(self.numbers) and self.numbers[index] == number
+
+    @property
+    def first(self) -> Optional[int]:
+        """
+        the lowest volume number
+        """
+        return self.numbers[0] if self.numbers else None
+
+    @property
+    def last(self) -> Optional[int]:
+        """
+        the highest volume number
+        """
+        return self.numbers[-1] if self.numbers else None
+
+    def get(self, number: int):
+        """
+        get the volume with the given number
+
+        Returns:
+            Volume: the volume or None if there is no such volume
+        """
+        index = bisect_left(self.numbers, number)
+        if index < len(self.numbers) and self.numbers[index] == number:
+            return self.volumes[index]
+        return None
+
+    def range(
+        self,
+        lower: Optional[int] = None,
+        upper: Optional[int] = None,
+        descending: bool = False,
+    ) -> List:
+        """
+        get the volumes with lower <= number <= upper
+
+        Args:
+            lower(int): the lowest volume number - None for no limit
+            upper(int): the highest volume number - None for no limit
+            descending(bool): if True return the highest number first
+
+        Returns:
+            list: the volumes in the range
+        """
+        start = 0 if lower is None else bisect_left(self.numbers, lower)
+        end = len(self.numbers) if upper is None else bisect_right(self.numbers, upper)
+        volumes = self.volumes[start:end]
+        if descending:
+            volumes.reverse()
+        return volumes
+
+    def neighbour(self, number: int, inc: int) -> Optional[int]:
+        """
+        get the number of the existing volume inc steps away from the given number
+
+        Args:
+            number(int): the volume number - does not need to exist
+            inc(int): the number of existing volumes to step - negative for previous
+
+        Returns:
+            int: the volume number or None if there is no such volume
+        """
+        index = bisect_left(self.numbers, number)
+        exists = index < len(self.numbers) and self.numbers[index] == number
+        if inc > 0 and not exists:
+            # the volume at index is already the next one
+            index -= 1
+        index += inc
+        if 0 <= index < len(self.numbers):
+            return self.numbers[index]
+        return None
+
+    def previous(self, number: int) -> Optional[int]:
+        """
+        get the number of the existing volume before the given number
+        """
+        return self.neighbour(number, -1)
+
+    def next(self, number: int) -> Optional[int]:
+        """
+        get the number of the existing volume after the given number
+        """
+        return self.neighbour(number, +1)
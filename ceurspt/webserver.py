@@ -4,22 +4,36 @@ Created on 2023-03-17
 @author: wf
 """
 
-from typing import Optional
+import hmac
+import os
+from typing import List, Optional, Tuple
 
 import yaml
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import (
-    FileResponse,
     HTMLResponse,
     PlainTextResponse,
     RedirectResponse,
     Response,
+    StreamingResponse,
 )
 from fastapi.staticfiles import StaticFiles
 
 from ceurspt.bibtex import BibTexConverter
 from ceurspt.ceurws import Paper, PaperManager, Volume, VolumeManager
+from ceurspt.duplicates import DuplicateFinder
+from ceurspt.file_delivery import FileDelivery
+from ceurspt.fulltext import FullTextIndex
+from ceurspt.index_versions import IndexVersions
+from ceurspt.jsonld_dump import CorpusDumper
 from ceurspt.jsonldBuilder import CeurWsJsonLdBuilder
+from ceurspt.memory_report import MemoryReport
+from ceurspt.metrics import MetricsMiddleware, MetricsRegistry
+from ceurspt.profiler import TRACER, Profiler, TraceMiddleware
+from ceurspt.related import RelatedPapers
+from ceurspt.request_profiler import RequestProfilerMiddleware
+from ceurspt.xml_metadata import XmlMetadataStore
 
 
 class WebServer:
@@ -28,7 +42,16 @@ class WebServer:
     """
 
     def __init__(
-        self, vm: VolumeManager, pm: PaperManager, static_directory: str = "static"
+        self,
+        vm: VolumeManager,
+        pm: PaperManager,
+        static_directory: str = "static",
+        admin_token: Optional[str] = None,
+        profile_dir: Optional[str] = None,
+        fulltext_dir: Optional[str] = None,
+        related_dir: Optional[str] = None,
+        duplicates_report: Optional[str] = None,
+        xml_store_dir: Optional[str] = None,
     ):
         """
         constructor
@@ -37,6 +60,12 @@ class WebServer:
             vm(VolumeManager): the volume manager to use
             pm(PaperManager): the paper manager to use
             static_directory(str): the directory for static html files to use
+            admin_token(str): the token needed for administrative requests
+            profile_dir(str): if set allow profiling single requests to this directory
+            fulltext_dir(str): the directory of the full text index for /search
+            related_dir(str): the directory of the precomputed related papers
+            duplicates_report(str): the path of the near duplicate papers report
+            xml_store_dir(str): the directory of the metadata extracted from the XML files
         """
         self.app = FastAPI()
         # https://fastapi.tiangolo.com/tutorial/static-files/
@@ -45,6 +74,46 @@ class WebServer:
         )
         self.vm = vm
         self.pm = pm
+        self.admin_token = admin_token
+        self.fulltext_dir = fulltext_dir
+        self.fulltext: Optional[FullTextIndex] = None
+        self.related_dir = related_dir
+        self.related_papers: Optional[RelatedPapers] = None
+        self.duplicates_report = duplicates_report
+        # the modification time and content of the parsed duplicates report
+        self.duplicates_cache: Optional[Tuple[int, dict]] = None
+        self.xml_store = XmlMetadataStore(xml_store_dir) if xml_store_dir else None
+        self.file_delivery = FileDelivery()
+        self.metrics = MetricsRegistry()
+        self.metrics.register_managers(vm, pm)
+        self.metrics.register_cache("pdf_fd", self.file_delivery.fd_cache)
+        self.metrics.register_cache("zip_maps", self.file_delivery.zip_store)
+        self.app.add_middleware(MetricsMiddleware, metrics=self.metrics)
+        self.app.add_middleware(TraceMiddleware)
+        if profile_dir:
+            self.app.add_middleware(
+                RequestProfilerMiddleware,
+                profile_dir=profile_dir,
+                admin_token=admin_token,
+            )
+
+        @self.app.get("/metrics", include_in_schema=False)
+        async def metrics():
+            """
+            get the metrics in the Prometheus text exposition format
+            """
+            return PlainTextResponse(
+                self.metrics.render(), media_type="text/plain; version=0.0.4"
+            )
+
+        @self.app.get("/admin/memory", include_in_schema=False)
+        async def memory_report(request: Request, reload: bool = False, top: int = 10):
+            """
+            get the memory report of the loaded managers optionally
+            with the diff of loading them again into fresh managers
+            """
+            self.check_admin(request)
+            return await run_in_threadpool(self.getMemoryReport, reload, top)
 
         @self.app.get("/index.html/{upper:int}/{lower:int}")
         async def index_html(upper: Optional[int], lower: Optional[int]):
@@ -56,24 +125,183 @@ class WebServer:
             return await index_html(upper=None, lower=None)
 
         @self.app.get("/index_alt.html")
-        async def full_index_html():
-            content = self.vm.index_alt_html()
+        async def full_index_html(
+            year: Optional[str] = None,
+            lower: Optional[str] = None,
+            upper: Optional[str] = None,
+            acronym: Optional[str] = None,
+            series: Optional[str] = None,
+            cursor: Optional[str] = None,
+            limit: int = 50,
+        ):
+            """
+            the filtered index rendering the first page of the matching volumes
+            """
+            filters = self.index_filters(year, lower, upper, acronym, series, cursor)
+            content = self.vm.index_alt_html(limit=limit, **filters)
             return HTMLResponse(content)
 
+        @self.app.get("/index_alt/volumes.html")
+        async def index_alt_volumes(
+            year: Optional[str] = None,
+            lower: Optional[str] = None,
+            upper: Optional[str] = None,
+            acronym: Optional[str] = None,
+            series: Optional[str] = None,
+            cursor: Optional[str] = None,
+            limit: int = 50,
+        ):
+            """
+            a page of the filtered index as html fragment with the total in the
+            X-Total-Count and the cursor of the next page in the X-Next-Cursor header
+            """
+            filters = self.index_filters(year, lower, upper, acronym, series, cursor)
+            page = self.vm.volume_index.query(limit=limit, **filters)
+            headers = {"X-Total-Count": str(page["total"])}
+            if page["next_cursor"] is not None:
+                headers["X-Next-Cursor"] = str(page["next_cursor"])
+            content = self.vm.index_alt_fragment(page)
+            return HTMLResponse(content, headers=headers)
+
+        @self.app.get("/api/volumes", tags=["json"])
+        async def api_volumes(
+            year: Optional[str] = None,
+            lower: Optional[str] = None,
+            upper: Optional[str] = None,
+            acronym: Optional[str] = None,
+            series: Optional[str] = None,
+            cursor: Optional[str] = None,
+            limit: int = 50,
+        ):
+            """
+            a page of the volumes filtered by year, volume range, acronym and
+            event series newest first - pass next_cursor as cursor to get the next page
+            """
+            filters = self.index_filters(year, lower, upper, acronym, series, cursor)
+            page = self.vm.volume_index.query(limit=limit, **filters)
+            return {
+                "total": page["total"],
+                "next_cursor": page["next_cursor"],
+                "volumes": [
+                    self.vm.volume_index.as_row(vol) for vol in page["volumes"]
+                ],
+            }
+
+        @self.app.get("/suggest", tags=["json"])
+        async def suggest(q: str = "", limit: int = 10):
+            """
+            autocomplete volumes by title or acronym and papers by title
+            """
+            limit = max(1, min(limit, 50))
+            return {"q": q, "suggestions": self.pm.suggest_index.suggest(q, limit)}
+
+        @self.app.get("/duplicates", tags=["json"])
+        async def duplicates(cross_volume: bool = False, min_similarity: float = 0.0):
+            """
+            get the near duplicate papers found by ceur-spt --find-duplicates
+            optionally only the pairs from different volumes
+            """
+            report = self.getDuplicatesReport()
+            pairs = [
+                pair
+                for pair in report["pairs"]
+                if pair["similarity"] >= min_similarity
+                and (pair["cross_volume"] or not cross_volume)
+            ]
+            return {**report, "pairs": pairs}
+
+        @self.app.get("/search", tags=["json"])
+        async def search(q: str, limit: int = 20):
+            """
+            search the paper texts ranked by BM25
+            """
+            index = self.getFullTextIndex()
+            limit = max(1, min(limit, 100))
+            profiler = Profiler("search", profile=False)
+            # scoring the postings is cpu bound and must not block the event loop
+            result = await run_in_threadpool(index.search, q, limit=limit)
+            elapsed = profiler.time()
+            hits = []
+            for hit in result["hits"]:
+                paper = self.pm.papers_by_path.get(hit["pdf_path"])
+                hits.append(
+                    {
+                        "id": paper.id if paper else None,
+                        "title": paper.title if paper else None,
+                        "url": "/" + hit["pdf_path"].replace(".pdf", ".html"),
+                        **hit,
+                    }
+                )
+            return {
+                "q": q,
+                "total": result["total"],
+                "took_ms": round(elapsed * 1000, 3),
+                "hits": hits,
+            }
+
         @self.app.get("/Vol-{number:int}.jsonld")
         async def volumeJsonLD(number: int, include_errors: bool = False):
             volume = self.getVolume(number)
             builder = CeurWsJsonLdBuilder.from_volume(volume, include_errors)
             return builder.build()
 
+        @self.app.get("/corpus.jsonld")
+        async def corpusJsonLD(format: str = "ndjson", include_errors: bool = False):
+            """
+            stream the JSON-LD of all volumes as NDJSON or N-Quads
+
+            the volumes are built in the server process - forking a pool
+            of the whole server per request would multiply its memory
+            """
+            if format not in CorpusDumper.FORMATS:
+                raise HTTPException(
+                    status_code=400, detail=f"unknown corpus format {format}"
+                )
+            dumper = CorpusDumper(self.vm, fmt=format, include_errors=include_errors)
+            return StreamingResponse(dumper.stream(), media_type=dumper.media_type)
+
         @self.app.get("/Vol-{number:int}/{pdf_name:str}.pdf")
-        async def paperPdf(number: int, pdf_name: str):
+        async def paperPdf(number: int, pdf_name: str, request: Request):
             """
             get the PDF for the given paper
+            supporting conditional and byte range requests
             """
             paper = self.getPaper(number, pdf_name)
             pdf = paper.getPdf()
-            return FileResponse(pdf)
+            if pdf is None:
+                raise HTTPException(
+                    status_code=404,
+                    detail=f"pdf for Vol-{number}/{pdf_name}.pdf not available",
+                )
+            try:
+                return self.file_delivery.response(request.headers, pdf)
+            except OSError as ex:
+                raise HTTPException(status_code=404, detail=str(ex))
+
+        @self.app.get("/Vol-{number:int}/{pdf_name}.references.json", tags=["json"])
+        async def paperReferences(number: int, pdf_name: str):
+            """
+            get the references extracted from the GROBID or CERMINE XML of the given paper
+            """
+            return self.getXmlMetadata(number, pdf_name, ["references"])
+
+        @self.app.get("/Vol-{number:int}/{pdf_name}.abstract.json", tags=["json"])
+        async def paperAbstract(number: int, pdf_name: str):
+            """
+            get the title, abstract and keywords extracted from the GROBID
+            or CERMINE XML of the given paper
+            """
+            return self.getXmlMetadata(
+                number, pdf_name, ["title", "abstract", "keywords"]
+            )
+
+        @self.app.get("/Vol-{number:int}/{pdf_name}.affiliations.json", tags=["json"])
+        async def paperAffiliations(number: int, pdf_name: str):
+            """
+            get the authors with their affiliations extracted from the GROBID
+            or CERMINE XML of the given paper
+            """
+            return self.getXmlMetadata(number, pdf_name, ["authors"])
 
         @self.app.get("/Vol-{number:int}/{pdf_name}.json")
         async def paperJson(number: int, pdf_name: str):
@@ -102,6 +330,27 @@ class WebServer:
             paper_cli_text = paper.as_wbi_cli_text(qid)
             return PlainTextResponse(paper_cli_text)
 
+        @self.app.get("/Vol-{number:int}/{pdf_name}/related", tags=["json"])
+        async def paperRelated(number: int, pdf_name: str, k: int = 10):
+            """
+            get the precomputed most similar papers of the given paper
+            """
+            paper = self.getPaper(number, pdf_name)
+            related_papers = self.getRelatedPapers()
+            related = []
+            for pdf_path, score in related_papers.related(paper.pdf_path, k):
+                other = self.pm.papers_by_path.get(pdf_path)
+                related.append(
+                    {
+                        "id": other.id if other else None,
+                        "title": other.title if other else None,
+                        "url": "/" + pdf_path.replace(".pdf", ".html"),
+                        "pdf_path": pdf_path,
+                        "score": score,
+                    }
+                )
+            return {"pdf_path": paper.pdf_path, "related": related}
+
         @self.app.get("/Vol-{number:int}/{pdf_name}.html")
         async def paperHtml(number: int, pdf_name: str):
             """
@@ -112,13 +361,14 @@ class WebServer:
             return HTMLResponse(content=content)
 
         @self.app.get("/Vol-{number:int}/{pdf_name}.txt")
-        async def paperText(number: int, pdf_name: str):
+        async def paperText(number: int, pdf_name: str, request: Request):
             """
             get the text for the given paper
             """
             paper = self.getPaper(number, pdf_name)
-            text = paper.getText()
-            return PlainTextResponse(text)
+            return self.getContentResponse(
+                request, paper, "-content.txt", "text/plain; charset=utf-8"
+            )
 
         @self.app.get("/Vol-{number:int}/{pdf_name}.smw")
         async def paperSMW(number: int, pdf_name: str):
@@ -126,9 +376,10 @@ class WebServer:
             Get semantic media wiki markup of the given paper"""
             paper = self.getPaper(number, pdf_name)
             if paper:
-                markup = paper.as_smw_markup()
-            else:
-                markup = f"""{{{{Paper
+                return StreamingResponse(
+                    paper.iter_smw_markup(), media_type="text/plain; charset=utf-8"
+                )
+            markup = f"""{{{{Paper
 |id=Vol-{number}/{pdf_name}
 |volume=Vol-{number}
 }}}}"""
@@ -144,22 +395,24 @@ class WebServer:
             return PlainTextResponse(qs)
 
         @self.app.get("/Vol-{number:int}/{pdf_name}.grobid")
-        async def paperGrobidXml(number: int, pdf_name: str):
+        async def paperGrobidXml(number: int, pdf_name: str, request: Request):
             """
             get the grobid XML for the given paper
             """
             paper = self.getPaper(number, pdf_name)
-            xml = paper.getContentByPostfix(".tei.xml")
-            return Response(content=xml, media_type="application/xml")
+            return self.getContentResponse(
+                request, paper, ".tei.xml", "application/xml"
+            )
 
         @self.app.get("/Vol-{number:int}/{pdf_name}.cermine")
-        async def paperCermineXml(number: int, pdf_name: str):
+        async def paperCermineXml(number: int, pdf_name: str, request: Request):
             """
             get the grobid XML for the given paper
             """
             paper = self.getPaper(number, pdf_name)
-            xml = paper.getContentByPostfix(".cermine.xml")
-            return Response(content=xml, media_type="application/xml")
+            return self.getContentResponse(
+                request, paper, ".cermine.xml", "application/xml"
+            )
 
         @self.app.get("/Vol-{number:int}.smw")
         async def volumeSMW(number: int):
@@ -312,6 +565,218 @@ class WebServer:
             yaml_content = yaml.dump(paper_dict)
             return Response(content=yaml_content, media_type="application/x-yaml")
 
+    def index_filters(
+        self,
+        year: Optional[str],
+        lower: Optional[str],
+        upper: Optional[str],
+        acronym: Optional[str],
+        series: Optional[str],
+        cursor: Optional[str],
+    ) -> dict:
+        """
+        get the volume index filters from the given query parameters
+
+        empty parameters as sent by the filter form are ignored
+
+        Raises:
+            HTTPException: 400 if a numeric parameter is not a number
+        """
+        filters = {"acronym": acronym or None, "series": series or None}
+        for name, value in [
+            ("year", year),
+            ("lower", lower),
+            ("upper", upper),
+            ("cursor", cursor),
+        ]:
+            if value is None or value.strip() == "":
+                filters[name] = None
+            elif value.strip().isdigit():
+                filters[name] = int(value)
+            else:
+                raise HTTPException(
+                    status_code=400, detail=f"{name} must be a number not {value!r}"
+                )
+        return filters
+
+    def getFullTextIndex(self) -> FullTextIndex:
+        """
+        get the full text index - opened on first use and reopened when a
+        new version has been published so that a rebuilt index is picked up
+
+        Raises:
+            HTTPException: 503 if there is no full text index
+        """
+        version_dir = None
+        if self.fulltext_dir:
+            version_dir = IndexVersions(self.fulltext_dir).current_dir()
+        if version_dir is None:
+            raise HTTPException(status_code=503, detail="full text index not available")
+        if self.fulltext is None or self.fulltext.version_dir != version_dir:
+            # the old index is not closed - searches in flight may still use
+            # it and its memory maps are released once it is collected
+            self.fulltext = FullTextIndex(self.fulltext_dir)
+        return self.fulltext
+
+    def getRelatedPapers(self) -> RelatedPapers:
+        """
+        get the precomputed related papers - opened on first use and
+        reopened when a new version has been published
+
+        Raises:
+            HTTPException: 503 if the related papers have not been computed
+        """
+        version_dir = None
+        if self.related_dir:
+            version_dir = IndexVersions(self.related_dir).current_dir()
+        if version_dir is None:
+            raise HTTPException(status_code=503, detail="related papers not available")
+        if (
+            self.related_papers is None
+            or self.related_papers.version_dir != version_dir
+        ):
+            # the old related papers are not closed - see getFullTextIndex
+            self.related_papers = RelatedPapers(self.related_dir)
+        return self.related_papers
+
+    def getContentResponse(
+        self, request: Request, paper: Paper, postfix: str, media_type: str
+    ) -> Response:
+        """
+        get the response streaming the content file of the given paper
+        from the descriptor cache or its volume archive
+
+        Args:
+            request(Request): the request with the conditional and range headers
+            paper(Paper): the paper
+            postfix(str): the postfix of the content file e.g. .tei.xml
+            media_type(str): the media type of the content
+
+        Returns:
+            Response: the streamed content or an empty response if there
+            is no such content
+        """
+        content_path = paper.getContentPathByPostfix(postfix)
+        if content_path is None:
+            return Response(media_type=media_type)
+        try:
+            return self.file_delivery.response(
+                request.headers, content_path, media_type=media_type
+            )
+        except OSError as ex:
+            raise HTTPException(status_code=404, detail=str(ex))
+
+    def getDuplicatesReport(self) -> dict:
+        """
+        get the near duplicate papers report - parsed once and parsed again
+        when the report file has been replaced
+
+        Raises:
+            HTTPException: 503 if there is no duplicates report
+        """
+        report = None
+        if self.duplicates_report:
+            try:
+                mtime_ns = os.stat(self.duplicates_report).st_mtime_ns
+                cached = self.duplicates_cache
+                if cached is not None and cached[0] == mtime_ns:
+                    return cached[1]
+                report = DuplicateFinder.read_report(self.duplicates_report)
+            except OSError:
+                report = None
+        if report is None:
+            raise HTTPException(
+                status_code=503, detail="duplicates report not available"
+            )
+        self.duplicates_cache = (mtime_ns, report)
+        return report
+
+    def getXmlMetadata(self, number: int, pdf_name: str, fields: List[str]) -> dict:
+        """
+        get the given fields of the metadata extracted from the XML files of a paper
+
+        Args:
+            number(int): the volume number
+            pdf_name(str): the pdf name of the paper
+            fields(list): the names of the fields
+
+        Returns:
+            dict: the pdf path, the fields and their sources
+
+        Raises:
+            HTTPException: 503 if the store was not built, 404 if nothing was
+            extracted for the paper
+        """
+        if self.xml_store is None or not self.xml_store.available():
+            raise HTTPException(status_code=503, detail="xml metadata not available")
+        record = self.xml_store.paper(number, pdf_name)
+        if record is None:
+            raise HTTPException(
+                status_code=404,
+                detail=f"no xml metadata for Vol-{number}/{pdf_name}.pdf",
+            )
+        result = {"pdf_path": f"Vol-{number}/{pdf_name}.pdf"}
+        sources = record.get("sources", {})
+        for field in fields:
+            result[field] = record.get(field)
+        result["sources"] = {
+            field: sources[field] for field in fields if field in sources
+        }
+        return result
+
+    def check_admin(self, request: Request):
+        """
+        check that the given request carries the admin token
+
+        Raises:
+            HTTPException: 403 if no admin token is configured or the token does not match
+        """
+        token = request.headers.get("x-admin-token") or request.query_params.get(
+            "admin_token"
+        )
+        if (
+            not self.admin_token
+            or not token
+            or not hmac.compare_digest(token.encode(), self.admin_token.encode())
+        ):
+            raise HTTPException(status_code=403, detail="admin token needed")
+
+    def load_managers(self) -> Tuple[VolumeManager, PaperManager]:
+        """
+        load the volumes and papers into new managers configured like mine
+        without touching the live managers
+
+        Returns:
+            tuple: the loaded volume and paper manager
+        """
+        vm = VolumeManager(
+            base_path=self.vm.base_path,
+            base_url=self.vm.base_url,
+            cache_dir=self.vm.cache_dir,
+        )
+        pm = PaperManager(base_url=self.pm.base_url, cache_dir=self.pm.cache_dir)
+        vm.getVolumes()
+        pm.getPapers(vm)
+        return vm, pm
+
+    def getMemoryReport(self, reload: bool = False, top: int = 10) -> dict:
+        """
+        get the memory report of the loaded managers - walking the object
+        graphs takes seconds so this is called off the event loop
+
+        Args:
+            reload(bool): if True add the diff of loading fresh managers
+            top(int): the number of growing types to show in the diff
+
+        Returns:
+            dict: the memory report
+        """
+        diff = None
+        if reload:
+            diff = MemoryReport.reload_diff(self.load_managers, top=top)
+        report = MemoryReport(self.vm, self.pm, caches=self.metrics.caches)
+        return report.as_dict(diff)
+
     def volumeHtml(self, number: int, ext: str = ".pdf") -> HTMLResponse:
         """
         get html Response for the given volume by number
@@ -327,6 +792,7 @@ class WebServer:
             content = vol.get_empty_volume_page()
             return HTMLResponse(content=content, status_code=200)
 
+    @TRACER.traced("lookup volume")
     def getVolume(self, number: int) -> Volume:
         """
         get the volume for the given number
@@ -340,6 +806,7 @@ class WebServer:
         vol = self.vm.getVolume(number)
         return vol
 
+    @TRACER.traced("lookup paper")
     def getPaper(
         self, number: int, pdf_name: str, exceptionOnFail: bool = True
     ) -> Paper:
@@ -0,0 +1,585 @@
+"""
+Created on 2026-10-19
+
+@author: agent
+"""
+
+import gzip
+import os
+import re
+import threading
+import time
+import xml.etree.ElementTree as ET
+import zlib
+from collections import OrderedDict
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+import orjson
+
+from ceurspt.fork_pool import fork_map
+from ceurspt.zip_store import ZIP_STORE
+
+SPACE_RE = re.compile(r"\s+")
+
+
+def _build_in_worker(
+    builder: "XmlMetadataBuilder", volumes: List[Tuple[int, Dict[str, dict]]]
+) -> List[dict]:
+    """
+    extract the metadata of the given volumes in a worker process
+    """
+    return [builder.build_volume(number, papers) for number, papers in volumes]
+
+
+def local_name(tag: str) -> str:
+    """
+    get the tag name without namespace
+    """
+    return tag.rpartition("}")[2]
+
+
+def text_of(element: Optional[ET.Element]) -> Optional[str]:
+    """
+    get the whitespace normalized text of the given element and its children
+    """
+    if element is None:
+        return None
+    text = SPACE_RE.sub(" ", "".join(element.itertext())).strip()
+    return text or None
+
+
+def find(element: ET.Element, path: str) -> Optional[ET.Element]:
+    """
+    find the first descendant with the given slash separated local names
+    """
+    names = path.split("/")
+    candidates = [element]
+    for name in names:
+        candidates = [
+            child
+            for candidate in candidates
+            for child in candidate.iter()
+            if child is not candidate and local_name(child.tag) == name
+        ]
+        if not candidates:
+            return None
+    return candidates[0]
+
+
+def find_all(element: ET.Element, name: str) -> List[ET.Element]:
+    """
+    find all descendants with the given local name
+    """
+    return [child for child in element.iter() if local_name(child.tag) == name]
+
+
+def iter_ends(source, keep: Set[str]) -> Iterator[Tuple[ET.Element, str, List[str]]]:
+    """
+    parse the given xml incrementally yielding each element when it ends
+    with its local name and the local names of its open ancestors
+
+    a handled element is detached from its parent unless it is inside an
+    element whose subtree is handled as a whole - only the open elements
+    and the subtrees being collected are kept in memory
+
+    Args:
+        source: the path of the unpacked or archived xml file or an
+            iterable of byte chunks
+        keep(set): the local names of the elements whose subtrees are
+            handled as a whole
+
+    Raises:
+        OSError: if the file can not be read
+        ET.ParseError: if the xml is not well formed
+    """
+    chunks = ZIP_STORE.iter_bytes(source) if isinstance(source, str) else source
+    parser = ET.XMLPullParser(events=("start", "end"))
+    names: List[str] = []
+    elements: List[ET.Element] = []
+    # the number of open elements whose subtrees are kept
+    kept = 0
+
+    def events():
+        for chunk in chunks:
+            parser.feed(chunk)
+            yield from parser.read_events()
+        parser.close()
+        yield from parser.read_events()
+
+    for event, element in events():
+        if event == "start":
+            name = local_name(element.tag)
+            names.append(name)
+            elements.append(element)
+            if name in keep:
+                kept += 1
+            continue
+        name = names.pop()
+        elements.pop()
+        if name in keep:
+            kept -= 1
+        yield element, name, names
+        if not kept and elements:
+            elements[-1].remove(element)
+
+
+class GrobidParser:
+    """
+    streaming parser for the TEI XML of GROBID
+    """
+
+    source = "grobid"
+    # the elements handled as a whole
+    KEEP = {"title", "abstract", "term", "author", "biblStruct"}
+
+    def parse(self, source) -> dict:
+        """
+        parse the given TEI file
+
+        Args:
+            source: the path of the .tei.xml file or an iterable of byte chunks
+
+        Returns:
+            dict: the title, abstract, keywords, authors and references
+        """
+        fields = {"keywords": [], "authors": [], "references": []}
+        for element, name, stack in iter_ends(source, self.KEEP):
+            if "teiHeader" in stack:
+                if name == "title" and stack[-1] == "titleStmt":
+                    fields.setdefault("title", text_of(element))
+                elif name == "abstract":
+                    fields["abstract"] = text_of(element)
+                elif name == "term" and "keywords" in stack:
+                    fields["keywords"].append(text_of(element))
+                elif name == "author" and stack[-1] == "analytic":
+                    fields["authors"].append(self.author(element))
+            elif name == "biblStruct" and stack and stack[-1] == "listBibl":
+                fields["references"].append(self.reference(element))
+        fields["keywords"] = [keyword for keyword in fields["keywords"] if keyword]
+        return fields
+
+    def name_of(self, element: ET.Element) -> Optional[str]:
+        """
+        get the name of the given persName
+        """
+        pers_name = find(element, "persName")
+        if pers_name is None:
+            return None
+        parts = [text_of(part) for part in find_all(pers_name, "forename")]
+        parts.append(text_of(find(pers_name, "surname")))
+        name = " ".join(part for part in parts if part)
+        return name or None
+
+    def author(self, element: ET.Element) -> dict:
+        """
+        get the name and affiliations of the given author
+        """
+        affiliations = []
+        for affiliation in find_all(element, "affiliation"):
+            parts = [text_of(org) for org in find_all(affiliation, "orgName")]
+            parts.append(text_of(find(affiliation, "country")))
+            text = ", ".join(part for part in parts if part)
+            if text:
+                affiliations.append(text)
+        return {"name": self.name_of(element), "affiliations": affiliations}
+
+    def reference(self, element: ET.Element) -> dict:
+        """
+        get the title, authors, year, venue and doi of the given biblStruct
+        """
+        reference = {
+            "title": None,
+            "authors": [],
+            "year": None,
+            "venue": None,
+            "doi": None,
+        }
+        for title in find_all(element, "title"):
+            level = title.get("level")
+            if level == "a" and reference["title"] is None:
+                reference["title"] = text_of(title)
+            elif level in ("j", "m", "s") and reference["venue"] is None:
+                reference["venue"] = text_of(title)
+        if reference["title"] is None:
+            reference["title"], reference["venue"] = reference["venue"], None
+        for author in find_all(element, "author"):
+            name = self.name_of(author)
+            if name:
+                reference["authors"].append(name)
+        date = find(element, "date")
+        if date is not None:
+            when = date.get("when") or text_of(date) or ""
+            reference["year"] = when[:4] or None
+        for idno in find_all(element, "idno"):
+            if (idno.get("type") or "").upper() == "DOI":
+                reference["doi"] = text_of(idno)
+        return {key: value for key, value in reference.items() if value}
+
+
+class CermineParser:
+    """
+    streaming parser for the NLM JATS XML of CERMINE
+    """
+
+    source = "cermine"
+    # the elements handled as a whole
+    KEEP = {"article-title", "abstract", "kwd", "contrib", "aff", "ref"}
+
+    def parse(self, source) -> dict:
+        """
+        parse the given CERMINE file
+
+        Args:
+            source: the path of the .cermine.xml file or an iterable of byte chunks
+
+        Returns:
+            dict: the title, abstract, keywords, authors and references
+        """
+        fields = {"keywords": [], "authors": [], "references": []}
+        affiliations: Dict[str, str] = {}
+        for element, name, stack in iter_ends(source, self.KEEP):
+            if "article-meta" in stack:
+                if name == "article-title" and stack[-1] == "title-group":
+                    fields.setdefault("title", text_of(element))
+                elif name == "abstract":
+                    fields["abstract"] = text_of(element)
+                elif name == "kwd":
+                    fields["keywords"].append(text_of(element))
+                elif name == "contrib" and element.get("contrib-type") == "author":
+                    fields["authors"].append(self.author(element))
+                elif name == "aff":
+                    affiliations[element.get("id")] = self.affiliation(element)
+            elif name == "ref" and stack and stack[-1] == "ref-list":
+                fields["references"].append(self.reference(element))
+        for author in fields["authors"]:
+            author["affiliations"] = [
+                affiliations[rid]
+                for rid in author["affiliations"]
+                if affiliations.get(rid)
+            ]
+        fields["keywords"] = [keyword for keyword in fields["keywords"] if keyword]
+        return fields
+
+    def name_of(self, element: ET.Element) -> Optional[str]:
+        """
+        get the name of the given string-name or name
+        """
+        parts = [
+            text_of(find(element, "given-names")),
+            text_of(find(element, "surname")),
+        ]
+        name = " ".join(part for part in parts if part)
+        return name or text_of(element)
+
+    def author(self, element: ET.Element) -> dict:
+        """
+        get the name and the affiliation ids of the given contrib
+        """
+        name_element = find(element, "string-name")
+        if name_element is None:
+            name_element = find(element, "name")
+        rids = [
+            xref.get("rid")
+            for xref in find_all(element, "xref")
+            if xref.get("ref-type") == "aff"
+        ]
+        name = self.name_of(name_element) if name_element is not None else None
+        return {"name": name, "affiliations": rids}
+
+    def affiliation(self, element: ET.Element) -> Optional[str]:
+        """
+        get the text of the given aff without its label
+        """
+        parts = [
+            text_of(child)
+            for child in element
+            if local_name(child.tag) in ("institution", "addr-line", "country")
+        ]
+        text = ", ".join(part for part in parts if part)
+        if not text:
+            label = text_of(find(element, "label")) or ""
+            text = (text_of(element) or "")[len(label) :].strip()
+        return text or None
+
+    def reference(self, element: ET.Element) -> dict:
+        """
+        get the title, authors, year, venue and doi of the given ref
+        """
+        authors = [
+            self.name_of(name)
+            for name in find_all(element, "string-name") + find_all(element, "name")
+        ]
+        doi = None
+        for pub_id in find_all(element, "pub-id"):
+            if pub_id.get("pub-id-type") == "doi":
+                doi = text_of(pub_id)
+        reference = {
+            "title": text_of(find(element, "article-title")),
+            "authors": [author for author in authors if author],
+            "year": text_of(find(element, "year")),
+            "venue": text_of(find(element, "source")),
+            "doi": doi,
+        }
+        if not reference["title"]:
+            reference["title"] = text_of(find(element, "mixed-citation"))
+        return {key: value for key, value in reference.items() if value}
+
+
+class XmlMetadataStore:
+    """
+    the metadata extracted from the GROBID and CERMINE XML files
+
+    the store directory holds one gzipped json file Vol-N.json.gz per
+    volume with the record of each paper by pdf name and the modification
+    times of the XML files it was extracted from - decoded volumes are
+    kept in a small least recently used cache
+    """
+
+    FIELDS = ["title", "abstract", "keywords", "authors", "references"]
+
+    def __init__(self, store_dir: str, max_volumes: int = 64):
+        """
+        constructor
+
+        Args:
+            store_dir(str): the directory of the volume files
+            max_volumes(int): the maximum number of decoded volumes to keep
+        """
+        self.store_dir = store_dir
+        self.max_volumes = max_volumes
+        self.volumes: "OrderedDict[int, Tuple[int, dict]]" = OrderedDict()
+        self.lock = threading.Lock()
+
+    def volume_file(self, number: int) -> str:
+        """
+        get the path of the file of the given volume
+        """
+        return f"{self.store_dir}/Vol-{number}.json.gz"
+
+    def available(self) -> bool:
+        """
+        check whether the store has been built
+        """
+        return os.path.isdir(self.store_dir)
+
+    @classmethod
+    def read_volume_file(cls, volume_file: str) -> Optional[dict]:
+        """
+        read the given volume file - a truncated or corrupt file is treated
+        as missing so that it is served as not extracted and extracted again
+
+        Returns:
+            dict: the sources and papers of the volume or None if there is no
+            readable file
+        """
+        try:
+            with gzip.open(volume_file, "rb") as gz_file:
+                return orjson.loads(gz_file.read())
+        except (OSError, EOFError, zlib.error, orjson.JSONDecodeError):
+            return None
+
+    def volume(self, number: int) -> Optional[dict]:
+        """
+        get the records of the papers of the given volume by pdf name
+        """
+        volume_file = self.volume_file(number)
+        try:
+            mtime_ns = os.stat(volume_file).st_mtime_ns
+        except OSError:
+            return None
+        with self.lock:
+            cached = self.volumes.get(number)
+            if cached is not None and cached[0] == mtime_ns:
+                self.volumes.move_to_end(number)
+                return cached[1]
+        data = self.read_volume_file(volume_file)
+        papers = data["papers"] if data else {}
+        with self.lock:
+            self.volumes[number] = (mtime_ns, papers)
+            while len(self.volumes) > self.max_volumes:
+                self.volumes.popitem(last=False)
+        return papers
+
+    def paper(self, number: int, pdf_name: str) -> Optional[dict]:
+        """
+        get the extracted metadata of the given paper
+
+        Args:
+            number(int): the volume number
+            pdf_name(str): the name of the pdf without extension e.g. paper2
+
+        Returns:
+            dict: the record or None if nothing was extracted for the paper
+        """
+        papers = self.volume(number)
+        if not papers:
+            return None
+        return papers.get(pdf_name)
+
+
+class XmlMetadataBuilder:
+    """
+    extract the metadata of the GROBID .tei.xml and CERMINE .cermine.xml
+    files of all papers into an XmlMetadataStore
+
+    volumes whose XML files did not change since the last build are
+    skipped - the other volumes are parsed in forked worker processes
+    that write their volume files themselves
+    """
+
+    # the xml postfixes and parsers by source - earlier sources win per field
+    PARSERS = {".tei.xml": GrobidParser, ".cermine.xml": CermineParser}
+    # the number of volumes per worker task
+    BATCH_SIZE = 16
+
+    def __init__(
+        self, xml_files: Dict[int, Dict[str, dict]], store_dir: str, workers: int = 1
+    ):
+        """
+        constructor
+
+        Args:
+            xml_files(dict): the xml file path by postfix by pdf name by volume number
+            store_dir(str): the directory of the store
+            workers(int): the number of worker processes
+        """
+        self.xml_files = xml_files
+        self.store_dir = store_dir
+        self.workers = max(1, workers or 1)
+        self.parsers = {postfix: parser() for postfix, parser in self.PARSERS.items()}
+
+    @classmethod
+    def xml_files_of(cls, pm) -> Dict[int, Dict[str, dict]]:
+        """
+        get the available xml files of the papers of the given paper manager
+
+        Args:
+            pm(PaperManager): the paper manager with the loaded papers
+
+        Returns:
+            dict: the xml file path by postfix by pdf name by volume number
+        """
+        xml_files: Dict[int, Dict[str, dict]] = {}
+        for pdf_path, paper in pm.papers_by_path.items():
+            vol_dir, _sep, pdf_file = pdf_path.rpartition("/")
+            if not vol_dir.startswith("Vol-") or not pdf_file.endswith(".pdf"):
+                continue
+            files = {}
+            for postfix in cls.PARSERS:
+                xml_path = paper.getContentPathByPostfix(postfix)
+                if xml_path:
+                    files[postfix] = xml_path
+            if files:
+                number = int(vol_dir[len("Vol-") :])
+                xml_files.setdefault(number, {})[pdf_file[: -len(".pdf")]] = files
+        return xml_files
+
+    def sources_of(self, papers: Dict[str, dict]) -> Dict[str, dict]:
+        """
+        get the modification times of the xml files of the given papers
+        """
+        sources = {}
+        for pdf_name, files in sorted(papers.items()):
+            sources[pdf_name] = {
+                postfix: ZIP_STORE.stat(xml_path)[0]
+                for postfix, xml_path in files.items()
+            }
+        return sources
+
+    def record_of(self, files: Dict[str, str]) -> Tuple[dict, List[str]]:
+        """
+        extract the record of a paper from its xml files
+
+        Returns:
+            tuple: the record with the source of each field and the errors
+        """
+        record = {"sources": {}}
+        errors = []
+        for postfix, parser in self.parsers.items():
+            xml_path = files.get(postfix)
+            if not xml_path:
+                continue
+            try:
+                fields = parser.parse(xml_path)
+            except (OSError, ET.ParseError) as ex:
+                errors.append(f"{xml_path}: {ex}")
+                continue
+            for field in XmlMetadataStore.FIELDS:
+                if field not in record and fields.get(field):
+                    record[field] = fields[field]
+                    record["sources"][field] = parser.source
+        return record, errors
+
+    def build_volume(self, number: int, papers: Dict[str, dict]) -> dict:
+        """
+        extract and write the records of the given volume if its xml files changed
+
+        Returns:
+            dict: the volume number, the number of papers, whether the volume
+            was extracted and the errors
+        """
+        volume_file = f"{self.store_dir}/Vol-{number}.json.gz"
+        sources = self.sources_of(papers)
+        old = XmlMetadataStore.read_volume_file(volume_file)
+        result = {
+            "volume": number,
+            "papers": len(papers),
+            "extracted": False,
+            "errors": [],
+        }
+        if old is not None and old.get("sources") == sources:
+            return result
+        records = {}
+        for pdf_name, files in sorted(papers.items()):
+            record, errors = self.record_of(files)
+            result["errors"].extend(errors)
+            if len(record) > 1:
+                records[pdf_name] = record
+        data = orjson.dumps({"sources": sources, "papers": records})
+        tmp_file = f"{volume_file}.tmp"
+        with gzip.open(tmp_file, "wb") as gz_file:
+            gz_file.write(data)
+        os.replace(tmp_file, volume_file)
+        result["extracted"] = True
+        return result
+
+    def build(self) -> dict:
+        """
+        build or update the store
+
+        Returns:
+            dict: the number of volumes, extracted volumes, papers, removed
+            volumes, the seconds taken and the first errors
+        """
+        start = time.perf_counter()
+        os.makedirs(self.store_dir, exist_ok=True)
+        volumes = sorted(self.xml_files.items())
+        batches = [
+            volumes[index : index + self.BATCH_SIZE]
+            for index in range(0, len(volumes), self.BATCH_SIZE)
+        ]
+        results = [
+            result
+            for batch_results in fork_map(
+                _build_in_worker, batches, self.workers, state=self
+            )
+            for result in batch_results
+        ]
+        # volumes without xml files any more
+        removed = 0
+        for file_name in os.listdir(self.store_dir):
+            if file_name.startswith("Vol-") and file_name.endswith(".json.gz"):
+                number = file_name[len("Vol-") : -len(".json.gz")]
+                if number.isdigit() and int(number) not in self.xml_files:
+                    os.remove(f"{self.store_dir}/{file_name}")
+                    removed += 1
+        errors = [error for result in results for error in result["errors"]]
+        return {
+            "volumes": len(results),
+            "extracted": sum(1 for result in results if result["extracted"]),
+            "papers": sum(result["papers"] for result in results),
+            "removed": removed,
+            "errors": errors[:20],
+            "failed": len(errors),
+            "seconds": time.perf_counter() - start,
+        }
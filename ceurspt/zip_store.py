@@ -0,0 +1,447 @@
+"""
+Created on 2026-10-19
+
+@author: agent
+"""
+
+import codecs
+import mmap
+import os
+import struct
+import threading
+import time
+import zipfile
+import zlib
+from collections import OrderedDict
+from typing import Dict, Iterator, Optional, Tuple, Union
+
+# the local file header up to the lengths of the name and the extra field
+LOCAL_HEADER = struct.Struct("<4s2B4HL2L2H")
+
+
+class ZipMember:
+    """
+    the central directory entry of a file in a zip archive
+    """
+
+    __slots__ = (
+        "name",
+        "header_offset",
+        "size",
+        "compressed_size",
+        "method",
+        "crc",
+        "data_offset",
+    )
+
+    def __init__(self, info: zipfile.ZipInfo):
+        """
+        constructor
+
+        Args:
+            info(ZipInfo): the central directory entry
+        """
+        self.name = info.filename
+        self.header_offset = info.header_offset
+        self.size = info.file_size
+        self.compressed_size = info.compress_size
+        self.method = info.compress_type
+        self.crc = info.CRC
+        # read from the local header on first access
+        self.data_offset: Optional[int] = None
+
+
+class ZipArchive:
+    """
+    a zip archive with its central directory indexed by member name
+
+    the archive is memory mapped on first read so that stored members are
+    read without copying - the map is dropped again by the store when
+    too many archives are mapped
+    """
+
+    def __init__(self, path: str):
+        """
+        constructor
+
+        Args:
+            path(str): the path of the zip file
+
+        Raises:
+            OSError: if the file can not be read
+            zipfile.BadZipFile: if the file is not a zip archive
+        """
+        self.path = path
+        stat = os.stat(path)
+        self.mtime_ns = stat.st_mtime_ns
+        self.file_size = stat.st_size
+        self.mtime = stat.st_mtime
+        with zipfile.ZipFile(path) as zip_file:
+            self.members: Dict[str, ZipMember] = {
+                info.filename: ZipMember(info)
+                for info in zip_file.infolist()
+                if not info.is_dir()
+            }
+        self.map: Optional[mmap.mmap] = None
+        self.checked = time.monotonic()
+
+    def __len__(self) -> int:
+        return len(self.members)
+
+    def open_map(self) -> Union[mmap.mmap, bytes]:
+        """
+        get the memory map of the archive - mapping it if needed
+        """
+        if self.map is None:
+            with open(self.path, "rb") as zip_file:
+                if os.fstat(zip_file.fileno()).st_size == 0:
+                    # empty files can not be mapped
+                    return b""
+                self.map = mmap.mmap(zip_file.fileno(), 0, access=mmap.ACCESS_READ)
+        return self.map
+
+    def data_offset(self, member: ZipMember) -> int:
+        """
+        get the offset of the data of the given member behind its local header
+        """
+        if member.data_offset is None:
+            header = LOCAL_HEADER.unpack_from(self.open_map(), member.header_offset)
+            if header[0] != b"PK\x03\x04":
+                raise zipfile.BadZipFile(
+                    f"bad local header of {member.name} in {self.path}"
+                )
+            name_length, extra_length = header[-2:]
+            member.data_offset = (
+                member.header_offset + LOCAL_HEADER.size + name_length + extra_length
+            )
+        return member.data_offset
+
+    def read(self, member: ZipMember) -> Union[memoryview, bytes]:
+        """
+        read the content of the given member
+
+        Returns:
+            memoryview: a view of the map for stored members - otherwise
+            the decompressed bytes
+        """
+        data_map = self.open_map()
+        start = self.data_offset(member)
+        if member.method == zipfile.ZIP_STORED:
+            return memoryview(data_map)[start : start + member.size]
+        if member.method == zipfile.ZIP_DEFLATED:
+            compressed = memoryview(data_map)[start : start + member.compressed_size]
+            return zlib.decompressobj(-zlib.MAX_WBITS).decompress(compressed)
+        with zipfile.ZipFile(self.path) as zip_file:
+            return zip_file.read(member.name)
+
+    def iter_chunks(
+        self, member: ZipMember, chunk_size: int
+    ) -> Iterator[Union[memoryview, bytes]]:
+        """
+        read the content of the given member in chunks of at most chunk_size
+        bytes - deflated members are decompressed incrementally
+        """
+        if member.method not in (zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED):
+            yield self.read(member)
+            return
+        data_map = self.open_map()
+        start = self.data_offset(member)
+        if member.method == zipfile.ZIP_STORED:
+            view = memoryview(data_map)[start : start + member.size]
+            for offset in range(0, member.size, chunk_size):
+                yield view[offset : offset + chunk_size]
+            return
+        view = memoryview(data_map)[start : start + member.compressed_size]
+        decompressor = zlib.decompressobj(-zlib.MAX_WBITS)
+        for offset in range(0, member.compressed_size, chunk_size):
+            pending = view[offset : offset + chunk_size]
+            while pending:
+                chunk = decompressor.decompress(pending, chunk_size)
+                if chunk:
+                    yield chunk
+                pending = decompressor.unconsumed_tail
+        tail = decompressor.flush()
+        if tail:
+            yield tail
+
+
+class ZipStore:
+    """
+    access to volume files kept in Vol-N.zip archives instead of
+    unpacked Vol-N directories
+
+    files in archives are addressed by the path of the archive and the
+    member name separated by "!/" e.g. /ceur-ws/Vol-3262.zip!/Vol-3262/paper2.pdf
+    so that they can be passed around like the paths of unpacked files
+
+    the central directory of each archive is parsed once and kept until the
+    archive changes - at most max_size archives are memory mapped at a time
+    """
+
+    SEPARATOR = "!/"
+
+    def __init__(self, max_size: int = 256, revalidate_secs: float = 5.0):
+        """
+        constructor
+
+        Args:
+            max_size(int): the maximum number of memory mapped archives
+            revalidate_secs(float): re-stat cached archives after this many seconds
+        """
+        self.max_size = max_size
+        self.revalidate_secs = revalidate_secs
+        self.archives: Dict[str, ZipArchive] = {}
+        # the archives with a memory map in least recently used order
+        self.mapped: "OrderedDict[str, ZipArchive]" = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self.mapped)
+
+    @classmethod
+    def split(cls, path: str) -> Optional[Tuple[str, str]]:
+        """
+        split the given path into the archive path and the member name
+
+        Returns:
+            tuple: the archive path and the member name or None for other paths
+        """
+        if not path or cls.SEPARATOR not in path:
+            return None
+        zip_path, _sep, name = path.partition(cls.SEPARATOR)
+        return zip_path, name
+
+    @classmethod
+    def is_archived(cls, path: Optional[str]) -> bool:
+        """
+        check whether the given path addresses a file in an archive
+        """
+        return bool(path) and cls.SEPARATOR in path
+
+    def archive(self, zip_path: str) -> Optional[ZipArchive]:
+        """
+        get the archive with the given path - parsing its central directory
+        if it was not parsed yet or the archive changed
+
+        Returns:
+            ZipArchive: the archive or None if there is no readable archive
+        """
+        with self.lock:
+            archive = self.archives.get(zip_path)
+            if archive is not None and not self._is_stale(archive):
+                self.hits += 1
+                return archive
+            self.misses += 1
+        try:
+            archive = ZipArchive(zip_path)
+        except (OSError, zipfile.BadZipFile):
+            archive = None
+        with self.lock:
+            old = self.archives.pop(zip_path, None)
+            if old is not None and self.mapped.pop(zip_path, None) is not None:
+                old.map = None
+            if archive is not None:
+                self.archives[zip_path] = archive
+        return archive
+
+    def _is_stale(self, archive: ZipArchive) -> bool:
+        """
+        check whether the archive was replaced or modified since it was parsed
+        """
+        now = time.monotonic()
+        if now - archive.checked < self.revalidate_secs:
+            return False
+        archive.checked = now
+        try:
+            stat = os.stat(archive.path)
+        except OSError:
+            return True
+        return stat.st_mtime_ns != archive.mtime_ns or stat.st_size != archive.file_size
+
+    def member(self, path: str) -> Optional[Tuple[ZipArchive, ZipMember]]:
+        """
+        get the archive and the member for the given path
+
+        Returns:
+            tuple: the archive and the member or None if there is no such member
+        """
+        split = self.split(path)
+        if split is None:
+            return None
+        zip_path, name = split
+        archive = self.archive(zip_path)
+        if archive is None:
+            return None
+        member = archive.members.get(name)
+        if member is None:
+            return None
+        return archive, member
+
+    def read_member(self, archive: ZipArchive, member: ZipMember):
+        """
+        read the given member keeping at most max_size archives mapped
+
+        Returns:
+            memoryview: a view of the map for stored members - otherwise
+            the decompressed bytes
+        """
+        self._touch(archive)
+        return archive.read(member)
+
+    def _touch(self, archive: ZipArchive):
+        """
+        mark the given archive as mapped and most recently used
+        """
+        with self.lock:
+            self.mapped[archive.path] = archive
+            self.mapped.move_to_end(archive.path)
+            while len(self.mapped) > self.max_size:
+                _path, oldest = self.mapped.popitem(last=False)
+                # views still in use keep the map open until they are released
+                oldest.map = None
+                self.evictions += 1
+
+    def volume_dir(self, vol_dir: str) -> Optional[str]:
+        """
+        get the path of the given volume directory within its Vol-N.zip archive
+
+        Args:
+            vol_dir(str): the path of the volume directory e.g. /ceur-ws/Vol-3262
+
+        Returns:
+            str: the archive path of the directory or None if there is no archive
+        """
+        zip_path = f"{vol_dir}.zip"
+        archive = self.archive(zip_path)
+        if archive is None:
+            return None
+        # the CEUR-WS archives contain the Vol-N directory itself
+        prefix = f"{os.path.basename(vol_dir)}/"
+        if any(name.startswith(prefix) for name in archive.members):
+            return f"{zip_path}{self.SEPARATOR}{prefix[:-1]}"
+        return f"{zip_path}!"
+
+    def list_files(self, dir_path: str) -> frozenset:
+        """
+        list the names of the files in the given archive directory
+
+        Args:
+            dir_path(str): the archive path of the directory
+        """
+        if dir_path.endswith("!"):
+            zip_path, prefix = dir_path[:-1], ""
+        else:
+            zip_path, name = self.split(dir_path)
+            prefix = f"{name}/"
+        archive = self.archive(zip_path)
+        if archive is None:
+            return frozenset()
+        files = set()
+        for member_name in archive.members:
+            if member_name.startswith(prefix):
+                file_name = member_name[len(prefix) :]
+                if "/" not in file_name:
+                    files.add(file_name)
+        return frozenset(files)
+
+    def isfile(self, path: Optional[str]) -> bool:
+        """
+        check whether the given unpacked or archived file exists
+        """
+        if not path:
+            return False
+        if self.is_archived(path):
+            return self.member(path) is not None
+        return os.path.isfile(path)
+
+    def stat(self, path: str) -> Tuple[int, int]:
+        """
+        get the modification time in nanoseconds and the size of the given
+        unpacked or archived file - archived files change with their archive
+
+        Raises:
+            OSError: if there is no such file
+        """
+        if self.is_archived(path):
+            found = self.member(path)
+            if found is None:
+                raise FileNotFoundError(f"no member {path}")
+            archive, member = found
+            return archive.mtime_ns, member.size
+        stat = os.stat(path)
+        return stat.st_mtime_ns, stat.st_size
+
+    def read_bytes(self, path: str) -> Union[memoryview, bytes]:
+        """
+        read the given unpacked or archived file
+
+        Raises:
+            OSError: if there is no such file
+        """
+        if self.is_archived(path):
+            found = self.member(path)
+            if found is None:
+                raise FileNotFoundError(f"no member {path}")
+            return self.read_member(*found)
+        with open(path, "rb") as data_file:
+            return data_file.read()
+
+    def read_text(self, path: str, errors: str = "strict") -> str:
+        """
+        read the given unpacked or archived text file as utf-8
+
+        Raises:
+            OSError: if there is no such file
+        """
+        return str(self.read_bytes(path), "utf-8", errors)
+
+    def iter_bytes(
+        self, path: str, chunk_size: int = 64 * 1024
+    ) -> Iterator[Union[memoryview, bytes]]:
+        """
+        read the given unpacked or archived file in chunks so that large
+        files are never held in memory at once
+
+        Raises:
+            OSError: if there is no such file
+        """
+        if self.is_archived(path):
+            found = self.member(path)
+            if found is None:
+                raise FileNotFoundError(f"no member {path}")
+            archive, member = found
+            self._touch(archive)
+            yield from archive.iter_chunks(member, chunk_size)
+            return
+        with open(path, "rb") as data_file:
+            while True:
+                chunk = data_file.read(chunk_size)
+                if not chunk:
+                    break
+                yield chunk
+
+    def iter_text(
+        self, path: str, chunk_size: int = 64 * 1024, errors: str = "strict"
+    ) -> Iterator[str]:
+        """
+        read the given unpacked or archived text file as utf-8 in chunks -
+        characters split between chunks are decoded with the next chunk
+
+        Raises:
+            OSError: if there is no such file
+        """
+        decoder = codecs.getincrementaldecoder("utf-8")(errors)
+        for chunk in self.iter_bytes(path, chunk_size):
+            text = decoder.decode(chunk)
+            if text:
+                yield text
+        text = decoder.decode(b"", final=True)
+        if text:
+            yield text
+
+
+# the store shared by the managers, the file delivery and the index builders
+ZIP_STORE = ZipStore()
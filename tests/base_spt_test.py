@@ -30,6 +30,9 @@ class BaseSptTest(Basetest):
         fixtures_dir = cls.FIXTURES_DIR
 
         def _fixture_json_path(self, lod_name: str) -> str:  # noqa: ARG001
+            # an explicit cache_dir e.g. of a synthetic corpus takes precedence
+            if getattr(self, "cache_dir", None):
+                return f"{self.cache_dir}/{lod_name}.json"
             return str(fixtures_dir / f"{lod_name}.json")
 
         JsonCacheManager.json_path = _fixture_json_path  # type: ignore[assignment]
@@ -1,7 +1,11 @@
 import getpass
+import tempfile
 import time
 from unittest import TestCase
 
+from ceurspt.ceurws import PaperManager, VolumeManager
+from ceurspt.synthetic import SyntheticCorpus
+
 
 class Basetest(TestCase):
     """
@@ -29,6 +33,66 @@ class Basetest(TestCase):
         return getpass.getuser() in ["travis", "runner"]
 
 
+class SyntheticTest(Basetest):
+    """
+    base test case on a synthetic corpus in a temporary directory
+    """
+
+    def setUp(self, debug=False, profile=True):
+        Basetest.setUp(self, debug=debug, profile=profile)
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.cache_dir = f"{self.tmp_dir.name}/cache"
+        self.base_path = f"{self.tmp_dir.name}/ceur-ws"
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+        Basetest.tearDown(self)
+
+    def generate_corpus(self, volumes: int, papers: int, seed: int, **kwargs):
+        """
+        generate a synthetic corpus in my cache directory and base path
+
+        Args:
+            volumes(int): the number of volumes
+            papers(int): the number of papers
+            seed(int): the random seed
+            **kwargs: further arguments of SyntheticCorpus
+        """
+        corpus = SyntheticCorpus(volumes=volumes, papers=papers, seed=seed, **kwargs)
+        corpus.generate(self.cache_dir, self.base_path)
+
+    def managers(self) -> tuple:
+        """
+        get new unloaded managers of my corpus
+        """
+        vm = VolumeManager(
+            base_path=self.base_path, base_url="file://none", cache_dir=self.cache_dir
+        )
+        pm = PaperManager(base_url="file://none", cache_dir=self.cache_dir)
+        return vm, pm
+
+    def load_managers(self):
+        """
+        load my corpus into the managers self.vm and self.pm
+        """
+        self.vm, self.pm = self.managers()
+        self.vm.getVolumes()
+        self.pm.getPapers(self.vm)
+
+    def load_corpus(self, volumes: int, papers: int, seed: int, **kwargs):
+        """
+        generate a synthetic corpus and load it into self.vm and self.pm
+
+        Args:
+            volumes(int): the number of volumes
+            papers(int): the number of papers
+            seed(int): the random seed
+            **kwargs: further arguments of SyntheticCorpus
+        """
+        self.generate_corpus(volumes, papers, seed, **kwargs)
+        self.load_managers()
+
+
 class Profiler:
     """
     simple profiler
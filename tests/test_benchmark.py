@@ -0,0 +1,105 @@
+"""
+Created on 2026-10-19
+
+@author: agent
+"""
+
+import os
+
+from ceurspt.benchmark import BenchmarkSuite
+from tests.base_spt_test import BaseSptTest
+from tests.basetest import SyntheticTest
+
+
+class TestBenchmark(BaseSptTest):
+    """
+    test the benchmark suite
+    """
+
+    def test_benchmark_suite(self):
+        """
+        run the benchmark suite once against the fixtures
+        """
+        static_directory = f"{self.script_path.parent.parent}/static"
+        suite = BenchmarkSuite(
+            base_path=self.base_path,
+            base_url=self.base_url,
+            repeat=1,
+            sample_size=3,
+            static_directory=static_directory,
+        )
+        results = suite.run()
+        self.assertEqual(139, results["meta"]["papers"])
+        groups = {result["group"] for result in results["results"].values()}
+        self.assertEqual(
+            {"load_lod", "startup", "construct", "render", "route"}, groups
+        )
+        for key in [
+            "load_lod:papers",
+            "startup:getPapers",
+            "construct:Paper fast",
+            "render:Volume.getHtml",
+            "render:BibTexConverter.convert_volume",
+            "route:/Vol-{number:int}.html",
+            "route:/Vol-{number:int}/{pdf_name}.html",
+        ]:
+            with self.subTest(key=key):
+                self.assertIn(key, results["results"])
+        self.assertEqual(
+            0, results["results"]["render:CeurWsJsonLdBuilder.build"]["errors"]
+        )
+        route = results["results"]["route:/Vol-{number:int}/{pdf_name}.json"]
+        self.assertEqual(200, route["status"])
+        if self.debug:
+            rows = BenchmarkSuite.compare(results, results)
+            print(BenchmarkSuite.comparison_text(rows))
+
+    def test_compare(self):
+        """
+        test flagging regressions against a baseline
+        """
+        baseline = {"results": {"a": {"median": 1.0}, "b": {"median": 1.0}}}
+        current = {
+            "results": {"a": {"median": 1.1}, "b": {"median": 1.5}, "c": {"median": 1}}
+        }
+        rows = BenchmarkSuite.compare(baseline, current, threshold=0.2)
+        self.assertEqual(["a", "b"], [row["benchmark"] for row in rows])
+        self.assertEqual([False, True], [row["regression"] for row in rows])
+
+    def test_record(self):
+        """
+        test summarizing timings with the nearest rank percentile
+        """
+        suite = BenchmarkSuite(base_path=self.base_path, base_url=self.base_url)
+        suite.record("test", "times", [float(t) for t in range(20, 0, -1)])
+        result = suite.results["test:times"]
+        self.assertEqual(
+            (1.0, 10.5, 19.0, 20.0),
+            tuple(result[stat] for stat in ["min", "median", "p95", "max"]),
+        )
+
+
+class TestPdfRangeBenchmark(SyntheticTest):
+    """
+    test the benchmark of concurrent pdf range requests
+    """
+
+    def test_pdf_ranges(self):
+        """
+        run the range benchmark on a synthetic corpus with stub pdfs
+        """
+        self.load_corpus(volumes=2, papers=4, seed=32, pdf_size=256 * 1024)
+        suite = BenchmarkSuite(
+            base_path=self.base_path,
+            base_url="file://none",
+            cache_dir=self.cache_dir,
+            static_directory=f"{os.path.dirname(__file__)}/../static",
+        )
+        suite.bench_pdf_ranges(self.vm, self.pm, concurrency=4, requests=16)
+        result = suite.results["pdf:range x4"]
+        self.assertEqual(16, result["n"])
+        self.assertEqual(0, result["errors"])
+        # all requests share the descriptor opened by the first one
+        self.assertEqual((16, 1), (result["fd_cache_hits"], result["fd_cache_misses"]))
+        if self.debug:
+            print(f"{result['requests_per_second']:.0f} range requests/s")
@@ -0,0 +1,97 @@
+"""
+Created on 2026-10-19
+
+@author: agent
+"""
+
+import os
+
+from ceurspt.bundle import StartupBundle
+from ceurspt.spt_cmd import CeurSptCmd
+from tests.basetest import SyntheticTest
+
+
+class TestBundle(SyntheticTest):
+    """
+    test the precomputed startup bundle
+    """
+
+    def setUp(self, debug=False, profile=True):
+        SyntheticTest.setUp(self, debug=debug, profile=profile)
+        self.bundle_dir = f"{self.cache_dir}/bundle"
+        self.load_corpus(volumes=4, papers=60, seed=3, dblp_ratio=1.0, text_words=10)
+
+    def test_load(self):
+        """
+        test that the bundle restores the state of the loaded managers
+        """
+        bundle = StartupBundle(self.bundle_dir)
+        stats = bundle.build(self.vm, self.pm)
+        self.assertEqual(
+            (4, 60, 60), (stats["volumes"], stats["papers"], stats["pdf_files"])
+        )
+        vm, pm = self.managers()
+        self.assertIsNone(bundle.load(vm, pm))
+        self.assertIn("bundle", pm.lod_load_times)
+        self.assertEqual(self.vm.volume_records_by_number, vm.volume_records_by_number)
+        for number, volume in self.vm.volumes_by_number.items():
+            restored = vm.getVolume(number)
+            self.assertEqual(volume.vol_dir, restored.vol_dir)
+            self.assertEqual(
+                getattr(volume, "wikidataid", None),
+                getattr(restored, "wikidataid", None),
+            )
+            self.assertEqual(len(volume.papers), len(restored.papers))
+        self.assertEqual(list(self.pm.papers_by_path), list(pm.papers_by_path))
+        self.assertEqual(
+            self.pm.pdf_index.paths_by_pdf_path, pm.pdf_index.paths_by_pdf_path
+        )
+        self.assertEqual(list(self.pm.paper_dblp_by_path), list(pm.paper_dblp_by_path))
+        paper = next(paper for paper in self.pm.papers_by_path.values() if paper.title)
+        for query in [paper.title, paper.title[:4], f"{paper.title}x"]:
+            with self.subTest(query=query):
+                self.assertEqual(
+                    self.pm.suggest_index.suggest(query),
+                    pm.suggest_index.suggest(query),
+                )
+        # a reload updates the restored suggest index incrementally
+        pm.getPapers(vm)
+        self.assertEqual(len(self.pm.suggest_index), len(pm.suggest_index))
+
+    def test_stale(self):
+        """
+        test that a stale bundle is not loaded
+        """
+        bundle = StartupBundle(self.bundle_dir)
+        vm, pm = self.managers()
+        self.assertIn("no bundle", bundle.load(vm, pm))
+        bundle.build(self.vm, self.pm)
+        self.assertIsNone(bundle.staleness(vm))
+        os.utime(f"{self.base_path}/Vol-2", ns=(0, 0))
+        self.assertEqual("volume directories changed", bundle.staleness(vm))
+        bundle.build(self.vm, self.pm)
+        os.utime(f"{self.cache_dir}/papers.json", ns=(0, 0))
+        self.assertEqual("json caches changed", bundle.load(vm, pm))
+        self.assertEqual({}, vm.volumes_by_number)
+
+    def test_cmd(self):
+        """
+        test building the bundle and starting from it on the command line
+        """
+        cmd = CeurSptCmd()
+        parser = cmd.get_arg_parser("test", "test")
+        argv = [
+            "--cache-dir",
+            self.cache_dir,
+            "-b",
+            self.base_path,
+            "-bu",
+            "file://none",
+        ]
+        args = parser.parse_args(argv + ["--build-bundle"])
+        self.assertEqual(self.bundle_dir, cmd.bundle_dir(args))
+        stats = cmd.build_bundle(args)
+        self.assertEqual(60, stats["papers"])
+        vm, pm = cmd.load_managers(parser.parse_args(argv), use_bundle=True)
+        self.assertIn("bundle", vm.lod_load_times)
+        self.assertEqual(60, len(pm.papers_by_path))
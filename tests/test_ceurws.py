@@ -234,3 +234,23 @@ class Test_CEURWS(BaseSptTest):
                 if expected_papers > 0:
                     for paper in vol_papers:
                         self.assertIsInstance(paper, Paper)
+
+    def test_fast_construction(self):
+        """
+        test that the fast construction path gives the same objects
+        as the generic LinkML construction
+        """
+        for number, volume_record in self.vm.volume_records_by_number.items():
+            fast = self.vm.createVolume(volume_record, fast=True)
+            generic = self.vm.createVolume(volume_record, fast=False)
+            with self.subTest(number=number):
+                self.assertEqual(vars(generic), vars(fast))
+        for pdf_path, paper_record in self.pm.paper_records_by_path.items():
+            volume = self.vm.getVolume(paper_record["vol_number"])
+            fast = self.pm.createPaper(paper_record, volume, fast=True)
+            generic = self.pm.createPaper(paper_record, volume, fast=False)
+            self.assertEqual(vars(generic), vars(fast), pdf_path)
+        # untrusted records fall back to the generic coercion
+        paper_record = dict(paper_record, title=42)
+        paper = self.pm.createPaper(paper_record, volume)
+        self.assertEqual("42", paper.title)
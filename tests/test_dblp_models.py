@@ -0,0 +1,114 @@
+"""
+Created on 2026-10-19
+
+@author: agent
+"""
+
+from ceurspt.benchmark import BenchmarkSuite
+from ceurspt.ceurws import Scholar
+from ceurspt.models.dblp import DblpPaper, DblpProceeding, DblpScholar
+from tests.base_spt_test import BaseSptTest
+
+
+class TestDblpModels(BaseSptTest):
+    """
+    test the compact dblp model classes
+    """
+
+    def test_slots(self):
+        """
+        test that the models have no per instance dict
+        """
+        scholar = DblpScholar(dblp_author_id="https://dblp.org/pid/1", label="A")
+        self.assertFalse(hasattr(scholar, "__dict__"))
+        author = Scholar(dblp_author_id=None, label="B", name="B", index=0)
+        self.assertFalse(hasattr(author, "__dict__"))
+        self.assertEqual("B", author.name)
+
+    def test_unknown_keys(self):
+        """
+        test that unknown keys of the records are logged once per class
+        """
+        record = {"dblp_author_id": "https://dblp.org/pid/7", "affiliation": "X"}
+        with self.assertLogs("ceurspt.models.dblp", level="WARNING") as logs:
+            scholar = DblpScholar.from_dict(record)
+            DblpScholar.from_dict(dict(record))
+        self.assertEqual(
+            ["DblpScholar ignores the unknown key affiliation"],
+            [log.getMessage() for log in logs.records],
+        )
+        self.assertEqual("https://dblp.org/pid/7", scholar.dblp_author_id)
+        self.assertNotIn("affiliation", scholar.to_dict())
+
+    def test_shared_scholars(self):
+        """
+        test that scholars and their identifiers are shared between papers
+        """
+        author = {
+            "dblp_author_id": "https://dblp.org/pid/" + "42",
+            "label": "A",
+            "wikidata_id": None,
+            "orcid_id": None,
+            "gnd_id": None,
+        }
+        scholars = {}
+        records = [
+            {
+                "dblp_publication_id": f"https://dblp.org/rec/p{i}",
+                "dblp_proceeding_id": "https://dblp.org/rec/conf",
+                "volume_number": 1,
+                "title": f"paper {i}",
+                "authors": [dict(author)],
+                "pdf_id": f"Vol-1/paper{i}",
+            }
+            for i in range(2)
+        ]
+        papers = [DblpPaper.from_dict(record, scholars) for record in records]
+        self.assertIs(papers[0].authors[0], papers[1].authors[0])
+        self.assertEqual(1, len(scholars))
+        self.assertIs(papers[0].dblp_proceeding_id, papers[1].dblp_proceeding_id)
+        self.assertEqual(records[0], papers[0].to_dict())
+        self.assertEqual(papers[0], DblpPaper.from_dict(records[0]))
+        proceeding = DblpProceeding.from_dict(
+            {
+                "dblp_publication_id": "https://dblp.org/rec/conf",
+                "volume_number": 1,
+                "title": "proceedings",
+                "papers": records,
+                "editors": [dict(author)],
+            },
+            scholars,
+        )
+        self.assertIs(papers[0].authors[0], proceeding.editors[0])
+
+    def test_loaded_dblp_papers(self):
+        """
+        test the typed dblp papers of the paper manager
+        """
+        dblp_paper = self.pm.paper_dblp_by_path["Vol-3197/paper2.pdf"]
+        self.assertIsInstance(dblp_paper, DblpPaper)
+        self.assertIs(
+            dblp_paper.authors[0],
+            self.pm.dblp_scholars[dblp_paper.authors[0].dblp_author_id],
+        )
+        paper = self.pm.getPaper(3197, "paper2")
+        authors = paper.getAuthors()
+        self.assertIs(authors, paper.getAuthors())
+        self.assertEqual(2, len(authors))
+        self.assertEqual("Q62048937", authors[1].wikidata_id)
+        m_dict = paper.getMergedDict()
+        self.assertEqual("Renata Wassermann", m_dict["dblp.authors"][1]["label"])
+
+    def test_dblp_memory(self):
+        """
+        test the dblp memory benchmark
+        """
+        suite = BenchmarkSuite(base_path=self.base_path, base_url=self.base_url)
+        suite.bench_dblp_memory(self.pm)
+        records = suite.memory["dblp:records"]
+        objects = suite.memory["dblp:objects"]
+        self.assertEqual(3, objects["papers"])
+        self.assertTrue(objects["bytes_per_paper"] < records["bytes_per_paper"])
+        self.assertTrue(objects["author_bytes"] < records["author_bytes"])
+        if self.debug:
+            print(BenchmarkSuite.memory_text(suite.memory))
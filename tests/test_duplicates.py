@@ -0,0 +1,107 @@
+"""
+Created on 2026-10-19
+
+@author: agent
+"""
+
+import os
+
+from fastapi.testclient import TestClient
+
+from ceurspt.duplicates import DuplicateFinder, MinHash
+from ceurspt.webserver import WebServer
+from tests.basetest import SyntheticTest
+
+
+class TestDuplicates(SyntheticTest):
+    """
+    test the near duplicate detection
+    """
+
+    def setUp(self, debug=False, profile=True):
+        SyntheticTest.setUp(self, debug=debug, profile=profile)
+        self.report_path = f"{self.tmp_dir.name}/duplicates.json"
+        self.load_corpus(volumes=5, papers=80, seed=11, dblp_ratio=1.0, text_words=300)
+        # publish the text of Vol-1/paper1 with a small change in Vol-3
+        self.original = "Vol-1/paper1.pdf"
+        self.copy = next(
+            pdf_path
+            for pdf_path in sorted(self.pm.papers_by_path)
+            if pdf_path.startswith("Vol-3/")
+        )
+        text = self.pm.papers_by_path[self.original].getText()
+        copy_path = self.pm.papers_by_path[self.copy].getContentPathByPostfix(
+            "-content.txt"
+        )
+        with open(copy_path, "w", encoding="utf-8") as text_file:
+            text_file.write(text.replace("Abstract", "Summary"))
+
+    def test_minhash(self):
+        """
+        test the similarity estimate of the signatures
+        """
+        minhash = MinHash(num_bins=64)
+        words = [f"w{index}" for index in range(400)]
+        text = " ".join(words)
+        near = " ".join(words[:380] + ["x"] * 20)
+        other = " ".join(reversed(words))
+        signature = minhash.signature(minhash.shingles(text))
+        self.assertEqual(1.0, MinHash.similarity(signature, signature))
+        near_similarity = MinHash.similarity(
+            signature, minhash.signature(minhash.shingles(near))
+        )
+        self.assertTrue(near_similarity > 0.7, near_similarity)
+        other_similarity = MinHash.similarity(
+            signature, minhash.signature(minhash.shingles(other))
+        )
+        self.assertTrue(other_similarity < 0.2, other_similarity)
+        self.assertIsNone(minhash.signature(minhash.shingles("")))
+        with self.assertRaises(ValueError):
+            MinHash(num_bins=60)
+
+    def test_find(self):
+        """
+        test finding the planted duplicate with and without worker processes
+        """
+        for workers in [1, 2]:
+            finder = DuplicateFinder(self.pm, workers=workers)
+            report = finder.find()
+            self.assertEqual(80, report["texts"])
+            pairs = [
+                [paper["pdf_path"] for paper in pair["papers"]]
+                for pair in report["pairs"]
+            ]
+            self.assertEqual([[self.original, self.copy]], pairs)
+            self.assertTrue(report["pairs"][0]["cross_volume"])
+            # far fewer candidates than all pairs
+            self.assertTrue(report["candidates"] < 80 * 79 // 20)
+
+    def test_duplicates_endpoint(self):
+        """
+        test the /duplicates endpoint
+        """
+        static_directory = f"{os.path.dirname(__file__)}/../static"
+        ws = WebServer(
+            self.vm,
+            self.pm,
+            static_directory=static_directory,
+            duplicates_report=self.report_path,
+        )
+        client = TestClient(ws.app)
+        self.assertEqual(503, client.get("/duplicates").status_code)
+        report = DuplicateFinder(self.pm).find()
+        DuplicateFinder.write_report(report, self.report_path)
+        response = client.get("/duplicates", params={"cross_volume": True})
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(1, len(response.json()["pairs"]))
+        response = client.get("/duplicates", params={"min_similarity": 1.01})
+        self.assertEqual([], response.json()["pairs"])
+        # the parsed report is cached and filtering does not change it
+        cached = ws.duplicates_cache
+        self.assertEqual(1, len(client.get("/duplicates").json()["pairs"]))
+        self.assertIs(cached, ws.duplicates_cache)
+        # a replaced report is parsed again
+        report["pairs"] = []
+        DuplicateFinder.write_report(report, self.report_path)
+        os.utime(self.report_path, ns=(1, 1))
+        self.assertEqual([], client.get("/duplicates").json()["pairs"])
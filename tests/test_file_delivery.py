@@ -0,0 +1,253 @@
+"""
+Created on 2026-10-19
+
+@author: agent
+"""
+
+import asyncio
+import gc
+import os
+import random
+import tempfile
+
+import httpx
+from fastapi.testclient import TestClient
+
+from ceurspt.ceurws import PaperManager, VolumeManager
+from ceurspt.file_delivery import FileDelivery, FileDescriptorCache
+from ceurspt.webserver import WebServer
+from tests.base_spt_test import BaseSptTest
+
+
+class TestFileDelivery(BaseSptTest):
+    """
+    test serving PDF files with ETag and Range support
+    """
+
+    def setUp(self, debug=False, profile=True):
+        BaseSptTest.setUp(self, debug=debug, profile=profile)
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        vol_dir = f"{self.tmp_dir.name}/Vol-3262"
+        os.makedirs(vol_dir)
+        self.pdf_bytes = random.Random(3262).randbytes(1024 * 1024)
+        with open(f"{vol_dir}/paper1.pdf", "wb") as pdf_file:
+            pdf_file.write(self.pdf_bytes)
+        self.vm = VolumeManager(base_path=self.tmp_dir.name, base_url=self.base_url)
+        self.vm.getVolumes()
+        self.pm = PaperManager(base_url=self.base_url)
+        self.pm.getPapers(self.vm)
+        static_directory = f"{self.script_path.parent.parent}/static"
+        self.ws = WebServer(self.vm, self.pm, static_directory=static_directory)
+        self.client = TestClient(self.ws.app)
+
+    def tearDown(self):
+        self.ws.file_delivery.fd_cache.clear()
+        self.tmp_dir.cleanup()
+        BaseSptTest.tearDown(self)
+
+    def test_pdf_index(self):
+        """
+        test the precomputed pdf path index
+        """
+        self.assertEqual(1, len(self.pm.pdf_index))
+        paper = self.pm.getPaper(3262, "paper1")
+        self.assertEqual(f"{self.tmp_dir.name}/Vol-3262/paper1.pdf", paper.getPdf())
+        missing = self.pm.getPaper(3262, "paper2")
+        self.assertIsNone(missing.getPdf())
+
+    def test_missing_pdf(self):
+        """
+        test that a paper without pdf file gives a 404 instead of a None.pdf path
+        """
+        response = self.client.get("/Vol-3262/paper2.pdf")
+        self.assertEqual(404, response.status_code)
+
+    def test_full_and_conditional(self):
+        """
+        test a full response and a conditional revalidation
+        """
+        response = self.client.get("/Vol-3262/paper1.pdf")
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(self.pdf_bytes, response.content)
+        self.assertEqual("bytes", response.headers["accept-ranges"])
+        etag = response.headers["etag"]
+        response = self.client.get(
+            "/Vol-3262/paper1.pdf", headers={"If-None-Match": etag}
+        )
+        self.assertEqual(304, response.status_code)
+        self.assertEqual(b"", response.content)
+
+    def test_ranges(self):
+        """
+        test byte range requests
+        """
+        size = len(self.pdf_bytes)
+        for range_header, expected in [
+            ("bytes=0-99", self.pdf_bytes[0:100]),
+            ("bytes=1000-", self.pdf_bytes[1000:]),
+            ("bytes=-500", self.pdf_bytes[-500:]),
+            ("bytes=100-99999999", self.pdf_bytes[100:]),
+        ]:
+            with self.subTest(range_header=range_header):
+                response = self.client.get(
+                    "/Vol-3262/paper1.pdf", headers={"Range": range_header}
+                )
+                self.assertEqual(206, response.status_code)
+                self.assertEqual(expected, response.content)
+                self.assertTrue(response.headers["content-range"].endswith(f"/{size}"))
+        response = self.client.get(
+            "/Vol-3262/paper1.pdf", headers={"Range": f"bytes={size}-"}
+        )
+        self.assertEqual(416, response.status_code)
+        self.assertEqual(f"bytes */{size}", response.headers["content-range"])
+        # invalid ranges are ignored
+        for range_header in ["bytes=abc-", "bytes=5-3"]:
+            with self.subTest(range_header=range_header):
+                response = self.client.get(
+                    "/Vol-3262/paper1.pdf", headers={"Range": range_header}
+                )
+                self.assertEqual(200, response.status_code)
+                self.assertEqual(size, len(response.content))
+        # a stale If-Range gives the full content
+        response = self.client.get(
+            "/Vol-3262/paper1.pdf",
+            headers={"Range": "bytes=0-9", "If-Range": '"outdated"'},
+        )
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(size, len(response.content))
+
+    def test_text(self):
+        """
+        test streaming a text file with conditional and range requests
+        """
+        text = "ünïcödé text\n" * 10000
+        paper = self.pm.getPaper(3262, "paper1")
+        with open(f"{paper.getBasePath()}-content.txt", "w", encoding="utf-8") as f:
+            f.write(text)
+        response = self.client.get("/Vol-3262/paper1.txt")
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(text, response.text)
+        self.assertEqual("text/plain; charset=utf-8", response.headers["content-type"])
+        response = self.client.get(
+            "/Vol-3262/paper1.txt", headers={"If-None-Match": response.headers["etag"]}
+        )
+        self.assertEqual(304, response.status_code)
+        response = self.client.get(
+            "/Vol-3262/paper1.txt", headers={"Range": "bytes=0-15"}
+        )
+        self.assertEqual("ünïcödé text", response.content.decode("utf-8"))
+        self.assertEqual(b"", self.client.get("/Vol-3262/paper1.cermine").content)
+
+    def test_zero_copy_send(self):
+        """
+        test handing the descriptor to servers with the zero copy send extension
+        """
+        pdf = self.pm.getPaper(3262, "paper1").getPdf()
+        response = self.ws.file_delivery.response({"range": "bytes=100-"}, pdf)
+        messages = []
+
+        async def send(message):
+            if "file" in message:
+                fd = message["file"].fileno()
+                message["body"] = os.pread(fd, message["count"], message["offset"])
+            messages.append(message)
+
+        scope = {"type": "http", "extensions": {"http.response.zerocopysend": {}}}
+        asyncio.run(response(scope, None, send))
+        self.assertEqual(206, messages[0]["status"])
+        self.assertEqual("http.response.zerocopysend", messages[1]["type"])
+        self.assertEqual(self.pdf_bytes[100:], messages[1]["body"])
+
+    def test_parse_range(self):
+        """
+        test parsing Range headers
+        """
+        self.assertEqual((0, 9), FileDelivery.parse_range("bytes=0-9", 100))
+        self.assertEqual((90, 99), FileDelivery.parse_range("bytes=-10", 100))
+        self.assertIsNone(FileDelivery.parse_range("bytes=0-1,5-6", 100))
+        self.assertIsNone(FileDelivery.parse_range("items=0-1", 100))
+        self.assertEqual((0, 99), FileDelivery.parse_range("bytes=-200", 100))
+        # invalid ranges are ignored
+        for invalid in ["bytes=abc-", "bytes=5-3", "bytes=a-b", "bytes=-", "bytes=--5"]:
+            with self.subTest(invalid=invalid):
+                self.assertIsNone(FileDelivery.parse_range(invalid, 100))
+        for unsatisfiable in ["bytes=100-", "bytes=100-200", "bytes=-0"]:
+            with self.subTest(unsatisfiable=unsatisfiable):
+                with self.assertRaises(ValueError):
+                    FileDelivery.parse_range(unsatisfiable, 100)
+
+    def test_fd_cache(self):
+        """
+        test the file descriptor cache
+        """
+        fd_cache = FileDescriptorCache(max_size=1)
+        pdf = self.pm.getPaper(3262, "paper1").getPdf()
+        other = f"{self.tmp_dir.name}/other.bin"
+        with open(other, "wb") as other_file:
+            other_file.write(b"x")
+        first = fd_cache.acquire(pdf)
+        fd_cache.release(first)
+        again = fd_cache.acquire(pdf)
+        self.assertIs(first, again)
+        # evicting a file in use must not close its descriptor
+        fd_cache.acquire(other)
+        self.assertEqual(1, fd_cache.evictions)
+        self.assertEqual(100, len(os.pread(again.fd, 100, 0)))
+        fd_cache.release(again)
+        self.assertEqual((1, 2), (fd_cache.hits, fd_cache.misses))
+        fd_cache.clear()
+
+    def test_unsent_response(self):
+        """
+        test that a response collected without being sent releases its file
+        """
+        fd_cache = self.ws.file_delivery.fd_cache
+        pdf = self.pm.getPaper(3262, "paper1").getPdf()
+        response = self.ws.file_delivery.response({}, pdf)
+        cached = response.cached
+        self.assertEqual(1, cached.users)
+        del response
+        gc.collect()
+        # the release is deferred to the next acquire
+        again = fd_cache.acquire(pdf)
+        self.assertIs(cached, again)
+        self.assertEqual(1, again.users)
+        fd_cache.release(again)
+        self.assertEqual(0, again.users)
+        fd_cache.clear()
+
+    def test_concurrent_ranges(self):
+        """
+        test concurrent range requests as issued by PDF viewers sharing
+        one cached file descriptor - see BenchmarkSuite.bench_pdf_ranges
+        for the timing
+        """
+        concurrency = 8
+        requests = 32
+        size = len(self.pdf_bytes)
+
+        async def fetch_ranges():
+            transport = httpx.ASGITransport(app=self.ws.app)
+            semaphore = asyncio.Semaphore(concurrency)
+            rng = random.Random(42)
+
+            async def fetch(client, start):
+                async with semaphore:
+                    end = min(size - 1, start + 64 * 1024 - 1)
+                    response = await client.get(
+                        "/Vol-3262/paper1.pdf",
+                        headers={"Range": f"bytes={start}-{end}"},
+                    )
+                    self.assertEqual(206, response.status_code)
+                    self.assertEqual(self.pdf_bytes[start : end + 1], response.content)
+
+            async with httpx.AsyncClient(
+                transport=transport, base_url="http://test"
+            ) as client:
+                await asyncio.gather(
+                    *[fetch(client, rng.randrange(size)) for _ in range(requests)]
+                )
+
+        asyncio.run(fetch_ranges())
+        fd_cache = self.ws.file_delivery.fd_cache
+        self.assertEqual((requests - 1, 1), (fd_cache.hits, fd_cache.misses))
@@ -0,0 +1,44 @@
+"""
+Created on 2026-10-19
+
+@author: agent
+"""
+
+import os
+
+from ceurspt.fork_pool import can_fork, fork_map
+from tests.basetest import Basetest
+
+
+def _scaled(factor: int, batch: list) -> list:
+    """
+    scale the given batch and tag it with the process id
+    """
+    return [(value * factor, os.getpid()) for value in batch]
+
+
+class TestForkPool(Basetest):
+    """
+    test mapping batches in forked worker processes
+    """
+
+    def test_fork_map(self):
+        """
+        test that the state reaches the workers and the results are complete
+        """
+        batches = [[index, index + 1] for index in range(0, 40, 2)]
+        expected = [[value * 3 for value in batch] for batch in batches]
+        for workers in [1, 2]:
+            for ordered in [True, False]:
+                with self.subTest(workers=workers, ordered=ordered):
+                    results = list(
+                        fork_map(_scaled, batches, workers, state=3, ordered=ordered)
+                    )
+                    values = [[value for value, _pid in batch] for batch in results]
+                    pids = {pid for batch in results for _value, pid in batch}
+                    if ordered:
+                        self.assertEqual(expected, values)
+                    else:
+                        self.assertEqual(sorted(expected), sorted(values))
+                    forked = workers > 1 and can_fork()
+                    self.assertEqual(forked, os.getpid() not in pids)
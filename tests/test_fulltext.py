@@ -0,0 +1,133 @@
+"""
+Created on 2026-10-19
+
+@author: agent
+"""
+
+import os
+
+from fastapi.testclient import TestClient
+
+from ceurspt.fulltext import (
+    FullTextIndex,
+    FullTextIndexBuilder,
+    decode_varints,
+    encode_varints,
+    tokenize,
+)
+from ceurspt.index_versions import IndexVersions
+from ceurspt.webserver import WebServer
+from tests.basetest import SyntheticTest
+
+
+class TestFullText(SyntheticTest):
+    """
+    test the full text index
+    """
+
+    def setUp(self, debug=False, profile=True):
+        SyntheticTest.setUp(self, debug=debug, profile=profile)
+        self.index_dir = f"{self.tmp_dir.name}/fulltext"
+        self.load_corpus(volumes=5, papers=60, seed=3, text_words=80)
+        self.text_files = FullTextIndexBuilder.text_files_of(self.pm)
+
+    def test_tokenize_and_varints(self):
+        """
+        test the tokenizer and the postings encoding
+        """
+        self.assertEqual(
+            ["knowledge", "graphs", "wikidata"],
+            tokenize("Knowledge Graphs and the Wikidata 2023 a"),
+        )
+        numbers = [0, 1, 127, 128, 300, 2**20, 2**33]
+        self.assertEqual(numbers, decode_varints(encode_varints(numbers)))
+
+    def test_build_and_search(self):
+        """
+        test building the index and BM25 ranking
+        """
+        self.assertEqual(60, len(self.text_files))
+        for workers in [1, 2]:
+            stats = FullTextIndexBuilder(
+                self.text_files, f"{self.index_dir}{workers}", workers=workers
+            ).build()
+            self.assertEqual(60, stats["added"])
+        index1 = FullTextIndex(f"{self.index_dir}1")
+        index2 = FullTextIndex(f"{self.index_dir}2")
+        self.assertEqual(60, len(index1))
+        self.assertEqual(list(index1.all_postings()), list(index2.all_postings()))
+        pdf_path = sorted(self.text_files)[7]
+        paper = self.pm.papers_by_path[pdf_path]
+        result = index1.search(paper.title, limit=3)
+        self.assertEqual(pdf_path, result["hits"][0]["pdf_path"])
+        self.assertTrue(result["total"] >= len(result["hits"]))
+        self.assertEqual(0, index1.search("zzzunknownzzz")["total"])
+        index1.close()
+        index2.close()
+
+    def test_incremental(self):
+        """
+        test that an update only tokenizes the changed files
+        """
+        builder = FullTextIndexBuilder(self.text_files, self.index_dir)
+        builder.build()
+        stats = builder.build()
+        self.assertEqual(0, stats["added"])
+        self.assertEqual(60, stats["kept"])
+        old_index = FullTextIndex(self.index_dir)
+        changed_path, removed_path = sorted(self.text_files)[3:5]
+        with open(self.text_files[changed_path], "w", encoding="utf-8") as text_file:
+            text_file.write("a completely new text about quokkas\n")
+        del self.text_files[removed_path]
+        stats = builder.build()
+        self.assertEqual(1, stats["added"])
+        self.assertEqual(58, stats["kept"])
+        self.assertEqual(1, stats["removed"])
+        # an open index keeps reading its own version
+        self.assertEqual(60, len(old_index))
+        self.assertEqual(0, old_index.search("quokkas")["total"])
+        old_index.close()
+        self.assertEqual([1, 2], IndexVersions(self.index_dir).versions())
+        index = FullTextIndex(self.index_dir)
+        self.assertEqual(59, len(index))
+        self.assertNotIn(removed_path, index.docs)
+        hits = index.search("quokkas")["hits"]
+        self.assertEqual([changed_path], [hit["pdf_path"] for hit in hits])
+        # the kept postings still point to the right documents
+        paper = self.pm.papers_by_path[sorted(self.text_files)[10]]
+        self.assertEqual(
+            paper.pdf_path, index.search(paper.title)["hits"][0]["pdf_path"]
+        )
+        index.close()
+
+    def test_search_endpoint(self):
+        """
+        test the /search endpoint
+        """
+        static_directory = f"{os.path.dirname(__file__)}/../static"
+        ws = WebServer(
+            self.vm,
+            self.pm,
+            static_directory=static_directory,
+            fulltext_dir=self.index_dir,
+        )
+        client = TestClient(ws.app)
+        response = client.get("/search", params={"q": "wikidata"})
+        self.assertEqual(503, response.status_code)
+        FullTextIndexBuilder(self.text_files, self.index_dir).build()
+        paper = self.pm.papers_by_path[sorted(self.text_files)[0]]
+        response = client.get("/search", params={"q": paper.title, "limit": 5})
+        self.assertEqual(200, response.status_code)
+        result = response.json()
+        self.assertTrue(len(result["hits"]) <= 5)
+        hit = result["hits"][0]
+        self.assertEqual(paper.id, hit["id"])
+        self.assertEqual(paper.title, hit["title"])
+        self.assertEqual("/" + paper.pdf_path.replace(".pdf", ".html"), hit["url"])
+        # a rebuilt index is picked up by the running server
+        changed_path = sorted(self.text_files)[1]
+        with open(self.text_files[changed_path], "w", encoding="utf-8") as text_file:
+            text_file.write("a completely new text about quokkas\n")
+        FullTextIndexBuilder(self.text_files, self.index_dir).build()
+        result = client.get("/search", params={"q": "quokkas"}).json()
+        self.assertEqual(1, result["total"])
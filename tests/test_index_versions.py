@@ -0,0 +1,34 @@
+"""
+Created on 2026-10-19
+
+@author: agent
+"""
+
+import os
+import tempfile
+
+from ceurspt.index_versions import IndexVersions
+from tests.basetest import Basetest
+
+
+class TestIndexVersions(Basetest):
+    """
+    test publishing versions of an on-disk index
+    """
+
+    def test_publish(self):
+        """
+        test that publishing switches the current version and keeps the previous one
+        """
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            versions = IndexVersions(f"{tmp_dir}/index")
+            self.assertIsNone(versions.current_dir())
+            for number in range(1, 4):
+                version_dir = versions.new_dir()
+                self.assertEqual(f"{tmp_dir}/index/v{number}", version_dir)
+                # an unpublished version is not visible to readers
+                self.assertNotEqual(version_dir, versions.current_dir())
+                versions.publish(version_dir)
+                self.assertEqual(version_dir, versions.current_dir())
+            self.assertEqual([2, 3], versions.versions())
+            self.assertFalse(os.path.exists(f"{tmp_dir}/index/current.tmp"))
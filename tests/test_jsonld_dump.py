@@ -0,0 +1,69 @@
+"""
+Created on 2026-10-19
+
+@author: agent
+"""
+
+import io
+import json
+
+from fastapi.testclient import TestClient
+from rdflib import Dataset
+
+from ceurspt.jsonld_dump import CorpusDumper
+from ceurspt.webserver import WebServer
+from tests.base_spt_test import BaseSptTest
+
+
+class TestJsonLdDump(BaseSptTest):
+    """
+    test the corpus wide JSON-LD dump
+    """
+
+    def test_ndjson_dump(self):
+        """
+        test dumping all volumes as NDJSON in volume order
+        """
+        dumper = CorpusDumper(self.vm, fmt="ndjson")
+        out = io.BytesIO()
+        count = dumper.dump(out)
+        lines = out.getvalue().decode("utf-8").splitlines()
+        self.assertEqual(len(self.vm.volumes_by_number), count)
+        self.assertEqual(count, len(lines))
+        volume_nrs = [json.loads(line)["ceur:volume_nr"] for line in lines]
+        expected = [f"Vol-{number}" for number in dumper.volume_numbers()]
+        self.assertEqual(expected, volume_nrs)
+
+    def test_parallel_dump(self):
+        """
+        test that the parallel dump keeps the volume order
+        """
+        sequential = b"".join(CorpusDumper(self.vm, workers=1).stream())
+        parallel = b"".join(CorpusDumper(self.vm, workers=2).stream())
+        self.assertEqual(sequential, parallel)
+
+    def test_nquads_dump(self):
+        """
+        test dumping all volumes as N-Quads with one graph per volume
+        """
+        dumper = CorpusDumper(self.vm, fmt="nquads", workers=2)
+        nquads = b"".join(dumper.stream()).decode("utf-8")
+        dataset = Dataset()
+        dataset.parse(data=nquads, format="nquads")
+        graph_names = {str(graph.identifier) for graph in dataset.graphs()}
+        self.assertIn("http://ceur-ws.org/Vol-3262/", graph_names)
+
+    def test_corpus_endpoint(self):
+        """
+        test the /corpus.jsonld endpoint
+        """
+        static_directory = f"{self.script_path.parent.parent}/static"
+        ws = WebServer(self.vm, self.pm, static_directory=static_directory)
+        client = TestClient(ws.app)
+        response = client.get("/corpus.jsonld")
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(
+            len(self.vm.volumes_by_number), len(response.text.splitlines())
+        )
+        response = client.get("/corpus.jsonld?format=turtle")
+        self.assertEqual(400, response.status_code)
@@ -0,0 +1,100 @@
+"""
+Created on 2026-10-19
+
+@author: agent
+"""
+
+from fastapi.testclient import TestClient
+
+from ceurspt.ceurws import PaperManager, VolumeManager
+from ceurspt.memory_report import MemoryReport
+from ceurspt.webserver import WebServer
+from tests.base_spt_test import BaseSptTest
+
+
+class TestMemoryReport(BaseSptTest):
+    """
+    test the memory accounting of the loaded managers
+    """
+
+    def test_memory_report(self):
+        """
+        test loading the managers with a memory report
+        """
+        vm = VolumeManager(base_path=self.base_path, base_url=self.base_url)
+        pm = PaperManager(base_url=self.base_url)
+        report = MemoryReport(vm, pm)
+        report.load()
+        self.assertEqual(["getVolumes", "getPapers"], list(report.phases))
+        self.assertTrue(report.phases["getPapers"]["retained"] > 0)
+        breakdown = report.breakdown()
+        self.assertEqual(
+            len(self.pm.papers_by_path), breakdown["Paper objects"]["count"]
+        )
+        self.assertEqual(7, breakdown["Volume objects"]["count"])
+        for name in [
+            "paper records",
+            "Paper objects",
+            "papers_by_path",
+            "paper_dblp_by_path",
+        ]:
+            with self.subTest(name=name):
+                self.assertTrue(breakdown[name]["bytes"] > 0)
+        text = report.as_text()
+        if self.debug:
+            print(text)
+        self.assertIn("Paper objects", text)
+
+    def test_deep_sizeof(self):
+        """
+        test that shared objects are accounted only once
+        """
+        shared = ["x" * 1000]
+        seen = set()
+        first = MemoryReport.deep_sizeof({"a": shared}, set(), seen)
+        second = MemoryReport.deep_sizeof({"b": shared}, set(), seen)
+        self.assertTrue(first > 1000)
+        self.assertTrue(second < 1000)
+
+    def test_reload_diff(self):
+        """
+        test the memory diff of loading fresh managers
+        """
+
+        def reload():
+            vm = VolumeManager(base_path=self.base_path, base_url=self.base_url)
+            pm = PaperManager(base_url=self.base_url)
+            vm.getVolumes()
+            pm.getPapers(vm)
+
+        diff = MemoryReport.reload_diff(reload, top=5)
+        if self.debug:
+            print(diff)
+        self.assertTrue(len(diff["top"]) <= 5)
+        # a reload must not retain a second copy of the data
+        report = MemoryReport(self.vm, self.pm)
+        self.assertTrue(diff["growth"] < report.as_dict()["total"] / 2)
+
+    def test_admin_endpoint(self):
+        """
+        test the admin memory endpoint
+        """
+        static_directory = f"{self.script_path.parent.parent}/static"
+        ws = WebServer(
+            self.vm, self.pm, static_directory=static_directory, admin_token="secret"
+        )
+        client = TestClient(ws.app)
+        response = client.get("/admin/memory")
+        self.assertEqual(403, response.status_code)
+        volumes_by_number = self.vm.volumes_by_number
+        papers_by_path = self.pm.papers_by_path
+        response = client.get(
+            "/admin/memory?reload=true", headers={"X-Admin-Token": "secret"}
+        )
+        self.assertEqual(200, response.status_code)
+        # the diff is taken on fresh managers - the live ones are untouched
+        self.assertIs(volumes_by_number, self.vm.volumes_by_number)
+        self.assertIs(papers_by_path, self.pm.papers_by_path)
+        report = response.json()
+        self.assertIn("cache pdf_fd", report["breakdown"])
+        self.assertIn("reload_diff", report)
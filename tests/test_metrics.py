@@ -0,0 +1,96 @@
+"""
+Created on 2026-10-19
+
+@author: agent
+"""
+
+import os
+
+from fastapi.testclient import TestClient
+
+from ceurspt.metrics import Histogram, MetricsRegistry
+from ceurspt.webserver import WebServer
+from tests.base_spt_test import BaseSptTest
+
+
+class TestMetrics(BaseSptTest):
+    """
+    test the Prometheus style metrics
+    """
+
+    def test_histogram(self):
+        """
+        test the cumulative histogram buckets
+        """
+        histogram = Histogram("latency", "test latency", ("route",), buckets=(0.1, 1.0))
+        for value in [0.05, 0.1, 0.5, 2.0]:
+            histogram.observe(value, "/x")
+        text = histogram.render()
+        debug = self.debug
+        if debug:
+            print(text)
+        self.assertIn('latency_bucket{route="/x",le="0.1"} 2', text)
+        self.assertIn('latency_bucket{route="/x",le="1.0"} 3', text)
+        self.assertIn('latency_bucket{route="/x",le="+Inf"} 4', text)
+        self.assertIn('latency_count{route="/x"} 4', text)
+
+    def test_metrics_endpoint(self):
+        """
+        test the /metrics endpoint
+        """
+        static_directory = f"{self.script_path.parent.parent}/static"
+        ws = WebServer(self.vm, self.pm, static_directory=static_directory)
+        client = TestClient(ws.app)
+        for path in ["/Vol-3262.json", "/Vol-3263.json", "/Vol-3262/paper1.json"]:
+            self.assertEqual(200, client.get(path).status_code)
+        response = client.get("/metrics")
+        self.assertEqual(200, response.status_code)
+        text = response.text
+        debug = self.debug
+        if debug:
+            print(text)
+        self.assertIn(
+            'ceurspt_http_requests_total{route="/Vol-{number:int}.json",method="GET",status="200"} 2',
+            text,
+        )
+        self.assertIn(
+            'ceurspt_http_request_duration_seconds_count{route="/Vol-{number:int}/{pdf_name}.json"} 1',
+            text,
+        )
+        volumes = len(self.vm.volumes_by_number)
+        self.assertIn(
+            f'ceurspt_index_entries{{index="volumes_by_number"}} {volumes}', text
+        )
+        self.assertIn(
+            'ceurspt_lod_load_duration_seconds{manager="papers",lod="papers"}', text
+        )
+        self.assertIn(
+            'ceurspt_lod_age_seconds{manager="volumes",lod="proceedings"}', text
+        )
+        self.assertIn('ceurspt_cache_misses_total{cache="pdf_fd"} 0', text)
+
+    def test_registry_render_empty(self):
+        """
+        test rendering a registry without observations
+        """
+        metrics = MetricsRegistry(prefix="test")
+        text = metrics.render()
+        self.assertIn("# TYPE test_http_requests_total counter", text)
+        self.assertIn("# TYPE test_http_request_duration_seconds histogram", text)
+
+    def test_pid_label(self):
+        """
+        test labelling the samples of a pre-forked worker with its pid
+        """
+        metrics = MetricsRegistry(prefix="test", pid_label=True)
+        metrics.observe_request("/x", "GET", 200, 0.01)
+        text = metrics.render()
+        pid = os.getpid()
+        self.assertIn(
+            f'test_http_requests_total{{route="/x",method="GET",status="200",pid="{pid}"}} 1',
+            text,
+        )
+        self.assertIn(
+            f'test_http_request_duration_seconds_bucket{{route="/x",le="+Inf",pid="{pid}"}} 1',
+            text,
+        )
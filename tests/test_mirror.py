@@ -0,0 +1,164 @@
+"""
+Created on 2026-10-19
+
+@author: agent
+"""
+
+import hashlib
+import io
+import os
+import random
+import tempfile
+import threading
+import zipfile
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from ceurspt.mirror import VolumeMirror
+from ceurspt.zip_store import ZipStore
+from tests.basetest import Basetest
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """
+    stand-in for the mirror serving the files of its server with range support
+    """
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        name = self.path.rpartition("/")[2]
+        range_header = self.headers.get("Range")
+        self.server.requests.append((name, range_header))
+        data = self.server.files.get(name)
+        if data is None:
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        start = 0
+        if range_header:
+            start = int(range_header[len("bytes=") :].rstrip("-"))
+            self.send_response(206)
+            self.send_header(
+                "Content-Range", f"bytes {start}-{len(data) - 1}/{len(data)}"
+            )
+        else:
+            self.send_response(200)
+        self.send_header("Content-Length", str(len(data) - start))
+        self.end_headers()
+        cut = self.server.cuts.pop(name, None)
+        if cut is not None:
+            # simulate a connection dropped in the middle of the body
+            self.wfile.write(data[start:cut])
+            self.close_connection = True
+            return
+        self.wfile.write(data[start:])
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestMirror(Basetest):
+    """
+    test mirroring volume archives from a local stand-in server
+    """
+
+    def setUp(self, debug=False, profile=True):
+        Basetest.setUp(self, debug=debug, profile=profile)
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.base_path = f"{self.tmp_dir.name}/ceur-ws"
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+        self.server.requests = []
+        self.server.cuts = {}
+        self.server.files = {
+            "Vol-1.zip": self.make_zip(1),
+            "Vol-2.zip": self.make_zip(2, size=300 * 1024),
+            # archived without the Vol-N directory
+            "Vol-4.zip": self.make_zip(4, prefix=False),
+        }
+        sums = "".join(
+            f"{hashlib.sha256(data).hexdigest()}  {name}\n"
+            for name, data in self.server.files.items()
+        )
+        self.server.files["SHA256SUMS"] = sums.encode()
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        self.url = f"http://127.0.0.1:{self.server.server_port}/ftp-dir"
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.tmp_dir.cleanup()
+        Basetest.tearDown(self)
+
+    def make_zip(self, number: int, size: int = 1000, prefix: bool = True) -> bytes:
+        """
+        make the archive of the given volume with an index.html and a pdf
+        """
+        buffer = io.BytesIO()
+        folder = f"Vol-{number}/" if prefix else ""
+        with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as zip_file:
+            zip_file.writestr(f"{folder}index.html", f"<html>Vol-{number}</html>")
+            zip_file.writestr(
+                f"{folder}paper1.pdf",
+                random.Random(number).randbytes(size),
+                compress_type=zipfile.ZIP_STORED,
+            )
+        return buffer.getvalue()
+
+    def zip_requests(self) -> list:
+        return [request for request in self.server.requests if ".zip" in request[0]]
+
+    def test_mirror(self):
+        """
+        test mirroring a range of volumes and skipping them on the next run
+        """
+        mirror = VolumeMirror(self.base_path, self.url, connections=2, workers=2)
+        report = mirror.mirror(1, 4)
+        self.assertEqual({"extracted": 3, "missing": 1}, report["counts"])
+        for number in [1, 2, 4]:
+            with open(f"{self.base_path}/Vol-{number}/index.html") as index_file:
+                self.assertEqual(f"<html>Vol-{number}</html>", index_file.read())
+        self.assertEqual(
+            300 * 1024, os.path.getsize(f"{self.base_path}/Vol-2/paper1.pdf")
+        )
+        self.assertEqual(
+            [], [name for name in os.listdir(self.base_path) if "." in name]
+        )
+        self.assertTrue(mirror.pool.opened <= 2)
+        self.server.requests.clear()
+        report = VolumeMirror(self.base_path, self.url).mirror(1, 4)
+        self.assertEqual({"skipped": 3, "missing": 1}, report["counts"])
+        self.assertEqual([("Vol-3.zip", None)], self.zip_requests())
+
+    def test_resume(self):
+        """
+        test resuming an interrupted download by a range request
+        """
+        self.server.cuts["Vol-2.zip"] = 100 * 1024
+        report = VolumeMirror(self.base_path, self.url, keep_zip=True).mirror(2, 2)
+        result = report["volumes"][0]
+        self.assertEqual("downloaded", result["status"])
+        self.assertTrue(result["resumed"])
+        self.assertEqual(
+            [("Vol-2.zip", None), ("Vol-2.zip", f"bytes={100 * 1024}-")],
+            self.zip_requests(),
+        )
+        # the kept archive is served without unpacking
+        store = ZipStore()
+        vol_dir = store.volume_dir(f"{self.base_path}/Vol-2")
+        self.assertEqual(300 * 1024, len(store.read_bytes(f"{vol_dir}/paper1.pdf")))
+        self.assertFalse(os.path.isdir(f"{self.base_path}/Vol-2"))
+
+    def test_checksum_mismatch(self):
+        """
+        test that a corrupted archive is neither kept nor extracted
+        """
+        data = bytearray(self.server.files["Vol-1.zip"])
+        data[-30] ^= 0xFF
+        self.server.files["Vol-1.zip"] = bytes(data)
+        report = VolumeMirror(self.base_path, self.url).mirror(1, 1)
+        result = report["volumes"][0]
+        self.assertEqual("failed", result["status"])
+        self.assertIn("sha256 mismatch", result["error"])
+        self.assertEqual([], os.listdir(self.base_path))
@@ -0,0 +1,54 @@
+"""
+Created on 2026-10-19
+
+@author: agent
+"""
+
+import os
+import socket
+import unittest
+
+from ceurspt.prefork import PreforkBenchmark, PreforkServer
+from ceurspt.webserver import WebServer
+from tests.base_spt_test import BaseSptTest
+
+
+class TestPrefork(BaseSptTest):
+    """
+    test pre-fork serving
+    """
+
+    def free_port(self) -> int:
+        """
+        get a free local port
+        """
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            return sock.getsockname()[1]
+
+    def test_process_memory(self):
+        """
+        test reading the memory of a process
+        """
+        memory = PreforkServer.process_memory(os.getpid())
+        if not memory:
+            self.skipTest("/proc/<pid>/smaps_rollup not available")
+        self.assertTrue(0 < memory["uss"] <= memory["rss"])
+        self.assertTrue(memory["pss"] <= memory["rss"])
+
+    @unittest.skipUnless(hasattr(os, "fork"), "needs os.fork")
+    def test_prefork_benchmark(self):
+        """
+        test serving from two forked workers
+        """
+        static_directory = f"{self.script_path.parent.parent}/static"
+        ws = WebServer(self.vm, self.pm, static_directory=static_directory)
+        benchmark = PreforkBenchmark(
+            ws.app, ["/Vol-3262.json", "/Vol-3262/paper1.json"], port=self.free_port()
+        )
+        rows = benchmark.run([2], requests=40, concurrency=4)
+        if self.debug:
+            print(PreforkBenchmark.report_text(rows))
+        self.assertEqual(1, len(rows))
+        self.assertEqual(40, rows[0]["requests"])
+        self.assertEqual(0, rows[0]["errors"])
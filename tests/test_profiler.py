@@ -0,0 +1,93 @@
+"""
+Created on 2026-10-19
+
+@author: agent
+"""
+
+import json
+import tempfile
+
+from fastapi.testclient import TestClient
+
+from ceurspt.profiler import TRACER, Profiler, Tracer
+from ceurspt.webserver import WebServer
+from tests.base_spt_test import BaseSptTest
+
+
+class TestProfiler(BaseSptTest):
+    """
+    test the span tracer
+    """
+
+    def tearDown(self):
+        TRACER.enabled = False
+        TRACER.reset()
+        BaseSptTest.tearDown(self)
+
+    def test_nested_spans(self):
+        """
+        test nesting spans and profilers
+        """
+        tracer = Tracer(enabled=True)
+        with tracer.span("outer", volume=3262):
+            with tracer.span("inner"):
+                pass
+            with Profiler("profiled", profile=False, tracer=tracer) as profiler:
+                pass
+        self.assertIsNotNone(profiler.span.end_ns)
+        tree = tracer.as_tree()
+        self.assertEqual(1, len(tree))
+        outer = tree[0]
+        self.assertEqual("outer", outer["name"])
+        self.assertEqual({"volume": "3262"}, outer["args"])
+        child_names = [child["name"] for child in outer["children"]]
+        self.assertEqual(["inner", "profiled"], child_names)
+
+    def test_disabled(self):
+        """
+        test that a disabled tracer records nothing
+        """
+        tracer = Tracer()
+        with tracer.span("ignored") as span:
+            self.assertIsNone(span)
+        Profiler("ignored", profile=False, tracer=tracer).time()
+        self.assertEqual([], tracer.spans)
+
+    def test_trace_loading_and_requests(self):
+        """
+        test tracing the loading and a request and exporting a chrome trace
+        """
+        TRACER.enabled = True
+        self.vm.getVolumes()
+        self.pm.getPapers(self.vm)
+        static_directory = f"{self.script_path.parent.parent}/static"
+        ws = WebServer(self.vm, self.pm, static_directory=static_directory)
+        client = TestClient(ws.app)
+        self.assertEqual(200, client.get("/Vol-3262/paper2.html").status_code)
+        names = {span.name for span in TRACER.spans}
+        for expected in [
+            "Loading volumes",
+            "getPapers",
+            "construct papers",
+            "link dblp papers",
+            "load_lod papers",
+            "decode",
+            "GET /Vol-3262/paper2.html",
+            "lookup paper",
+            "Paper.asHtml",
+            "author bar",
+        ]:
+            self.assertIn(expected, names)
+        with tempfile.NamedTemporaryFile(suffix=".json") as trace_file:
+            TRACER.export(trace_file.name, fmt="chrome")
+            with open(trace_file.name) as json_file:
+                trace = json.load(json_file)
+        events = trace["traceEvents"]
+        self.assertEqual(len(TRACER.spans), len(events))
+        self.assertTrue(all(event["ph"] == "X" for event in events))
+        request_span = [
+            span for span in TRACER.spans if span.name == "GET /Vol-3262/paper2.html"
+        ][0]
+        self.assertEqual(
+            "/Vol-{number:int}/{pdf_name}.html", request_span.args["route"]
+        )
@@ -0,0 +1,86 @@
+"""
+Created on 2026-10-19
+
+@author: agent
+"""
+
+import os
+
+from fastapi.testclient import TestClient
+
+from ceurspt.fulltext import FullTextIndexBuilder
+from ceurspt.related import RelatedPapers, RelatedPapersBuilder
+from ceurspt.webserver import WebServer
+from tests.basetest import SyntheticTest
+
+
+class TestRelated(SyntheticTest):
+    """
+    test the precomputed related papers
+    """
+
+    def setUp(self, debug=False, profile=True):
+        SyntheticTest.setUp(self, debug=debug, profile=profile)
+        self.index_dir = f"{self.tmp_dir.name}/related"
+        self.load_corpus(volumes=5, papers=60, seed=5, text_words=80)
+        self.text_files = FullTextIndexBuilder.text_files_of(self.pm)
+
+    def test_related(self):
+        """
+        test that a copy of a paper is its most related paper
+        """
+        pdf_paths = sorted(self.text_files)
+        original, copy = pdf_paths[2], pdf_paths[40]
+        with open(self.text_files[original], encoding="utf-8") as text_file:
+            text = text_file.read()
+        with open(self.text_files[copy], "w", encoding="utf-8") as text_file:
+            text_file.write(text)
+        for workers in [1, 2]:
+            builder = RelatedPapersBuilder.from_managers(
+                self.pm, self.text_files, self.index_dir, k=5, workers=workers
+            )
+            stats = builder.build()
+            self.assertEqual(60, stats["docs"])
+            related_papers = RelatedPapers(self.index_dir)
+            related = related_papers.related(original)
+            self.assertEqual(5, len(related))
+            self.assertEqual(copy, related[0][0])
+            scores = [score for _pdf_path, score in related]
+            self.assertEqual(sorted(scores, reverse=True), scores)
+            self.assertNotIn(original, [pdf_path for pdf_path, _score in related])
+            self.assertEqual(2, len(related_papers.related(original, k=2)))
+            self.assertEqual([], related_papers.related("Vol-0/none.pdf"))
+            related_papers.close()
+
+    def test_related_endpoint(self):
+        """
+        test the related papers endpoint
+        """
+        static_directory = f"{os.path.dirname(__file__)}/../static"
+        ws = WebServer(
+            self.vm,
+            self.pm,
+            static_directory=static_directory,
+            related_dir=self.index_dir,
+        )
+        client = TestClient(ws.app)
+        response = client.get("/Vol-1/paper1/related")
+        self.assertEqual(503, response.status_code)
+        RelatedPapersBuilder.from_managers(
+            self.pm, self.text_files, self.index_dir, k=3
+        ).build()
+        response = client.get("/Vol-1/paper1/related", params={"k": 2})
+        self.assertEqual(200, response.status_code)
+        result = response.json()
+        self.assertEqual("Vol-1/paper1.pdf", result["pdf_path"])
+        self.assertEqual(2, len(result["related"]))
+        other = self.pm.papers_by_path[result["related"][0]["pdf_path"]]
+        self.assertEqual(other.title, result["related"][0]["title"])
+        response = client.get("/Vol-1/nopaper/related")
+        self.assertEqual(404, response.status_code)
+        # recomputed related papers are picked up by the running server
+        RelatedPapersBuilder.from_managers(
+            self.pm, self.text_files, self.index_dir, k=1
+        ).build()
+        result = client.get("/Vol-1/paper1/related", params={"k": 2}).json()
+        self.assertEqual(1, len(result["related"]))
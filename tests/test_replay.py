@@ -0,0 +1,99 @@
+"""
+Created on 2026-10-19
+
+@author: agent
+"""
+
+import tempfile
+
+from ceurspt.replay import AccessLogEntry, LogReplayer, RouteFamilyStats
+from ceurspt.webserver import WebServer
+from tests.base_spt_test import BaseSptTest
+
+
+class TestReplay(BaseSptTest):
+    """
+    test replaying access logs
+    """
+
+    LOG_LINES = [
+        '127.0.0.1 - - [19/Oct/2026:10:00:00 +0200] "GET /Vol-3262.html HTTP/1.1" 200 5120',
+        '127.0.0.1 - - [19/Oct/2026:10:00:01 +0200] "GET /Vol-3262/paper1.json HTTP/1.1" 200 812',
+        '127.0.0.1 - - [19/Oct/2026:10:00:01 +0200] "GET /Vol-3262/paper1.pdf HTTP/1.1" 200 9999 "-" "Mozilla/5.0"',
+        '127.0.0.1 - - [19/Oct/2026:10:00:02 +0200] "GET /index.html HTTP/1.1" 200 100000',
+        '127.0.0.1 - - [19/Oct/2026:10:00:02 +0200] "POST /Vol-3262.html HTTP/1.1" 405 0',
+        '127.0.0.1 - - [19/Oct/2026:10:00:03 +0200] "GET /Vol-9999.json HTTP/1.1" 404 20',
+        '127.0.0.1 - - [19/Oct/2026:10:00:03 +0200] "HEAD /Vol-3262.html HTTP/1.1" 200 0',
+        "garbage",
+    ]
+
+    def test_parse(self):
+        """
+        test parsing log lines
+        """
+        entry = AccessLogEntry.parse(self.LOG_LINES[2])
+        self.assertEqual(
+            ("GET", "/Vol-3262/paper1.pdf", 200),
+            (entry.method, entry.path, entry.status),
+        )
+        self.assertIsNone(AccessLogEntry.parse("garbage"))
+        for path, family in [
+            ("/Vol-3262.html", "/Vol-*.html"),
+            ("/Vol-3262/paper1.html", "/Vol-*.html"),
+            ("/Vol-3262.json?x=1", "*.json"),
+            ("/Vol-3262/paper1.pdf", "*.pdf"),
+            ("/index_alt.html", "/index*"),
+            ("/volume/3262", "other"),
+        ]:
+            with self.subTest(path=path):
+                self.assertEqual(family, LogReplayer.route_family(path))
+
+    def test_percentile(self):
+        """
+        test the nearest rank percentiles of known latencies
+        """
+        stats = RouteFamilyStats("test")
+        self.assertEqual(0.0, stats.percentile(50))
+        stats.latencies = list(range(10, 0, -1))
+        self.assertEqual(
+            (1, 5, 9, 10, 10),
+            tuple(stats.percentile(p) for p in [0, 50, 90, 99, 100]),
+        )
+        stats.latencies = list(range(1, 101))
+        self.assertEqual(
+            (50, 90, 99, 100),
+            tuple(stats.percentile(p) for p in [50, 90, 99, 100]),
+        )
+
+    def test_replay(self):
+        """
+        test replaying a log in process
+        """
+        with tempfile.NamedTemporaryFile("w", suffix=".log") as log_file:
+            log_file.write("\n".join(self.LOG_LINES * 5))
+            log_file.flush()
+            entries = AccessLogEntry.read(log_file.name)
+            static_directory = f"{self.script_path.parent.parent}/static"
+            ws = WebServer(self.vm, self.pm, static_directory=static_directory)
+            replayer = LogReplayer(app=ws.app, concurrency=4)
+            report = replayer.replay(entries)
+        if self.debug:
+            print(LogReplayer.report_text(report))
+        self.assertEqual(25, report["requests"])
+        families = report["families"]
+        self.assertEqual(["/Vol-*.html", "*.json", "*.pdf", "/index*"], list(families))
+        self.assertEqual(10, families["*.json"]["count"])
+        # the fixtures come without pdf files
+        self.assertEqual(5, families["*.pdf"]["client_errors"])
+        self.assertEqual(0.0, families["/Vol-*.html"]["error_rate"])
+
+    def test_rate(self):
+        """
+        test that the replay rate is honored
+        """
+        static_directory = f"{self.script_path.parent.parent}/static"
+        ws = WebServer(self.vm, self.pm, static_directory=static_directory)
+        entries = [AccessLogEntry("GET", "/Vol-3262.json", 200)] * 10
+        replayer = LogReplayer(app=ws.app, concurrency=4, rate=50)
+        report = replayer.replay(entries)
+        self.assertTrue(report["elapsed"] >= 9 / 50)
@@ -0,0 +1,104 @@
+"""
+Created on 2026-10-19
+
+@author: agent
+"""
+
+import json
+import os
+import pstats
+import tempfile
+
+from fastapi.testclient import TestClient
+
+from ceurspt.webserver import WebServer
+from tests.base_spt_test import BaseSptTest
+
+
+class TestRequestProfiler(BaseSptTest):
+    """
+    test profiling single requests on demand
+    """
+
+    def setUp(self, debug=False, profile=True):
+        BaseSptTest.setUp(self, debug=debug, profile=profile)
+        self.profile_dir = tempfile.TemporaryDirectory()
+        static_directory = f"{self.script_path.parent.parent}/static"
+        self.ws = WebServer(
+            self.vm,
+            self.pm,
+            static_directory=static_directory,
+            admin_token="secret",
+            profile_dir=self.profile_dir.name,
+        )
+        self.client = TestClient(self.ws.app)
+
+    def tearDown(self):
+        self.profile_dir.cleanup()
+        BaseSptTest.tearDown(self)
+
+    def test_unprofiled_request(self):
+        """
+        test that requests without profiling options are passed through
+        """
+        response = self.client.get("/Vol-3262.json")
+        self.assertEqual(200, response.status_code)
+        self.assertNotIn("x-profile-id", response.headers)
+        self.assertEqual([], os.listdir(self.profile_dir.name))
+
+    def test_unauthorized(self):
+        """
+        test that profiling needs the admin token
+        """
+        for headers in [
+            {"X-Profile": "cprofile"},
+            {"X-Profile": "cprofile", "X-Admin-Token": "wrong"},
+        ]:
+            with self.subTest(headers=headers):
+                response = self.client.get("/Vol-3262.json", headers=headers)
+                self.assertEqual(403, response.status_code)
+        response = self.client.get(
+            "/Vol-3262.json", headers={"X-Profile": "perf", "X-Admin-Token": "secret"}
+        )
+        self.assertEqual(400, response.status_code)
+
+    def test_cprofile(self):
+        """
+        test profiling a volume page with cProfile
+        """
+        response = self.client.get(
+            "/Vol-3262.json",
+            headers={"X-Profile": "cprofile", "X-Admin-Token": "secret"},
+        )
+        self.assertEqual(200, response.status_code)
+        profile_id = response.headers["x-profile-id"]
+        prof_path = f"{self.profile_dir.name}/{profile_id}.prof"
+        stats = pstats.Stats(prof_path)
+        function_names = [func[2] for func in stats.stats]
+        self.assertIn("getMergedDict", function_names)
+        with open(f"{self.profile_dir.name}/{profile_id}.json") as meta_file:
+            meta = json.load(meta_file)
+        self.assertEqual("/Vol-3262.json", meta["path"])
+        self.assertEqual("cprofile", meta["mode"])
+
+    def test_sampler(self):
+        """
+        test profiling a request with the sampling profiler via query parameters
+        """
+        response = self.client.get(
+            "/Vol-3262.json?profile=sample&admin_token=secret",
+        )
+        self.assertEqual(200, response.status_code)
+        profile_id = response.headers["x-profile-id"]
+        self.assertTrue(
+            os.path.isfile(f"{self.profile_dir.name}/{profile_id}.collapsed")
+        )
+
+    def test_needs_token(self):
+        """
+        test that request profiling can not be switched on without admin token
+        """
+        with self.assertRaises(ValueError):
+            WebServer(
+                self.vm, self.pm, profile_dir=self.profile_dir.name
+            ).app.build_middleware_stack()
@@ -0,0 +1,62 @@
+"""
+Created on 2026-10-19
+
+@author: agent
+"""
+
+from ceurspt.ceurws import Paper
+from ceurspt.string_pool import StringPool
+from tests.base_spt_test import BaseSptTest
+
+
+class TestStringPool(BaseSptTest):
+    """
+    test the string pool shared by the loaded lods
+    """
+
+    def test_intern(self):
+        """
+        test interning equal strings
+        """
+        pool = StringPool()
+        first = "".join(["Vol-", "3262"])
+        second = "".join(["Vol-", "3262"])
+        self.assertIsNot(first, second)
+        self.assertIs(first, pool.intern(first))
+        self.assertIs(first, pool.intern(second))
+        self.assertIsNone(pool.intern(None))
+        self.assertEqual(3262, pool.intern(3262))
+        record = {"vol_number": "".join(["Vol-", "3262"]), "title": "t"}
+        pool.intern_record(record, ["vol_number", "missing"])
+        self.assertIs(first, record["vol_number"])
+        stats = pool.as_dict()
+        self.assertEqual(1, stats["strings"])
+        self.assertEqual(2, stats["hits"])
+        self.assertTrue(stats["saved"] > 0)
+
+    def test_loaded_lods(self):
+        """
+        test that the loaded records share their repeated values
+        """
+        papers = self.pm.get_volume_papers(3262)
+        records = [self.pm.paper_records_by_path[paper.pdf_path] for paper in papers]
+        self.assertTrue(len(records) > 1)
+        self.assertIs(records[0]["vol_number"], records[1]["vol_number"])
+        self.assertIs(self.pm.string_pool, self.vm.string_pool)
+        self.assertTrue(self.vm.string_pool.hits > 0)
+
+    def test_relative_pdf_path(self):
+        """
+        test that papers store relative pdf paths
+        """
+        paper = self.pm.getPaper(3262, "paper2")
+        self.assertEqual("Vol-3262/paper2.pdf", paper.pdf_path)
+        self.assertEqual("https://ceur-ws.org/Vol-3262/paper2.pdf", paper.pdfUrl)
+        self.assertNotIn("pdfUrl", vars(paper))
+        self.assertIs(
+            paper.pdf_path,
+            next(key for key in self.pm.papers_by_path if key == paper.pdf_path),
+        )
+        other = Paper(pdfUrl="http://example.org/paper.pdf")
+        self.assertEqual("http://example.org/paper.pdf", other.pdfUrl)
+        self.assertIsNone(Paper().pdfUrl)
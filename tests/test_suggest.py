@@ -0,0 +1,90 @@
+"""
+Created on 2026-10-19
+
+@author: agent
+"""
+
+from fastapi.testclient import TestClient
+
+from ceurspt.suggest import SuggestIndex
+from ceurspt.webserver import WebServer
+from tests.base_spt_test import BaseSptTest
+
+
+class TestSuggest(BaseSptTest):
+    """
+    test the title and acronym suggest index
+    """
+
+    def setUp(self, debug=False, profile=True):
+        BaseSptTest.setUp(self, debug=debug, profile=profile)
+        self.index = self.pm.suggest_index
+
+    def keys(self, query: str, limit: int = 10) -> list:
+        return [hit["key"] for hit in self.index.suggest(query, limit)]
+
+    def test_prefix(self):
+        """
+        test acronym and prefix lookup
+        """
+        self.assertEqual("Vol-1500", self.keys("AMT 2015")[0])
+        self.assertEqual("Vol-3262", self.keys("wikidata 2022")[0])
+        self.assertEqual("Vol-3263", self.keys("descr")[0])
+        keys = self.keys("helicopter turbo")
+        self.assertIn("Vol-3347/Paper_2.pdf", keys)
+        self.assertEqual([], self.keys(""))
+        self.assertEqual([], self.keys("xyzzyq"))
+        self.assertTrue(len(self.keys("of", limit=3)) <= 3)
+
+    def test_fuzzy(self):
+        """
+        test trigram matching of misspelled words
+        """
+        self.assertEqual("Vol-3197", self.keys("non-monotonik reasoning")[0])
+        self.assertIn("Vol-3347/Paper_2.pdf", self.keys("helicoptre"))
+
+    def test_update(self):
+        """
+        test that a reload only indexes the changed entries
+        """
+        count = len(self.index)
+        stats = self.index.update(self.vm, self.pm)
+        self.assertEqual({"added": 0, "removed": 0, "kept": count}, stats)
+        paper = self.pm.papers_by_path["Vol-3347/Paper_2.pdf"]
+        title = paper.title
+        try:
+            paper.title = "Quokka Population Estimates"
+            stats = self.index.update(self.vm, self.pm)
+            self.assertEqual(1, stats["added"])
+            self.assertEqual(1, stats["removed"])
+            self.assertEqual(["Vol-3347/Paper_2.pdf"], self.keys("quokka"))
+            self.assertNotIn("Vol-3347/Paper_2.pdf", self.keys("helicopter"))
+            self.index.rebuild()
+            self.assertEqual(0, self.index.dead)
+            self.assertEqual(count, len(self.index))
+            self.assertEqual(["Vol-3347/Paper_2.pdf"], self.keys("quokka"))
+        finally:
+            paper.title = title
+            self.index.update(self.vm, self.pm)
+
+    def test_trigrams(self):
+        """
+        test the padded trigrams
+        """
+        self.assertEqual(
+            sorted(["  d", " dl", "dl "]), sorted(SuggestIndex.trigrams_of("dl"))
+        )
+
+    def test_suggest_endpoint(self):
+        """
+        test the /suggest endpoint
+        """
+        static_directory = f"{self.script_path.parent.parent}/static"
+        ws = WebServer(self.vm, self.pm, static_directory=static_directory)
+        client = TestClient(ws.app)
+        response = client.get("/suggest", params={"q": "DL 2022", "limit": 3})
+        self.assertEqual(200, response.status_code)
+        suggestions = response.json()["suggestions"]
+        self.assertEqual("/Vol-3263.html", suggestions[0]["url"])
+        self.assertEqual("volume", suggestions[0]["kind"])
+        self.assertTrue(len(suggestions) <= 3)
@@ -0,0 +1,74 @@
+"""
+Created on 2026-10-19
+
+@author: agent
+"""
+
+import os
+import tempfile
+
+from fastapi.testclient import TestClient
+
+from ceurspt.ceurws import PaperManager, VolumeManager
+from ceurspt.synthetic import SyntheticCorpus
+from ceurspt.webserver import WebServer
+from tests.basetest import Basetest
+
+
+class TestSynthetic(Basetest):
+    """
+    test the synthetic corpus generator
+    """
+
+    def setUp(self, debug=False, profile=True):
+        Basetest.setUp(self, debug=debug, profile=profile)
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.cache_dir = f"{self.tmp_dir.name}/cache"
+        self.base_path = f"{self.tmp_dir.name}/ceur-ws"
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+        Basetest.tearDown(self)
+
+    def test_generate(self):
+        """
+        test generating a small corpus and serving it
+        """
+        corpus = SyntheticCorpus(volumes=20, papers=300, seed=7)
+        counts = corpus.generate(self.cache_dir, self.base_path)
+        self.assertEqual(20, counts["volumes"])
+        self.assertEqual(300, counts["papers"])
+        self.assertTrue(counts["papers_dblp"] > 0)
+        vm = VolumeManager(
+            base_path=self.base_path, base_url="file://none", cache_dir=self.cache_dir
+        )
+        vm.getVolumes()
+        pm = PaperManager(base_url="file://none", cache_dir=self.cache_dir)
+        pm.getPapers(vm)
+        self.assertEqual(20, len(vm.volumes_by_number))
+        self.assertEqual(300, len(pm.papers_by_path))
+        self.assertEqual(300, len(pm.pdf_index))
+        paper = pm.getPaper(5, "paper1")
+        self.assertTrue(paper.getText().startswith(paper.title))
+        static_directory = f"{os.path.dirname(__file__)}/../static"
+        ws = WebServer(vm, pm, static_directory=static_directory)
+        client = TestClient(ws.app)
+        response = client.get("/Vol-5.html")
+        self.assertEqual(200, response.status_code)
+        self.assertIn("/Vol-5/paper1.html", response.text)
+        response = client.get("/Vol-5/paper1.pdf")
+        self.assertEqual(200, response.status_code)
+        self.assertTrue(response.content.startswith(b"%PDF-1.4"))
+        self.assertEqual(corpus.pdf_size, len(response.content))
+
+    def test_reproducible(self):
+        """
+        test that the same seed gives the same lods
+        """
+        contents = []
+        for run in range(2):
+            cache_dir = f"{self.cache_dir}{run}"
+            SyntheticCorpus(volumes=5, papers=40, seed=3).generate(cache_dir)
+            with open(f"{cache_dir}/papers.json", "rb") as json_file:
+                contents.append(json_file.read())
+        self.assertEqual(contents[0], contents[1])
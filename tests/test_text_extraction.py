@@ -0,0 +1,109 @@
+"""
+Created on 2026-10-19
+
+@author: agent
+"""
+
+import os
+
+from ceurspt.text_extraction import TextExtractionPipeline, TextExtractor
+from tests.basetest import SyntheticTest
+
+
+class StubExtractor(TextExtractor):
+    """
+    extract the title comment of the synthetic stub pdfs
+    """
+
+    name = "stub"
+
+    def available(self) -> bool:
+        return True
+
+    def extract(self, pdf_file: str, text_file: str):
+        with open(pdf_file, "rb") as pdf:
+            lines = pdf.read().decode("ascii").splitlines()
+        titles = [line[2:] for line in lines if line.startswith("% ")]
+        if not titles:
+            raise ValueError("no title")
+        with open(text_file, "w", encoding="utf-8") as text:
+            text.write(f"{titles[0]}\n")
+
+
+class TestTextExtraction(SyntheticTest):
+    """
+    test the incremental text extraction pipeline
+    """
+
+    def setUp(self, debug=False, profile=True):
+        SyntheticTest.setUp(self, debug=debug, profile=profile)
+        TextExtractionPipeline.register(StubExtractor)
+        self.load_corpus(volumes=3, papers=40, seed=5, dblp_ratio=1.0, text_words=20)
+        self.pdf_files = TextExtractionPipeline.pdf_files_of(self.pm)
+
+    def tearDown(self):
+        TextExtractionPipeline.unregister(StubExtractor)
+        SyntheticTest.tearDown(self)
+
+    def outdate(self, pdf_paths: list):
+        """
+        remove or age the text files of the given papers
+        """
+        for index, pdf_path in enumerate(pdf_paths):
+            pdf_file = self.pdf_files[pdf_path]
+            text_file = TextExtractionPipeline.text_file_of(pdf_file)
+            if index % 2:
+                os.remove(text_file)
+            else:
+                os.utime(text_file, ns=(0, 0))
+
+    def test_incremental(self):
+        """
+        test that only missing and outdated texts are extracted
+        """
+        self.assertEqual(40, len(self.pdf_files))
+        pdf_paths = sorted(self.pdf_files)
+        for workers in [1, 2]:
+            with self.subTest(workers=workers):
+                self.outdate(pdf_paths[:20])
+                pipeline = TextExtractionPipeline(
+                    self.pdf_files, extractor="stub", workers=workers
+                )
+                report = pipeline.run()
+                self.assertEqual(20, report["extracted"])
+                self.assertEqual(20, report["up_to_date"])
+                self.assertEqual(0, report["failed"])
+                self.assertTrue(report["files_per_second"] > 0)
+                paper = self.pm.papers_by_path[pdf_paths[1]]
+                self.assertEqual(f"{paper.title or 'Preface'}\n", paper.getText())
+                report = pipeline.run()
+                self.assertEqual(0, report["pending"])
+                self.assertEqual(40, report["up_to_date"])
+
+    def test_failures(self):
+        """
+        test that failed extractions leave neither text nor temporary files
+        """
+        pdf_path = sorted(self.pdf_files)[0]
+        pdf_file = self.pdf_files[pdf_path]
+        with open(pdf_file, "wb") as pdf:
+            pdf.write(b"%PDF-1.4\n%%EOF\n")
+        os.remove(TextExtractionPipeline.text_file_of(pdf_file))
+        report = TextExtractionPipeline(self.pdf_files, extractor="stub").run()
+        self.assertEqual(1, report["failed"])
+        self.assertIn("no title", report["errors"][0])
+        vol_dir = os.path.dirname(pdf_file)
+        self.assertEqual([], [name for name in os.listdir(vol_dir) if ".tmp" in name])
+        with self.assertRaises(ValueError):
+            TextExtractionPipeline(self.pdf_files, extractor="unknown")
+
+    def test_register(self):
+        """
+        test registering extractors
+        """
+        with self.assertRaises(TypeError):
+            TextExtractor()
+        self.assertIs(StubExtractor, TextExtractionPipeline.EXTRACTORS["stub"])
+        TextExtractionPipeline.unregister(StubExtractor)
+        self.assertNotIn("stub", TextExtractionPipeline.EXTRACTORS)
+        self.assertIn("pdftotext", TextExtractionPipeline.EXTRACTORS)
@@ -0,0 +1,101 @@
+"""
+Created on 2026-10-19
+
+@author: agent
+"""
+
+from fastapi.testclient import TestClient
+
+from ceurspt.volume_index import VolumeIndex
+from ceurspt.webserver import WebServer
+from tests.base_spt_test import BaseSptTest
+
+
+class TestVolumeIndex(BaseSptTest):
+    """
+    test the server side filtered and paginated volume index
+    """
+
+    def setUp(self, debug=False, profile=True):
+        BaseSptTest.setUp(self, debug=debug, profile=profile)
+        static_directory = f"{self.script_path.parent.parent}/static"
+        self.ws = WebServer(self.vm, self.pm, static_directory=static_directory)
+        self.client = TestClient(self.ws.app)
+
+    def numbers(self, page: dict) -> list:
+        return [vol.number for vol in page["volumes"]]
+
+    def test_buckets(self):
+        """
+        test the precomputed filter buckets
+        """
+        index = self.vm.volume_index
+        self.assertEqual({2022: 5, 2015: 1, 2002: 1}, index.year_counts())
+        self.assertEqual("amt", VolumeIndex.acronym_key("AMT 2015"))
+        self.assertEqual("it&i", VolumeIndex.acronym_key("IT&I-2022"))
+        self.assertEqual(
+            "q59829280",
+            VolumeIndex.series_key("http://www.wikidata.org/entity/Q59829280"),
+        )
+
+    def test_query(self):
+        """
+        test filtering and keyset pagination
+        """
+        index = self.vm.volume_index
+        page = index.query(year=2022, limit=2)
+        self.assertEqual(5, page["total"])
+        self.assertEqual([3347, 3263], self.numbers(page))
+        self.assertEqual(3263, page["next_cursor"])
+        page = index.query(year=2022, limit=2, cursor=page["next_cursor"])
+        self.assertEqual([3262, 3261], self.numbers(page))
+        page = index.query(year=2022, limit=2, cursor=page["next_cursor"])
+        self.assertEqual([3197], self.numbers(page))
+        self.assertIsNone(page["next_cursor"])
+        self.assertEqual([1500], self.numbers(index.query(acronym="amt")))
+        self.assertEqual([3263], self.numbers(index.query(series="Description Logics")))
+        self.assertEqual([3263], self.numbers(index.query(series="Q59829280")))
+        page = index.query(lower=3200, upper=3262)
+        self.assertEqual([3262, 3261], self.numbers(page))
+        self.assertEqual(0, index.query(year=1999)["total"])
+        self.assertEqual(0, index.query(year=2022, acronym="AMT")["total"])
+
+    def test_api(self):
+        """
+        test the json cursor api
+        """
+        response = self.client.get("/api/volumes?year=2022&limit=3")
+        self.assertEqual(200, response.status_code)
+        result = response.json()
+        self.assertEqual(5, result["total"])
+        self.assertEqual(
+            [3347, 3263, 3262], [row["number"] for row in result["volumes"]]
+        )
+        cursor = result["next_cursor"]
+        response = self.client.get(f"/api/volumes?year=2022&limit=3&cursor={cursor}")
+        result = response.json()
+        self.assertEqual([3261, 3197], [row["number"] for row in result["volumes"]])
+        self.assertIsNone(result["next_cursor"])
+        response = self.client.get("/api/volumes?year=twenty")
+        self.assertEqual(400, response.status_code)
+
+    def test_fragment_and_page(self):
+        """
+        test the html fragment and the filtered index page
+        """
+        response = self.client.get("/index_alt/volumes.html?year=2022&limit=2")
+        self.assertEqual(200, response.status_code)
+        self.assertEqual("5", response.headers["X-Total-Count"])
+        self.assertEqual("3263", response.headers["X-Next-Cursor"])
+        self.assertEqual(2, response.text.count('class="VOLGROUP"'))
+        # the plain form submission sends empty parameters
+        response = self.client.get(
+            "/index_alt.html?year=&lower=&upper=&acronym=&series=&limit=2"
+        )
+        self.assertEqual(200, response.status_code)
+        html = response.text
+        self.assertEqual(2, html.count('class="VOLGROUP"'))
+        self.assertIn("2 of 7 volumes shown", html)
+        self.assertIn("cursor=3263", html)
+        response = self.client.get("/index_alt.html")
+        self.assertEqual(7, response.text.count('class="VOLGROUP"'))
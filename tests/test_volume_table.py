@@ -0,0 +1,74 @@
+"""
+Created on 2026-10-19
+
+@author: agent
+"""
+
+from ceurspt.ceurws import Volume
+from ceurspt.volume_table import VolumeTable
+from tests.base_spt_test import BaseSptTest
+
+
+class TestVolumeTable(BaseSptTest):
+    """
+    test the array backed volume table
+    """
+
+    def test_range(self):
+        """
+        test range slicing and lookups
+        """
+        table = self.vm.volume_table
+        self.assertEqual(7, len(table))
+        self.assertEqual(58, table.first)
+        self.assertEqual(3347, table.last)
+        numbers = [volume.number for volume in table.range(3200, 3300)]
+        self.assertEqual([3261, 3262, 3263], numbers)
+        numbers = [volume.number for volume in table.range(3261, 3263, True)]
+        self.assertEqual([3263, 3262, 3261], numbers)
+        self.assertEqual(7, len(table.range()))
+        self.assertEqual([], table.range(60, 1000))
+        self.assertIs(self.vm.getVolume(1500), table.get(1500))
+        self.assertIsNone(table.get(1501))
+        self.assertIn(3197, table)
+        self.assertNotIn(3198, table)
+
+    def test_neighbours(self):
+        """
+        test the previous and next existing volume
+        """
+        table = self.vm.volume_table
+        self.assertEqual(3261, table.previous(3262))
+        self.assertEqual(3197, table.previous(3261))
+        self.assertEqual(3261, table.next(3200))
+        self.assertEqual(3197, table.previous(3200))
+        self.assertIsNone(table.previous(58))
+        self.assertIsNone(table.next(3347))
+        self.assertEqual(3263, table.neighbour(3197, 3))
+        self.assertIsNone(VolumeTable().next(1))
+
+    def test_vol_links(self):
+        """
+        test that volume links skip to existing volumes
+        """
+        table = self.vm.volume_table
+        link = Volume.volLink(3261, -1, table)
+        self.assertEqual('<a href="/Vol-3197.html">Vol-3197⫷</a>', link)
+        self.assertEqual("", Volume.volLink(3347, +1, table))
+        # without a table the neighbour is assumed to exist
+        self.assertIn("/Vol-3260.html", Volume.volLink(3261, -1))
+        self.assertIsNone(Volume().getVolumeTable())
+        html = self.vm.getVolume(3197).getHtml()
+        self.assertIn("/Vol-1500.html", html)
+        self.assertIn("/Vol-3261.html", html)
+
+    def test_index_range(self):
+        """
+        test the index for a volume range
+        """
+        html = self.vm.index_html(upper=3262, lower=3200)
+        self.assertIn("Vol-3261", html)
+        self.assertIn("Vol-3262", html)
+        self.assertNotIn("Vol-3263", html)
+        self.assertNotIn("Vol-3197", html)
+        self.assertTrue(html.index("Vol-3262") < html.index("Vol-3261"))
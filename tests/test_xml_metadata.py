@@ -0,0 +1,271 @@
+"""
+Created on 2026-10-19
+
+@author: agent
+"""
+
+import gzip
+import io
+import os
+
+from fastapi.testclient import TestClient
+
+from ceurspt.webserver import WebServer
+from ceurspt.xml_metadata import (
+    CermineParser,
+    GrobidParser,
+    XmlMetadataBuilder,
+    XmlMetadataStore,
+    iter_ends,
+)
+from tests.basetest import SyntheticTest
+
+TEI_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<TEI xmlns="http://www.tei-c.org/ns/1.0">
+  <teiHeader>
+    <fileDesc>
+      <titleStmt><title level="a" type="main">Streaming   Parsers</title></titleStmt>
+      <sourceDesc><biblStruct><analytic>
+        <author>
+          <persName><forename type="first">Ada</forename><surname>Lovelace</surname></persName>
+          <affiliation><orgName type="institution">RWTH Aachen</orgName>
+            <address><country>Germany</country></address></affiliation>
+        </author>
+      </analytic></biblStruct></sourceDesc>
+    </fileDesc>
+    <profileDesc>
+      <textClass><keywords><term>XML</term><term>parsing</term></keywords></textClass>
+      <abstract><div><p>We parse <hi>large</hi> files.</p></div></abstract>
+    </profileDesc>
+  </teiHeader>
+  <text><body><div><p>The body is skipped.</p></div></body>
+    <back><div><listBibl>
+      <biblStruct xml:id="b0">
+        <analytic><title level="a">Fast XML</title>
+          <author><persName><forename>Tim</forename><surname>Bray</surname></persName></author>
+        </analytic>
+        <monogr><title level="j">Markup Journal</title>
+          <imprint><date type="published" when="1998"/></imprint></monogr>
+        <idno type="DOI">10.1000/xml</idno>
+      </biblStruct>
+    </listBibl></div></back>
+  </text>
+</TEI>
+"""
+
+CERMINE_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<article>
+  <front><article-meta>
+    <title-group><article-title>Cermine Title</article-title></title-group>
+    <contrib-group>
+      <contrib contrib-type="author"><string-name>Grace Hopper</string-name>
+        <xref ref-type="aff" rid="aff0"/></contrib>
+      <aff id="aff0"><institution>Yale University</institution></aff>
+    </contrib-group>
+    <abstract><p>Cermine abstract.</p></abstract>
+    <kwd-group><kwd>compilers</kwd></kwd-group>
+  </article-meta></front>
+  <back><ref-list>
+    <ref id="ref1"><mixed-citation>
+      <string-name>J. Backus</string-name>
+      <article-title>Fortran</article-title>
+      <source>IBM Journal</source><year>1957</year>
+    </mixed-citation></ref>
+    <ref id="ref2"><mixed-citation>
+      <article-title>Cobol</article-title><year>1960</year>
+    </mixed-citation></ref>
+  </ref-list></back>
+</article>
+"""
+
+
+class TestXmlMetadata(SyntheticTest):
+    """
+    test the metadata extracted from GROBID and CERMINE xml files
+    """
+
+    def setUp(self, debug=False, profile=True):
+        SyntheticTest.setUp(self, debug=debug, profile=profile)
+        self.store_dir = f"{self.tmp_dir.name}/xml-metadata"
+        self.load_corpus(volumes=3, papers=40, seed=7, dblp_ratio=1.0, text_words=20)
+        # every volume gets xml files - the first paper has both
+        self.papers = {}
+        for pdf_path in sorted(self.pm.papers_by_path):
+            vol_dir = pdf_path.partition("/")[0]
+            self.papers.setdefault(vol_dir, []).append(pdf_path)
+        self.xml_paths = []
+        for vol_dir, pdf_paths in sorted(self.papers.items()):
+            self.write_xml(pdf_paths[0], ".tei.xml", TEI_XML)
+            self.write_xml(pdf_paths[0], ".cermine.xml", CERMINE_XML)
+            self.write_xml(pdf_paths[1], ".cermine.xml", CERMINE_XML)
+
+    def write_xml(self, pdf_path: str, postfix: str, xml: str) -> str:
+        """
+        write the xml file with the given postfix for the given paper
+        """
+        paper = self.pm.papers_by_path[pdf_path]
+        xml_path = f"{paper.getBasePath()}{postfix}"
+        with open(xml_path, "w", encoding="utf-8") as xml_file:
+            xml_file.write(xml)
+        self.xml_paths.append(xml_path)
+        return xml_path
+
+    def test_parsers(self):
+        """
+        test parsing the TEI and JATS samples
+        """
+        tei = GrobidParser().parse(io.BytesIO(TEI_XML.encode()))
+        self.assertEqual("Streaming Parsers", tei["title"])
+        self.assertEqual("We parse large files.", tei["abstract"])
+        self.assertEqual(["XML", "parsing"], tei["keywords"])
+        self.assertEqual("Ada Lovelace", tei["authors"][0]["name"])
+        self.assertEqual(["RWTH Aachen, Germany"], tei["authors"][0]["affiliations"])
+        self.assertEqual(
+            {
+                "title": "Fast XML",
+                "authors": ["Tim Bray"],
+                "year": "1998",
+                "venue": "Markup Journal",
+                "doi": "10.1000/xml",
+            },
+            tei["references"][0],
+        )
+        jats = CermineParser().parse(io.BytesIO(CERMINE_XML.encode()))
+        self.assertEqual("Cermine Title", jats["title"])
+        self.assertEqual(["compilers"], jats["keywords"])
+        self.assertEqual(
+            [{"name": "Grace Hopper", "affiliations": ["Yale University"]}],
+            jats["authors"],
+        )
+        self.assertEqual(2, len(jats["references"]))
+        self.assertEqual({"title": "Cobol", "year": "1960"}, jats["references"][1])
+
+    def test_streaming(self):
+        """
+        test that the parsed elements do not pile up below the root
+        """
+        body = "<p>text</p>" * 1000
+        refs = "".join(
+            f'<biblStruct><analytic><title level="a">Ref {index}</title></analytic>'
+            "</biblStruct>"
+            for index in range(1000)
+        )
+        xml = TEI_XML.replace("<p>The body is skipped.</p>", body).replace(
+            "</listBibl>", f"{refs}</listBibl>"
+        )
+        data = xml.encode()
+        chunks = [data[index : index + 100] for index in range(0, len(data), 100)]
+        tei = GrobidParser().parse(chunks)
+        self.assertEqual(1001, len(tei["references"]))
+        self.assertEqual({"title": "Ref 999"}, tei["references"][-1])
+        max_size = 0
+        for element, _name, stack in iter_ends(chunks, GrobidParser.KEEP):
+            max_size = max(max_size, sum(1 for _child in element.iter()))
+            if not stack:
+                root = element
+        self.assertEqual(0, len(root))
+        self.assertTrue(max_size < 50, max_size)
+
+    def test_build(self):
+        """
+        test building the store incrementally
+        """
+        xml_files = XmlMetadataBuilder.xml_files_of(self.pm)
+        self.assertEqual(len(self.papers), len(xml_files))
+        for workers in [1, 2]:
+            with self.subTest(workers=workers):
+                for name in os.listdir(self.store_dir) if workers > 1 else []:
+                    os.remove(f"{self.store_dir}/{name}")
+                builder = XmlMetadataBuilder(xml_files, self.store_dir, workers=workers)
+                builder.BATCH_SIZE = 1
+                stats = builder.build()
+                self.assertEqual(len(self.papers), stats["extracted"])
+                self.assertEqual(0, stats["failed"])
+                stats = builder.build()
+                self.assertEqual(0, stats["extracted"])
+        # a changed xml file only extracts its volume again
+        first = self.xml_paths[0]
+        os.utime(first, ns=(0, 0))
+        stats = XmlMetadataBuilder(xml_files, self.store_dir).build()
+        self.assertEqual(1, stats["extracted"])
+        # a broken xml file is reported and the other source is used
+        with open(first, "w", encoding="utf-8") as xml_file:
+            xml_file.write("<TEI><teiHeader>")
+        stats = XmlMetadataBuilder(xml_files, self.store_dir).build()
+        self.assertEqual(1, stats["failed"])
+        vol_dir, _sep, pdf_file = sorted(self.pm.papers_by_path)[0].partition("/")
+        record = XmlMetadataStore(self.store_dir).paper(
+            int(vol_dir[len("Vol-") :]), pdf_file[: -len(".pdf")]
+        )
+        self.assertEqual("Cermine Title", record["title"])
+        self.assertEqual("cermine", record["sources"]["title"])
+
+    def test_endpoints(self):
+        """
+        test the endpoints serving the extracted metadata
+        """
+        static_directory = f"{os.path.dirname(__file__)}/../static"
+        ws = WebServer(
+            self.vm,
+            self.pm,
+            static_directory=static_directory,
+            xml_store_dir=self.store_dir,
+        )
+        client = TestClient(ws.app)
+        first, second = self.papers[sorted(self.papers)[0]][:2]
+        url = f"/{first[: -len('.pdf')]}"
+        self.assertEqual(503, client.get(f"{url}.references.json").status_code)
+        xml_files = XmlMetadataBuilder.xml_files_of(self.pm)
+        XmlMetadataBuilder(xml_files, self.store_dir).build()
+        response = client.get(f"{url}.references.json")
+        self.assertEqual(200, response.status_code)
+        data = response.json()
+        self.assertEqual(first, data["pdf_path"])
+        self.assertEqual("Fast XML", data["references"][0]["title"])
+        self.assertEqual({"references": "grobid"}, data["sources"])
+        data = client.get(f"{url}.abstract.json").json()
+        self.assertEqual("Streaming Parsers", data["title"])
+        self.assertEqual(["XML", "parsing"], data["keywords"])
+        data = client.get(f"/{second[: -len('.pdf')]}.affiliations.json").json()
+        self.assertEqual("Grace Hopper", data["authors"][0]["name"])
+        self.assertEqual({"authors": "cermine"}, data["sources"])
+        third = self.papers[sorted(self.papers)[0]][2]
+        response = client.get(f"/{third[: -len('.pdf')]}.abstract.json")
+        self.assertEqual(404, response.status_code)
+        # the paper json is still served
+        self.assertEqual(200, client.get(f"{url}.json").status_code)
+
+    def test_corrupt_volume_file(self):
+        """
+        test that truncated or corrupt volume files count as not extracted
+        """
+        static_directory = f"{os.path.dirname(__file__)}/../static"
+        ws = WebServer(
+            self.vm,
+            self.pm,
+            static_directory=static_directory,
+            xml_store_dir=self.store_dir,
+        )
+        client = TestClient(ws.app)
+        xml_files = XmlMetadataBuilder.xml_files_of(self.pm)
+        XmlMetadataBuilder(xml_files, self.store_dir).build()
+        first = self.papers[sorted(self.papers)[0]][0]
+        vol_dir, _sep, pdf_file = first.partition("/")
+        number = int(vol_dir[len("Vol-") :])
+        volume_file = XmlMetadataStore(self.store_dir).volume_file(number)
+        with open(volume_file, "rb") as gz_file:
+            data = gz_file.read()
+        url = f"/{first[: -len('.pdf')]}.abstract.json"
+        for name, corrupt in [
+            ("truncated", data[: len(data) // 2]),
+            ("not gzip", b"not gzip"),
+            ("not json", gzip.compress(b"{not json")),
+        ]:
+            with self.subTest(name=name):
+                with open(volume_file, "wb") as gz_file:
+                    gz_file.write(corrupt)
+                self.assertIsNone(XmlMetadataStore.read_volume_file(volume_file))
+                self.assertEqual(404, client.get(url).status_code)
+                stats = XmlMetadataBuilder(xml_files, self.store_dir).build()
+                self.assertEqual(1, stats["extracted"])
+                self.assertEqual(200, client.get(url).status_code)
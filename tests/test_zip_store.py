@@ -0,0 +1,167 @@
+"""
+Created on 2026-10-19
+
+@author: agent
+"""
+
+import os
+import random
+import shutil
+import zipfile
+
+from fastapi.testclient import TestClient
+
+from ceurspt.webserver import WebServer
+from ceurspt.zip_store import ZIP_STORE, ZipStore
+from tests.basetest import SyntheticTest
+
+
+class TestZipStore(SyntheticTest):
+    """
+    test serving volume files from Vol-N.zip archives
+    """
+
+    def setUp(self, debug=False, profile=True):
+        SyntheticTest.setUp(self, debug=debug, profile=profile)
+        self.generate_corpus(
+            volumes=3, papers=12, seed=7, dblp_ratio=1.0, text_words=50
+        )
+        # a pdf larger than a response chunk
+        self.pdf_bytes = random.Random(1).randbytes(600 * 1024)
+        with open(f"{self.base_path}/Vol-1/paper1.pdf", "wb") as pdf_file:
+            pdf_file.write(self.pdf_bytes)
+        with open(f"{self.base_path}/Vol-1/index.html", encoding="utf-8") as index:
+            self.index_html = index.read()
+        self.archive(f"{self.base_path}/Vol-1")
+        self.load_managers()
+
+    def archive(self, vol_dir: str, prefix: bool = True):
+        """
+        replace the given volume directory by its archive - the html is
+        deflated and all other files are stored
+        """
+        vol_name = os.path.basename(vol_dir)
+        with zipfile.ZipFile(f"{vol_dir}.zip", "w") as zip_file:
+            for name in sorted(os.listdir(vol_dir)):
+                method = zipfile.ZIP_DEFLATED if name.endswith(".html") else None
+                arcname = f"{vol_name}/{name}" if prefix else name
+                zip_file.write(f"{vol_dir}/{name}", arcname, compress_type=method)
+        shutil.rmtree(vol_dir)
+
+    def test_store(self):
+        """
+        test reading archived files
+        """
+        store = ZipStore(revalidate_secs=0)
+        vol_dir = store.volume_dir(f"{self.base_path}/Vol-1")
+        self.assertEqual(f"{self.base_path}/Vol-1.zip!/Vol-1", vol_dir)
+        self.assertIn("paper1.pdf", store.list_files(vol_dir))
+        pdf_path = f"{vol_dir}/paper1.pdf"
+        self.assertTrue(store.isfile(pdf_path))
+        self.assertFalse(store.isfile(f"{vol_dir}/nopaper.pdf"))
+        # stored members are views of the memory map
+        data = store.read_bytes(pdf_path)
+        self.assertIsInstance(data, memoryview)
+        self.assertEqual(self.pdf_bytes, bytes(data))
+        self.assertEqual(self.index_html, store.read_text(f"{vol_dir}/index.html"))
+        self.assertEqual(len(self.pdf_bytes), store.stat(pdf_path)[1])
+        self.assertIsNone(store.volume_dir(f"{self.base_path}/Vol-99"))
+        # archives without the Vol-N directory and replaced archives
+        self.archive(f"{self.base_path}/Vol-2", prefix=False)
+        vol_dir = store.volume_dir(f"{self.base_path}/Vol-2")
+        self.assertEqual(f"{self.base_path}/Vol-2.zip!", vol_dir)
+        self.assertTrue(store.isfile(f"{vol_dir}/index.html"))
+        with zipfile.ZipFile(f"{self.base_path}/Vol-2.zip", "w") as zip_file:
+            zip_file.writestr("index.html", "<html>replaced</html>")
+        os.utime(f"{self.base_path}/Vol-2.zip", ns=(1, 1))
+        self.assertEqual(
+            "<html>replaced</html>", store.read_text(f"{vol_dir}/index.html")
+        )
+        with self.assertRaises(FileNotFoundError):
+            store.read_bytes(f"{vol_dir}/paper1.pdf")
+
+    def test_iter_text(self):
+        """
+        test reading unpacked, stored and deflated text files in chunks
+        """
+        text = "Zürich € 𝔘𝔫𝔦𝔠𝔬𝔡𝔢 " * 20000
+        data = text.encode("utf-8")
+        text_file = f"{self.tmp_dir.name}/big.txt"
+        with open(text_file, "wb") as big:
+            big.write(data)
+        zip_path = f"{self.tmp_dir.name}/big.zip"
+        with zipfile.ZipFile(zip_path, "w") as zip_file:
+            zip_file.writestr("stored.txt", data, compress_type=zipfile.ZIP_STORED)
+            zip_file.writestr("deflated.txt", data, compress_type=zipfile.ZIP_DEFLATED)
+        store = ZipStore()
+        for path in [text_file, f"{zip_path}!/stored.txt", f"{zip_path}!/deflated.txt"]:
+            with self.subTest(path=path):
+                chunks = list(store.iter_bytes(path, chunk_size=4096))
+                self.assertTrue(max(len(chunk) for chunk in chunks) <= 4096)
+                self.assertEqual(data, b"".join(chunks))
+                self.assertEqual(text, "".join(store.iter_text(path, chunk_size=1001)))
+        with self.assertRaises(FileNotFoundError):
+            list(store.iter_text(f"{zip_path}!/missing.txt"))
+
+    def test_managers(self):
+        """
+        test that volumes and papers resolve their files in the archive
+        """
+        volume = self.vm.getVolume(1)
+        self.assertTrue(ZIP_STORE.is_archived(volume.vol_dir))
+        self.assertIn("Vol-1", volume.getHtml())
+        paper = self.pm.getPaper(1, "paper1")
+        self.assertTrue(paper.getPdf().endswith(".zip!/Vol-1/paper1.pdf"))
+        self.assertTrue(paper.getText().startswith(paper.title or "Preface"))
+        # unpacked volumes are not affected
+        self.assertFalse(ZIP_STORE.is_archived(self.vm.getVolume(2).vol_dir))
+
+    def test_pdf_ranges(self):
+        """
+        test serving an archived pdf with conditional and range requests
+        """
+        static_directory = f"{os.path.dirname(__file__)}/../static"
+        ws = WebServer(self.vm, self.pm, static_directory=static_directory)
+        client = TestClient(ws.app)
+        response = client.get("/Vol-1/paper1.pdf")
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(self.pdf_bytes, response.content)
+        response = client.get(
+            "/Vol-1/paper1.pdf", headers={"If-None-Match": response.headers["etag"]}
+        )
+        self.assertEqual(304, response.status_code)
+        size = len(self.pdf_bytes)
+        for range_header, expected in [
+            ("bytes=0-99", self.pdf_bytes[0:100]),
+            ("bytes=300000-", self.pdf_bytes[300000:]),
+            ("bytes=-500", self.pdf_bytes[-500:]),
+        ]:
+            with self.subTest(range_header=range_header):
+                response = client.get(
+                    "/Vol-1/paper1.pdf", headers={"Range": range_header}
+                )
+                self.assertEqual(206, response.status_code)
+                self.assertEqual(expected, response.content)
+        response = client.get("/Vol-1/paper1.pdf", headers={"Range": f"bytes={size}-"})
+        self.assertEqual(416, response.status_code)
+        self.assertEqual(404, client.get("/Vol-1/nopaper.pdf").status_code)
+        response = client.get("/Vol-1.html")
+        self.assertEqual(200, response.status_code)
+
+    def test_streamed_text(self):
+        """
+        test streaming archived texts and the smw markup of their papers
+        """
+        static_directory = f"{os.path.dirname(__file__)}/../static"
+        ws = WebServer(self.vm, self.pm, static_directory=static_directory)
+        client = TestClient(ws.app)
+        paper = self.pm.getPaper(1, "paper2")
+        response = client.get("/Vol-1/paper2.txt")
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(paper.getText(), response.text)
+        self.assertTrue(response.headers["content-type"].startswith("text/plain"))
+        response = client.get("/Vol-1/paper2.smw")
+        self.assertEqual(paper.as_smw_markup(), response.text)
+        self.assertIn(f"<pre>\n{paper.getText()}\n</pre>", response.text)
+        # papers without content give an empty response as before
+        self.assertEqual(b"", client.get("/Vol-1/paper2.grobid").content)